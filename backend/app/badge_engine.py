@@ -100,6 +100,7 @@ class BadgeEngine:
 
         # Get all active badges
         active_badges = self.db.query(Badge).filter_by(is_active=True).all()
+        earned_ids = self._earned_badge_ids(player_profile_id)
 
         # Check each badge
         for badge in active_badges:
@@ -107,7 +108,7 @@ class BadgeEngine:
             # regardless of trigger_type (career-milestone conditions like
             # "games_played >= 10" stay true forever, so without this check
             # every later game would re-award e.g. "Rookie" as a duplicate row).
-            if self._player_has_badge(player_profile_id, int(badge.id)):
+            if int(badge.id) in earned_ids:
                 continue
 
             # Check if badge trigger condition is in our checkers
@@ -126,8 +127,9 @@ class BadgeEngine:
                     if earned_badge:
                         earned_badges.append(earned_badge)
 
-                        # Check if this completes a series
+                        # Check if this completes a series (which may award its completion badge)
                         self._check_series_completion(player_profile_id, badge)
+                        earned_ids = self._earned_badge_ids(player_profile_id)
 
         # Update badge progress for progression badges
         self._update_progression_badges(player_profile_id, player_stats)
@@ -165,12 +167,13 @@ class BadgeEngine:
             return earned_badges
 
         active_badges = self.db.query(Badge).filter_by(is_active=True).all()
+        earned_ids = self._earned_badge_ids(player_profile_id)
 
         for badge in active_badges:
             trigger = badge.trigger_condition.get("type") if badge.trigger_condition else None
             if trigger not in self.STATS_ONLY_TRIGGERS:
                 continue
-            if self._player_has_badge(player_profile_id, int(badge.id)):
+            if int(badge.id) in earned_ids:
                 continue
 
             checker_func = self.badge_checkers[trigger]
@@ -179,6 +182,7 @@ class BadgeEngine:
                 if earned_badge:
                     earned_badges.append(earned_badge)
                     self._check_series_completion(player_profile_id, badge)
+                    earned_ids = self._earned_badge_ids(player_profile_id)
 
         self._update_progression_badges(player_profile_id, stats)
 
@@ -203,8 +207,9 @@ class BadgeEngine:
             .all()
         )
 
+        earned_ids = self._earned_badge_ids(player_profile_id)
         for badge in badges:
-            if self._player_has_badge(player_profile_id, int(badge.id)):
+            if int(badge.id) in earned_ids:
                 continue
 
             # Check specific event criteria
@@ -581,7 +586,7 @@ class BadgeEngine:
         game_record_id: int | None = None,
     ) -> PlayerBadgeEarned | None:
         """Award a badge to a player"""
-        badge = self.db.query(Badge).filter_by(id=badge_id).first()
+        badge = self.db.get(Badge, badge_id)
         if not badge:
             return None
 
@@ -611,19 +616,10 @@ class BadgeEngine:
 
         return earned
 
-    def _player_has_badge(self, player_profile_id: int, badge_id: int) -> bool:
-        """Check if player already has this badge"""
-        count = (
-            self.db.query(PlayerBadgeEarned)
-            .filter(
-                and_(
-                    PlayerBadgeEarned.player_profile_id == player_profile_id,
-                    PlayerBadgeEarned.badge_id == badge_id,
-                )
-            )
-            .count()
-        )
-        return bool(count > 0)
+    def _earned_badge_ids(self, player_profile_id: int) -> set[int]:
+        """Ids of every badge the player already holds"""
+        rows = self.db.query(PlayerBadgeEarned.badge_id).filter_by(player_profile_id=player_profile_id).all()
+        return {int(badge_id) for (badge_id,) in rows}
 
     def _get_or_create_progress(self, player_profile_id: int, badge_id: int) -> BadgeProgress:
         """Get or create badge progress tracking"""
@@ -639,35 +635,54 @@ class BadgeEngine:
         )
 
         if not progress:
-            badge = self.db.query(Badge).filter_by(id=badge_id).first()
-            target = badge.trigger_condition.get("target", 0) if badge and badge.trigger_condition else 0
-
-            progress = BadgeProgress(
-                player_profile_id=player_profile_id,
-                badge_id=badge_id,
-                current_progress=0,
-                target_progress=target,
-                progress_percentage=0.0,
-                created_at=utc_now().isoformat(),
-                updated_at=utc_now().isoformat(),
-            )
+            progress = self._new_progress(player_profile_id, self.db.get(Badge, badge_id), badge_id)
             self.db.add(progress)
             self.db.commit()
             self.db.refresh(progress)
 
         return progress
 
+    def _new_progress(self, player_profile_id: int, badge: Badge | None, badge_id: int) -> BadgeProgress:
+        """Unsaved progress row at zero, targeting the badge's ``target`` condition"""
+        target = badge.trigger_condition.get("target", 0) if badge and badge.trigger_condition else 0
+        return BadgeProgress(
+            player_profile_id=player_profile_id,
+            badge_id=badge_id,
+            current_progress=0,
+            target_progress=target,
+            progress_percentage=0.0,
+            created_at=utc_now().isoformat(),
+            updated_at=utc_now().isoformat(),
+        )
+
     def _update_progression_badges(self, player_profile_id: int, stats: PlayerStatistics) -> None:
         """Update progress for all progression badges"""
         progression_badges = (
             self.db.query(Badge).filter(and_(Badge.trigger_type == "career_milestone", Badge.is_active == True)).all()
         )
+        earned_ids = self._earned_badge_ids(player_profile_id)
+        pending = [badge for badge in progression_badges if int(badge.id) not in earned_ids]
+        if not pending:
+            return
 
-        for badge in progression_badges:
-            if self._player_has_badge(player_profile_id, int(badge.id)):
-                continue
+        # One read for every pending badge's progress row, one commit at the end
+        existing = {
+            int(progress.badge_id): progress
+            for progress in self.db.query(BadgeProgress)
+            .filter(
+                and_(
+                    BadgeProgress.player_profile_id == player_profile_id,
+                    BadgeProgress.badge_id.in_([int(badge.id) for badge in pending]),
+                )
+            )
+            .all()
+        }
 
-            progress = self._get_or_create_progress(player_profile_id, int(badge.id))
+        for badge in pending:
+            progress = existing.get(int(badge.id))
+            if progress is None:
+                progress = self._new_progress(player_profile_id, badge, int(badge.id))
+                self.db.add(progress)
 
             # Update progress based on badge type
             trigger = badge.trigger_condition.get("type") if badge.trigger_condition else None
@@ -688,7 +703,8 @@ class BadgeEngine:
                 )
 
             progress.updated_at = utc_now().isoformat()
-            self.db.commit()
+
+        self.db.commit()
 
     def _check_series_completion(self, player_profile_id: int, newly_earned_badge: Badge) -> None:
         """Check if earning this badge completes a series"""
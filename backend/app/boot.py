@@ -0,0 +1,204 @@
+"""
+Boot path for the FastAPI lifespan: schema preparation with a fast path, and
+per-phase timings.
+
+A full schema preparation runs ``init_db`` (create_all + the
+``legacy_rounds_official`` view), the ``*_postgres.sql`` migrations, and the
+badge and legacy-roster seed checks. That is dozens of round trips, and on an
+unchanged deploy none of it does anything. After a successful preparation we
+store a fingerprint of the model metadata and the migration file set in
+``schema_fingerprint``. The next boot reads it back with one query and skips
+everything when it still matches.
+
+Set ``FORCE_SCHEMA_SYNC=true`` to run the full preparation regardless.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import MetaData, delete, select
+from sqlalchemy.engine import Engine
+
+from . import database
+from .migrations_runner import MIGRATIONS_DIR, run_sql_migrations
+from .models import Badge, SchemaFingerprint
+from .utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+FORCE_SCHEMA_SYNC = os.getenv("FORCE_SCHEMA_SYNC", "false").lower() == "true"
+
+
+class BootTimer:
+    """Collects wall-clock durations of named boot phases."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+            logger.info("⏱️ Boot phase %s: %.0f ms", name, self.phases[name] * 1000)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        phases = ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items())
+        return f"ready in {self.elapsed * 1000:.0f} ms ({phases})"
+
+
+def schema_fingerprint(metadata: MetaData | None = None, migrations_dir: Path | None = None) -> str:
+    """Hash the model metadata and the migration file set (names and contents)."""
+    metadata = metadata if metadata is not None else database.Base.metadata
+    migrations_dir = migrations_dir if migrations_dir is not None else MIGRATIONS_DIR
+
+    digest = hashlib.sha256()
+    for name in sorted(metadata.tables):
+        table = metadata.tables[name]
+        digest.update(f"table {name}\n".encode())
+        for column in table.columns:
+            foreign_keys = ",".join(sorted(fk.target_fullname for fk in column.foreign_keys))
+            digest.update(
+                f"  {column.name} {column.type!r} null={column.nullable} pk={column.primary_key} "
+                f"unique={column.unique} fk={foreign_keys}\n".encode()
+            )
+        for index in sorted(table.indexes, key=lambda ix: ix.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            digest.update(f"  index {index.name} ({columns}) unique={index.unique}\n".encode())
+    for path in sorted(migrations_dir.glob("*_postgres.sql")):
+        digest.update(f"migration {path.name}\n".encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def stored_fingerprint(session_factory: Any) -> str | None:
+    """Fingerprint recorded by the last full preparation, or None (including on a fresh DB)."""
+    try:
+        db = session_factory()
+        try:
+            fingerprint: str | None = db.execute(
+                select(SchemaFingerprint.fingerprint).where(SchemaFingerprint.id == 1)
+            ).scalar()
+            return fingerprint
+        finally:
+            db.close()
+    except Exception as e:
+        logger.info("No stored schema fingerprint (%s)", type(e).__name__)
+        return None
+
+
+def record_fingerprint(session_factory: Any, fingerprint: str) -> None:
+    db = session_factory()
+    try:
+        db.execute(delete(SchemaFingerprint))
+        db.add(SchemaFingerprint(id=1, fingerprint=fingerprint, recorded_at=utc_now().isoformat()))
+        db.commit()
+    finally:
+        db.close()
+
+
+def seed_badges_if_empty(session_factory: Any) -> int:
+    """Seed the badge catalogue when the table is empty. Returns badges inserted."""
+    from .badge_seeds import seed_badges
+
+    db = session_factory()
+    try:
+        if db.query(Badge).count():
+            logger.info("🏅 Badges already seeded")
+            return 0
+        logger.info("🏅 Seeding badges...")
+        seed_badges(db)
+        inserted: int = db.query(Badge).count()
+        logger.info("✅ Badges seeded")
+        return inserted
+    finally:
+        db.close()
+
+
+def seed_legacy_roster(session_factory: Any) -> int:
+    """Seed the canonical legacy roster (mirrors Jeff's tee-sheet dropdown) when empty."""
+    from .services.legacy_player_service import seed_roster_if_empty
+
+    db = session_factory()
+    try:
+        inserted = seed_roster_if_empty(db)
+        if inserted:
+            logger.info(f"⛳ Seeded {inserted} canonical legacy players")
+        else:
+            logger.info("⛳ Legacy roster already seeded")
+        return inserted
+    finally:
+        db.close()
+
+
+async def prepare_database(
+    engine: Engine | None = None,
+    session_factory: Any = None,
+    timer: BootTimer | None = None,
+    force: bool | None = None,
+) -> dict[str, Any]:
+    """Bring the schema and seed data up to date, skipping it all when the fingerprint matches.
+
+    Returns ``{"fast_path": bool, "fingerprint": str, ...}``. ``init_db``
+    failures propagate (the app can't serve without tables); migration and
+    seed failures are logged and leave the fingerprint unrecorded so the next
+    boot retries the full preparation.
+    """
+    engine = engine if engine is not None else database.engine
+    session_factory = session_factory if session_factory is not None else database.SessionLocal
+    timer = timer or BootTimer()
+    force = FORCE_SCHEMA_SYNC if force is None else force
+
+    with timer.phase("schema_check"):
+        fingerprint = schema_fingerprint()
+        if not force and await database.run_db(stored_fingerprint, session_factory) == fingerprint:
+            logger.info("🗄️ Schema fingerprint unchanged — skipping init_db, migrations and seeding")
+            return {"fast_path": True, "fingerprint": fingerprint}
+
+    with timer.phase("init_db"):
+        await database.run_db(database.init_db, engine)
+
+    # Migrations ALTER tables create_all just made sure exist, so they run
+    # after it; the two seed checks touch disjoint tables and run side by side.
+    ok = True
+    with timer.phase("migrations"):
+        try:
+            migrations = await database.run_db(run_sql_migrations, engine)
+            if migrations.get("applied"):
+                logger.info(f"SQL migrations applied: {migrations['applied']}")
+            ok = not migrations.get("failed")
+        except Exception as e:
+            logger.error(f"SQL migration runner failed (continuing startup): {e}")
+            ok = False
+
+    with timer.phase("seeding"):
+        badges, roster = await asyncio.gather(
+            database.run_db(seed_badges_if_empty, session_factory),
+            database.run_db(seed_legacy_roster, session_factory),
+            return_exceptions=True,
+        )
+        for label, outcome in (("Badge", badges), ("Legacy roster", roster)):
+            if isinstance(outcome, BaseException):
+                logger.error(f"{label} seeding failed: {outcome}")
+                ok = False
+
+    if ok:
+        try:
+            await database.run_db(record_fingerprint, session_factory, fingerprint)
+        except Exception as e:
+            logger.warning(f"Could not record schema fingerprint: {e}")
+    return {"fast_path": False, "fingerprint": fingerprint, "recorded": ok}
@@ -1,7 +1,12 @@
+import asyncio
+import contextvars
 import logging
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from typing import Any, TypeVar
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
@@ -68,6 +73,34 @@ else:
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+T = TypeVar("T")
+
+# Worker threads for blocking Session work started from coroutines. Sized to
+# the connection pool (size + overflow) by default: more threads would only
+# queue on pool_timeout, fewer would leave connections idle.
+DB_THREAD_LIMIT = _int_env("DB_THREAD_LIMIT", _int_env("DB_POOL_SIZE", 5) + _int_env("DB_MAX_OVERFLOW", 10))
+_db_executor = ThreadPoolExecutor(max_workers=max(DB_THREAD_LIMIT, 1), thread_name_prefix="db")
+
+
+async def run_db(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking SQLAlchemy work off the event loop.
+
+    ``async def`` routes and handlers must not call the synchronous Session
+    directly — one slow query would stall every request on the worker. Wrap
+    the DB part in a plain function and await it here instead. Context
+    variables are carried over to the worker thread.
+
+    Example:
+        profile = await run_db(db.get, PlayerProfile, player_id)
+
+    Routes that never await anything should simply be ``def``: FastAPI already
+    runs those in its threadpool.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_db_executor, partial(ctx.run, func, *args, **kwargs))
+
 
 def get_db():
     """
@@ -157,29 +190,28 @@ def ensure_legacy_rounds_official_view(bind) -> None:
         )
 
 
-def init_db():
-    """Initialize database tables"""
+def init_db(bind=None):
+    """Initialize database tables (on ``bind``, default: the app engine)"""
+    bind = bind if bind is not None else engine
     try:
         # Import all models to ensure they're registered with SQLAlchemy
         from . import models  # noqa: F401
 
         # Create all tables
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=bind)
         # Filtered view used by Commissioner SQL reads (SQLite dev; Postgres gets
         # it from the attestation migration).
-        ensure_legacy_rounds_official_view(engine)
+        ensure_legacy_rounds_official_view(bind)
         logger.info("Database initialized successfully")
 
         # Test database connection
-        db = SessionLocal()
         try:
-            db.execute(text("SELECT 1"))
+            with bind.connect() as conn:
+                conn.execute(text("SELECT 1"))
             logger.info("Database connection test successful")
         except Exception as e:
             logger.error(f"Database connection test failed: {e}")
             raise
-        finally:
-            db.close()
 
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -8,11 +8,15 @@ import logging
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from functools import wraps
+from typing import TypeVar
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def with_db_session(func: Callable) -> Callable:
     """
@@ -73,3 +77,44 @@ def get_db_session() -> Generator[Session, None, None]:
 
     with get_isolated_session() as session:
         yield session
+
+
+# Attempts before an optimistic-concurrency conflict is surfaced to the caller.
+MAX_OPTIMISTIC_ATTEMPTS = 3
+
+
+def commit_with_optimistic_retry(
+    db: Session, attempt: Callable[[], T], max_attempts: int = MAX_OPTIMISTIC_ATTEMPTS
+) -> T:
+    """
+    Run ``attempt`` and commit, retrying when a versioned row changed underneath.
+
+    Versioned models (e.g. GameStateModel) compare-and-swap on their version
+    column at flush time, so a concurrent writer makes the commit raise
+    StaleDataError instead of silently overwriting. On conflict the session is
+    rolled back and ``attempt`` runs again, so it must re-load the rows it
+    changes and re-apply its delta from scratch every time.
+
+    Example:
+        def apply():
+            game = db.query(GameStateModel).filter_by(game_id=gid).one()
+            game.state = {**game.state, "current_hole": 5}
+            return game
+
+        game = commit_with_optimistic_retry(db, apply)
+
+    Raises:
+        StaleDataError: If every attempt lost the race.
+    """
+    attempt_number = 1
+    while True:
+        try:
+            result = attempt()
+            db.commit()
+            return result
+        except StaleDataError:
+            db.rollback()
+            if attempt_number >= max_attempts:
+                raise
+            logger.info("Version conflict on attempt %d/%d; re-applying", attempt_number, max_attempts)
+            attempt_number += 1
@@ -0,0 +1,97 @@
+"""Column types for calendar dates and timestamps.
+
+The application passes dates around as ISO strings (``"2026-04-06"``,
+``utc_now().isoformat()``). These types keep that contract at the ORM
+boundary — values are accepted and returned as ISO strings — while storing
+them as native DATE / TIMESTAMP on Postgres, so range filters and ordering
+use typed comparisons and btree range scans. SQLite has no native date
+type; there the values stay TEXT in the same ISO format (which sorts
+chronologically), normalised on write.
+
+Sheet syncs write whatever the spreadsheet holds, so a value that does not
+parse is logged and bound as NULL rather than failing the whole flush.
+"""
+
+import logging
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy import Date, DateTime, String
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+logger = logging.getLogger(__name__)
+
+
+def parse_iso_date(value: str | date) -> date:
+    """``date`` for an ISO date (or the date part of an ISO timestamp)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value.strip()[:10])
+
+
+def parse_iso_timestamp(value: str | datetime) -> datetime:
+    """Naive UTC ``datetime`` for an ISO timestamp; aware values are converted to UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+class ISODate(TypeDecorator[str]):
+    """DATE column read and written as ``YYYY-MM-DD`` strings."""
+
+    impl = Date
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(Date())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        try:
+            parsed = parse_iso_date(value)
+        except (AttributeError, TypeError, ValueError):
+            logger.warning("Unparseable date %r bound as NULL", value)
+            return None
+        return parsed.isoformat() if dialect.name == "sqlite" else parsed
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        stored: date = value
+        return stored.isoformat()
+
+
+class ISOTimestamp(TypeDecorator[str]):
+    """TIMESTAMP (naive UTC) column read and written as ``datetime.isoformat()`` strings."""
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        try:
+            parsed = parse_iso_timestamp(value)
+        except (AttributeError, TypeError, ValueError):
+            logger.warning("Unparseable timestamp %r bound as NULL", value)
+            return None
+        return parsed.isoformat() if dialect.name == "sqlite" else parsed
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        stored: date = value
+        return stored.isoformat()
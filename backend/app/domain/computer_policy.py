@@ -0,0 +1,238 @@
+"""Precomputed decision table for computer players.
+
+Every computer decision (go solo, float, offer or accept a double, accept a
+partnership) is a probability looked up in a table keyed by a quantized
+situation: personality, decision, game phase, hole, wager bucket, points
+standing and handicap spread. The table is generated offline by
+``build_table()`` from each personality's base rates and written to
+``app/data/computer_policy.bin`` (``scripts/build_computer_policy.py``,
+``--check`` in CI), then loaded once per process; a decision costs one
+index computation and one byte read.
+
+File layout: ``MAGIC``, one line of JSON describing the axes, then one byte
+per cell (probability * 255) in row-major order over ``Axes``.
+"""
+
+import json
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cache
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+from .game_types import GamePhase
+
+POLICY_PATH = Path(__file__).resolve().parent.parent / "data" / "computer_policy.bin"
+MAGIC = b"WGPPOLICY1\n"
+
+DECISIONS = ("go_solo", "use_float", "offer_double", "accept_double", "accept_partnership")
+PHASES = (GamePhase.REGULAR, GamePhase.VINNIE_VARIATION, GamePhase.HOEPFINGER)
+HOLES = 18
+# Wager buckets: 1, 2-3, 4-7, 8+ quarters.
+WAGER_BUCKETS = 4
+# Points relative to the field average, and handicap relative to the field
+# average; bucket 0 is far behind / much stronger than the field.
+STANDING_EDGES = (-7.5, -2.5, 2.5, 7.5)
+SPREAD_EDGES = (-5.5, -1.5, 1.5, 5.5)
+
+DEFAULT_PERSONALITY = "balanced"
+
+
+@dataclass(frozen=True, slots=True)
+class Personality:
+    """Base decision rates for one computer personality (probabilities in [0, 1])."""
+
+    name: str
+    solo_rate: float
+    accept_rate: float
+    double_rate: float
+    accept_double_rate: float
+    float_rate: float
+    # Added to solo/double/float appetite per standing bucket below even.
+    comeback: float = 0.0
+
+    def base_rate(self, decision: str) -> float:
+        return {
+            "go_solo": self.solo_rate,
+            "use_float": self.float_rate,
+            "offer_double": self.double_rate,
+            "accept_double": self.accept_double_rate,
+            "accept_partnership": self.accept_rate,
+        }[decision]
+
+
+PERSONALITIES: dict[str, Personality] = {
+    p.name: p
+    for p in (
+        Personality(
+            "aggressive",
+            solo_rate=0.35,
+            accept_rate=0.85,
+            double_rate=0.6,
+            accept_double_rate=0.85,
+            float_rate=0.2,
+            comeback=0.05,
+        ),
+        Personality(
+            "balanced",
+            solo_rate=0.2,
+            accept_rate=0.7,
+            double_rate=0.35,
+            accept_double_rate=0.6,
+            float_rate=0.1,
+            comeback=0.03,
+        ),
+        Personality(
+            "conservative",
+            solo_rate=0.08,
+            accept_rate=0.6,
+            double_rate=0.15,
+            accept_double_rate=0.35,
+            float_rate=0.03,
+        ),
+        Personality(
+            "strategic",
+            solo_rate=0.15,
+            accept_rate=0.65,
+            double_rate=0.4,
+            accept_double_rate=0.5,
+            float_rate=0.08,
+            comeback=0.08,
+        ),
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Situation:
+    """A quantized decision point; build one with ``Situation.of``."""
+
+    phase: int
+    hole: int  # 0-based
+    wager: int
+    standing: int
+    spread: int
+
+    @classmethod
+    def of(cls, phase: GamePhase, hole: int, wager: int, standing: float, spread: float) -> "Situation":
+        return cls(
+            phase=PHASES.index(phase),
+            hole=min(max(hole, 1), HOLES) - 1,
+            wager=min(WAGER_BUCKETS - 1, max(wager, 1).bit_length() - 1),
+            standing=bisect_right(STANDING_EDGES, standing),
+            spread=bisect_right(SPREAD_EDGES, spread),
+        )
+
+
+@dataclass(frozen=True)
+class Axes:
+    personalities: tuple[str, ...]
+    decisions: tuple[str, ...] = DECISIONS
+    phases: int = len(PHASES)
+    holes: int = HOLES
+    wagers: int = WAGER_BUCKETS
+    standings: int = len(STANDING_EDGES) + 1
+    spreads: int = len(SPREAD_EDGES) + 1
+
+    @property
+    def cells_per_decision(self) -> int:
+        return self.phases * self.holes * self.wagers * self.standings * self.spreads
+
+    @property
+    def size(self) -> int:
+        return len(self.personalities) * len(self.decisions) * self.cells_per_decision
+
+    def offset(self, personality: int, decision: int, situation: Situation) -> int:
+        index = personality * len(self.decisions) + decision
+        index = index * self.phases + situation.phase
+        index = index * self.holes + situation.hole
+        index = index * self.wagers + situation.wager
+        index = index * self.standings + situation.standing
+        return index * self.spreads + situation.spread
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "personalities": list(self.personalities),
+            "decisions": list(self.decisions),
+            "phases": [p.value for p in PHASES],
+            "holes": self.holes,
+            "wagers": self.wagers,
+            "standing_edges": list(STANDING_EDGES),
+            "spread_edges": list(SPREAD_EDGES),
+        }
+
+
+def _rate(personality: Personality, decision: str, situation: Situation) -> float:
+    behind = max(0, 2 - situation.standing)  # 2, 1 or 0 buckets below even
+    stronger = 2 - situation.spread  # +2 much stronger .. -2 much weaker
+    closing = PHASES[situation.phase] is GamePhase.HOEPFINGER
+    rate = personality.base_rate(decision)
+    if decision == "go_solo":
+        rate += 0.04 * stronger + personality.comeback * behind + (0.08 if closing else 0) - 0.03 * situation.wager
+    elif decision == "use_float":
+        rate += personality.comeback * behind + (0.05 if situation.hole >= 12 else 0) - 0.04 * situation.wager
+    elif decision == "offer_double":
+        rate += 0.03 * stronger + personality.comeback * behind + (0.05 if closing else 0)
+    elif decision == "accept_double":
+        rate += 0.03 * stronger + personality.comeback * behind - 0.06 * situation.wager
+    elif decision == "accept_partnership":
+        rate += 0.02 * stronger
+    return min(0.99, max(0.01, rate))
+
+
+def build_table(personalities: dict[str, Personality] | None = None) -> tuple[Axes, bytes]:
+    """Generate the table from the personalities' base rates (offline step)."""
+    personalities = personalities or PERSONALITIES
+    axes = Axes(personalities=tuple(personalities))
+    cells = bytearray(axes.size)
+    shape = (axes.phases, axes.holes, axes.wagers, axes.standings, axes.spreads)
+    for p_index, name in enumerate(axes.personalities):
+        for d_index, decision in enumerate(axes.decisions):
+            for situation in (Situation(*index) for index in product(*map(range, shape))):
+                rate = _rate(personalities[name], decision, situation)
+                cells[axes.offset(p_index, d_index, situation)] = round(rate * 255)
+    return axes, bytes(cells)
+
+
+def encode(axes: Axes, cells: bytes) -> bytes:
+    return MAGIC + json.dumps(axes.to_json(), sort_keys=True).encode() + b"\n" + cells
+
+
+class ComputerPolicy:
+    """The loaded table. Lookups are index arithmetic over a bytes object."""
+
+    def __init__(self, axes: Axes, cells: bytes) -> None:
+        if len(cells) != axes.size:
+            raise ValueError(f"Policy table has {len(cells)} cells, expected {axes.size}")
+        self.axes = axes
+        self._cells = cells
+        self._personalities = {name: i for i, name in enumerate(axes.personalities)}
+        self._decisions = {name: i for i, name in enumerate(axes.decisions)}
+
+    @classmethod
+    def decode(cls, data: bytes) -> "ComputerPolicy":
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a computer policy table")
+        header, cells = data[len(MAGIC) :].split(b"\n", 1)
+        meta = json.loads(header)
+        if (
+            tuple(meta["decisions"]) != DECISIONS
+            or tuple(meta["standing_edges"]) != STANDING_EDGES
+            or tuple(meta["spread_edges"]) != SPREAD_EDGES
+        ):
+            raise ValueError("Policy table axes do not match this build; regenerate it")
+        return cls(Axes(personalities=tuple(meta["personalities"])), cells)
+
+    def probability(self, personality: str, decision: str, situation: Situation) -> float:
+        """Probability that a player of ``personality`` takes ``decision``; unknown personalities play balanced."""
+        p_index = self._personalities.get(personality)
+        if p_index is None:
+            p_index = self._personalities[DEFAULT_PERSONALITY]
+        return self._cells[self.axes.offset(p_index, self._decisions[decision], situation)] / 255
+
+
+@cache
+def computer_policy() -> ComputerPolicy:
+    """The process-wide policy table, read from ``POLICY_PATH`` on first use."""
+    return ComputerPolicy.decode(POLICY_PATH.read_bytes())
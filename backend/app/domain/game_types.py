@@ -1,4 +1,13 @@
-"""Domain data types for the Wolf Goat Pig game engine."""
+"""Domain data types for the Wolf Goat Pig game engine.
+
+The per-game state types are ``slots=True`` dataclasses with hand-written
+``to_dict``/``from_dict`` codecs: a resident game holds hundreds of these
+objects, and ``dataclasses.asdict`` recursed through (and deep-copied) every
+one of them on each save. ``to_dict`` copies containers one level deep,
+which is all the JSON-shaped values stored here need; ``from_dict`` takes
+ownership of the (freshly decoded) containers it is given and falls back to
+the field defaults for keys missing from older saved states.
+"""
 
 import random
 from dataclasses import dataclass, field
@@ -28,7 +37,7 @@ class PlayerRole(Enum):
     GOAT = "goat"  # Player furthest down
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEvent:
     """Represents a chronological event in the hole timeline"""
 
@@ -40,8 +49,32 @@ class TimelineEvent:
     player_id: str | None = None
     player_name: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "timestamp": (self.timestamp.isoformat() if hasattr(self.timestamp, "isoformat") else str(self.timestamp)),
+            "type": self.type,
+            "description": self.description,
+            "details": self.details,
+            "player_id": self.player_id,
+            "player_name": self.player_name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TimelineEvent":
+        timestamp = data["timestamp"]
+        return cls(
+            id=data["id"],
+            timestamp=datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp,
+            type=data["type"],
+            description=data["description"],
+            details=data.get("details", {}),
+            player_id=data.get("player_id"),
+            player_name=data.get("player_name"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Wolf Goat Pig Player with all game-specific attributes"""
 
@@ -59,12 +92,35 @@ class Player:
         self.float_used = self.float_used or 0
         self.solo_count = self.solo_count or 0
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "handicap": self.handicap,
+            "points": self.points,
+            "float_used": self.float_used,
+            "solo_count": self.solo_count,
+            "goat_position_history": list(self.goat_position_history),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Player":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            handicap=data["handicap"],
+            points=data.get("points", 0),
+            float_used=data.get("float_used", 0),
+            solo_count=data.get("solo_count", 0),
+            goat_position_history=data.get("goat_position_history", []),
+        )
+
 
 # Backwards compatibility alias (temporary during transition)
 WGPPlayer = Player
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamFormation:
     """Represents team formations for a hole"""
 
@@ -78,8 +134,35 @@ class TeamFormation:
     opponents: list[str] = field(default_factory=list)
     pending_request: dict | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "captain": self.captain,
+            "second_captain": self.second_captain,
+            "team1": list(self.team1),
+            "team2": list(self.team2),
+            "team3": list(self.team3),
+            "solo_player": self.solo_player,
+            "opponents": list(self.opponents),
+            "pending_request": dict(self.pending_request) if self.pending_request is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TeamFormation":
+        return cls(
+            type=data.get("type", "pending"),
+            captain=data.get("captain"),
+            second_captain=data.get("second_captain"),
+            team1=data.get("team1", []),
+            team2=data.get("team2", []),
+            team3=data.get("team3", []),
+            solo_player=data.get("solo_player"),
+            opponents=data.get("opponents", []),
+            pending_request=data.get("pending_request"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class BettingState:
     """Complete betting state for Wolf Goat Pig"""
 
@@ -100,8 +183,49 @@ class BettingState:
     tossed_aardvarks: list[str] = field(default_factory=list)  # Track tossed aardvarks
     ping_pong_count: int = 0  # Ping pong counter
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "base_wager": self.base_wager,
+            "current_wager": self.current_wager,
+            "doubled": self.doubled,
+            "redoubled": self.redoubled,
+            "carry_over": self.carry_over,
+            "float_invoked": self.float_invoked,
+            "option_invoked": self.option_invoked,
+            "duncan_invoked": self.duncan_invoked,
+            "tunkarri_invoked": self.tunkarri_invoked,
+            "big_dick_invoked": self.big_dick_invoked,
+            "joes_special_value": self.joes_special_value,
+            "ackerley_gambit": dict(self.ackerley_gambit) if self.ackerley_gambit is not None else None,
+            "line_of_scrimmage": self.line_of_scrimmage,
+            "doubles_history": [dict(entry) for entry in self.doubles_history],
+            "tossed_aardvarks": list(self.tossed_aardvarks),
+            "ping_pong_count": self.ping_pong_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BettingState":
+        return cls(
+            base_wager=data.get("base_wager", 1),
+            current_wager=data.get("current_wager", 1),
+            doubled=data.get("doubled", False),
+            redoubled=data.get("redoubled", False),
+            carry_over=data.get("carry_over", False),
+            float_invoked=data.get("float_invoked", False),
+            option_invoked=data.get("option_invoked", False),
+            duncan_invoked=data.get("duncan_invoked", False),
+            tunkarri_invoked=data.get("tunkarri_invoked", False),
+            big_dick_invoked=data.get("big_dick_invoked", False),
+            joes_special_value=data.get("joes_special_value"),
+            ackerley_gambit=data.get("ackerley_gambit"),
+            line_of_scrimmage=data.get("line_of_scrimmage"),
+            doubles_history=data.get("doubles_history", []),
+            tossed_aardvarks=data.get("tossed_aardvarks", []),
+            ping_pong_count=data.get("ping_pong_count", 0),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class BallPosition:
     """Represents a ball's current position on the hole"""
 
@@ -113,8 +237,31 @@ class BallPosition:
     conceded: bool = False  # "good but not in"
     penalty_strokes: int = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "player_id": self.player_id,
+            "distance_to_pin": self.distance_to_pin,
+            "lie_type": self.lie_type,
+            "shot_count": self.shot_count,
+            "holed": self.holed,
+            "conceded": self.conceded,
+            "penalty_strokes": self.penalty_strokes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BallPosition":
+        return cls(
+            player_id=data["player_id"],
+            distance_to_pin=data["distance_to_pin"],
+            lie_type=data["lie_type"],
+            shot_count=data["shot_count"],
+            holed=data.get("holed", False),
+            conceded=data.get("conceded", False),
+            penalty_strokes=data.get("penalty_strokes", 0),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class StrokeAdvantage:
     """Represents stroke advantages for a player on a specific hole"""
 
@@ -124,8 +271,27 @@ class StrokeAdvantage:
     net_score: float | None = None  # Gross score minus strokes received
     stroke_index: int | None = None  # Hole's stroke index (1-18)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "player_id": self.player_id,
+            "handicap": self.handicap,
+            "strokes_received": self.strokes_received,
+            "net_score": self.net_score,
+            "stroke_index": self.stroke_index,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StrokeAdvantage":
+        return cls(
+            player_id=data["player_id"],
+            handicap=data["handicap"],
+            strokes_received=data["strokes_received"],
+            net_score=data.get("net_score"),
+            stroke_index=data.get("stroke_index"),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class HoleState:
     """Complete state for a single hole with comprehensive shot-by-shot tracking"""
 
@@ -162,6 +328,78 @@ class HoleState:
     partnership_deadline_passed: bool = False  # Can no longer request partnerships
     invitation_windows: dict[str, bool] = field(default_factory=dict)  # Track who can still be invited
 
+    # Set when a side flushes (concedes) the hole
+    status: str | None = None
+    conceded: bool = False
+    conceding_player: str | int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hole_number": self.hole_number,
+            "hitting_order": list(self.hitting_order),
+            "teams": self.teams.to_dict(),
+            "betting": self.betting.to_dict(),
+            "ball_positions": {pid: pos.to_dict() for pid, pos in self.ball_positions.items()},
+            "current_order_of_play": list(self.current_order_of_play),
+            "line_of_scrimmage": self.line_of_scrimmage,
+            "next_player_to_hit": self.next_player_to_hit,
+            "stroke_advantages": {pid: adv.to_dict() for pid, adv in self.stroke_advantages.items()},
+            "hole_par": self.hole_par,
+            "stroke_index": self.stroke_index,
+            "hole_yardage": self.hole_yardage,
+            "hole_difficulty": self.hole_difficulty,
+            "scores": dict(self.scores),
+            "shots_completed": dict(self.shots_completed),
+            "balls_in_hole": list(self.balls_in_hole),
+            "concessions": dict(self.concessions),
+            "points_awarded": dict(self.points_awarded),
+            "current_shot_number": self.current_shot_number,
+            "hole_complete": self.hole_complete,
+            "wagering_closed": self.wagering_closed,
+            "tee_shots_complete": self.tee_shots_complete,
+            "partnership_deadline_passed": self.partnership_deadline_passed,
+            "invitation_windows": dict(self.invitation_windows),
+            "status": self.status,
+            "conceded": self.conceded,
+            "conceding_player": self.conceding_player,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], hole_number: int | None = None) -> "HoleState":
+        return cls(
+            hole_number=hole_number if hole_number is not None else data["hole_number"],
+            hitting_order=data.get("hitting_order", []),
+            teams=TeamFormation.from_dict(data.get("teams", {})),
+            betting=BettingState.from_dict(data.get("betting", {})),
+            ball_positions={
+                pid: BallPosition.from_dict(pos) for pid, pos in data.get("ball_positions", {}).items() if pos
+            },
+            current_order_of_play=data.get("current_order_of_play", []),
+            line_of_scrimmage=data.get("line_of_scrimmage"),
+            next_player_to_hit=data.get("next_player_to_hit"),
+            stroke_advantages={
+                pid: StrokeAdvantage.from_dict(adv) for pid, adv in data.get("stroke_advantages", {}).items() if adv
+            },
+            hole_par=data.get("hole_par", 4),
+            stroke_index=data.get("stroke_index", 10),
+            hole_yardage=data.get("hole_yardage", 400),
+            hole_difficulty=data.get("hole_difficulty", "Medium"),
+            scores=data.get("scores", {}),
+            shots_completed=data.get("shots_completed", {}),
+            balls_in_hole=data.get("balls_in_hole", []),
+            concessions=data.get("concessions", {}),
+            points_awarded=data.get("points_awarded", {}),
+            current_shot_number=data.get("current_shot_number", 1),
+            hole_complete=data.get("hole_complete", False),
+            wagering_closed=data.get("wagering_closed", False),
+            tee_shots_complete=data.get("tee_shots_complete", 0),
+            partnership_deadline_passed=data.get("partnership_deadline_passed", False),
+            invitation_windows=data.get("invitation_windows", {}),
+            status=data.get("status"),
+            conceded=data.get("conceded", False),
+            conceding_player=data.get("conceding_player"),
+        )
+
     def set_hole_info(
         self,
         par: int | None = None,
@@ -648,15 +886,4 @@ class WGPHoleProgression:
 
     def get_timeline_events(self) -> list[dict[str, Any]]:
         """Get timeline events as serializable dictionaries"""
-        return [
-            {
-                "id": event.id,
-                "timestamp": event.timestamp.isoformat(),
-                "type": event.type,
-                "description": event.description,
-                "details": event.details,
-                "player_id": event.player_id,
-                "player_name": event.player_name,
-            }
-            for event in self.timeline_events
-        ]
+        return [event.to_dict() for event in self.timeline_events]
@@ -11,9 +11,12 @@ from typing import Any
 
 from fastapi import HTTPException
 
+from ..database import SessionLocal, run_db
 from ..managers.rule_manager import RuleManager
 from ..schemas import ActionResponse
+from ..services.statistics_service import StatisticsService
 from ..state.course_manager import CourseManager
+from ..utils.season import current_season
 from ..utils.time import utc_now
 from ..validators import GameStateValidator, HandicapValidator
 from ..wolf_goat_pig import Player, WolfGoatPigGame
@@ -34,6 +37,51 @@ game: WolfGoatPigGame | None = None
 # ---------------------------------------------------------------------------
 
 
+def _record_hole_events(
+    game: WolfGoatPigGame, db: Any, hole_number: int, scores: dict[str, Any], points_changes: dict[str, Any]
+) -> None:
+    """Upsert the hole's HoleEvent rows and replay all events back into the game."""
+    from ..models import HoleEvent
+
+    recorded_at = utc_now().isoformat()
+
+    for player_id, gross_score in scores.items():
+        existing = (
+            db.query(HoleEvent)
+            .filter(
+                HoleEvent.game_id == game.game_id,
+                HoleEvent.hole_number == hole_number,
+                HoleEvent.player_id == player_id,
+            )
+            .first()
+        )
+        player_quarters = points_changes.get(player_id, 0)
+        if existing:
+            existing.score = gross_score
+            existing.quarters = player_quarters
+            existing.recorded_at = recorded_at
+        else:
+            db.add(
+                HoleEvent(
+                    game_id=game.game_id,
+                    hole_number=hole_number,
+                    player_id=player_id,
+                    score=gross_score,
+                    quarters=player_quarters,
+                    recorded_at=recorded_at,
+                )
+            )
+    db.commit()
+
+    all_events = db.query(HoleEvent).filter(HoleEvent.game_id == game.game_id).order_by(HoleEvent.hole_number).all()
+    game.apply_hole_events(
+        [
+            {"hole_number": e.hole_number, "player_id": e.player_id, "score": e.score, "quarters": e.quarters}
+            for e in all_events
+        ]
+    )
+
+
 def _get_current_captain_id() -> str | None:
     """Best-effort lookup for the active captain id across legacy and unified state."""
     try:
@@ -532,49 +580,7 @@ async def handle_enter_hole_scores(game: WolfGoatPigGame, payload: dict[str, Any
         result = game.enter_hole_scores(scores)
 
         if db is not None:
-            from ..models import HoleEvent
-            from ..utils.time import utc_now as _utc_now
-
-            points_changes = result.get("points_changes", {})
-            recorded_at = _utc_now().isoformat()
-
-            for player_id, gross_score in scores.items():
-                existing = (
-                    db.query(HoleEvent)
-                    .filter(
-                        HoleEvent.game_id == game.game_id,
-                        HoleEvent.hole_number == hole_number,
-                        HoleEvent.player_id == player_id,
-                    )
-                    .first()
-                )
-                player_quarters = points_changes.get(player_id, 0)
-                if existing:
-                    existing.score = gross_score
-                    existing.quarters = player_quarters
-                    existing.recorded_at = recorded_at
-                else:
-                    db.add(
-                        HoleEvent(
-                            game_id=game.game_id,
-                            hole_number=hole_number,
-                            player_id=player_id,
-                            score=gross_score,
-                            quarters=player_quarters,
-                            recorded_at=recorded_at,
-                        )
-                    )
-            db.commit()
-
-            all_events = (
-                db.query(HoleEvent).filter(HoleEvent.game_id == game.game_id).order_by(HoleEvent.hole_number).all()
-            )
-            game.apply_hole_events(
-                [
-                    {"hole_number": e.hole_number, "player_id": e.player_id, "score": e.score, "quarters": e.quarters}
-                    for e in all_events
-                ]
-            )
+            await run_db(_record_hole_events, game, db, hole_number, scores, result.get("points_changes", {}))
 
         updated_state = game.get_game_state()
 
@@ -729,10 +735,22 @@ async def handle_calculate_hole_points(payload: dict[str, Any]) -> ActionRespons
         raise HTTPException(status_code=500, detail=f"Failed to calculate hole points: {e!s}")
 
 
+def _season_aggregations() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """This season's game results and sheet standings (season store, else the database)."""
+    db = SessionLocal()
+    try:
+        stats = StatisticsService(db)
+        season = current_season()
+        return stats.get_season_player_results(season), stats.get_season_standings(season)
+    finally:
+        db.close()
+
+
 async def handle_get_advanced_analytics(game: WolfGoatPigGame, payload: dict[str, Any]) -> ActionResponse:
     """Handle getting advanced analytics dashboard data"""
     try:
-        analytics = game.get_advanced_analytics()
+        season_results, season_standings = await run_db(_season_aggregations)
+        analytics = game.get_advanced_analytics(season_results, season_standings)
         updated_state = game.get_game_state()
 
         # Include analytics data in the updated game state
@@ -8,8 +8,17 @@ from ..domain.game_types import Player
 class AnalyticsMixin:
     """Read-only analytics derived from game state."""
 
-    def get_advanced_analytics(self) -> dict[str, Any]:
-        """Get comprehensive analytics dashboard data"""
+    def get_advanced_analytics(
+        self,
+        season_results: list[dict[str, Any]] | None = None,
+        season_standings: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Get comprehensive analytics dashboard data
+
+        ``season_results`` / ``season_standings`` are the season aggregations
+        from ``StatisticsService`` (season store, else the database); they
+        feed ``season_form``.
+        """
         return {
             "performance_trends": self._get_performance_trends(),
             "betting_analysis": self._get_betting_analysis(),
@@ -17,6 +26,22 @@ class AnalyticsMixin:
             "game_statistics": self._get_game_statistics(),
             "risk_analysis": self._get_risk_analysis(),
             "prediction_models": self._get_prediction_models(),
+            "season_form": self._get_season_form(season_results or [], season_standings or []),
+        }
+
+    def _get_season_form(
+        self, season_results: list[dict[str, Any]], season_standings: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Each player's season so far, matched by name (None where they have no rows)"""
+        results = {row["player_name"]: row for row in season_results}
+        standings = {row["member"]: row for row in season_standings}
+        return {
+            player.id: {
+                "name": player.name,
+                "games": results.get(player.name),
+                "sheet": standings.get(player.name),
+            }
+            for player in self.players
         }
 
     def _get_performance_trends(self) -> dict[str, Any]:
@@ -2,6 +2,7 @@
 
 import logging
 import random
+from typing import Any
 
 from ..domain.game_types import (
     BettingState,
@@ -47,6 +48,17 @@ class HoleSetupMixin:
         """Get starting hole for Hoepfinger phase based on player count"""
         return {4: 17, 5: 16, 6: 13}[self.player_count]
 
+    def _get_course_hole_info(self, hole_number: int) -> dict[str, Any]:
+        """Course data for one hole, read from this game's own course snapshot.
+
+        Falls back to the course manager's current selection for games that
+        predate snapshots. Raises KeyError when the hole cannot be resolved.
+        """
+        snapshot = getattr(self, "course_snapshot", None)
+        if snapshot is not None:
+            return snapshot.hole_info(hole_number)
+        return self.course_manager.get_hole_info(hole_number)
+
     def _initialize_hole(self, hole_number: int) -> None:
         """Initialize a new hole with proper state"""
         # Validate hole number using GameStateValidator
@@ -98,7 +110,7 @@ class HoleSetupMixin:
 
         if self.course_manager and hasattr(self.course_manager, "get_hole_info"):
             try:
-                hole_info = self.course_manager.get_hole_info(hole_number)
+                hole_info = self._get_course_hole_info(hole_number)
                 hole_par = hole_info.get("par")
                 hole_yardage = hole_info.get("yards")
                 stroke_index = hole_info.get("stroke_index", stroke_index)
@@ -24,10 +24,8 @@ class PartnershipMixin:
 
         for player in self.players:
             if player.id != human_player_id and player.id in self.computer_players:
-                computer_player = self.computer_players[player.id]
-
                 # Check if computer player wants to request human as partner
-                if computer_player.should_request_partner(human_player_id, self.get_game_state()):
+                if self.should_request_partner(human_player_id):
                     requests.append(
                         {
                             "requesting_player": player.id,
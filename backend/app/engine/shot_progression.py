@@ -3,6 +3,7 @@
 import random
 from typing import Any
 
+from ..domain.computer_policy import computer_policy
 from ..domain.game_types import HoleState, TeamFormation, WGPBettingOpportunity, WGPHoleProgression, WGPShotResult
 
 
@@ -286,13 +287,18 @@ class ShotProgressionMixin:
         if not hasattr(self, "computer_players"):
             return {}
 
+        policy = computer_policy()
         tendencies = {}
         for player_id, computer_player in self.computer_players.items():
             personality = computer_player.personality
+            situation = self.policy_situation(player_id)
             tendencies[player_id] = {
                 "personality": personality,
                 "betting_style": self._get_personality_betting_style(personality),
                 "double_acceptance": self._get_personality_double_tendency(personality),
+                # From the same policy table the player decides with, for the current hole
+                "double_offer_rate": round(policy.probability(personality, "offer_double", situation), 2),
+                "double_accept_rate": round(policy.probability(personality, "accept_double", situation), 2),
             }
 
         return tendencies
@@ -3,6 +3,7 @@
 import random
 from typing import Any
 
+from ..domain.computer_policy import DEFAULT_PERSONALITY, Situation, computer_policy
 from ..domain.game_types import Player, TeamFormation
 
 
@@ -27,11 +28,7 @@ class SimulationMixin:
 
         if partner_id in self.computer_players:
             # Computer partner - simulate their decision
-            computer_player = self.computer_players[partner_id]
-            accept = computer_player.should_accept_partnership(
-                next(p for p in self.players if p.id == human_player_id),
-                self.get_game_state(),
-            )
+            accept = self.should_accept_partnership(player_id=partner_id)
 
             if accept:
                 # Computer accepts partnership
@@ -117,11 +114,7 @@ class SimulationMixin:
             # Check if target player is computer or human
             if target_player_id in self.computer_players:
                 # Computer partner - simulate their decision
-                computer_player = self.computer_players[target_player_id]
-                accept = computer_player.should_accept_partnership(
-                    next(p for p in self.players if p.id == human_player_id),
-                    self.get_game_state(),
-                )
+                accept = self.should_accept_partnership(player_id=target_player_id)
 
                 if accept:
                     # Computer accepts partnership
@@ -179,68 +172,79 @@ class SimulationMixin:
         }
 
     # AI Decision Making Methods (moved from WGPComputerPlayer)
+    #
+    # Each decision is a lookup in the precomputed policy table
+    # (app/domain/computer_policy.py) for the deciding player's personality
+    # and situation. The game_state arguments are kept for older callers and
+    # ignored: the situation is read straight off the engine.
+
+    def policy_situation(self, player_id: str) -> Situation:
+        """Quantized decision point for one player on the current hole."""
+        player = next(p for p in self.players if p.id == player_id)
+        count = len(self.players)
+        hole_state = self.hole_states.get(self.current_hole)
+        return Situation.of(
+            phase=self.game_phase,
+            hole=self.current_hole,
+            wager=hole_state.betting.current_wager if hole_state else 1,
+            standing=player.points - sum(p.points for p in self.players) / count,
+            spread=player.handicap - sum(p.handicap for p in self.players) / count,
+        )
 
-    def should_accept_partnership(self, captain: Player, game_state: dict) -> bool:
-        """Decide whether to accept partnership request"""
-        # For simulation purposes, use a simple decision based on handicap difference
-        # In a real implementation, this would be called on a specific player
-        handicap_diff = abs(captain.handicap - 12.0)  # Assume average handicap
-        current_position = 2  # Assume middle position
-
-        # Simple decision logic
-        if handicap_diff < 8 or current_position > 2:
-            return True
-        return random.random() > 0.4
-
-    def should_request_partner(self, target_player_id: str, game_state: dict) -> bool:
+    def decision_probability(self, decision: str, player_id: str) -> float:
+        """Chance that ``player_id`` takes ``decision`` (see computer_policy.DECISIONS)."""
+        computer_player = self.computer_players.get(player_id)
+        personality = computer_player.personality if computer_player else DEFAULT_PERSONALITY
+        return computer_policy().probability(personality, decision, self.policy_situation(player_id))
+
+    def _decides(self, decision: str, player_id: str | None) -> bool:
+        player_id = player_id or self.hole_states[self.current_hole].teams.captain
+        return random.random() < self.decision_probability(decision, player_id)
+
+    def should_accept_partnership(
+        self, captain: Player | None = None, game_state: dict | None = None, player_id: str | None = None
+    ) -> bool:
+        """Decide whether player_id accepts the captain's partnership request"""
+        if player_id is None:
+            pending = self.hole_states[self.current_hole].teams.pending_request or {}
+            player_id = pending.get("requested")
+        return self._decides("accept_partnership", player_id)
+
+    def should_request_partner(self, target_player_id: str, game_state: dict | None = None) -> bool:
         """Determine if this computer player should request a specific player as partner"""
         # This would be used if computer players could request human as partner
         # For now, computer players don't actively request partners
         return False
 
-    def should_go_solo(self, game_state: dict) -> bool:
-        """Decide whether to go solo as captain"""
-        # For simulation purposes, use simple decision logic
-        current_position = 2  # Assume middle position
-        individual_skill = 0.5  # Assume average skill
-
-        # Simple decision logic
-        if individual_skill > 0.4:
-            return random.random() > 0.7
-        return current_position > 3
-
-    def should_use_float(self, game_state: dict) -> bool:
-        """Decide whether to use float as captain"""
-        # For simulation purposes, use simple decision logic
-        current_position = 2  # Assume middle position
-        hole_confidence = 0.6  # Assume moderate confidence
-
-        # Simple decision logic
-        if hole_confidence > 0.6:
-            return random.random() > 0.5
-        return current_position > 3
-
-    def should_offer_double(self, game_state: dict) -> bool:
-        """Decide whether to offer a double"""
-        # For simulation purposes, use simple decision logic
-        team_advantage = 0.5  # Assume moderate advantage
-        current_position = 2  # Assume middle position
-
-        # Simple decision logic
-        if team_advantage > 0.5:
-            return random.random() > 0.3
-        return current_position > 2
-
-    def should_accept_double(self, game_state: dict) -> bool:
-        """Decide whether to accept a double"""
-        # For simulation purposes, use simple decision logic
-        current_points = 0  # Assume neutral position
-        hole_advantage = 0.1  # Assume slight advantage
-
-        # Simple decision logic
-        if hole_advantage > 0:
-            return random.random() > 0.4
-        return current_points < 0
+    def should_go_solo(self, game_state: dict | None = None, player_id: str | None = None) -> bool:
+        """Decide whether to go solo as captain (defaults to the current captain)"""
+        return self._decides("go_solo", player_id)
+
+    def should_use_float(self, game_state: dict | None = None, player_id: str | None = None) -> bool:
+        """Decide whether to use float as captain (defaults to the current captain)"""
+        return self._decides("use_float", player_id)
+
+    def should_offer_double(self, game_state: dict | None = None, player_id: str | None = None) -> bool:
+        """Decide whether to offer a double (defaults to the current captain)"""
+        return self._decides("offer_double", player_id)
+
+    def should_accept_double(self, game_state: dict | None = None, player_id: str | None = None) -> bool:
+        """Decide whether to accept a double (defaults to a player on the side being doubled)"""
+        return self._decides("accept_double", player_id or self._double_responder())
+
+    def _double_responder(self) -> str:
+        """First player on a side other than the one that offered the last double."""
+        hole_state = self.hole_states[self.current_hole]
+        teams = hole_state.teams
+        history = hole_state.betting.doubles_history
+        offering = history[-1]["offering_player"] if history else teams.captain
+        sides = (
+            [[teams.solo_player], teams.opponents] if teams.type == "solo" else [teams.team1, teams.team2, teams.team3]
+        )
+        for side in sides:
+            if side and side[0] and offering not in side:
+                return side[0]
+        raise ValueError("No side to answer a double before teams are formed; pass player_id")
 
     # Compatibility methods for old simulation API
     def setup_simulation(self, human_player, computer_configs, course_name=None):
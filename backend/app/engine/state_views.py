@@ -23,7 +23,7 @@ class StateViewsMixin:
                 pass
             else:
                 try:
-                    current_hole_info = self.course_manager.get_hole_info(self.current_hole)
+                    current_hole_info = self._get_course_hole_info(self.current_hole)
                     hole_info = {
                         "hole_par": current_hole_info.get("par", 4),
                         "hole_distance": current_hole_info.get("yards", 400),
@@ -59,9 +59,7 @@ class StateViewsMixin:
             "game_phase": self.game_phase.value,
             "player_count": self.player_count,
             **hole_info,  # Include hole info at top level
-            "course_name": (
-                self.course_manager.selected_course_name if self.course_manager else getattr(self, "course_name", None)
-            ),
+            "course_name": self._get_course_name(),
             "players": [
                 {
                     "id": p.id,
@@ -125,6 +123,15 @@ class StateViewsMixin:
 
         return history
 
+    def _get_course_name(self) -> str | None:
+        """Name of the course this game is played on (its snapshot, else the manager's selection)."""
+        snapshot = getattr(self, "course_snapshot", None)
+        if snapshot is not None:
+            return snapshot.name
+        if self.course_manager:
+            return self.course_manager.selected_course_name
+        return getattr(self, "course_name", None)
+
     def _get_hole_state_summary(self) -> dict[str, Any]:
         """Get summary of current hole state"""
         hole_state = self.hole_states.get(self.current_hole)
@@ -259,7 +266,7 @@ class StateViewsMixin:
         for hole_num in range(1, 19):
             try:
                 if hasattr(self.course_manager, "get_hole_info"):
-                    hole_info = self.course_manager.get_hole_info(hole_num)
+                    hole_info = self._get_course_hole_info(hole_num)
                 else:
                     raise AttributeError("course_manager does not have get_hole_info method")
                 holes_info.append(
@@ -315,7 +322,8 @@ class StateViewsMixin:
         net_handicaps = HandicapValidator.calculate_net_handicaps(player_handicaps)
 
         # Get hole handicaps (stroke indexes) for the course - returns list indexed 0-17 for holes 1-18
-        hole_handicaps = self.course_manager.get_hole_handicaps()
+        snapshot = getattr(self, "course_snapshot", None)
+        hole_handicaps = list(snapshot.handicaps) if snapshot else self.course_manager.get_hole_handicaps()
         if not hole_handicaps:
             # Fallback to default 1-18 if course data unavailable
             hole_handicaps = list(range(1, 19))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import traceback
@@ -20,7 +21,9 @@ from pydantic import BaseModel
 
 from . import database, models, schemas
 from .badge_routes import router as badge_router
+from .boot import BootTimer, prepare_database
 from .migrations_routes import router as migrations_router
+from .observability.metrics import MetricsMiddleware, instrument_engine
 from .post_hole_analytics import PostHoleAnalyzer
 
 # Import routers
@@ -71,90 +74,48 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("🐺 Wolf Goat Pig API starting up...")
     logger.info(f"ENVIRONMENT: {os.getenv('ENVIRONMENT')}")
 
+    timer = BootTimer()
+
     # Initialize Post-Hole Analyzer and Course Manager (deferred from import time)
     if get_post_hole_analyzer() is None:
         set_post_hole_analyzer(PostHoleAnalyzer())
     if get_course_manager() is None:
         set_course_manager(CourseManager())
 
-    # Initialize database
-    try:
-        database.init_db()
-        logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-        raise
-
-    # Apply pending SQL migrations (create_all never ALTERs existing tables —
-    # without this, migrations/*.sql files silently drift from production)
-    try:
-        from .migrations_runner import run_sql_migrations
-
-        result = run_sql_migrations(database.engine)
-        if result.get("applied"):
-            logger.info(f"SQL migrations applied: {result['applied']}")
-    except Exception as e:
-        logger.error(f"SQL migration runner failed (continuing startup): {e}")
-
-    # Seed badges if table is empty
-    try:
-        from .badge_seeds import seed_badges
-        from .database import SessionLocal
-        from .models import Badge as _Badge
-
-        _seed_db = SessionLocal()
-        try:
-            if _seed_db.query(_Badge).count() == 0:
-                logger.info("🏅 Seeding badges...")
-                seed_badges(_seed_db)
-                logger.info("✅ Badges seeded")
-            else:
-                logger.info("🏅 Badges already seeded")
-        finally:
-            _seed_db.close()
-    except Exception as e:
-        logger.error(f"Badge seeding failed: {e}")
-
-    # Seed the canonical legacy roster if empty (mirrors Jeff's tee-sheet dropdown)
-    try:
-        from .database import SessionLocal
-        from .services.legacy_player_service import seed_roster_if_empty
-
-        _roster_db = SessionLocal()
-        try:
-            inserted = seed_roster_if_empty(_roster_db)
-            if inserted:
-                logger.info(f"⛳ Seeded {inserted} canonical legacy players")
-            else:
-                logger.info("⛳ Legacy roster already seeded")
-        finally:
-            _roster_db.close()
-    except Exception as e:
-        logger.error(f"Legacy roster seeding failed: {e}")
-
     # In-process schedulers assume a single long-lived process. On Cloud Run
     # (autoscaled, many instances) set RUN_INPROCESS_SCHEDULERS=false and let
     # Cloud Scheduler drive /internal/jobs/* instead (Phase 4). Default true
     # preserves local and test behavior.
     run_inprocess_schedulers = os.getenv("RUN_INPROCESS_SCHEDULERS", "true").lower() == "true"
 
-    # Initialize email scheduler if enabled
-    if not run_inprocess_schedulers:
-        logger.info(
-            "⏭️ In-process schedulers disabled (RUN_INPROCESS_SCHEDULERS=false) — Cloud Scheduler drives /internal/jobs/*"
-        )
-    elif os.getenv("ENABLE_EMAIL_NOTIFICATIONS", "true").lower() == "true":
-        try:
-            logger.info("📧 Initializing email scheduler...")
-            result = await initialize_email_scheduler()
-            if result["status"] == "success":
-                logger.info("✅ Email scheduler initialized")
-            else:
-                logger.warning(f"⚠️ Email scheduler: {result['message']}")
-        except Exception as e:
-            logger.error(f"❌ Email scheduler initialization failed: {e}")
-    else:
-        logger.info("📧 Email notifications disabled")
+    async def start_email_scheduler() -> None:
+        if not run_inprocess_schedulers:
+            logger.info(
+                "⏭️ In-process schedulers disabled (RUN_INPROCESS_SCHEDULERS=false) — Cloud Scheduler drives /internal/jobs/*"
+            )
+        elif os.getenv("ENABLE_EMAIL_NOTIFICATIONS", "true").lower() == "true":
+            with timer.phase("email_scheduler"):
+                try:
+                    logger.info("📧 Initializing email scheduler...")
+                    result = await initialize_email_scheduler()
+                    if result["status"] == "success":
+                        logger.info("✅ Email scheduler initialized")
+                    else:
+                        logger.warning(f"⚠️ Email scheduler: {result['message']}")
+                except Exception as e:
+                    logger.error(f"❌ Email scheduler initialization failed: {e}")
+        else:
+            logger.info("📧 Email notifications disabled")
+
+    # Schema preparation (skipped when the stored fingerprint matches) runs in
+    # DB worker threads; the scheduler only registers timers, so it starts
+    # alongside rather than after it.
+    try:
+        prepared, _ = await asyncio.gather(prepare_database(timer=timer), start_email_scheduler())
+        logger.info("Database initialized successfully" + (" (fast path)" if prepared["fast_path"] else ""))
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}")
+        raise
 
     # Kick off an immediate legacy rounds sync on startup (non-blocking). Skipped
     # when in-process schedulers are off, so autoscaled instances don't each fire
@@ -171,6 +132,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.warning(f"Legacy rounds startup sync failed to launch: {e}")
 
+    logger.info(f"⏱️ Boot {timer.summary()}")
     logger.info("🚀 Wolf Goat Pig API startup completed successfully!")
 
     yield  # Application runs here
@@ -265,6 +227,11 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Outermost middleware, so latency covers CORS and the exception handlers too.
+app.add_middleware(MetricsMiddleware)
+if database.engine is not None:
+    instrument_engine(database.engine)
+
 # Include badge system routes
 app.include_router(badge_router)
 
@@ -394,7 +361,7 @@ async def run_seeding_process():
         logger.info("🌱 Starting data seeding process...")
 
         # Run seeding in a try-catch to prevent startup failure
-        seeding_results = seed_all_data(force_reseed=False)
+        seeding_results = await database.run_db(seed_all_data, force_reseed=False)
 
         if seeding_results["status"] == "success":
             logger.info("✅ Data seeding completed successfully")
@@ -7,14 +7,23 @@ Contains:
 - Logging configuration
 """
 
-from .caching import SimpleCache, analytics_cache, leaderboard_cache, sheet_sync_cache
+from .caching import (
+    SimpleCache,
+    analytics_cache,
+    game_count_cache,
+    leaderboard_cache,
+    public_profile_cache,
+    sheet_sync_cache,
+)
 from .rate_limiting import RateLimiter, rate_limiter
 
 __all__ = [
     "RateLimiter",
     "SimpleCache",
     "analytics_cache",
+    "game_count_cache",
     "leaderboard_cache",
+    "public_profile_cache",
     "rate_limiter",
     "sheet_sync_cache",
 ]
@@ -123,3 +123,5 @@ class SimpleCache:
 sheet_sync_cache = SimpleCache(default_ttl_seconds=3600)  # 1 hour for sheet sync
 analytics_cache = SimpleCache(default_ttl_seconds=300)  # 5 minutes for analytics
 leaderboard_cache = SimpleCache(default_ttl_seconds=600)  # 10 minutes for leaderboards
+game_count_cache = SimpleCache(default_ttl_seconds=60)  # 1 minute for game list totals
+public_profile_cache = SimpleCache(default_ttl_seconds=300)  # 5 minutes for public player profiles
@@ -40,7 +40,7 @@ def verify_admin_key(x_admin_key: str = Header(...)) -> bool:
 
 
 @router.get("/status")
-async def get_migration_status(db: Session = Depends(get_db), _: bool = Depends(verify_admin_key)) -> dict[str, Any]:
+def get_migration_status(db: Session = Depends(get_db), _: bool = Depends(verify_admin_key)) -> dict[str, Any]:
     """Get current database schema status.
 
     Returns information about existing tables and columns to help
@@ -88,7 +88,7 @@ async def get_migration_status(db: Session = Depends(get_db), _: bool = Depends(
 
 
 @router.post("/run")
-async def run_migration(
+def run_migration(
     migration_name: str,
     db: Session = Depends(get_db),
     _: bool = Depends(verify_admin_key),
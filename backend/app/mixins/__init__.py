@@ -1,5 +1,19 @@
 """Mixins for Wolf Goat Pig game engine."""
 
+from .persistence_backends import (
+    DatabasePersistence,
+    InMemoryPersistence,
+    NullPersistence,
+    PersistenceBackend,
+    StoredGame,
+)
 from .persistence_mixin import PersistenceMixin
 
-__all__ = ["PersistenceMixin"]
+__all__ = [
+    "DatabasePersistence",
+    "InMemoryPersistence",
+    "NullPersistence",
+    "PersistenceBackend",
+    "PersistenceMixin",
+    "StoredGame",
+]
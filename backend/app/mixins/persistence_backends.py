@@ -0,0 +1,177 @@
+"""
+Storage backends for PersistenceMixin.
+
+A game engine is constructed with one backend and keeps it for its lifetime:
+
+- DatabasePersistence: the default. Game state lives in GameStateModel and
+  completed games become GameRecord/GamePlayerResult rows.
+- InMemoryPersistence: a dict keyed by game_id. Lets tests and what-if tools
+  save and reload games without a database.
+- NullPersistence: stores nothing and skips serialization entirely, so batch
+  simulations can build engines without touching SQLAlchemy.
+
+The database backend imports the ORM on first use; the other two never do.
+"""
+
+from __future__ import annotations
+
+import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.orm import Session
+
+
+@dataclass
+class StoredGame:
+    """A saved game as a backend returns it."""
+
+    state: dict[str, Any]
+    created_at: str
+
+
+class PersistenceBackend(ABC):
+    """
+    Interface the mixin talks to. Methods raise on failure; the mixin decides
+    how a failure is reported so every backend degrades the same way.
+    """
+
+    # False means save() discards its input, so callers need not build it.
+    stores_state = True
+
+    @abstractmethod
+    def load(self, game_id: str) -> StoredGame | None:
+        pass
+
+    @abstractmethod
+    def save(self, game_id: str, state: dict[str, Any], created_at: str, updated_at: str) -> None:
+        pass
+
+    @abstractmethod
+    def record_completion(self, record: dict[str, Any], player_results: list[dict[str, Any]]) -> None:
+        """Store the permanent result of a finished game."""
+
+    def close(self) -> None:  # noqa: B027 - optional; only DatabasePersistence holds anything
+        """Release any resources held by the backend."""
+
+
+class NullPersistence(PersistenceBackend):
+    """Keeps nothing: every game starts fresh and every save is dropped."""
+
+    stores_state = False
+
+    def load(self, game_id: str) -> StoredGame | None:
+        return None
+
+    def save(self, game_id: str, state: dict[str, Any], created_at: str, updated_at: str) -> None:
+        pass
+
+    def record_completion(self, record: dict[str, Any], player_results: list[dict[str, Any]]) -> None:
+        pass
+
+
+@dataclass
+class InMemoryPersistence(PersistenceBackend):
+    """
+    Keeps saved states and completion records in dicts.
+
+    States are deep-copied on the way in and out, so a reloaded engine never
+    shares containers with the one that saved it. Pass the same instance to
+    several engines to let them see each other's saves.
+    """
+
+    games: dict[str, StoredGame] = field(default_factory=dict)
+    completed: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def load(self, game_id: str) -> StoredGame | None:
+        stored = self.games.get(game_id)
+        if stored is None:
+            return None
+        return StoredGame(state=copy.deepcopy(stored.state), created_at=stored.created_at)
+
+    def save(self, game_id: str, state: dict[str, Any], created_at: str, updated_at: str) -> None:
+        existing = self.games.get(game_id)
+        self.games[game_id] = StoredGame(
+            state=copy.deepcopy(state), created_at=existing.created_at if existing else created_at
+        )
+
+    def record_completion(self, record: dict[str, Any], player_results: list[dict[str, Any]]) -> None:
+        self.completed[record["game_id"]] = {**copy.deepcopy(record), "player_results": copy.deepcopy(player_results)}
+
+
+class DatabasePersistence(PersistenceBackend):
+    """
+    Stores state as JSON in GameStateModel, one row per game_id.
+
+    Opens its session on first use (from session_factory, SessionLocal by
+    default) and rolls it back when a write fails so the engine can carry on.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] | None = None) -> None:
+        self._session_factory = session_factory
+        self._session: Session | None = None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            if self._session_factory is None:
+                from ..database import SessionLocal
+
+                self._session_factory = SessionLocal
+            self._session = self._session_factory()
+        return self._session
+
+    def load(self, game_id: str) -> StoredGame | None:
+        from ..models import GameStateModel
+
+        obj = self.session.query(GameStateModel).filter(GameStateModel.game_id == game_id).first()
+        if not obj or not obj.state:
+            return None
+        # Use str() to convert Column types
+        return StoredGame(state=cast("dict[str, Any]", obj.state), created_at=str(obj.created_at))
+
+    def save(self, game_id: str, state: dict[str, Any], created_at: str, updated_at: str) -> None:
+        from ..models import GameStateModel
+
+        session = self.session
+        try:
+            updated = (
+                session.query(GameStateModel)
+                .filter(GameStateModel.game_id == game_id)
+                .update({"state": state, "updated_at": updated_at})
+            )
+            if not updated:
+                session.add(GameStateModel(game_id=game_id, state=state, created_at=created_at, updated_at=updated_at))
+            session.commit()
+        except Exception:
+            self._rollback()
+            raise
+
+    def record_completion(self, record: dict[str, Any], player_results: list[dict[str, Any]]) -> None:
+        from ..models import GamePlayerResult, GameRecord
+
+        session = self.session
+        try:
+            game_record = GameRecord(**record)
+            session.add(game_record)
+            for player_result in player_results:
+                session.add(GamePlayerResult(**player_result, game_record_id=game_record.id))
+            session.commit()
+        except Exception:
+            self._rollback()
+            raise
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _rollback(self) -> None:
+        try:
+            self.session.rollback()
+        except Exception as rollback_error:
+            print(f"⚠️ Rollback failed: {rollback_error}")
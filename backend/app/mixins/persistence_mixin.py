@@ -1,24 +1,24 @@
 """
 Persistence Mixin for Wolf Goat Pig Game State
 
-Provides database save/load functionality that can be mixed into any game engine class.
+Provides save/load functionality that can be mixed into any game engine class.
 Extracted from GameState to enable persistence in WolfGoatPigGame.
 """
 
 import uuid
 from datetime import datetime
-from typing import Any, cast
+from typing import Any
 
-from sqlalchemy.orm import Session
-
-from ..database import SessionLocal
-from ..models import GamePlayerResult, GameRecord, GameStateModel
 from ..utils.time import utc_now
+from .persistence_backends import DatabasePersistence, PersistenceBackend
 
 
 class PersistenceMixin:
     """
-    Mixin that adds database persistence capabilities to a game engine.
+    Mixin that adds persistence capabilities to a game engine.
+
+    Where state is kept is up to the PersistenceBackend chosen at construction
+    (database by default; see persistence_backends for in-memory and no-op).
 
     Required attributes on the class using this mixin:
     - game_id: str
@@ -29,90 +29,56 @@ class PersistenceMixin:
     - _deserialize(data: Dict[str, Any]): Restore game state from dict
     """
 
-    def __init_persistence__(self, game_id: str | None = None) -> None:
+    def __init_persistence__(self, game_id: str | None = None, persistence: PersistenceBackend | None = None) -> None:
         """
         Initialize persistence layer. Call this from your __init__.
 
         Args:
             game_id: Optional game ID. If None, generates new UUID.
+            persistence: Storage backend. If None, uses DatabasePersistence.
         """
         self.game_id = game_id or str(uuid.uuid4())
-        self._db_session: Session = SessionLocal()
+        self._persistence = persistence if persistence is not None else DatabasePersistence()
         self._game_start_time = utc_now().isoformat()
         self._game_completed = False
 
-        # Try to load existing game from DB
+        # Try to load existing game from storage
         self._load_from_db()
 
     def _save_to_db(self):
         """
-        Save the current game state as JSON in the database.
+        Save the current game state through the persistence backend.
 
         Uses game_id as unique identifier. Creates new record if not exists,
         otherwise updates existing record.
 
-        Gracefully handles DB failures - game continues in memory if DB is down.
+        Gracefully handles storage failures - game continues in memory if DB is down.
         """
+        if not self._persistence.stores_state:
+            return
         try:
-            state_json = self._serialize()
-            session = self._db_session
-
-            # Find existing game by game_id
-            obj = session.query(GameStateModel).filter(GameStateModel.game_id == self.game_id).first()
-
-            current_time = utc_now().isoformat()
-
-            if obj:
-                # Update existing - use setattr to avoid Column type errors
-                obj.state = state_json
-                obj.updated_at = current_time
-            else:
-                # Create new
-                obj = GameStateModel(
-                    game_id=self.game_id,
-                    state=state_json,
-                    created_at=self._game_start_time,
-                    updated_at=current_time,
-                )
-                session.add(obj)
-
-            session.commit()
-
+            self._persistence.save(self.game_id, self._serialize(), self._game_start_time, utc_now().isoformat())
         except Exception as e:
             print(f"⚠️ Database save failed for game {self.game_id}: {e}")
             # Continue without saving - allows app to work even if DB is down
-            if hasattr(self, "_db_session"):
-                try:
-                    self._db_session.rollback()
-                except Exception as rollback_error:
-                    print(f"⚠️ Rollback failed: {rollback_error}")
 
     def _load_from_db(self):
         """
-        Load game state from database by game_id.
+        Load game state from the persistence backend by game_id.
 
-        If game exists in DB, deserializes and restores all state.
+        If game exists in storage, deserializes and restores all state.
         If game doesn't exist, this is a new game (no-op).
 
-        Gracefully handles DB failures - starts fresh game if DB is down.
+        Gracefully handles storage failures - starts fresh game if DB is down.
         """
         try:
-            session = self._db_session
-
-            # Try to load by game_id
-            obj = session.query(GameStateModel).filter(GameStateModel.game_id == self.game_id).first()
+            stored = self._persistence.load(self.game_id)
+            if stored is not None:
+                self._deserialize(stored.state)
 
-            if obj and obj.state:
-                # Restore state from DB - cast to proper type
-                state_data = cast("dict[str, Any]", obj.state)
-                self._deserialize(state_data)
-
-                # Preserve DB metadata - use str() to convert Column types
-                self.game_id = str(obj.game_id)
-                self._game_start_time = str(obj.created_at)
-            else:
-                # New game - keep generated game_id, start fresh
-                pass
+                # Preserve stored metadata
+                self._game_start_time = stored.created_at
+            # Otherwise a new game - keep generated game_id, start fresh
 
         except Exception as e:
             print(f"⚠️ Database load failed for game {self.game_id}: {e}")
@@ -153,8 +119,11 @@ class PersistenceMixin:
         if self._game_completed:
             return "Game already completed"
 
+        if not self._persistence.stores_state:
+            self._game_completed = True
+            return f"Game {self.game_id} completed successfully"
+
         try:
-            session = self._db_session
             current_time = utc_now().isoformat()
 
             # Calculate game duration
@@ -171,28 +140,24 @@ class PersistenceMixin:
             # Get game metadata
             game_metadata = self._get_game_metadata() if hasattr(self, "_get_game_metadata") else {}
 
-            # Create permanent GameRecord
-            game_record = GameRecord(
-                game_id=self.game_id,
-                course_name=game_metadata.get("course_name", "Unknown Course"),
-                game_mode="wolf_goat_pig",
-                player_count=game_metadata.get("player_count", 4),
-                total_holes_played=game_metadata.get("total_holes_played", 0),
-                game_duration_minutes=duration_minutes,
-                created_at=self._game_start_time,
-                completed_at=current_time,
-                game_settings=game_metadata.get("settings", {}),
-                final_scores=final_scores,
-            )
-
-            session.add(game_record)
-
-            # Create individual player results if subclass provides player data
-            if hasattr(self, "_get_player_results"):
-                for player_result in self._get_player_results():
-                    session.add(GamePlayerResult(**player_result, game_record_id=game_record.id))
-
-            session.commit()
+            # Permanent GameRecord fields
+            game_record = {
+                "game_id": self.game_id,
+                "course_name": game_metadata.get("course_name", "Unknown Course"),
+                "game_mode": "wolf_goat_pig",
+                "player_count": game_metadata.get("player_count", 4),
+                "total_holes_played": game_metadata.get("total_holes_played", 0),
+                "game_duration_minutes": duration_minutes,
+                "created_at": self._game_start_time,
+                "completed_at": current_time,
+                "game_settings": game_metadata.get("settings", {}),
+                "final_scores": final_scores,
+            }
+
+            # Individual player results if subclass provides player data
+            player_results = self._get_player_results() if hasattr(self, "_get_player_results") else []
+
+            self._persistence.record_completion(game_record, player_results)
 
             self._game_completed = True
             self._save_to_db()  # Save completion status
@@ -201,17 +166,11 @@ class PersistenceMixin:
 
         except Exception as e:
             print(f"⚠️ Failed to complete game {self.game_id}: {e}")
-            if hasattr(self, "_db_session"):
-                try:
-                    self._db_session.rollback()
-                except Exception as rollback_error:
-                    print(f"⚠️ Rollback failed: {rollback_error}")
             return f"Failed to complete game: {e!s}"
 
     def close_db_session(self):
-        """Close the database session. Call this when done with the game."""
-        if hasattr(self, "_db_session") and self._db_session:
-            try:
-                self._db_session.close()
-            except Exception as close_error:
-                print(f"⚠️ Failed to close DB session: {close_error}")
+        """Release the backend's resources (the DB session). Call this when done with the game."""
+        try:
+            self._persistence.close()
+        except Exception as close_error:
+            print(f"⚠️ Failed to close DB session: {close_error}")
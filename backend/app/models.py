@@ -12,10 +12,11 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.types import JSON
 
 from .database import Base
+from .db_types import ISODate, ISOTimestamp
 
 
 # Helper function to get correct UUID column type based on database
@@ -168,6 +169,8 @@ class HoleEvent(Base):
 # Updated to support multiple active games with unique game_id
 class GameStateModel(Base):
     __tablename__ = "game_state"
+    # Newest-first game listings page on (created_at, id)
+    __table_args__ = (Index("ix_game_state_created_at_id", "created_at", "id"),)
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(get_uuid_column(), unique=True, index=True)  # Unique identifier for each game
     join_code = Column(String, unique=True, index=True, nullable=True)  # 6-char code for joining
@@ -179,9 +182,18 @@ class GameStateModel(Base):
     # changes are tracked; NESTED mutation (state["players"][i]["x"] = ...) is NOT,
     # so nested writes must reassign the top-level key (state["players"] = new_list).
     state = Column(MutableDict.as_mutable(JSON))
-    scorecard_image = Column(Text, nullable=True)  # downscaled JPEG as base64/data-URL for later per-hole backfill
-    created_at = Column(String)
+    # Downscaled JPEG as base64/data-URL for later per-hole backfill. Deferred so
+    # state reads and listings never drag the blob along; undefer() it to serve it.
+    scorecard_image = deferred(Column(Text, nullable=True))
+    created_at = Column(ISOTimestamp)
     updated_at = Column(String)
+    # Optimistic-concurrency counter: every UPDATE is issued as
+    # "... WHERE version = :expected" and bumps it, so a concurrent writer raises
+    # StaleDataError instead of silently losing the other update. Retry with
+    # db_helpers.commit_with_optimistic_retry.
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
 
 
 # Track authenticated players in games
@@ -225,7 +237,10 @@ class PlayerProfile(Base):
     # provider. Null = never (successfully) sent, so a retry is safe. See #318.
     welcome_email_sent_at = Column(String, nullable=True)
     avatar_url = Column(String, nullable=True)
-    avatar_image = Column(Text, nullable=True)  # uploaded avatar, downscaled JPEG as base64
+    # Uploaded avatar, downscaled JPEG as base64. Deferred so roster-wide queries
+    # don't load every blob; avatar_image_present answers "is there one" cheaply.
+    avatar_image = deferred(Column(Text, nullable=True))
+    avatar_image_present = column_property(avatar_image.expression.isnot(None))
     created_at = Column(String)
     updated_at = Column(String, nullable=True)
     last_played = Column(String, nullable=True)
@@ -250,10 +265,29 @@ class PlayerProfile(Base):
     strengths = Column(JSON, nullable=True)
     weaknesses = Column(JSON, nullable=True)
 
+    # Read-only views over the integer "References PlayerProfile.id" columns, for
+    # eager loading (joinedload/selectinload); writes still go through the rows.
+    availability = relationship(
+        "PlayerAvailability",
+        primaryjoin="PlayerProfile.id == foreign(PlayerAvailability.player_profile_id)",
+        order_by="PlayerAvailability.id",
+        viewonly=True,
+    )
+    statistics = relationship(
+        "PlayerStatistics",
+        primaryjoin="PlayerProfile.id == foreign(PlayerStatistics.player_id)",
+        uselist=False,
+        viewonly=True,
+    )
+
     @property
     def has_avatar_image(self) -> bool:
-        # Uploaded photo: DB base64 blob, inline data: URL, or GCS marker.
-        if self.avatar_image:
+        # Uploaded photo: DB base64 blob, inline data: URL, or GCS marker. Only
+        # consult the blob itself when it is already loaded (or just assigned).
+        if "avatar_image" in self.__dict__:
+            if self.avatar_image:
+                return True
+        elif self.avatar_image_present:
             return True
         url = self.avatar_url or ""
         return url.startswith("gcs:") or url.startswith("data:image/")
@@ -332,6 +366,8 @@ class GameRecord(Base):
 
 class GamePlayerResult(Base):
     __tablename__ = "game_player_results"
+    # Time-filtered leaderboards range-scan created_at and group by player
+    __table_args__ = (Index("ix_game_player_results_created_player", "created_at", "player_profile_id"),)
     id = Column(Integer, primary_key=True, index=True)
     game_record_id = Column(Integer, index=True)  # References GameRecord.id
     player_profile_id = Column(Integer, index=True)  # References PlayerProfile.id
@@ -404,7 +440,7 @@ class LegacyRound(Base):
         ),
     )
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(String, index=True)  # e.g. "2026-04-06"
+    date = Column(ISODate, index=True)  # e.g. "2026-04-06"
     group = Column(String)  # e.g. "A"
     member = Column(String, index=True)  # e.g. "Stuart Gano"
     score = Column(Integer)  # quarters won/lost
@@ -442,7 +478,7 @@ class DailySignup(Base):
     __tablename__ = "daily_signups"
     __table_args__ = (Index("ix_daily_signups_date_player", "date", "player_profile_id"),)
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(String, index=True)  # YYYY-MM-DD format
+    date = Column(ISODate, index=True)  # YYYY-MM-DD format
     player_profile_id = Column(Integer, index=True)  # References PlayerProfile.id
     player_name = Column(String)  # Denormalized for easy querying
     signup_time = Column(String)  # ISO timestamp when they signed up
@@ -496,7 +532,7 @@ class CalloutNotification(Base):
     __tablename__ = "callout_notifications"
     __table_args__ = (Index("ix_callout_notifications_date_window", "game_date", "callout_window"),)
     id = Column(Integer, primary_key=True, index=True)
-    game_date = Column(String, index=True)  # YYYY-MM-DD the callout is for
+    game_date = Column(ISODate, index=True)  # YYYY-MM-DD the callout is for
     callout_window = Column(String)  # "pre_pairing" or "morning_of" (window is a reserved SQL word)
     signup_count = Column(Integer)  # Signups at the time the callout fired
     target = Column(Integer)  # Headcount we were filling up to (next foursome)
@@ -525,7 +561,7 @@ class GHINScore(Base):
     id = Column(Integer, primary_key=True, index=True)
     player_profile_id = Column(Integer, index=True)  # References PlayerProfile.id
     ghin_id = Column(String, index=True)  # GHIN ID
-    score_date = Column(String, index=True)  # Date the round was played (YYYY-MM-DD)
+    score_date = Column(ISODate, index=True)  # Date the round was played (YYYY-MM-DD)
     course_name = Column(String)  # Name of the golf course
     tees = Column(String, nullable=True)  # Tee box played (e.g., "Blue", "Championship")
     score = Column(Integer)  # Total score for the round
@@ -692,6 +728,7 @@ class GameBanner(Base):
 # Notification System
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (Index("ix_notifications_player_unread", "player_profile_id", "is_read"),)
     id = Column(Integer, primary_key=True, index=True)
     player_profile_id = Column(Integer, index=True)  # References PlayerProfile.id
     notification_type = Column(String, index=True)  # game_start, game_end, turn_notification, etc.
@@ -701,6 +738,20 @@ class Notification(Base):
     created_at = Column(String, index=True)  # ISO timestamp when notification was created
 
 
+class NotificationUnreadCount(Base):
+    """Unread notification count per player, kept in step with ``notifications``.
+
+    Maintained by NotificationService (and its mapper events for single-row
+    ORM writes) in the same transaction as the rows it counts, so the bell's
+    unread-count poll is a primary-key read. A missing row means "not seeded
+    yet" and the service falls back to counting.
+    """
+
+    __tablename__ = "notification_unread_counts"
+    player_profile_id = Column(Integer, primary_key=True)
+    unread = Column(Integer, nullable=False, default=0)
+
+
 # Generated Pairings for Sunday Games (RNG Calculator)
 class GeneratedPairing(Base):
     """Stores generated random pairings for a specific game date.
@@ -838,3 +889,54 @@ class PendingLegacyPlayer(Base):
     created_at = Column(String)
     resolved_at = Column(String, nullable=True)
     notes = Column(String, nullable=True)
+
+
+class JobLease(Base):
+    """Cross-instance lock for a periodic job (one row per EmailScheduler job key).
+
+    Both the in-process ``schedule`` thread and ``/internal/jobs/{job}`` take
+    the lease before running, so autoscaled instances don't each run their
+    own copy. ``holder`` is NULL while the job is idle; a lease whose
+    ``expires_at`` has passed is treated as abandoned (crashed instance).
+    """
+
+    __tablename__ = "job_leases"
+    job_name = Column(String, primary_key=True)
+    holder = Column(String, nullable=True)
+    acquired_at = Column(String, nullable=True)
+    expires_at = Column(String, nullable=True)
+    last_run_at = Column(String, nullable=True)
+    last_success_at = Column(String, nullable=True)
+    last_status = Column(String, nullable=True)  # "success" | "failed"
+    last_duration_seconds = Column(Float, nullable=True)
+    run_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+
+
+class JobRun(Base):
+    """One row per leased job run, kept for duration/failure trend analysis."""
+
+    __tablename__ = "job_runs"
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String, nullable=False)
+    holder = Column(String, nullable=True)
+    trigger = Column(String, nullable=True)  # "schedule" | "internal"
+    started_at = Column(String, nullable=False)
+    duration_seconds = Column(Float, nullable=True)
+    status = Column(String, nullable=True)  # "success" | "failed"
+    error = Column(String, nullable=True)
+
+    __table_args__ = (Index("ix_job_runs_job_started", "job_name", "started_at"),)
+
+
+class SchemaFingerprint(Base):
+    """Fingerprint of the schema the last fully-prepared boot ran against (single row, id=1).
+
+    The hash covers the model metadata and the migration file set. When a boot
+    finds a matching row it skips create_all, the SQL migrations and the seed
+    checks entirely (see ``app/boot.py``).
+    """
+
+    __tablename__ = "schema_fingerprint"
+    id = Column(Integer, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    recorded_at = Column(String, nullable=True)
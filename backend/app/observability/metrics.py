@@ -0,0 +1,315 @@
+"""In-process request and database metrics in Prometheus text format.
+
+``MetricsMiddleware`` is a pure ASGI middleware (no ``BaseHTTPMiddleware``
+buffering) that records, per method and route template, a latency
+histogram, a response-size histogram and a status-code counter, plus a
+process-wide in-flight gauge. ``instrument_engine`` hooks SQLAlchemy cursor
+events so every statement is also charged to the request that issued it:
+the per-request tally lives in a ``ContextVar``, which ``run_db`` and
+Starlette's threadpool copy into worker threads, so queries run off the
+event loop still land on the right route. Statements outside a request
+(scheduled jobs, boot) only count towards the process totals.
+
+Routes are labelled by their template (``/games/{game_id}``), never the raw
+path, so label cardinality stays bounded; unmatched paths share one label.
+
+Statements slower than ``SLOW_QUERY_MS`` are sampled (``SLOW_QUERY_SAMPLE_RATE``)
+and logged by fingerprint together with how often that shape has been slow
+on the same route, so a hot N+1 loop shows up as one growing count rather
+than a wall of distinct SQL.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .queries import fingerprint
+
+logger = logging.getLogger("app.observability.metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+UNMATCHED_ROUTE = "(unmatched)"
+BACKGROUND_ROUTE = "(background)"
+
+# Distinct (route, statement shape) pairs remembered for slow-query counts.
+MAX_SLOW_SHAPES = 1000
+
+
+class Histogram:
+    """Cumulative-bucket histogram; callers hold the registry lock."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip((*self.bounds, None), self.counts, strict=True):
+            total += count
+            buckets.append(("+Inf" if bound is None else _number(bound), total))
+        return buckets
+
+
+@dataclass
+class RouteStats:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    response_size: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    queries: Histogram = field(default_factory=lambda: Histogram(QUERY_COUNT_BUCKETS))
+    db_seconds: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RequestDbStats:
+    """Statements issued while serving one request."""
+
+    queries: int = 0
+    seconds: float = 0.0
+    slow: list[tuple[str, float]] = field(default_factory=list)
+
+
+_request_db: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.routes: dict[tuple[str, str], RouteStats] = {}
+        self.in_flight = 0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.slow_queries: dict[tuple[str, str, str], int] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+            self.slow_queries.clear()
+            self.in_flight = 0
+            self.db_queries = 0
+            self.db_seconds = 0.0
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(
+        self, method: str, route: str, status: int, seconds: float, size: int, db: RequestDbStats
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            stats = self.routes.get((method, route))
+            if stats is None:
+                stats = self.routes[(method, route)] = RouteStats()
+            stats.latency.observe(seconds)
+            stats.response_size.observe(size)
+            stats.queries.observe(db.queries)
+            stats.db_seconds += db.seconds
+            code = str(status)
+            stats.statuses[code] = stats.statuses.get(code, 0) + 1
+        for statement, seconds in db.slow:
+            self.slow_query(method, route, statement, seconds)
+
+    def query_finished(self, seconds: float) -> None:
+        with self._lock:
+            self.db_queries += 1
+            self.db_seconds += seconds
+
+    def slow_query(self, method: str, route: str, statement: str, seconds: float) -> None:
+        shape = fingerprint(statement)
+        key = (method, route, shape)
+        with self._lock:
+            seen = self.slow_queries.get(key, 0) + 1
+            if key in self.slow_queries or len(self.slow_queries) < MAX_SLOW_SHAPES:
+                self.slow_queries[key] = seen
+        logger.warning(
+            "Slow query %.0f ms on %s %s (%d slow on this route): %s", seconds * 1000, method, route, seen, shape
+        )
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            routes = sorted(self.routes.items())
+            lines = [
+                "# HELP wgp_http_requests_in_flight Requests currently being served.",
+                "# TYPE wgp_http_requests_in_flight gauge",
+                f"wgp_http_requests_in_flight {self.in_flight}",
+                "# HELP wgp_db_queries_total SQL statements executed by this process.",
+                "# TYPE wgp_db_queries_total counter",
+                f"wgp_db_queries_total {self.db_queries}",
+                "# HELP wgp_db_query_seconds_total Time spent executing SQL statements.",
+                "# TYPE wgp_db_query_seconds_total counter",
+                f"wgp_db_query_seconds_total {_number(self.db_seconds)}",
+                "# HELP wgp_http_requests_total Requests served, by route and status code.",
+                "# TYPE wgp_http_requests_total counter",
+            ]
+            for (method, route), stats in routes:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f"wgp_http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+            _histogram_lines(
+                lines, "wgp_http_request_duration_seconds", "Request latency.", routes, lambda s: s.latency
+            )
+            _histogram_lines(
+                lines, "wgp_http_response_size_bytes", "Response body size.", routes, lambda s: s.response_size
+            )
+            _histogram_lines(
+                lines, "wgp_http_request_db_queries", "SQL statements per request.", routes, lambda s: s.queries
+            )
+            lines += [
+                "# HELP wgp_http_request_db_seconds_total Time spent in SQL while serving requests.",
+                "# TYPE wgp_http_request_db_seconds_total counter",
+            ]
+            for (method, route), stats in routes:
+                lines.append(
+                    f"wgp_http_request_db_seconds_total{_labels(method=method, route=route)} {_number(stats.db_seconds)}"
+                )
+            slow: dict[tuple[str, str], int] = {}
+            for (method, route, _), count in self.slow_queries.items():
+                slow[(method, route)] = slow.get((method, route), 0) + count
+            lines += [
+                "# HELP wgp_db_slow_queries_total Sampled statements slower than SLOW_QUERY_MS.",
+                "# TYPE wgp_db_slow_queries_total counter",
+            ]
+            for (method, route), count in sorted(slow.items()):
+                lines.append(f"wgp_db_slow_queries_total{_labels(method=method, route=route)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """Record latency, response size, status and DB usage for each HTTP request."""
+
+    def __init__(self, app: Any, metrics: MetricsRegistry | None = None) -> None:
+        self.app = app
+        self.metrics = metrics or registry
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db = RequestDbStats()
+        token = _request_db.set(db)
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.request_started()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_db.reset(token)
+            route = scope.get("route")
+            self.metrics.request_finished(
+                scope["method"],
+                getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status,
+                time.perf_counter() - started,
+                size,
+                db,
+            )
+
+
+def instrument_engine(
+    engine: Engine,
+    metrics: MetricsRegistry | None = None,
+    slow_query_ms: float | None = None,
+    sample_rate: float | None = None,
+) -> None:
+    """Count and time every statement ``engine`` executes, sampling slow ones (idempotent)."""
+    if getattr(engine, "_wgp_metrics_instrumented", False):
+        return
+    target = metrics or registry
+    if slow_query_ms is None:
+        slow_query_ms = float(os.getenv("SLOW_QUERY_MS", "250"))
+    if sample_rate is None:
+        sample_rate = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "1.0"))
+    slow_after = slow_query_ms / 1000
+
+    # The start time rides on the statement's execution context, so a failed
+    # statement (no after_cursor_execute) leaves nothing behind on the
+    # pooled connection.
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._wgp_query_started = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_wgp_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        target.query_finished(elapsed)
+        db = _request_db.get()
+        if db is not None:
+            db.queries += 1
+            db.seconds += elapsed
+        if elapsed < slow_after or (sample_rate < 1 and random.random() >= sample_rate):
+            return
+        if db is not None:
+            # Logged when the request finishes, once its route is known.
+            db.slow.append((statement, elapsed))
+        else:
+            target.slow_query("-", BACKGROUND_ROUTE, statement, elapsed)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    engine._wgp_metrics_instrumented = True  # type: ignore[attr-defined]
+
+
+def _histogram_lines(
+    lines: list[str], name: str, help_text: str, routes: list[tuple[tuple[str, str], RouteStats]], pick: Any
+) -> None:
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (method, route), stats in routes:
+        histogram: Histogram = pick(stats)
+        for le, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=le)} {count}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+
+
+def _labels(**labels: str) -> str:
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
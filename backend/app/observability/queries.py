@@ -0,0 +1,102 @@
+"""Statement fingerprints and query budgets.
+
+``fingerprint`` reduces a SQL statement to its shape: literals, bound
+parameters and ``IN``/``VALUES`` lists collapse to ``?`` so the same query
+issued with different ids compares equal. That is what an N+1 loop looks
+like from the driver's side — one shape, many executions.
+
+``QueryBudget`` listens to an engine for the duration of a ``with`` block
+and raises ``QueryBudgetExceededError`` when the block ran more than
+``max_queries`` statements, or any one shape more than ``max_repeats``
+times. Tests use it through the ``query_budget`` fixture in
+``tests/conftest.py``; the slow-query sampler in ``metrics`` reuses the
+fingerprints for its log lines.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from types import TracebackType
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize ``statement`` so executions differing only in values compare equal."""
+    shape = _STRING.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _LIST.sub("(?)", shape)
+    shape = _ROWS.sub("(?)", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class QueryBudgetExceededError(AssertionError):
+    """A block issued more statements, or repeated a shape more often, than allowed."""
+
+
+class QueryBudget:
+    """Count statements ``engine`` executes inside a ``with`` block.
+
+    Statements from every thread count, so requests served through
+    ``TestClient`` (which runs the app on a portal thread) and ``run_db``
+    workers are included.
+    """
+
+    def __init__(self, engine: Engine, max_queries: int | None = None, max_repeats: int | None = None) -> None:
+        self.engine = engine
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.shapes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self.shapes.values())
+
+    def _record(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        with self._lock:
+            self.shapes[fingerprint(statement)] += 1
+
+    def __enter__(self) -> QueryBudget:
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        if exc_type is None:
+            self.check()
+
+    def check(self) -> None:
+        problems = []
+        if self.max_queries is not None and self.count > self.max_queries:
+            problems.append(f"{self.count} queries (budget {self.max_queries})")
+        if self.max_repeats is not None:
+            problems += [
+                f"{times}x (limit {self.max_repeats}): {shape}"
+                for shape, times in self.shapes.most_common()
+                if times > self.max_repeats
+            ]
+        if problems:
+            raise QueryBudgetExceededError("Query budget exceeded:\n  " + "\n  ".join(problems) + "\n" + self.report())
+
+    def report(self, limit: int = 10) -> str:
+        lines = [f"{self.count} statements, {len(self.shapes)} distinct shapes:"]
+        lines += [f"  {times:>4}x {shape}" for shape, times in self.shapes.most_common(limit)]
+        return "\n".join(lines)
@@ -223,7 +223,7 @@ async def upload_gmail_credentials(file: UploadFile = File(...)):
 
 
 @router.get("/banner")
-async def get_active_banner(db: Session = Depends(database.get_db)):  # type: ignore
+def get_active_banner(db: Session = Depends(database.get_db)):  # type: ignore
     """Get the currently active banner for display on game pages (public route)"""
     try:
         banner = (
@@ -254,7 +254,7 @@ async def get_active_banner(db: Session = Depends(database.get_db)):  # type: ig
 
 
 @router.get("/admin/banner", dependencies=[Depends(require_admin)])
-async def get_banner_config(db: Session = Depends(database.get_db)):  # type: ignore
+def get_banner_config(db: Session = Depends(database.get_db)):  # type: ignore
     """Get current banner configuration (admin only)"""
     try:
         banner = db.query(models.GameBanner).order_by(models.GameBanner.id.desc()).first()
@@ -283,7 +283,7 @@ async def get_banner_config(db: Session = Depends(database.get_db)):  # type: ig
 
 
 @router.post("/admin/banner", dependencies=[Depends(require_admin)])
-async def create_or_update_banner(  # type: ignore
+def create_or_update_banner(  # type: ignore
     banner_data: schemas.GameBannerCreate,
     db: Session = Depends(database.get_db),
 ):
@@ -335,7 +335,7 @@ async def create_or_update_banner(  # type: ignore
 
 
 @router.put("/admin/banner/{banner_id}", dependencies=[Depends(require_admin)])
-async def update_banner(  # type: ignore
+def update_banner(  # type: ignore
     banner_id: int,
     banner_data: schemas.GameBannerUpdate,
     db: Session = Depends(database.get_db),
@@ -387,7 +387,7 @@ async def update_banner(  # type: ignore
 
 
 @router.delete("/admin/banner/{banner_id}", dependencies=[Depends(require_admin)])
-async def delete_banner(  # type: ignore
+def delete_banner(  # type: ignore
     banner_id: int,
     db: Session = Depends(database.get_db),
 ):
@@ -434,7 +434,7 @@ def admin_delete_all_matches():
 
 
 @router.get("/admin/db/schemas", dependencies=[Depends(require_admin)])
-async def get_db_schemas(db: Session = Depends(database.get_db)):  # type: ignore
+def get_db_schemas(db: Session = Depends(database.get_db)):  # type: ignore
     """Get all database schemas."""
     try:
         query = text("SELECT schema_name FROM information_schema.schemata;")
@@ -447,7 +447,7 @@ async def get_db_schemas(db: Session = Depends(database.get_db)):  # type: ignor
 
 
 @router.get("/admin/db/schemas/{schema_name}/tables", dependencies=[Depends(require_admin)])
-async def get_db_tables(
+def get_db_tables(
     schema_name: str,
     db: Session = Depends(database.get_db),
 ):  # type: ignore
@@ -463,7 +463,7 @@ async def get_db_tables(
 
 
 @router.get("/admin/db/schemas/{schema_name}/tables/{table_name}", dependencies=[Depends(require_admin)])
-async def get_table_content(
+def get_table_content(
     schema_name: str,
     table_name: str,
     db: Session = Depends(database.get_db),
@@ -508,7 +508,7 @@ async def test_deployment():
 
 
 @router.get("/admin/cleanup/orphaned-games", dependencies=[Depends(require_admin)])
-async def get_orphaned_games(
+def get_orphaned_games(
     hours_old: int = Query(24, description="Only show games older than this many hours"),
     db: Session = Depends(database.get_db),
 ):  # type: ignore
@@ -553,7 +553,7 @@ async def get_orphaned_games(
 
 
 @router.delete("/admin/cleanup/orphaned-games", dependencies=[Depends(require_admin)])
-async def delete_orphaned_games(
+def delete_orphaned_games(
     hours_old: int = Query(24, description="Only delete games older than this many hours"),
     dry_run: bool = Query(True, description="If true, only show what would be deleted"),
     db: Session = Depends(database.get_db),
@@ -615,7 +615,7 @@ async def delete_orphaned_games(
 
 
 @router.get("/admin/cleanup/database-stats", dependencies=[Depends(require_admin)])
-async def get_database_stats(db: Session = Depends(database.get_db)):  # type: ignore
+def get_database_stats(db: Session = Depends(database.get_db)):  # type: ignore
     """Get database statistics for health monitoring."""
     try:
         stats = {}
@@ -682,7 +682,7 @@ async def get_database_stats(db: Session = Depends(database.get_db)):  # type: i
 
 
 @router.post("/admin/run-migration", dependencies=[Depends(require_admin)])
-async def run_database_migration(
+def run_database_migration(
     migration: str = Query(..., description="Migration to run: 'add_statistics_columns'"),
     db: Session = Depends(database.get_db),
 ):  # type: ignore
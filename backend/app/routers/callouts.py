@@ -54,7 +54,7 @@ async def send_test_callout_email(
 
 
 @router.post("/run")
-async def run_headcount_callout(
+def run_headcount_callout(
     window: str = Query(..., description="Callout window: pre_pairing or morning_of"),
     game_date: str | None = Query(
         default=None,
@@ -11,14 +11,12 @@ import logging
 import re
 from typing import Any
 
-import sqlglot
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from sqlglot import exp
 
-from ..database import get_db
+from ..database import get_db, run_db
 from ..services.commissioner_llm_service import commissioner_provider, llm_generate
 from ..utils.api_helpers import ApiResponse, handle_api_errors
 
@@ -145,7 +143,7 @@ async def commissioner_chat(
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """Ask the Commissioner a question about rules or game history."""
-    data_context = _build_data_context(db)
+    data_context = await run_db(_build_data_context, db)
     game_context = _build_game_context(request.game_state)
 
     system = WGP_RULES
@@ -350,6 +348,9 @@ def _validate_sql(sql: str) -> bool:
     # explicit JOINs, subqueries, CTE bodies, set operations (UNION/…), and
     # nested CTEs are all covered — closing the regex whack-a-mole bypasses.
     # Parse with the Postgres dialect (prod), and FAIL CLOSED if it can't parse.
+    import sqlglot
+    from sqlglot import exp
+
     try:
         tree = sqlglot.parse_one(cleaned, dialect="postgres")
     except Exception:
@@ -431,7 +432,7 @@ async def commissioner_data_chat(
 ) -> dict[str, Any]:
     """Ask Commissioner Hover Over a data question about the WGP database."""
     # Season snapshot so leaderboard questions have ground truth even before SQL.
-    data_context = _build_data_context(db)
+    data_context = await run_db(_build_data_context, db)
 
     if commissioner_provider() == "vertex":
         from ..services.commissioner_adk_service import run_data_chat_adk
@@ -499,7 +500,7 @@ Example queries:
         )
 
     # Execute the SQL
-    results = _execute_readonly_sql(db, sql)
+    results = await run_db(_execute_readonly_sql, db, sql)
 
     if "error" in results:
         return ApiResponse.success(
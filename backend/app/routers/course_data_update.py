@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.patch("/games/{game_id}/update-course-data")
-async def update_game_course_data(game_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
+def update_game_course_data(game_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Update course data (par and handicap) for an in-progress game.
 
@@ -134,7 +134,7 @@ async def update_game_course_data(game_id: str, db: Session = Depends(get_db)) -
 
 
 @router.patch("/games/update-all-course-data")
-async def update_all_games_course_data(db: Session = Depends(get_db)) -> dict[str, Any]:
+def update_all_games_course_data(db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Update course data for ALL in-progress games.
 
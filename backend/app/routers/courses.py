@@ -21,7 +21,7 @@ from sqlalchemy.orm import Session
 from .. import models, schemas
 from ..course_import import import_course_by_name, import_course_from_json
 from ..database import get_db
-from ..state.course_manager import CourseManager
+from ..state.course_manager import CourseManager, invalidate_course_cache
 from ..utils.api_helpers import ApiResponse, handle_api_errors
 from ..utils.time import utc_now
 
@@ -219,6 +219,7 @@ def get_courses(response: Response) -> Any:
 
                 if seeding_status["status"] == "success":
                     # Reinitialize by creating a new instance
+                    invalidate_course_cache()
                     course_manager = CourseManager()
                     courses_summary = course_manager.get_courses()
 
@@ -324,7 +325,7 @@ def add_course(course: schemas.CourseCreate, db: Session = Depends(get_db)) -> d
     db.refresh(db_course)
 
     # Refresh in-memory course manager cache
-    course_manager.load_course(course.name)
+    course_manager.refresh_course(int(db_course.id))
 
     logger.info(f"Created course '{course.name}' with {len(holes)} holes (ID: {db_course.id})")
 
@@ -406,9 +407,8 @@ def update_course(
     db.commit()
     db.refresh(db_course)
 
-    # Update in-memory course manager
-    if "holes" in update_dict:
-        course_manager.load_course(course_name)
+    # Publish a new course snapshot version; games in progress keep their own
+    course_manager.refresh_course(int(db_course.id))
 
     logger.info(f"Updated course '{course_name}' (ID: {db_course.id})")
 
@@ -431,8 +431,10 @@ def delete_course(course_name: str = Path(...), db: Session = Depends(get_db)) -
     if not db_course:
         raise HTTPException(status_code=404, detail=f"Course '{course_name}' not found")
 
+    course_id = int(db_course.id)
     db.delete(db_course)
     db.commit()
+    invalidate_course_cache(course_id)
 
     logger.info(f"Deleted course '{course_name}' from database")
 
@@ -13,7 +13,7 @@ from pydantic import BaseModel, field_validator
 from sqlalchemy.orm import Session
 
 from .. import models
-from ..database import get_db
+from ..database import get_db, run_db
 from ..services.auth_service import get_current_user
 from ..services.encryption_service import decrypt, encrypt
 from ..services.foretees_service import (
@@ -162,7 +162,7 @@ async def save_credentials(
     # Persist encrypted credentials
     current_user.foretees_username = creds.username
     current_user.foretees_password_encrypted = encrypt(creds.password)
-    db.commit()
+    await run_db(db.commit)
 
     logger.info("Saved ForeTees credentials for player %s", current_user.id)
     return ApiResponse.success(
@@ -173,7 +173,7 @@ async def save_credentials(
 
 @router.delete("/credentials")
 @handle_api_errors(operation_name="remove credentials")
-async def remove_credentials(
+def remove_credentials(
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
@@ -1,20 +1,28 @@
 """Game lifecycle routes — create, join, lobby, start, list, delete, complete, state, action, history, details."""
 
 import base64
+import json
 import logging
 import traceback
 from typing import Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy.orm.attributes import flag_modified
 
 from .. import database, models, schemas
 from ..badge_engine import BadgeEngine
+from ..db_types import parse_iso_timestamp
+from ..middleware.caching import game_count_cache
+from ..mixins import NullPersistence
+from ..services.export_service import GAME_HISTORY_COLUMNS, ExportFormat, export_response, stream_rows
 from ..services.game_lifecycle_service import get_game_lifecycle_service
 from ..services.notification_service import get_notification_service
 from ..state.course_manager import CourseManager
+from ..utils.fast_json import FastJSONResponse
 from ..utils.handicap_resolve import resolve_player_handicap
 from ..utils.time import utc_now
 from ..wolf_goat_pig import Player, WolfGoatPigGame
@@ -136,7 +144,7 @@ UNIFIED_ACTION_TYPES = {
 
 
 @router.post("/create")
-async def create_game_with_join_code(
+def create_game_with_join_code(
     course_name: str | None = None,
     player_count: int = 4,
     user_id: str | None = None,
@@ -199,6 +207,7 @@ async def create_game_with_join_code(
         db.add(game_state_model)
         db.commit()
         db.refresh(game_state_model)
+        game_count_cache.clear()
 
         return {
             "game_id": game_id,
@@ -239,7 +248,7 @@ class ScorecardRoundRequest(BaseModel):
 
 
 @router.post("/from-scorecard")
-async def create_round_from_scorecard(
+def create_round_from_scorecard(
     body: ScorecardRoundRequest,
     db: Session = Depends(database.get_db),
 ) -> dict[str, Any]:
@@ -333,54 +342,65 @@ async def join_game_with_code(  # type: ignore
 ):
     """Join a game using a join code"""
     try:
-        # Find game by join code
-        game = db.query(models.GameStateModel).filter(models.GameStateModel.join_code == join_code).first()
-
-        if not game:
-            raise HTTPException(status_code=404, detail="Game not found with that join code")
-
-        if game.game_status != "setup":
-            raise HTTPException(status_code=400, detail="Game has already started")
-
-        # Check if user already joined
-        if request.user_id:
-            existing = (
-                db.query(models.GamePlayer)
-                .filter(
-                    models.GamePlayer.game_id == game.game_id,
-                    models.GamePlayer.user_id == request.user_id,
+        # The DB work runs in the bounded DB threadpool; only the optional GHIN
+        # lookup between the two phases awaits on the event loop.
+        def find_game_and_players():
+            game = db.query(models.GameStateModel).filter(models.GameStateModel.join_code == join_code).first()
+
+            if not game:
+                raise HTTPException(status_code=404, detail="Game not found with that join code")
+
+            if game.game_status != "setup":
+                raise HTTPException(status_code=400, detail="Game has already started")
+
+            # Check if user already joined
+            existing = None
+            if request.user_id:
+                existing = (
+                    db.query(models.GamePlayer)
+                    .filter(
+                        models.GamePlayer.game_id == game.game_id,
+                        models.GamePlayer.user_id == request.user_id,
+                    )
+                    .first()
                 )
-                .first()
+                if existing:
+                    return game, existing, [], None, None
+
+            # Get current players
+            current_players = db.query(models.GamePlayer).filter(models.GamePlayer.game_id == game.game_id).all()
+
+            # Check player limit
+            max_players = game.state.get("player_count", 4)
+            if len(current_players) >= max_players:
+                raise HTTPException(status_code=400, detail="Game is full")
+
+            # Explicit handicap always wins. Otherwise fill from the roster — never
+            # let a silent 18 stand in for a rostered scratch player.
+            player_handicap, profile = resolve_player_handicap(
+                db,
+                name=request.player_name,
+                handicap=request.handicap,
+                player_profile_id=request.player_profile_id,
             )
-            if existing:
-                return {
-                    "status": "already_joined",
-                    "message": "You've already joined this game",
-                    "game_id": game.game_id,
-                    "player_slot_id": existing.player_slot_id,
-                }
+            return game, None, current_players, player_handicap, profile
 
-        # Get current players
-        current_players = db.query(models.GamePlayer).filter(models.GamePlayer.game_id == game.game_id).all()
+        game, existing, current_players, player_handicap, profile = await database.run_db(find_game_and_players)
+        if existing is not None:
+            return {
+                "status": "already_joined",
+                "message": "You've already joined this game",
+                "game_id": game.game_id,
+                "player_slot_id": existing.player_slot_id,
+            }
 
-        # Check player limit
         max_players = game.state.get("player_count", 4)
-        if len(current_players) >= max_players:
-            raise HTTPException(status_code=400, detail="Game is full")
 
         # Assign player slot
         player_slot_id = f"p{len(current_players) + 1}"
         current_time = utc_now().isoformat()
 
-        # Explicit handicap always wins. Otherwise fill from the roster — never
-        # let a silent 18 stand in for a rostered scratch player.
         handicap_was_omitted = request.handicap is None
-        player_handicap, profile = resolve_player_handicap(
-            db,
-            name=request.player_name,
-            handicap=request.handicap,
-            player_profile_id=request.player_profile_id,
-        )
         resolved_profile_id = int(profile.id) if profile is not None else request.player_profile_id
         handicap_source = "manual" if not handicap_was_omitted else ("profile" if profile else "manual")
 
@@ -400,38 +420,41 @@ async def join_game_with_code(  # type: ignore
             except Exception as ghin_err:
                 logger.warning("GHIN lookup failed for %s: %s", request.player_name, ghin_err)
 
-        # Create GamePlayer record
-        game_player = models.GamePlayer(
-            game_id=game.game_id,
-            player_slot_id=player_slot_id,
-            user_id=request.user_id,
-            player_profile_id=resolved_profile_id,
-            player_name=request.player_name,
-            handicap=player_handicap,
-            join_status="joined",
-            joined_at=current_time,
-            created_at=current_time,
-        )
-        db.add(game_player)
+        def record_join() -> None:
+            # Create GamePlayer record
+            game_player = models.GamePlayer(
+                game_id=game.game_id,
+                player_slot_id=player_slot_id,
+                user_id=request.user_id,
+                player_profile_id=resolved_profile_id,
+                player_name=request.player_name,
+                handicap=player_handicap,
+                join_status="joined",
+                joined_at=current_time,
+                created_at=current_time,
+            )
+            db.add(game_player)
 
-        # Update game state with new player. Build the list and reassign the
-        # top-level key (not .append on the nested list) so MutableDict tracks it.
-        players = list(game.state.get("players", []))
-        players.append(
-            {
-                "id": player_slot_id,
-                "name": request.player_name,
-                "handicap": player_handicap,
-                "user_id": request.user_id,
-                "player_profile_id": resolved_profile_id,
-            }
-        )
-        game.state["players"] = players
-        game.updated_at = current_time
+            # Update game state with new player. Build the list and reassign the
+            # top-level key (not .append on the nested list) so MutableDict tracks it.
+            players = list(game.state.get("players", []))
+            players.append(
+                {
+                    "id": player_slot_id,
+                    "name": request.player_name,
+                    "handicap": player_handicap,
+                    "user_id": request.user_id,
+                    "player_profile_id": resolved_profile_id,
+                }
+            )
+            game.state["players"] = players
+            game.updated_at = current_time
 
-        flag_modified(game, "state")
-        db.commit()
-        db.refresh(game_player)
+            flag_modified(game, "state")
+            db.commit()
+            db.refresh(game_player)
+
+        await database.run_db(record_join)
 
         return {
             "status": "joined",
@@ -447,12 +470,12 @@ async def join_game_with_code(  # type: ignore
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await database.run_db(db.rollback)
         raise HTTPException(status_code=500, detail=f"Error joining game: {e!s}")
 
 
-@router.get("/{game_id}/lobby")
-async def get_game_lobby(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
+@router.get("/{game_id}/lobby", response_model=dict[str, Any])
+def get_game_lobby(game_id: str, db: Session = Depends(database.get_db)) -> FastJSONResponse:
     """Get game lobby information - who has joined"""
     try:
         game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
@@ -469,29 +492,31 @@ async def get_game_lobby(game_id: str, db: Session = Depends(database.get_db)) -
 
         max_players = game.state.get("player_count", 4)
 
-        return {
-            "game_id": game_id,
-            "join_code": game.join_code,
-            "status": game.game_status,
-            "course_name": game.state.get("course_name"),
-            "max_players": max_players,
-            "players_joined": len(players),
-            "ready_to_start": len(players) >= 2 and len(players) <= max_players,
-            "tee_order_set": game.state.get("tee_order_set", False),
-            "players": [
-                {
-                    "player_slot_id": p.player_slot_id,
-                    "player_name": p.player_name,
-                    "handicap": p.handicap,
-                    "is_authenticated": p.user_id is not None,
-                    "join_status": p.join_status,
-                    "joined_at": p.joined_at,
-                    "tee_order": p.tee_order,
-                }
-                for p in players
-            ],
-            "created_at": game.created_at,
-        }
+        return FastJSONResponse(
+            {
+                "game_id": game_id,
+                "join_code": game.join_code,
+                "status": game.game_status,
+                "course_name": game.state.get("course_name"),
+                "max_players": max_players,
+                "players_joined": len(players),
+                "ready_to_start": len(players) >= 2 and len(players) <= max_players,
+                "tee_order_set": game.state.get("tee_order_set", False),
+                "players": [
+                    {
+                        "player_slot_id": p.player_slot_id,
+                        "player_name": p.player_name,
+                        "handicap": p.handicap,
+                        "is_authenticated": p.user_id is not None,
+                        "join_status": p.join_status,
+                        "joined_at": p.joined_at,
+                        "tee_order": p.tee_order,
+                    }
+                    for p in players
+                ],
+                "created_at": game.created_at,
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -499,9 +524,7 @@ async def get_game_lobby(game_id: str, db: Session = Depends(database.get_db)) -
 
 
 @router.patch("/{game_id}/tee-order")
-async def set_tee_order(
-    game_id: str, request: SetTeeOrderRequest, db: Session = Depends(database.get_db)
-) -> dict[str, Any]:
+def set_tee_order(game_id: str, request: SetTeeOrderRequest, db: Session = Depends(database.get_db)) -> dict[str, Any]:
     """Set or update the tee order for the game at any time during gameplay"""
     try:
         game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
@@ -559,7 +582,7 @@ async def set_tee_order(
 
 
 @router.post("/{game_id}/start")
-async def start_game_from_lobby(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
+def start_game_from_lobby(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
     """Start a game from the lobby - initializes WGP simulation"""
     # MIGRATED: Using GameLifecycleService instead of global active_games
 
@@ -635,10 +658,12 @@ async def start_game_from_lobby(game_id: str, db: Session = Depends(database.get
 
         try:
             # Create simulation with configured player count, actual players, and course manager
+            # The route persists the state itself, so the engine stores nothing.
             simulation = WolfGoatPigGame(
                 player_count=configured_player_count,
                 players=wgp_players,
                 course_manager=course_manager,
+                persistence=NullPersistence(),
             )
             logger.info(f"Simulation initialized for game {game_id}")
         except Exception as init_error:
@@ -694,12 +719,40 @@ async def start_game_from_lobby(game_id: str, db: Session = Depends(database.get
         raise HTTPException(status_code=500, detail=f"Error starting game: {e!s}")
 
 
+def _encode_cursor(created_at: str | None, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([created_at, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str | None, int]:
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (None if created_at is None else parse_iso_timestamp(created_at).isoformat()), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _count_games(db: Session, status: str | None, creator_user_id: str | None) -> int:
+    """Total games matching the filters, cached for a minute per filter combination."""
+    key = f"games:{status}:{creator_user_id}"
+    total = game_count_cache.get(key)
+    if total is None:
+        query = select(func.count()).select_from(models.GameStateModel)
+        if status:
+            query = query.where(models.GameStateModel.game_status == status)
+        if creator_user_id:
+            query = query.where(models.GameStateModel.creator_user_id == creator_user_id)
+        total = db.execute(query).scalar_one()
+        game_count_cache.set(key, total)
+    return total
+
+
 @router.get("")
-async def get_games(  # type: ignore
+def get_games(  # type: ignore
     status: str | None = Query(None, description="Filter by game status: setup, in_progress, completed"),
     creator_user_id: str | None = Query(None, description="Filter by creator user ID"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of games to return"),
-    offset: int = Query(0, ge=0, description="Number of games to skip"),
+    offset: int = Query(0, ge=0, description="Number of games to skip (ignored when cursor is given)"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(database.get_db),
 ):
     """
@@ -709,61 +762,92 @@ async def get_games(  # type: ignore
     - status: Filter by game_status (setup, in_progress, completed)
     - creator_user_id: Filter by game creator
     - limit: Maximum results (1-100, default 20)
-    - offset: Pagination offset (default 0)
+    - cursor: Keyset cursor returned as next_cursor by the previous page
+    - offset: Pagination offset (default 0), for callers that do not pass a cursor
+
+    Only metadata columns are read (never the state blob) and player counts
+    come from one grouped join, so a page is a single query. total_count is
+    cached for a minute and may trail very recent creates.
     """
     try:
-        # Build query
-        query = db.query(models.GameStateModel)
-
-        # Apply filters
+        game = models.GameStateModel
+
+        page = select(
+            game.id,
+            game.game_id,
+            game.join_code,
+            game.game_status,
+            game.creator_user_id,
+            game.created_at,
+            game.updated_at,
+        )
         if status:
-            query = query.filter(models.GameStateModel.game_status == status)
-
+            page = page.where(game.game_status == status)
         if creator_user_id:
-            query = query.filter(models.GameStateModel.creator_user_id == creator_user_id)
-
-        # Order by created_at descending (newest first)
-        query = query.order_by(models.GameStateModel.created_at.desc())
-
-        # Get total count before pagination
-        total_count = query.count()
-
-        # Apply pagination
-        games = query.offset(offset).limit(limit).all()
-
-        # Format response
-        games_list = []
-        for game in games:
-            # Get player count
-            player_count = db.query(models.GamePlayer).filter(models.GamePlayer.game_id == game.game_id).count()
-
-            games_list.append(
-                {
-                    "game_id": game.game_id,
-                    "join_code": game.join_code,
-                    "game_status": game.game_status,
-                    "creator_user_id": game.creator_user_id,
-                    "player_count": player_count,
-                    "created_at": game.created_at,
-                    "updated_at": game.updated_at,
-                }
-            )
+            page = page.where(game.creator_user_id == creator_user_id)
+        if cursor:
+            after_created_at, after_id = _decode_cursor(cursor)
+            if after_created_at is None:
+                page = page.where(game.created_at.is_(None), game.id < after_id)
+            else:
+                page = page.where(
+                    or_(
+                        game.created_at < after_created_at,
+                        and_(game.created_at == after_created_at, game.id < after_id),
+                        game.created_at.is_(None),
+                    )
+                )
+        # Newest first (undated rows last); id breaks ties between games created in the same instant
+        page = page.order_by(game.created_at.desc().nulls_last(), game.id.desc()).limit(limit + 1)
+        if offset and not cursor:
+            page = page.offset(offset)
+        page = page.cte("page")
+
+        player_counts = (
+            select(models.GamePlayer.game_id, func.count().label("player_count"))
+            .where(models.GamePlayer.game_id.in_(select(page.c.game_id)))
+            .group_by(models.GamePlayer.game_id)
+            .subquery()
+        )
+        rows = db.execute(
+            select(page, func.coalesce(player_counts.c.player_count, 0).label("player_count"))
+            .outerjoin(player_counts, player_counts.c.game_id == page.c.game_id)
+            .order_by(page.c.created_at.desc().nulls_last(), page.c.id.desc())
+        ).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        games_list = [
+            {
+                "game_id": row.game_id,
+                "join_code": row.join_code,
+                "game_status": row.game_status,
+                "creator_user_id": row.creator_user_id,
+                "player_count": row.player_count,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            }
+            for row in rows
+        ]
 
         return {
             "games": games_list,
-            "total_count": total_count,
+            "total_count": _count_games(db, status, creator_user_id),
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < total_count,
+            "has_more": has_more,
+            "next_cursor": _encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving games: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving games: {e!s}")
 
 
 @router.delete("/{game_id}")
-async def delete_game(game_id: str, db: Session = Depends(database.get_db)):  # type: ignore
+def delete_game(game_id: str, db: Session = Depends(database.get_db)):  # type: ignore
     """
     Delete a game and all associated data.
 
@@ -808,6 +892,7 @@ async def delete_game(game_id: str, db: Session = Depends(database.get_db)):  #
         # Delete the game state itself
         db.delete(game)
         db.commit()
+        game_count_cache.clear()
 
         logger.info(f"Successfully deleted game {game_id} and {players_deleted} associated players")
 
@@ -828,7 +913,7 @@ async def delete_game(game_id: str, db: Session = Depends(database.get_db)):  #
 
 
 @router.post("/{game_id}/complete")
-async def mark_game_complete(game_id: str, db: Session = Depends(database.get_db)):
+def mark_game_complete(game_id: str, db: Session = Depends(database.get_db)):
     """
     Mark a game as completed and persist results to GameRecord / GamePlayerResult.
 
@@ -910,8 +995,8 @@ async def mark_game_complete(game_id: str, db: Session = Depends(database.get_db
         raise HTTPException(status_code=500, detail=f"Error completing game: {e!s}")
 
 
-@router.get("/{game_id}/state")
-async def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
+@router.get("/{game_id}/state", response_model=dict[str, Any])
+def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_db)) -> FastJSONResponse:
     """Get current game state for a specific multiplayer game.
 
     The database is the single source of truth. (The old in-memory simulation
@@ -929,7 +1014,7 @@ async def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_
 
         # If game is completed, just return the saved state
         if game.game_status == "completed":
-            return game.state  # type: ignore
+            return FastJSONResponse(game.state)
 
         # If game is in setup, return lobby info
         if game.game_status == "setup":
@@ -940,20 +1025,22 @@ async def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_
                 .all()
             )
 
-            return {
-                "game_id": game_id,
-                "game_status": "setup",
-                "players": [
-                    {
-                        "id": p.player_slot_id,
-                        "name": p.player_name,
-                        "handicap": p.handicap,
-                        "tee_order": p.tee_order,
-                    }
-                    for p in players
-                ],
-                "message": "Game not started yet. Please start from lobby.",
-            }
+            return FastJSONResponse(
+                {
+                    "game_id": game_id,
+                    "game_status": "setup",
+                    "players": [
+                        {
+                            "id": p.player_slot_id,
+                            "name": p.player_name,
+                            "handicap": p.handicap,
+                            "tee_order": p.tee_order,
+                        }
+                        for p in players
+                    ],
+                    "message": "Game not started yet. Please start from lobby.",
+                }
+            )
 
         # Game is in_progress but not in active_games (server restart?)
         # Return the saved state - SimpleScorekeeper works directly with game.state
@@ -999,7 +1086,7 @@ async def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_
                 )
             saved_state["players"] = enriched_players
 
-        return saved_state
+        return FastJSONResponse(saved_state)
 
     except HTTPException:
         raise
@@ -1008,8 +1095,26 @@ async def get_game_state_by_id(game_id: str, db: Session = Depends(database.get_
         raise HTTPException(status_code=500, detail=f"Error retrieving game state: {e!s}")
 
 
+@router.get("/history/export", response_class=StreamingResponse)
+def export_game_history(
+    fmt: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    db: Session = Depends(database.get_db),
+) -> StreamingResponse:
+    """Stream every completed game, newest first, as NDJSON or CSV.
+
+    Same fields as /games/history; rows are read in batches and written
+    incrementally instead of being paged by the client.
+    """
+    record = models.GameRecord
+    stmt = select(*(getattr(record, column) for column in GAME_HISTORY_COLUMNS)).order_by(
+        record.completed_at.desc(), record.id.desc()
+    )
+    rows = (row._asdict() for row in stream_rows(db, stmt))
+    return export_response(rows, fmt, GAME_HISTORY_COLUMNS, "game-history")
+
+
 @router.get("/history")
-async def get_game_history(limit: int = 10, offset: int = 0, db: Session = Depends(database.get_db)) -> dict[str, Any]:
+def get_game_history(limit: int = 10, offset: int = 0, db: Session = Depends(database.get_db)) -> dict[str, Any]:
     """Get list of completed games"""
     try:
         games = (
@@ -1043,7 +1148,7 @@ async def get_game_history(limit: int = 10, offset: int = 0, db: Session = Depen
 
 
 @router.get("/{game_id}/details")
-async def get_game_details(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
+def get_game_details(game_id: str, db: Session = Depends(database.get_db)) -> dict[str, Any]:
     """Get detailed game results including player performances and hole-by-hole scores"""
     try:
         # Get game record
@@ -1100,7 +1205,7 @@ class ScorecardBackfillRequest(BaseModel):
 
 
 @router.patch("/{game_id}/scorecard")
-async def backfill_scorecard(
+def backfill_scorecard(
     game_id: str,
     body: ScorecardBackfillRequest,
     db: Session = Depends(database.get_db),
@@ -1143,9 +1248,14 @@ async def backfill_scorecard(
 
 
 @router.get("/{game_id}/scorecard-photo")
-async def get_scorecard_photo(game_id: str, db: Session = Depends(database.get_db)) -> Response:
+def get_scorecard_photo(game_id: str, db: Session = Depends(database.get_db)) -> Response:
     """Return the stored scorecard photo for a scanned round (for later per-hole backfill)."""
-    game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
+    game = (
+        db.query(models.GameStateModel)
+        .options(undefer(models.GameStateModel.scorecard_image))
+        .filter(models.GameStateModel.game_id == game_id)
+        .first()
+    )
     if not game or not game.scorecard_image:
         raise HTTPException(status_code=404, detail="No scorecard photo for this round")
     raw = game.scorecard_image
@@ -1,17 +1,21 @@
-"""Hole operations — quarters-only scoring, per-player corrections, logs, validation."""
+"""Hole operations — quarters-only scoring, per-player corrections, logs, validation, what-if replays."""
 
 import json
 import logging
 import traceback
-from typing import Any
+from typing import Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.exc import StaleDataError
 
-from .. import database, models
+from .. import database, models, schemas
+from ..db_helpers import commit_with_optimistic_retry
+from ..services.hole_completion_service import refresh_running_totals
+from ..services.what_if_service import replay_what_if
 from ..utils.time import utc_now
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,8 @@ router = APIRouter(prefix="/games", tags=["games"])
 # A standard round is complete only when every hole 1-18 has score data.
 REQUIRED_HOLES = frozenset(range(1, 19))
 
+GAME_STATE_CONFLICT_DETAIL = "Game was updated concurrently by another scorekeeper; please retry"
+
 
 class HoleScore(BaseModel):
     hole_number: int
@@ -61,55 +67,53 @@ class ScoresRequest(BaseModel):
 
 
 @router.delete("/{game_id}/holes/{hole_number}")
-async def delete_hole(game_id: str, hole_number: int, db: Session = Depends(database.get_db)):  # type: ignore
+def delete_hole(game_id: str, hole_number: int, db: Session = Depends(database.get_db)):  # type: ignore
     """
     Delete a hole's data. Removes from hole_events (source of truth) and from
     the game state hole_history blob. Recalculates standings from what remains.
     """
-    game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
 
-    events = (
-        db.query(models.HoleEvent)
-        .filter(models.HoleEvent.game_id == game_id, models.HoleEvent.hole_number == hole_number)
-        .all()
-    )
-    if not events:
-        raise HTTPException(status_code=404, detail=f"Hole {hole_number} not found")
-
-    for row in events:
-        db.delete(row)
-
-    # Keep hole_history blob in sync
-    state = game.state or {}
-    state["hole_history"] = [h for h in state.get("hole_history", []) if h.get("hole") != hole_number]
-
-    # Recalculate standings from remaining hole_history
-    standings: dict[str, float] = {}
-    for entry in state["hole_history"]:
-        for pid, q in entry.get("points_delta", {}).items():
-            standings[pid] = standings.get(pid, 0) + q
-    state["standings"] = standings
-    for p in state.get("players", []):
-        p["total_points"] = standings.get(p.get("id"), 0)
-
-    flag_modified(game, "state")
-    game.updated_at = utc_now().isoformat()
-    db.commit()
+    def apply_delete() -> None:
+        game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
+
+        events = (
+            db.query(models.HoleEvent)
+            .filter(models.HoleEvent.game_id == game_id, models.HoleEvent.hole_number == hole_number)
+            .all()
+        )
+        if not events:
+            raise HTTPException(status_code=404, detail=f"Hole {hole_number} not found")
+
+        for row in events:
+            db.delete(row)
+
+        # Keep hole_history blob in sync
+        state = cast("dict[str, Any]", game.state or {})
+        state["hole_history"] = [h for h in state.get("hole_history", []) if h.get("hole") != hole_number]
+
+        # Recalculate standings and every later hole's running_totals prefix
+        refresh_running_totals(state)
+        for p in state.get("players", []):
+            p["total_points"] = state["standings"].get(p.get("id"), 0)
+
+        flag_modified(game, "state")
+        game.updated_at = utc_now().isoformat()
+
+    try:
+        commit_with_optimistic_retry(db, apply_delete)
+    except StaleDataError:
+        raise HTTPException(status_code=409, detail=GAME_STATE_CONFLICT_DETAIL)
 
     logger.info(f"Deleted hole {hole_number} from game {game_id}")
     return {"success": True, "game_id": game_id, "hole_number": hole_number}
 
 
 @router.post("/{game_id}/scores")
-async def save_scores(game_id: str, request: ScoresRequest, db: Session = Depends(database.get_db)):
+def save_scores(game_id: str, request: ScoresRequest, db: Session = Depends(database.get_db)):
     """Submit hole scores for a game. Each hole must sum to zero. Upserts — safe to call repeatedly."""
     try:
-        game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
-        if not game:
-            raise HTTPException(status_code=404, detail="Game not found")
-
         # Collapse duplicate hole entries within this payload (last write wins).
         # Offline sync can replay a hole, sending the same hole_number twice in
         # one request. Left unmerged that double-counts standings (inflated money)
@@ -126,51 +130,7 @@ async def save_scores(game_id: str, request: ScoresRequest, db: Session = Depend
         if errors:
             raise HTTPException(status_code=400, detail=f"Zero-sum validation failed: {'; '.join(errors)}")
 
-        # Calculate standings
-        standings: dict[str, float] = {}
-        for h in holes:
-            for player_id, quarters in h.quarters.items():
-                standings[player_id] = standings.get(player_id, 0) + quarters
-
-        # Persist to hole_events (upsert per player per hole)
-        now_ts = utc_now().isoformat()
-        for h in holes:
-            for player_id, quarters in h.quarters.items():
-                existing = (
-                    db.query(models.HoleEvent)
-                    .filter(
-                        models.HoleEvent.game_id == game_id,
-                        models.HoleEvent.hole_number == h.hole_number,
-                        models.HoleEvent.player_id == player_id,
-                    )
-                    .first()
-                )
-                gross = (h.gross_scores or {}).get(player_id)
-                if existing:
-                    existing.quarters = quarters
-                    if gross is not None:
-                        existing.score = gross
-                    existing.recorded_at = now_ts
-                else:
-                    db.add(
-                        models.HoleEvent(
-                            game_id=game_id,
-                            hole_number=h.hole_number,
-                            player_id=player_id,
-                            score=gross,
-                            quarters=quarters,
-                            recorded_at=now_ts,
-                        )
-                    )
-
-        # Keep game state blob in sync for client reads
-        game_state = game.state or {}
-        game_state["current_hole"] = request.current_hole
-        game_state["standings"] = standings
-        for player in game_state.get("players", []):
-            player["total_points"] = standings.get(player.get("id"), 0)
-
-        hole_history = [
+        submitted_history = [
             {
                 "hole": h.hole_number,
                 "points_delta": h.quarters,
@@ -190,31 +150,89 @@ async def save_scores(game_id: str, request: ScoresRequest, db: Session = Depend
                 "aardvark_ping_ponged": h.aardvark_ping_ponged,
                 "carry_over_applied": h.carry_over_applied,
             }
-            for h in sorted(holes, key=lambda x: x.hole_number)
+            for h in holes
         ]
-        game_state["hole_history"] = hole_history
+
+        def apply_scores() -> tuple[models.GameStateModel, dict[str, Any]]:
+            # Re-run from a fresh read on every attempt: the submitted holes are
+            # the delta, merged over whatever another scorekeeper committed.
+            game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
+            if not game:
+                raise HTTPException(status_code=404, detail="Game not found")
+
+            # Persist to hole_events (upsert per player per hole)
+            now_ts = utc_now().isoformat()
+            for h in holes:
+                for player_id, quarters in h.quarters.items():
+                    existing = (
+                        db.query(models.HoleEvent)
+                        .filter(
+                            models.HoleEvent.game_id == game_id,
+                            models.HoleEvent.hole_number == h.hole_number,
+                            models.HoleEvent.player_id == player_id,
+                        )
+                        .first()
+                    )
+                    gross = (h.gross_scores or {}).get(player_id)
+                    if existing:
+                        existing.quarters = quarters
+                        if gross is not None:
+                            existing.score = gross
+                        existing.recorded_at = now_ts
+                    else:
+                        db.add(
+                            models.HoleEvent(
+                                game_id=game_id,
+                                hole_number=h.hole_number,
+                                player_id=player_id,
+                                score=gross,
+                                quarters=quarters,
+                                recorded_at=now_ts,
+                            )
+                        )
+
+            # Keep game state blob in sync for client reads. Submitted holes
+            # replace their hole_history entries; holes not in this payload keep
+            # what is already stored, matching the per-hole hole_events upsert.
+            game_state = dict(game.state or {})
+            merged = {entry.get("hole"): entry for entry in game_state.get("hole_history", [])}
+            merged.update({entry["hole"]: entry for entry in submitted_history})
+            hole_history = sorted(merged.values(), key=lambda entry: entry.get("hole") or 0)
+
+            game_state["current_hole"] = request.current_hole
+            game_state["hole_history"] = hole_history
+            game_state["players"] = [dict(player) for player in game_state.get("players", [])]
+            # Standings and each hole's running_totals prefix, from the merged history
+            refresh_running_totals(game_state)
+            for player in game_state["players"]:
+                player["total_points"] = game_state["standings"].get(player.get("id"), 0)
+
+            # Gate completion on the DISTINCT set of holes 1-18 actually played, not
+            # the raw entry count. Counting raw entries let 18 rows that skip a real
+            # hole (or duplicate one) trip completion before hole 18 was played.
+            if REQUIRED_HOLES.issubset(merged):
+                game_state["game_status"] = "completed"
+                game.game_status = "completed"
+            elif holes:
+                game_state["game_status"] = "in_progress"
+                game.game_status = "in_progress"
+
+            # A fresh top-level dict marks the JSON column dirty, so the version
+            # compare-and-swap covers this write.
+            game.state = game_state
+            game.updated_at = now_ts
+            return game, game_state
+
+        try:
+            game, game_state = commit_with_optimistic_retry(db, apply_scores)
+        except StaleDataError:
+            raise HTTPException(status_code=409, detail=GAME_STATE_CONFLICT_DETAIL)
 
         holes_with_data = len(holes)
-        # Gate completion on the DISTINCT set of holes 1-18 actually played, not
-        # the raw entry count. Counting raw entries let 18 rows that skip a real
-        # hole (or duplicate one) trip completion before hole 18 was played.
-        distinct_holes = {h.hole_number for h in holes}
+        hole_history = game_state["hole_history"]
+        standings = game_state["standings"]
+        distinct_holes = {entry.get("hole") for entry in hole_history}
         game_complete = REQUIRED_HOLES.issubset(distinct_holes)
-        if game_complete:
-            game_state["game_status"] = "completed"
-            game.game_status = "completed"
-        elif holes_with_data > 0:
-            game_state["game_status"] = "in_progress"
-            game.game_status = "in_progress"
-
-        game.state = game_state
-        # game_state is the SAME dict object as game.state (line above:
-        # `game.state or {}`), so reassigning it does NOT mark the JSON column
-        # dirty — SQLAlchemy can't see in-place mutations of a JSON blob. Without
-        # this, hole_history/current_hole/standings never persist (only the
-        # separate hole_events rows do), and /state reads back stale-empty state.
-        flag_modified(game, "state")
-        db.commit()
 
         logger.info(f"Saved quarters-only data for game {game_id}: {holes_with_data} holes")
 
@@ -354,7 +372,7 @@ class HoleEventPatch(BaseModel):
 
 
 @router.patch("/{game_id}/holes/{hole_number}/players/{player_id}")
-async def patch_hole_event(
+def patch_hole_event(
     game_id: str,
     hole_number: int,
     player_id: str,
@@ -406,7 +424,7 @@ async def patch_hole_event(
 
 
 @router.get("/{game_id}/holes/validate")
-async def validate_hole_quarters(
+def validate_hole_quarters(
     game_id: str,
     db: Session = Depends(database.get_db),
 ) -> dict[str, Any]:
@@ -447,6 +465,24 @@ async def validate_hole_quarters(
     }
 
 
+@router.post("/{game_id}/what-if")
+def replay_game_what_if(
+    game_id: str,
+    request: schemas.WhatIfRequest,
+    db: Session = Depends(database.get_db),
+) -> dict[str, Any]:
+    """Re-score the recorded round under alternative decisions.
+
+    Each scenario swaps decisions on recorded holes (a different partner, going
+    solo, declining the last double, floating) and gets back the resulting
+    totals and per-player difference from the recorded totals. Nothing is saved.
+    """
+    game = db.query(models.GameStateModel).filter(models.GameStateModel.game_id == game_id).first()
+    if not game:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return {"game_id": game_id, **replay_what_if(cast("dict[str, Any]", game.state or {}), request.scenarios)}
+
+
 # ---------------------------------------------------------------------------
 # Hole log — narrative record of a hole's betting arc and play
 # ---------------------------------------------------------------------------
@@ -457,7 +493,7 @@ class HoleLogRequest(BaseModel):
 
 
 @router.put("/{game_id}/holes/{hole_number}/log")
-async def put_hole_log(
+def put_hole_log(
     game_id: str,
     hole_number: int,
     body: HoleLogRequest,
@@ -490,7 +526,7 @@ async def put_hole_log(
 
 
 @router.get("/{game_id}/holes/{hole_number}/log")
-async def get_hole_log(
+def get_hole_log(
     game_id: str,
     hole_number: int,
     db: Session = Depends(database.get_db),
@@ -507,7 +543,7 @@ async def get_hole_log(
 
 
 @router.get("/{game_id}/log")
-async def get_game_log(
+def get_game_log(
     game_id: str,
     db: Session = Depends(database.get_db),
 ) -> dict[str, Any]:
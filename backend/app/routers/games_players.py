@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from .. import database, models
+from ..mixins import NullPersistence
 from ..services.game_lifecycle_service import get_game_lifecycle_service
 from ..state.course_manager import CourseManager
 from ..utils.handicap_resolve import resolve_player_handicap
@@ -179,7 +180,7 @@ def roster_suggestions(db: Session = Depends(database.get_db)) -> Any:
 
 
 @router.post("/create-custom")
-async def create_custom_game(body: CreateCustomGameRequest, db: Session = Depends(database.get_db)) -> Any:
+def create_custom_game(body: CreateCustomGameRequest, db: Session = Depends(database.get_db)) -> Any:
     """Create a started game from a custom roster of real and/or ghost
     players. Ghosts are flagged is_authenticated=False so Stuart Mode
     auto-plays them. Lands the host straight in the scorekeeper."""
@@ -215,7 +216,10 @@ async def create_custom_game(body: CreateCustomGameRequest, db: Session = Depend
         except Exception:
             logger.exception("Course load failed for custom game (continuing without)")
 
-    simulation = WolfGoatPigGame(player_count=len(seeds), players=wgp_players, course_manager=course_manager)
+    # The engine only builds the initial state; the rows below persist it.
+    simulation = WolfGoatPigGame(
+        player_count=len(seeds), players=wgp_players, course_manager=course_manager, persistence=NullPersistence()
+    )
     # Mark ghosts as computer-controlled in the engine
     ghost_ids = [s["id"] for s in seeds if s["is_ghost"]]
     if ghost_ids:
@@ -283,7 +287,7 @@ async def create_custom_game(body: CreateCustomGameRequest, db: Session = Depend
 
 
 @router.post("/create-test")
-async def create_test_game(
+def create_test_game(
     course_name: str | None = None,
     player_count: int = 4,
     db: Session = Depends(database.get_db),
@@ -373,6 +377,7 @@ async def create_test_game(
         player_count=player_count,
         players=wgp_players,
         course_manager=test_course_manager,
+        persistence=NullPersistence(),
     )
 
     # Get the game state (game is already started in __init__)
@@ -488,7 +493,7 @@ async def create_test_game(
 
 
 @router.patch("/{game_id}/players/{player_id}/name")
-async def update_player_name(
+def update_player_name(
     game_id: str,
     player_id: str,
     name_update: UpdatePlayerNameRequest,
@@ -528,7 +533,7 @@ async def update_player_name(
 
 
 @router.delete("/{game_id}/players/{player_slot_id}")
-async def remove_player(game_id: str, player_slot_id: str, db: Session = Depends(database.get_db)):  # type: ignore
+def remove_player(game_id: str, player_slot_id: str, db: Session = Depends(database.get_db)):  # type: ignore
     """
     Remove a player from a game in setup/lobby status.
     Only allowed before game starts.
@@ -599,7 +604,7 @@ async def remove_player(game_id: str, player_slot_id: str, db: Session = Depends
 
 
 @router.patch("/{game_id}/players/{player_slot_id}/handicap")
-async def update_player_handicap(  # type: ignore
+def update_player_handicap(  # type: ignore
     game_id: str,
     player_slot_id: str,
     handicap_update: UpdateHandicapRequest,
@@ -676,7 +681,7 @@ async def update_player_handicap(  # type: ignore
 
 
 @router.patch("/{game_id}/hitting-order")
-async def update_hitting_order(
+def update_hitting_order(
     game_id: str,
     body: UpdateHittingOrderRequest,
     db: Session = Depends(database.get_db),
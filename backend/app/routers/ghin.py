@@ -14,7 +14,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from .. import database
-from ..database import get_db
+from ..database import get_db, run_db
 
 logger = logging.getLogger("app.routers.ghin")
 
@@ -177,10 +177,10 @@ async def post_score(
 @router.post("/sync-handicaps")
 async def sync_ghin_handicaps():
     """Sync handicaps for all players with GHIN IDs."""
-    try:
-        db = database.SessionLocal()
-        from ..services.ghin_service import GHINService
+    from ..services.ghin_service import GHINService
 
+    db = await run_db(database.SessionLocal)
+    try:
         ghin_service = GHINService(db)
 
         # Initialize and check if available
@@ -200,4 +200,4 @@ async def sync_ghin_handicaps():
         logger.error(f"Error syncing GHIN handicaps: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to sync GHIN handicaps: {e!s}")
     finally:
-        db.close()
+        await run_db(db.close)
@@ -13,14 +13,16 @@ import os
 import time as _time
 from typing import Any, cast
 
-from fastapi import APIRouter, Header, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 
 from .. import models
 from ..observability.external_checks import check_all
+from ..observability.metrics import registry as metrics_registry
 from ..observability.report import report_message
 from ..state.course_manager import CourseManager
+from ..utils.admin_auth import require_admin
 from ..utils.api_helpers import handle_api_errors, managed_session
 from ..utils.time import utc_now
 
@@ -390,3 +392,9 @@ async def external_health(
 
     _EXTERNAL_CACHE.update(at=now, payload=payload, http_status=http_status)
     return JSONResponse(status_code=http_status, content={**payload, "cached": False})
+
+
+@router.get("/metrics", include_in_schema=False, dependencies=[Depends(require_admin)])
+def metrics() -> PlainTextResponse:
+    """Per-route latency, response size and DB usage in Prometheus text format (admin only)."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
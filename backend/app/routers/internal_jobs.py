@@ -4,6 +4,9 @@ Each in-process `schedule` loop in ``email_scheduler`` also exists here as a
 one-shot POST endpoint so that **Cloud Scheduler** can drive the periodic work on
 Cloud Run — where the single-long-lived-process assumption behind the in-process
 thread does not hold (every autoscaled instance would otherwise run its own copy).
+Both paths take the job's row in ``job_leases`` first (see
+``services/job_lease_service.py``), so a job already running or recently run
+elsewhere comes back as ``{"status": "skipped"}``.
 
 Security: the Cloud Run service is deployed ``--allow-unauthenticated``, so these
 endpoints are guarded at the application layer by a shared secret,
@@ -259,7 +259,7 @@ def run_matchmaking_for_player(
 
 @router.get("/my-matches", response_model=list[schemas.MatchSuggestionResponse])
 @handle_api_errors(operation_name="get my matches")
-async def get_my_matches(
+def get_my_matches(
     status: str | None = Query(None, description="Filter by status: pending, accepted, declined, expired"),
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -322,7 +322,7 @@ async def get_my_matches(
 
 @router.post("/matches/{match_id}/respond")
 @handle_api_errors(operation_name="respond to match")
-async def respond_to_match(
+def respond_to_match(
     match_id: int = Path(description="Match suggestion ID"),
     response_body: schemas.MatchResponseRequest = ...,
     current_user: models.PlayerProfile = Depends(get_current_user),
@@ -550,7 +550,7 @@ async def respond_to_match(
 
 @router.get("/matches/{match_id}")
 @handle_api_errors(operation_name="get match details")
-async def get_match_details(
+def get_match_details(
     match_id: int = Path(description="Match suggestion ID"),
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -708,7 +708,7 @@ def get_match_suggestions(
 
 
 @router.post("/create-and-notify")
-async def create_and_notify_matches(db: Session = Depends(get_db)) -> dict[str, Any]:
+def create_and_notify_matches(db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Run the full matchmaking process: find matches and send notifications.
     This endpoint can be called by a scheduler or manually.
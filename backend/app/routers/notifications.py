@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models import Notification, PlayerProfile
 from ..services.auth_service import get_current_user
+from ..services.notification_service import get_notification_service
 
 logger = logging.getLogger("app.routers.notifications")
 
@@ -52,14 +53,7 @@ def get_unread_count(
     current_user: PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    count = (
-        db.query(Notification)
-        .filter(
-            Notification.player_profile_id == current_user.id,
-            Notification.is_read == False,
-        )
-        .count()
-    )
+    count = get_notification_service().get_unread_count(current_user.id, db)
     return {"unread_count": count}
 
 
@@ -68,15 +62,7 @@ def mark_all_read(
     current_user: PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    updated = (
-        db.query(Notification)
-        .filter(
-            Notification.player_profile_id == current_user.id,
-            Notification.is_read == False,
-        )
-        .update({"is_read": True})
-    )
-    db.commit()
+    updated = get_notification_service().mark_all_as_read(current_user.id, db)
     return {"marked_read": updated}
 
 
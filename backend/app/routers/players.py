@@ -13,17 +13,18 @@ To migrate: Replace players.py with this file after testing.
 """
 
 import base64
+import hashlib
 import logging
 from io import BytesIO
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
 from fastapi.responses import Response
-from PIL import Image, ImageOps
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
+from starlette.concurrency import run_in_threadpool
 
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, run_db
 from ..services import media_storage_service
 from ..services.auth_service import get_current_auth0_user, get_current_user
 from ..services.legacy_player_service import (
@@ -32,7 +33,7 @@ from ..services.legacy_player_service import (
     link_profile_to_canonical_name,
 )
 from ..services.player_service import PlayerService
-from ..services.unified_data_service import get_unified_data_service
+from ..services.public_profile_service import all_players_availability, get_public_profile
 from ..utils.admin_auth import is_super_admin_email
 from ..utils.api_helpers import ApiResponse, handle_api_errors, require_not_none
 from ..utils.time import utc_now
@@ -40,10 +41,14 @@ from ..utils.time import utc_now
 AVATAR_ALLOWED_TYPES = {"image/jpeg", "image/png", "image/webp", "image/heic", "image/heif"}
 AVATAR_MAX_UPLOAD_BYTES = 8 * 1024 * 1024  # 8MB raw upload; we downscale server-side
 AVATAR_MAX_DIM = 400
+AVATAR_CACHE_CONTROL = "public, no-cache"
+AVATAR_VERSIONED_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 
 def _downscale_avatar_jpeg(image_bytes: bytes) -> bytes:
     """Resize to fit AVATAR_MAX_DIM, correct EXIF rotation, re-encode as JPEG bytes."""
+    from PIL import Image, ImageOps
+
     img = Image.open(BytesIO(image_bytes))
     img = ImageOps.exif_transpose(img)
     img = img.convert("RGB")
@@ -62,7 +67,7 @@ def _avatar_jpeg_for_player(player: models.PlayerProfile) -> bytes | None:
     """Resolve uploaded avatar bytes from GCS, data: URL, or legacy DB blob."""
     if media_storage_service.is_gcs_avatar_url(player.avatar_url):
         path = media_storage_service.gcs_path_from_marker(player.avatar_url or "")
-        return media_storage_service.download_bytes(path)
+        return media_storage_service.download_bytes_cached(path, version=player.updated_at)
     url = player.avatar_url or ""
     if url.startswith("data:image/"):
         try:
@@ -140,40 +145,8 @@ def get_player_profile_by_name(player_name: str, db: Session = Depends(get_db))
 @router.get("/availability/all", response_model=list[dict])
 @handle_api_errors(operation_name="get all players availability")
 def get_all_players_availability(db: Session = Depends(get_db)) -> list[dict[str, Any]]:
-    """Get all players' weekly availability with their names.
-
-    Uses two queries instead of N+1: one for all players, one for all availability records.
-    """
-    from collections import defaultdict
-
-    players = db.query(models.PlayerProfile).all()
-    all_availability = db.query(models.PlayerAvailability).all()
-
-    # Group availability by player_profile_id
-    availability_by_player: dict[int, list[models.PlayerAvailability]] = defaultdict(list)
-    for avail in all_availability:
-        availability_by_player[avail.player_profile_id].append(avail)
-
-    result: list[dict[str, Any]] = []
-    for player in players:
-        player_data: dict[str, Any] = {
-            "player_id": player.id,
-            "player_name": player.name,
-            "email": player.email,
-            "availability": [
-                {
-                    "day_of_week": avail.day_of_week,
-                    "is_available": avail.is_available,
-                    "available_from_time": avail.available_from_time,
-                    "available_to_time": avail.available_to_time,
-                    "notes": avail.notes,
-                }
-                for avail in availability_by_player.get(player.id, [])
-            ],
-        }
-        result.append(player_data)
-
-    return result
+    """Get all players' weekly availability with their names, in one query."""
+    return all_players_availability(db)
 
 
 # ============================================================================
@@ -183,7 +156,7 @@ def get_all_players_availability(db: Session = Depends(get_db)) -> list[dict[str
 
 @router.get("/me", response_model=schemas.PlayerProfileResponse)
 @handle_api_errors(operation_name="get my profile")
-async def get_my_profile(
+def get_my_profile(
     current_user: models.PlayerProfile = Depends(get_current_user),
     auth0_user: dict[str, Any] = Depends(get_current_auth0_user),
     db: Session = Depends(get_db),
@@ -215,7 +188,7 @@ async def get_my_profile(
 
 @router.put("/me/legacy-name", response_model=schemas.PlayerProfileResponse)
 @handle_api_errors(operation_name="update my legacy name")
-async def update_my_legacy_name(
+def update_my_legacy_name(
     legacy_name_update: dict[str, str | None],
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -262,7 +235,7 @@ async def update_my_legacy_name(
 
 @router.put("/me/venmo")
 @handle_api_errors(operation_name="update venmo handle")
-async def update_my_venmo(
+def update_my_venmo(
     body: dict[str, str | None],
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -282,7 +255,7 @@ async def update_my_venmo(
 
 @router.put("/me/description")
 @handle_api_errors(operation_name="update description")
-async def update_my_description(
+def update_my_description(
     body: dict[str, str | None],
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -313,14 +286,16 @@ async def upload_my_avatar(
         raise HTTPException(status_code=400, detail="Image too large. Maximum size is 8MB.")
 
     try:
-        jpeg_bytes = _downscale_avatar_jpeg(image_bytes)
+        jpeg_bytes = await run_in_threadpool(_downscale_avatar_jpeg, image_bytes)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Could not read image: {e}") from e
 
     if media_storage_service.is_enabled():
         object_path = media_storage_service.avatar_object_path(current_user.id)
         try:
-            media_storage_service.upload_bytes(object_path, jpeg_bytes, content_type="image/jpeg")
+            await run_in_threadpool(
+                media_storage_service.upload_bytes, object_path, jpeg_bytes, content_type="image/jpeg"
+            )
         except Exception as e:
             logger.exception("GCS avatar upload failed for player %s", current_user.id)
             raise HTTPException(status_code=502, detail=f"Could not store avatar: {e}") from e
@@ -330,15 +305,19 @@ async def upload_my_avatar(
         current_user.avatar_image = base64.b64encode(jpeg_bytes).decode("ascii")
 
     current_user.updated_at = utc_now().isoformat()
-    db.commit()
-    db.refresh(current_user)
+
+    def save() -> None:
+        db.commit()
+        db.refresh(current_user)
+
+    await run_db(save)
     logger.info(f"Updated avatar for user {current_user.id}")
     return {"has_avatar_image": True, "updated_at": current_user.updated_at}
 
 
 @router.get("/me/availability", response_model=list[schemas.PlayerAvailabilityResponse])
 @handle_api_errors(operation_name="get my availability")
-async def get_my_availability(
+def get_my_availability(
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> list[schemas.PlayerAvailabilityResponse]:
@@ -351,7 +330,7 @@ async def get_my_availability(
 
 @router.post("/me/availability", response_model=schemas.PlayerAvailabilityWithMatchesResponse)
 @handle_api_errors(operation_name="set my availability")
-async def set_my_availability(
+def set_my_availability(
     availability: schemas.PlayerAvailabilityCreate,
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -434,7 +413,7 @@ async def set_my_availability(
 
 @router.get("/me/email-preferences", response_model=schemas.EmailPreferencesResponse)
 @handle_api_errors(operation_name="get my email preferences")
-async def get_my_email_preferences(
+def get_my_email_preferences(
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> schemas.EmailPreferencesResponse:
@@ -469,7 +448,7 @@ async def get_my_email_preferences(
 
 @router.put("/me/email-preferences", response_model=schemas.EmailPreferencesResponse)
 @handle_api_errors(operation_name="update my email preferences")
-async def update_my_email_preferences(
+def update_my_email_preferences(
     preferences_update: schemas.EmailPreferencesUpdate,
     current_user: models.PlayerProfile = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -522,15 +501,30 @@ async def update_my_email_preferences(
 
 @router.get("/{player_id}/avatar")
 @handle_api_errors(operation_name="get player avatar")
-def get_player_avatar(player_id: int, db: Session = Depends(get_db)) -> Response:
+def get_player_avatar(player_id: int, request: Request, db: Session = Depends(get_db)) -> Response:
     """Serve a player's uploaded avatar image. Public — used directly as an <img> src."""
-    player = db.query(models.PlayerProfile).filter(models.PlayerProfile.id == player_id).first()
+    player = (
+        db.query(models.PlayerProfile)
+        .options(undefer(models.PlayerProfile.avatar_image))
+        .filter(models.PlayerProfile.id == player_id)
+        .first()
+    )
     if not player:
         raise HTTPException(status_code=404, detail="No uploaded avatar for this player")
     image_bytes = _avatar_jpeg_for_player(player)
     if not image_bytes:
         raise HTTPException(status_code=404, detail="No uploaded avatar for this player")
-    return Response(content=image_bytes, media_type="image/jpeg")
+
+    # Content-hash ETag. Versioned URLs (?v=..., bumped by the client after an
+    # upload) are cached as immutable; the bare URL is revalidated, which costs
+    # a 304 instead of the image.
+    headers = {
+        "ETag": f'"{hashlib.sha256(image_bytes).hexdigest()[:32]}"',
+        "Cache-Control": AVATAR_VERSIONED_CACHE_CONTROL if request.query_params.get("v") else AVATAR_CACHE_CONTROL,
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=image_bytes, media_type="image/jpeg", headers=headers)
 
 
 @router.get("/{player_id}/public-profile")
@@ -540,96 +534,11 @@ def get_public_player_profile(
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """Public profile — no auth required. Returns only non-sensitive fields
-    (no email, venmo, or GHIN id)."""
-    player = db.query(models.PlayerProfile).filter(models.PlayerProfile.id == player_id).first()
-    if not player:
-        from fastapi import HTTPException
-
+    (no email, venmo, or GHIN id). Cached per player; see public_profile_service."""
+    profile = get_public_profile(db, player_id)
+    if profile is None:
         raise HTTPException(status_code=404, detail="Player not found")
-
-    # Availability days (which days, no times)
-    availability_rows = (
-        db.query(models.PlayerAvailability).filter(models.PlayerAvailability.player_profile_id == player_id).all()
-    )
-    available_days = [a.day_of_week for a in availability_rows if a.is_available]
-
-    # Stats
-    stats = db.query(models.PlayerStatistics).filter(models.PlayerStatistics.player_id == player_id).first()
-
-    # Badges — showcased (equipped) ones first, in their chosen order, then
-    # the rest by most-recently-earned.
-    badge_rows = (
-        db.query(models.PlayerBadgeEarned, models.Badge)
-        .join(models.Badge, models.PlayerBadgeEarned.badge_id == models.Badge.id)
-        .filter(models.PlayerBadgeEarned.player_profile_id == player_id)
-        .order_by(
-            models.PlayerBadgeEarned.showcase_position.is_(None),
-            models.PlayerBadgeEarned.showcase_position,
-            models.PlayerBadgeEarned.earned_at.desc(),
-        )
-        .limit(12)
-        .all()
-    )
-    badges = [
-        {
-            "id": pbe.id,
-            "name": b.name,
-            "description": b.description,
-            "rarity": b.rarity,
-            "category": b.category,
-            "emoji": b.emoji,
-            "earned_at": pbe.earned_at,
-            "showcased": pbe.showcase_position is not None,
-        }
-        for pbe, b in badge_rows
-    ]
-    total_badges = db.query(models.Badge).count()
-
-    # Game history — actual played/scored rounds (sheet-synced + in-app).
-    game_history = []
-    if player.legacy_name or player.name:
-        rounds = get_unified_data_service(db=db).get_player_history(player.legacy_name or player.name)
-        game_history = [
-            {
-                "date": r.date_sortable,
-                "location": r.location,
-                "score": r.score,
-                "duration": r.duration,
-                "source": r.source,
-                # Only ever present for rounds scored live in the app or via
-                # scorecard scan — legacy sheet rounds are a total only.
-                "holes": (
-                    [
-                        {"hole": h.get("hole"), "quarters": h.get("quarters"), "gross_score": h.get("gross_score")}
-                        for h in sorted(r.hole_scores, key=lambda h: h.get("hole") or 0)
-                    ]
-                    if r.hole_scores
-                    else None
-                ),
-            }
-            for r in rounds[:20]
-        ]
-
-    return {
-        "id": player.id,
-        "name": player.name,
-        "handicap": player.handicap,
-        "description": player.description,
-        "avatar_url": player.avatar_url,
-        "has_avatar_image": bool(player.has_avatar_image),
-        "last_played": player.last_played,
-        "created_at": player.created_at,
-        "available_days": available_days,
-        "game_history": game_history,
-        "badges": badges,
-        "total_badges": total_badges,
-        "stats": {
-            "games_played": stats.games_played if stats else 0,
-            "games_won": stats.games_won if stats else 0,
-            "total_earnings": stats.total_earnings if stats else 0.0,
-            "solo_wins": stats.solo_wins if stats else 0,
-        },
-    }
+    return profile
 
 
 @router.get("/{player_id}", response_model=schemas.PlayerProfileResponse)
@@ -15,7 +15,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
-from ..database import get_db
+from ..database import get_db, run_db
 from ..middleware.caching import sheet_sync_cache
 from ..middleware.rate_limiting import rate_limiter
 from ..services.player_service import PlayerService
@@ -108,7 +108,7 @@ class CompareSheetRequest(BaseModel):
 
 
 @router.post("/analyze-structure")
-async def analyze_sheet_structure(sheet_headers: list[str], db: Session = Depends(get_db)) -> dict[str, Any]:
+def analyze_sheet_structure(sheet_headers: list[str], db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Analyze Google Sheets structure and suggest column mappings.
 
@@ -153,7 +153,7 @@ async def analyze_sheet_structure(sheet_headers: list[str], db: Session = Depend
 
 
 @router.post("/create-leaderboard")
-async def create_leaderboard_from_sheet(sheet_data: list[dict], db: Session = Depends(get_db)) -> dict[str, Any]:
+def create_leaderboard_from_sheet(sheet_data: list[dict], db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Transform Google Sheets data into leaderboard format.
 
@@ -197,7 +197,7 @@ async def sync_sheet_data(request: dict, db: Session = Depends(get_db)) -> dict[
         logger.error(f"Error syncing sheet data: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to sync sheet data: {e!s}")
     finally:
-        db.close()
+        await run_db(db.close)
 
 
 @router.get("/export-current-data")
@@ -437,56 +437,58 @@ async def sync_wgp_sheet_data(
         # Track GHIN data for response payload
         ghin_data_collection = {}
 
-        for player_name, stats in player_stats.items():
-            try:
-                # Check if player exists
-                existing_player = (
-                    db.query(models.PlayerProfile).filter(models.PlayerProfile.name == player_name).first()
-                )
+        def upsert_player_stats(player_name: str, stats: dict[str, Any]) -> tuple[int, models.PlayerProfile | None]:
+            # Check if player exists
+            existing_player = db.query(models.PlayerProfile).filter(models.PlayerProfile.name == player_name).first()
 
-                if not existing_player:
-                    # Create new player
-                    player_data = schemas.PlayerProfileCreate(
-                        name=player_name,
-                        handicap=10.0,  # Default handicap
-                    )
-                    new_player = player_service.create_player_profile(player_data)
-                    sync_results["players_created"] += 1
-                    player_id = int(new_player.id)
-                else:
-                    player_id = int(existing_player.id)
-                    sync_results["players_updated"] += 1
-
-                # Update or create statistics record
-                player_stats_record = (
-                    db.query(models.PlayerStatistics).filter(models.PlayerStatistics.player_id == player_id).first()
+            if not existing_player:
+                # Create new player
+                player_data = schemas.PlayerProfileCreate(
+                    name=player_name,
+                    handicap=10.0,  # Default handicap
                 )
+                new_player = player_service.create_player_profile(player_data)
+                sync_results["players_created"] += 1
+                player_id = int(new_player.id)
+            else:
+                player_id = int(existing_player.id)
+                sync_results["players_updated"] += 1
 
-                if not player_stats_record:
-                    # Create new statistics record
-                    player_stats_record = models.PlayerStatistics(player_id=player_id)
-                    db.add(player_stats_record)
+            # Update or create statistics record
+            player_stats_record = (
+                db.query(models.PlayerStatistics).filter(models.PlayerStatistics.player_id == player_id).first()
+            )
 
-                # Update statistics with sheet data - use safe type coercion
-                rounds_played = safe_float(stats.get("rounds"), 0.0, min_val=0.0)
-                total_earnings = safe_float(stats.get("total_earnings"), 0.0)
-                avg_earnings = safe_float(stats.get("average"), 0.0)
+            if not player_stats_record:
+                # Create new statistics record
+                player_stats_record = models.PlayerStatistics(player_id=player_id)
+                db.add(player_stats_record)
 
-                player_stats_record.games_played = rounds_played
-                player_stats_record.total_earnings = total_earnings
+            # Update statistics with sheet data - use safe type coercion
+            rounds_played = safe_float(stats.get("rounds"), 0.0, min_val=0.0)
+            total_earnings = safe_float(stats.get("total_earnings"), 0.0)
+            avg_earnings = safe_float(stats.get("average"), 0.0)
 
-                # The sheet records quarters per round, not wins. Zero these
-                # rather than deriving them from earnings — a guessed win count
-                # is indistinguishable from a real one once it's in the table,
-                # and quarters are the club's only standing metric anyway.
-                player_stats_record.win_percentage = 0.0
-                player_stats_record.games_won = 0
+            player_stats_record.games_played = rounds_played
+            player_stats_record.total_earnings = total_earnings
 
-                # Store additional metrics
-                player_stats_record.avg_earnings_per_game = avg_earnings
+            # The sheet records quarters per round, not wins. Zero these
+            # rather than deriving them from earnings — a guessed win count
+            # is indistinguishable from a real one once it's in the table,
+            # and quarters are the club's only standing metric anyway.
+            player_stats_record.win_percentage = 0.0
+            player_stats_record.games_won = 0
 
-                # Update timestamp
-                player_stats_record.last_updated = utc_now().isoformat()
+            # Store additional metrics
+            player_stats_record.avg_earnings_per_game = avg_earnings
+
+            # Update timestamp
+            player_stats_record.last_updated = utc_now().isoformat()
+            return player_id, existing_player
+
+        for player_name, stats in player_stats.items():
+            try:
+                player_id, existing_player = await run_db(upsert_player_stats, player_name, stats)
 
                 # Try to fetch GHIN data if player has GHIN ID
                 ghin_data = None
@@ -507,7 +509,7 @@ async def sync_wgp_sheet_data(
                                 )
                         else:
                             # Fall back to stored GHIN data
-                            ghin_data = ghin_service.get_player_ghin_data(player_id)
+                            ghin_data = await run_db(ghin_service.get_player_ghin_data, player_id)
                             if ghin_data:
                                 logger.info(f"Using stored GHIN data for {player_name}")
                     except Exception as ghin_error:
@@ -522,12 +524,12 @@ async def sync_wgp_sheet_data(
                         "last_updated": ghin_data.get("last_updated"),
                     }
 
-                db.commit()
+                await run_db(db.commit)
 
                 sync_results["players_processed"] += 1
 
             except Exception as e:
-                db.rollback()  # CRITICAL: Roll back the failed transaction
+                await run_db(db.rollback)  # CRITICAL: Roll back the failed transaction
                 sync_results["errors"].append(f"Error processing {player_name}: {e!s}")
                 logger.error(f"Failed to process {player_name}, rolled back transaction: {e}")
                 continue
@@ -617,7 +619,7 @@ async def fetch_google_sheet(request: CsvUrlRequest) -> dict[str, Any]:
 
 
 @router.post("/compare-data")
-async def compare_sheet_to_db_data(request: CompareSheetRequest, db: Session = Depends(get_db)) -> dict[str, Any]:
+def compare_sheet_to_db_data(request: CompareSheetRequest, db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     Compare Google Sheets data with current database data.
 
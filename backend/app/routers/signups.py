@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
 from .. import database, models, schemas
 from ..observability.report import report_exception, report_message
@@ -31,6 +32,29 @@ logger = logging.getLogger("app.routers.signups")
 router = APIRouter(tags=["signups"])
 
 
+def _week_dates(start_date: datetime) -> list[str]:
+    """The seven YYYY-MM-DD dates of the rolling week starting at ``start_date``."""
+    return [(start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+
+
+def _signups_by_date(db: Session, week: list[str]) -> dict[str, list[models.DailySignup]]:
+    """Non-cancelled signups for ``week`` in one range query, bucketed by date."""
+    by_date: dict[str, list[models.DailySignup]] = {date_str: [] for date_str in week}
+    signups = (
+        db.query(models.DailySignup)
+        .filter(
+            models.DailySignup.date >= week[0],
+            models.DailySignup.date <= week[-1],
+            models.DailySignup.status != "cancelled",
+        )
+        .order_by(models.DailySignup.date, models.DailySignup.id)
+        .all()
+    )
+    for signup in signups:
+        by_date[signup.date].append(signup)
+    return by_date
+
+
 def _deliver_signup_confirmation(signup_id: int, to_email: str, player_name: str, signup_date: str) -> None:
     """Send one signup confirmation email and record the outcome. Best-effort.
 
@@ -189,21 +213,13 @@ def get_weekly_signups(week_start: str = Query(description="YYYY-MM-DD format fo
         # Parse the week start date
         start_date = datetime.strptime(week_start, "%Y-%m-%d")
 
-        # Get all 7 days
-        daily_summaries = []
-        for i in range(7):
-            current_date = start_date + timedelta(days=i)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            signups = (
-                db.query(models.DailySignup)
-                .filter(
-                    models.DailySignup.date == date_str,
-                    models.DailySignup.status != "cancelled",
-                )
-                .all()
-            )
+        # One range scan for the whole week, bucketed by day
+        week = _week_dates(start_date)
+        signups_by_date = _signups_by_date(db, week)
 
+        daily_summaries = []
+        for date_str in week:
+            signups = signups_by_date[date_str]
             daily_summaries.append(
                 schemas.DailySignupSummary(
                     date=date_str,
@@ -461,33 +477,27 @@ def get_weekly_signups_with_messages(week_start: str = Query(description="YYYY-M
         # Parse the week start date
         start_date = datetime.strptime(week_start, "%Y-%m-%d")
 
-        # Get all 7 days
-        daily_summaries = []
-        for i in range(7):
-            current_date = start_date + timedelta(days=i)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            # Get signups
-            signups = (
-                db.query(models.DailySignup)
-                .filter(
-                    models.DailySignup.date == date_str,
-                    models.DailySignup.status != "cancelled",
-                )
-                .all()
-            )
-
-            # Get messages
-            messages = (
-                db.query(models.DailyMessage)
-                .filter(
-                    models.DailyMessage.date == date_str,
-                    models.DailyMessage.is_active == 1,
-                )
-                .order_by(models.DailyMessage.message_time)
-                .all()
+        # One range scan per table for the whole week, bucketed by day
+        week = _week_dates(start_date)
+        signups_by_date = _signups_by_date(db, week)
+        messages_by_date: dict[str, list[models.DailyMessage]] = {date_str: [] for date_str in week}
+        messages = (
+            db.query(models.DailyMessage)
+            .filter(
+                models.DailyMessage.date >= week[0],
+                models.DailyMessage.date <= week[-1],
+                models.DailyMessage.is_active == 1,
             )
+            .order_by(models.DailyMessage.message_time)
+            .all()
+        )
+        for message in messages:
+            messages_by_date[message.date].append(message)
 
+        daily_summaries = []
+        for date_str in week:
+            signups = signups_by_date[date_str]
+            messages = messages_by_date[date_str]
             daily_summaries.append(
                 schemas.DailySignupWithMessages(
                     date=date_str,
@@ -12,12 +12,21 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from .. import models
 from ..database import get_db
 from ..services.auth_service import get_current_auth0_user, get_current_user
+from ..services.export_service import (
+    HOLE_EVENT_COLUMNS,
+    ROUND_COLUMNS,
+    ExportFormat,
+    export_response,
+    stream_rows,
+)
 from ..services.livsow_service import get_livsow_leaderboard, get_livsow_team_map
 from ..services.livsow_transactions import LIVSOW_SEASON, check_and_record_snapshot, describe_transaction
 from ..services.spreadsheet_sync_service import PRIMARY_SHEET_ID, PRIMARY_SHEET_TAB_GID
@@ -549,6 +558,39 @@ def get_unified_rounds(
     ]
 
 
+@router.get("/rounds/export", response_class=StreamingResponse)
+def export_unified_rounds(
+    fmt: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream every round from all data sources as NDJSON or CSV.
+
+    Same rounds and order as /data/rounds, but read from the database in
+    batches and written incrementally, so memory stays flat for a full season.
+    """
+    rounds = get_unified_data_service(db=db).iter_all_rounds()
+    rows = ({column: getattr(r, column) for column in ROUND_COLUMNS} for r in rounds)
+    return export_response(rows, fmt, ROUND_COLUMNS, "rounds")
+
+
+@router.get("/hole-events/export", response_class=StreamingResponse)
+def export_hole_events(
+    fmt: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    game_id: str | None = Query(None, description="Only this game's hole events"),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream per-player hole events (gross score and quarters) as NDJSON or CSV.
+
+    Ordered by game, hole and player; all games unless ``game_id`` is given.
+    """
+    stmt = select(*(getattr(models.HoleEvent, column) for column in HOLE_EVENT_COLUMNS))
+    if game_id:
+        stmt = stmt.where(models.HoleEvent.game_id == game_id)
+    stmt = stmt.order_by(models.HoleEvent.game_id, models.HoleEvent.hole_number, models.HoleEvent.player_id)
+    rows = (row._asdict() for row in stream_rows(db, stmt))
+    return export_response(rows, fmt, HOLE_EVENT_COLUMNS, f"hole-events-{game_id}" if game_id else "hole-events")
+
+
 @router.get("/rounds/by-date/{date}", response_model=list[UnifiedRoundResponse])
 def get_rounds_by_date(
     date: str,
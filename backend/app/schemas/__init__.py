@@ -34,6 +34,9 @@ from .games import (
     ManualPointsOverride,
     RotationSelectionRequest,
     Rule,
+    WhatIfChange,
+    WhatIfRequest,
+    WhatIfScenario,
 )
 from .players import (
     LeaderboardEntry,
@@ -107,6 +110,9 @@ __all__ = [
     "ManualPointsOverride",
     "RotationSelectionRequest",
     "Rule",
+    "WhatIfChange",
+    "WhatIfRequest",
+    "WhatIfScenario",
     # signups
     "DailyMessageCreate",
     "DailyMessageResponse",
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -214,6 +214,35 @@ class CompleteHoleRequest(BaseModel):
     betting_events: list[dict] | None = Field(None, description="List of betting events for this hole")
 
 
+class WhatIfChange(BaseModel):
+    """One alternative decision on one recorded hole"""
+
+    hole_number: int = Field(..., ge=1, le=18)
+    decision: Literal["partner", "solo", "decline_double", "float"]
+    partner_id: str | None = Field(None, description="Partner the captain picks instead (decision='partner')")
+    captain_id: str | None = Field(
+        None,
+        description="Captain for 'partner'/'solo' when the hole did not record one (defaults to team1's first player)",
+    )
+    declined_by: str | None = Field(
+        None,
+        description="Side that declines the last double: 'team1'/'team2' or 'captain'/'opponents' (decision='decline_double')",
+    )
+
+
+class WhatIfScenario(BaseModel):
+    """A set of alternative decisions re-scored together"""
+
+    label: str | None = None
+    changes: list[WhatIfChange] = Field(..., min_length=1)
+
+
+class WhatIfRequest(BaseModel):
+    """Counterfactual replay of a recorded round - nothing is saved"""
+
+    scenarios: list[WhatIfScenario] = Field(..., min_length=1, max_length=100)
+
+
 class RotationSelectionRequest(BaseModel):
     """Request to select rotation position - for 5-man games on holes 16-18"""
 
@@ -0,0 +1,384 @@
+"""
+Headless self-play: computer-only Wolf Goat Pig rounds in bulk.
+
+Each round is a real WolfGoatPigGame (NullPersistence, an in-memory course
+snapshot) whose seats are computer players with a Personality. Every
+decision (solo, float, partnership and double offers and responses) comes
+from the engine's precomputed policy table (app/domain/computer_policy.py),
+drawn with the chunk's own generator. Gross scores come from a handicap-based model, so
+results depend on the engine's rules rather than on scripted outcomes.
+
+run_batch() splits the rounds into chunks, plays them across a process pool
+and writes one gzipped CSV per chunk with a row per hole (seats are indexes,
+lists are ";"-joined), which pandas or DuckDB read directly. Chunks are
+seeded from the batch seed, so a batch is reproducible at any worker count.
+
+CLI: scripts/self_play.py.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+import random
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from .data.wing_point_course_data import WING_POINT_COURSE_DATA
+from .domain.computer_policy import PERSONALITIES, Personality
+from .domain.game_types import Player
+from .mixins import NullPersistence
+from .state.course_manager import CourseManager, CourseSnapshot, HoleSnapshot
+from .wolf_goat_pig import WolfGoatPigGame
+
+logger = logging.getLogger(__name__)
+
+
+# Names and handicaps for up to six seats.
+DEFAULT_ROSTER = [("Bob", 10.5), ("Scott", 15), ("Vince", 8), ("Mike", 20.5), ("Terry", 12), ("Bill", 18)]
+
+# Strokes over a player's net par on a hole: eagle-ish .. triple.
+_SCORE_OFFSETS = (-2, -1, 0, 1, 2, 3)
+_SCORE_WEIGHTS = (0.01, 0.14, 0.42, 0.28, 0.11, 0.04)
+
+CSV_COLUMNS = (
+    "round",
+    "players",
+    "hole",
+    "par",
+    "stroke_index",
+    "personalities",
+    "captain",
+    "team_type",
+    "team1",
+    "float",
+    "doubles",
+    "double_declined",
+    "wager",
+    "scores",
+    "points",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SelfPlayConfig:
+    rounds: int
+    player_counts: tuple[int, ...] = (4, 5, 6)
+    personalities: tuple[str, ...] = tuple(PERSONALITIES)
+    seed: int = 0
+    chunk_size: int = 250
+
+    def __post_init__(self) -> None:
+        unknown = set(self.personalities) - set(PERSONALITIES)
+        if unknown:
+            raise ValueError(f"Unknown personalities: {', '.join(sorted(unknown))}")
+        if not set(self.player_counts) <= {4, 5, 6}:
+            raise ValueError("Wolf Goat Pig supports 4, 5, or 6 players only")
+        if self.rounds < 0 or self.chunk_size < 1:
+            raise ValueError("rounds must be >= 0 and chunk_size >= 1")
+
+
+@dataclass(slots=True)
+class HoleOutcome:
+    hole: int
+    par: int
+    stroke_index: int
+    captain: int
+    team_type: str
+    team1: list[int]  # captain's side; the solo player alone when team_type == "solo"
+    float_invoked: bool
+    doubles: int
+    double_declined: bool
+    wager: int
+    scores: list[int]  # by seat
+    points: list[int]  # by seat
+
+
+@dataclass
+class BatchSummary:
+    """Totals for a batch, merged from every chunk."""
+
+    rounds: int = 0
+    holes: int = 0
+    solo_holes: int = 0
+    doubles: int = 0
+    declined_doubles: int = 0
+    points_by_personality: dict[str, int] = field(default_factory=dict)
+    seats_by_personality: dict[str, int] = field(default_factory=dict)
+    files: list[str] = field(default_factory=list)
+
+    def merge(self, other: BatchSummary) -> None:
+        self.rounds += other.rounds
+        self.holes += other.holes
+        self.solo_holes += other.solo_holes
+        self.doubles += other.doubles
+        self.declined_doubles += other.declined_doubles
+        for name, points in other.points_by_personality.items():
+            self.points_by_personality[name] = self.points_by_personality.get(name, 0) + points
+        for name, seats in other.seats_by_personality.items():
+            self.seats_by_personality[name] = self.seats_by_personality.get(name, 0) + seats
+        self.files += other.files
+
+    def points_per_round(self) -> dict[str, float]:
+        """Average quarters won per seat-round, by personality."""
+        return {
+            name: self.points_by_personality.get(name, 0) / seats
+            for name, seats in sorted(self.seats_by_personality.items())
+            if seats
+        }
+
+
+@cache
+def wing_point_snapshot() -> CourseSnapshot:
+    """The bundled Wing Point course (white tees) as a snapshot, no database needed."""
+    holes = tuple(
+        HoleSnapshot(
+            hole_number=h["hole_number"],
+            par=h["par"],
+            yards=h["yards"]["white"],
+            handicap=h["handicap_men"],
+            description=h.get("name"),
+        )
+        for h in WING_POINT_COURSE_DATA["holes"]
+    )
+    return CourseSnapshot(
+        id=-1,  # never collides with a database course id
+        name=WING_POINT_COURSE_DATA["name"],
+        version=1,
+        holes=holes,
+        pars=tuple(h.par for h in holes),
+        handicaps=tuple(h.handicap for h in holes),
+        total_par=WING_POINT_COURSE_DATA["total_par"],
+    )
+
+
+def _course_manager(snapshot: CourseSnapshot) -> CourseManager:
+    manager = CourseManager()
+    manager._select(snapshot)
+    return manager
+
+
+def simulate_score(rng: random.Random, handicap: float, par: int, stroke_index: int) -> int:
+    """Gross score for one player on one hole: net par plus a skewed offset."""
+    strokes = int(handicap) // 18 + (1 if stroke_index <= int(handicap) % 18 else 0)
+    offset = rng.choices(_SCORE_OFFSETS, _SCORE_WEIGHTS)[0]
+    return max(1, par + strokes + offset)
+
+
+def simulate_round(
+    rng: random.Random,
+    seats: Sequence[Personality],
+    snapshot: CourseSnapshot | None = None,
+) -> list[HoleOutcome]:
+    """Play one 18-hole round with a computer player per seat."""
+    players = [
+        Player(id=f"p{i + 1}", name=name, handicap=handicap)
+        for i, (name, handicap) in enumerate(DEFAULT_ROSTER[: len(seats)])
+    ]
+    game = WolfGoatPigGame(
+        player_count=len(players),
+        players=players,
+        course_manager=_course_manager(snapshot or wing_point_snapshot()),
+        persistence=NullPersistence(),
+    )
+    game.set_computer_players([p.id for p in players], [seat.name for seat in seats])
+    seat_of = {p.id: i for i, p in enumerate(players)}
+    outcomes = []
+    for _ in range(18):
+        outcomes.append(_play_hole(game, rng, seat_of))
+        game.advance_to_next_hole()
+    return outcomes
+
+
+def _play_hole(game: WolfGoatPigGame, rng: random.Random, seat_of: dict[str, int]) -> HoleOutcome:
+    hole_state = game.hole_states[game.current_hole]
+    captain = hole_state.teams.captain
+    assert captain is not None
+
+    def decides(decision: str, player_id: str) -> bool:
+        return rng.random() < game.decision_probability(decision, player_id)
+
+    float_invoked = False
+    if not next(p for p in game.players if p.id == captain).float_used and decides("use_float", captain):
+        game.invoke_float(captain)
+        float_invoked = True
+
+    if decides("go_solo", captain):
+        game.captain_go_solo(captain)
+    else:
+        eligible = [
+            pid
+            for pid in hole_state.hitting_order
+            if pid != captain and game._is_player_eligible_for_partnership(pid, hole_state)
+        ]
+        # Captains favour low handicaps, but not always.
+        eligible.sort(key=lambda pid: next(p.handicap for p in game.players if p.id == pid))
+        partner = eligible[0] if rng.random() < 0.6 else rng.choice(eligible)
+        game.request_partner(captain, partner)
+        game.respond_to_partnership(partner, accept=decides("accept_partnership", partner))
+
+    teams = hole_state.teams
+    if teams.type == "solo":
+        assert teams.solo_player is not None
+        side = [teams.solo_player]
+    else:
+        side = list(teams.team1)
+    others = [p.id for p in game.players if p.id not in side]
+
+    scores = {p.id: simulate_score(rng, p.handicap, hole_state.hole_par, hole_state.stroke_index) for p in game.players}
+
+    # Doubles happen mid-hole, so sides judge from a noisy read of the outcome.
+    doubles = 0
+    declined = False
+    lead = min(scores[pid] for pid in others) - min(scores[pid] for pid in side) + rng.gauss(0, 1.0)
+    if lead != 0:
+        leaders, trailers = (side, others) if lead > 0 else (others, side)
+        offering = rng.choice(leaders)
+        if decides("offer_double", offering):
+            game.offer_double(offering)
+            doubles = 1
+            if decides("accept_double", rng.choice(trailers)):
+                game.respond_to_double("opponents", accept=True)
+            else:
+                declined = True
+                result = game.respond_to_double("opponents", accept=False)
+                _apply_points(game, hole_state, result["points_changes"])
+
+    wager = hole_state.betting.current_wager
+    if not declined:
+        game.enter_hole_scores(scores)
+
+    return HoleOutcome(
+        hole=hole_state.hole_number,
+        par=hole_state.hole_par,
+        stroke_index=hole_state.stroke_index,
+        captain=seat_of[captain],
+        team_type=teams.type,
+        team1=sorted(seat_of[pid] for pid in side if pid is not None),
+        float_invoked=float_invoked,
+        doubles=doubles,
+        double_declined=declined,
+        wager=wager,
+        scores=[scores[p.id] for p in game.players],
+        points=[hole_state.points_awarded.get(p.id, 0) for p in game.players],
+    )
+
+
+def _apply_points(game: WolfGoatPigGame, hole_state: Any, points_changes: dict[str, int]) -> None:
+    # A declined double ends the hole, but the engine only reports its points.
+    hole_state.points_awarded = dict(points_changes)
+    for player in game.players:
+        player.points += points_changes.get(player.id, 0)
+
+
+def run_chunk(config: SelfPlayConfig, index: int, first_round: int, rounds: int, out_dir: Path) -> BatchSummary:
+    """Play rounds [first_round, first_round + rounds) and write them to one chunk file."""
+    # Parts of the engine (hitting order, captain rotation) draw from the
+    # module-level generator; seed it too so a chunk replays exactly, and put
+    # it back afterwards for callers playing in-process.
+    saved = random.getstate()
+    random.seed(f"{config.seed}:{index}:engine")
+    try:
+        return _write_chunk(
+            config, random.Random(f"{config.seed}:{index}"), first_round, rounds, out_dir / f"holes-{index:05d}.csv.gz"
+        )
+    finally:
+        random.setstate(saved)
+
+
+def _write_chunk(config: SelfPlayConfig, rng: random.Random, first_round: int, rounds: int, path: Path) -> BatchSummary:
+    snapshot = wing_point_snapshot()
+    summary = BatchSummary()
+    with gzip.open(path, "wt", newline="", compresslevel=6) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_COLUMNS)
+        for number in range(first_round, first_round + rounds):
+            player_count = rng.choice(config.player_counts)
+            seats = [PERSONALITIES[rng.choice(config.personalities)] for _ in range(player_count)]
+            names = ";".join(s.name for s in seats)
+            round_points = [0] * player_count
+            for hole in simulate_round(rng, seats, snapshot):
+                writer.writerow(
+                    (
+                        number,
+                        player_count,
+                        hole.hole,
+                        hole.par,
+                        hole.stroke_index,
+                        names,
+                        hole.captain,
+                        hole.team_type,
+                        _join(hole.team1),
+                        int(hole.float_invoked),
+                        hole.doubles,
+                        int(hole.double_declined),
+                        hole.wager,
+                        _join(hole.scores),
+                        _join(hole.points),
+                    )
+                )
+                summary.holes += 1
+                summary.solo_holes += hole.team_type == "solo"
+                summary.doubles += hole.doubles
+                summary.declined_doubles += hole.double_declined
+                round_points = [a + b for a, b in zip(round_points, hole.points, strict=True)]
+            summary.rounds += 1
+            for seat, points in zip(seats, round_points, strict=True):
+                summary.points_by_personality[seat.name] = summary.points_by_personality.get(seat.name, 0) + points
+                summary.seats_by_personality[seat.name] = summary.seats_by_personality.get(seat.name, 0) + 1
+    summary.files.append(str(path))
+    return summary
+
+
+def run_batch(config: SelfPlayConfig, out_dir: str | Path, workers: int | None = None) -> BatchSummary:
+    """Play config.rounds rounds across ``workers`` processes (1 plays in-process)."""
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    chunks = [
+        (config, index, start, min(config.chunk_size, config.rounds - start), out)
+        for index, start in enumerate(range(0, config.rounds, config.chunk_size))
+    ]
+    summary = BatchSummary()
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            summary.merge(run_chunk(*chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(run_chunk, *zip(*chunks, strict=True)):
+                summary.merge(result)
+    logger.info(f"Self-play batch: {summary.rounds} rounds, {summary.holes} holes in {len(summary.files)} files")
+    return summary
+
+
+def read_holes(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield hole rows from a chunk file, or every chunk in a directory, with lists decoded."""
+    source = Path(path)
+    files = sorted(source.glob("holes-*.csv.gz")) if source.is_dir() else [source]
+    for file in files:
+        with gzip.open(file, "rt", newline="") as handle:
+            for row in csv.DictReader(handle):
+                yield {
+                    **{key: int(row[key]) for key in ("round", "players", "hole", "par", "stroke_index", "captain")},
+                    "personalities": row["personalities"].split(";"),
+                    "team_type": row["team_type"],
+                    "team1": _split(row["team1"]),
+                    "float": row["float"] == "1",
+                    "doubles": int(row["doubles"]),
+                    "double_declined": row["double_declined"] == "1",
+                    "wager": int(row["wager"]),
+                    "scores": _split(row["scores"]),
+                    "points": _split(row["points"]),
+                }
+
+
+def _join(values: Sequence[int]) -> str:
+    return ";".join(str(v) for v in values)
+
+
+def _split(value: str) -> list[int]:
+    return [int(v) for v in value.split(";")] if value else []
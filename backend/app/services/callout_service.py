@@ -10,11 +10,14 @@ calling these functions DIRECTLY against the DB — no self-HTTP, no deadlock ri
 """
 
 import logging
+from functools import partial
+from typing import cast
 
 from sqlalchemy.orm import Session
 
 from ..models import CalloutNotification, DailySignup, EmailPreferences, PlayerProfile
 from ..utils.time import utc_now
+from .email_fanout import fan_out
 from .email_service import get_email_service
 from .pairing_scheduler_service import PairingSchedulerService
 
@@ -129,20 +132,26 @@ def run_callout(db: Session, game_date: str, window: str) -> dict:
     target = foursome_target(signup_count)
     recipients = get_callout_recipients(db, game_date)
 
-    sent = 0
-    for player in recipients:
-        try:
-            ok = email_service.send_callout_notification(
-                to_email=player.email,
-                player_name=player.name or "Golfer",
-                game_date=game_date,
-                signup_count=signup_count,
-                needed=shortfall,
+    # One bad address shouldn't sink the rest: fan_out isolates each send.
+    report = fan_out(
+        "callout",
+        email_service,
+        [
+            (
+                cast("str", player.email),
+                partial(
+                    email_service.send_callout_notification,
+                    to_email=cast("str", player.email),
+                    player_name=cast("str", player.name) or "Golfer",
+                    game_date=game_date,
+                    signup_count=signup_count,
+                    needed=shortfall,
+                ),
             )
-            if ok:
-                sent += 1
-        except Exception as exc:  # one bad address shouldn't sink the rest
-            logger.error("Callout email to %s failed: %s", player.email, exc)
+            for player in recipients
+        ],
+    )
+    sent = report.sent
 
     # Record the callout so this window never fires twice for this date.
     db.add(
@@ -175,6 +184,7 @@ def run_callout(db: Session, game_date: str, window: str) -> dict:
         "target": target,
         "shortfall": shortfall,
         "recipient_count": sent,
+        "failed_count": report.failed,
     }
 
 
@@ -12,6 +12,8 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from sqlalchemy.orm import Session
 
+from ..database import run_db
+
 logger = logging.getLogger(__name__)
 
 _APP_NAME = "wgp_commissioner"
@@ -34,18 +36,22 @@ def _model_name() -> str:
 
 
 def _make_tools(db: Session, trace: dict[str, Any]):
-    """Build per-request tools bound to the SQLAlchemy session."""
+    """Build per-request tools bound to the SQLAlchemy session.
+
+    The tools are coroutines: ADK awaits them on the event loop, so their
+    queries go through ``run_db``.
+    """
     from app.routers.commissioner import (
         _build_data_context,
         _execute_readonly_sql,
         _validate_sql,
     )
 
-    def get_season_context() -> dict[str, str]:
+    async def get_season_context() -> dict[str, str]:
         """Return the current club season leaderboard and registered players."""
-        return {"context": _build_data_context(db)}
+        return {"context": await run_db(_build_data_context, db)}
 
-    def run_readonly_sql(sql: str) -> dict[str, Any]:
+    async def run_readonly_sql(sql: str) -> dict[str, Any]:
         """Run a read-only PostgreSQL SELECT against allowed WGP tables.
 
         Use legacy_rounds_official for club season standings. Results are capped
@@ -57,7 +63,7 @@ def _make_tools(db: Session, trace: dict[str, Any]):
                 "message": "Query failed safety validation. Use only allowed tables and SELECT.",
             }
 
-        results = _execute_readonly_sql(db, sql)
+        results = await run_db(_execute_readonly_sql, db, sql)
         if "error" in results:
             return {"status": "error", "message": results["error"]}
 
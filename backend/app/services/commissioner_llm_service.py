@@ -6,8 +6,6 @@ import logging
 import os
 
 import httpx
-from google import genai
-from google.genai import types
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +37,10 @@ async def _vertex_generate(prompt: str, system_instruction: str) -> str:
     location = os.getenv("GCP_LOCATION", "global").strip() or "global"
     model = os.getenv("COMMISSIONER_MODEL", "gemini-2.5-flash").strip() or "gemini-2.5-flash"
 
+    # google-genai takes ~0.4s to import; load it on the first Vertex call, not at boot.
+    from google import genai
+    from google.genai import types
+
     client = genai.Client(vertexai=True, project=project, location=location)
     try:
         response = await client.aio.models.generate_content(
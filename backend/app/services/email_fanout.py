@@ -0,0 +1,161 @@
+"""
+Parallel, batched email fan-out for scheduled jobs.
+
+Jobs that mail a whole roster (daily reminders, weekly summaries, callouts,
+pairing notifications) render every message first and then deliver them
+together: through the provider's batch API when it has one (Resend), else
+through a bounded worker pool calling ``send_email`` per message.
+
+Usage::
+
+    report = fan_out(
+        "callout",
+        email_service,
+        [(p.email, partial(email_service.send_callout_notification, to_email=p.email, ...)) for p in players],
+    )
+    logger.info(report.summary())
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+EMAIL_FANOUT_WORKERS = int(os.getenv("EMAIL_FANOUT_WORKERS", "8"))
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """A fully rendered message waiting to be delivered."""
+
+    to_email: str
+    subject: str
+    html_body: str
+    text_body: str | None = None
+
+
+@dataclass
+class FanoutReport:
+    """Per-job delivery outcome: counts, failed recipients and throughput."""
+
+    job: str
+    attempted: int = 0
+    sent: int = 0
+    failures: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def throughput(self) -> float:
+        """Messages attempted per second (0 when nothing was sent)."""
+        return self.attempted / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.job}: {self.sent}/{self.attempted} sent, {self.failed} failed "
+            f"in {self.duration_seconds:.2f}s ({self.throughput:.1f} msg/s)"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job": self.job,
+            "attempted": self.attempted,
+            "sent": self.sent,
+            "failed": self.failed,
+            "failures": list(self.failures),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "throughput": round(self.throughput, 2),
+        }
+
+
+def deliver(provider: Any, messages: Sequence[OutgoingEmail], workers: int | None = None) -> list[bool]:
+    """Deliver ``messages`` through ``provider``; returns one success flag per message.
+
+    Providers exposing ``send_batch(messages) -> list[bool]`` get chunks of
+    ``provider.batch_size``; others get one ``send_email`` call per message.
+    Either way at most ``workers`` requests are in flight.
+    """
+    if not messages:
+        return []
+
+    workers = max(workers or EMAIL_FANOUT_WORKERS, 1)
+    send_batch = getattr(provider, "send_batch", None)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="email") as pool:
+        if send_batch is not None:
+            size = max(int(getattr(provider, "batch_size", 100)), 1)
+            chunks = [list(messages[i : i + size]) for i in range(0, len(messages), size)]
+            return [ok for chunk_results in pool.map(send_batch, chunks) for ok in chunk_results]
+
+        def send_one(message: OutgoingEmail) -> bool:
+            try:
+                return bool(
+                    provider.send_email(message.to_email, message.subject, message.html_body, message.text_body)
+                )
+            except Exception as e:
+                logger.error(f"Error sending email to {message.to_email}: {e}")
+                return False
+
+        return list(pool.map(send_one, messages))
+
+
+def fan_out(
+    job: str,
+    email_service: Any,
+    sends: Iterable[tuple[str, Callable[[], bool]]],
+    workers: int | None = None,
+) -> FanoutReport:
+    """Run a job's ``(recipient, send)`` pairs and report how delivery went.
+
+    With the real ``EmailService`` every ``send`` only renders (inside
+    ``email_service.collect()``) and the rendered batch goes out through
+    ``email_service.send_many``. Services without ``collect`` (stubs, ad-hoc
+    senders) have their ``send`` callables run on the worker pool instead.
+    """
+    report = FanoutReport(job=job)
+    started = time.perf_counter()
+    sends = list(sends)
+    report.attempted = len(sends)
+
+    collect = getattr(email_service, "collect", None)
+    if collect is not None:
+        with collect() as outbox:
+            for recipient, send in sends:
+                try:
+                    rendered = send()
+                except Exception as e:
+                    logger.error(f"{job}: could not render email to {recipient}: {e}")
+                    rendered = False
+                if not rendered:
+                    report.failures.append(recipient)
+        results = email_service.send_many(outbox, workers=workers)
+        report.sent = sum(results)
+        report.failures.extend(message.to_email for message, ok in zip(outbox, results, strict=True) if not ok)
+    else:
+
+        def run(send: Callable[[], bool]) -> bool:
+            try:
+                return bool(send())
+            except Exception as e:
+                logger.error(f"{job}: email send failed: {e}")
+                return False
+
+        with ThreadPoolExecutor(
+            max_workers=max(workers or EMAIL_FANOUT_WORKERS, 1), thread_name_prefix="email"
+        ) as pool:
+            results = list(pool.map(run, (send for _, send in sends)))
+        report.sent = sum(results)
+        report.failures.extend(recipient for (recipient, _), ok in zip(sends, results, strict=True) if not ok)
+
+    report.duration_seconds = time.perf_counter() - started
+    log = logger.warning if report.failures else logger.info
+    log(f"Email fan-out {report.summary()}")
+    return report
@@ -7,6 +7,7 @@ This module handles scheduling and sending automated emails based on user prefer
 import logging
 import threading
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -16,7 +17,9 @@ import schedule
 from ..database import SessionLocal
 from ..models import EmailPreferences, PlayerProfile
 from ..utils.time import utc_now
+from .email_fanout import fan_out
 from .email_service import get_email_service
+from .job_lease_service import run_with_lease
 from .pairing_scheduler_service import PairingSchedulerService
 
 logger = logging.getLogger(__name__)
@@ -27,10 +30,11 @@ class EmailScheduler:
 
     # Public job registry: maps a stable Cloud Scheduler job key to the bound
     # method that runs exactly ONE cycle. Each target method opens/closes its own
-    # DB session and catches its own errors, so it is safe to invoke one-shot from
-    # the /internal/jobs/* HTTP endpoints (Phase 4 — Cloud Scheduler drives these
-    # instead of the in-process `schedule` thread). Keep keys in sync with
-    # deploy/gcp/phase4-scheduling/10-create-scheduler-jobs.sh.
+    # DB session and catches its own errors (season-store-export re-raises so its
+    # lease records the failure; both callers of run_job() handle that), so it is
+    # safe to invoke one-shot from the /internal/jobs/* HTTP endpoints (Phase 4 —
+    # Cloud Scheduler drives these instead of the in-process `schedule` thread).
+    # Keep keys in sync with deploy/gcp/phase4-scheduling/10-create-scheduler-jobs.sh.
     JOB_METHODS: dict[str, str] = {
         "daily-reminders": "_send_daily_reminders_all",
         "weekly-summaries": "_send_weekly_summaries",
@@ -38,6 +42,7 @@ class EmailScheduler:
         "legacy-rounds-sync": "_sync_legacy_rounds",
         "pending-sheet-syncs": "_process_pending_sheet_syncs",
         "ghin-sync": "_sync_ghin_handicaps",
+        "season-store-export": "_export_season_store",
     }
 
     def __init__(self):
@@ -50,25 +55,29 @@ class EmailScheduler:
         # Schedule daily signup reminders - send once per day at 9 AM
         # Users who have opted in will receive reminders at their preferred time
         # (or all at 9 AM if we want to simplify)
-        schedule.every().day.at("09:00").do(self._send_daily_reminders_all)
+        schedule.every().day.at("09:00").do(partial(self._run_scheduled, "daily-reminders"))
 
         # Schedule weekly summaries on Sunday at 9 AM
-        schedule.every().sunday.at("09:00").do(self._send_weekly_summaries)
+        schedule.every().sunday.at("09:00").do(partial(self._run_scheduled, "weekly-summaries"))
 
         # Schedule Saturday afternoon pairing generation for Sunday games
         # Runs at 2:00 PM every Saturday to generate pairings and notify players
-        schedule.every().saturday.at("14:00").do(self._run_saturday_pairings)
+        schedule.every().saturday.at("14:00").do(partial(self._run_scheduled, "saturday-pairings"))
 
         # Sync Google Sheets round history into legacy_rounds table every 2 hours.
         # Direct DB call — no HTTP, no deadlock risk.
-        schedule.every(2).hours.do(self._sync_legacy_rounds)
+        schedule.every(2).hours.do(partial(self._run_scheduled, "legacy-rounds-sync"))
 
         # Drain the pending sheet sync queue once daily at midnight.
-        schedule.every().day.at("00:00").do(self._process_pending_sheet_syncs)
+        schedule.every().day.at("00:00").do(partial(self._run_scheduled, "pending-sheet-syncs"))
 
         # Sync GHIN handicaps daily at 6 AM. Keeps stored handicap data fresh
         # so /leaderboard/ghin-enhanced never needs a live API call.
-        schedule.every().day.at("06:00").do(self._sync_ghin_handicaps)
+        schedule.every().day.at("06:00").do(partial(self._run_scheduled, "ghin-sync"))
+
+        # Rebuild the columnar season analytics snapshot nightly at 3 AM,
+        # after the day's games have been finalized.
+        schedule.every().day.at("03:00").do(partial(self._run_scheduled, "season-store-export"))
 
         # DISABLED: These tasks make HTTP requests to the same server which causes deadlocks
         # Use external cron jobs or proper async background tasks instead
@@ -109,29 +118,31 @@ class EmailScheduler:
             # Get available signup dates
             available_dates = self._get_available_signup_dates()
 
-            sent_count = 0
-            for player, prefs in players_with_prefs:
-                try:
-                    if player.email:
-                        success = get_email_service().send_daily_signup_reminder(  # type: ignore[attr-defined]
+            email_service = get_email_service()
+            report = fan_out(
+                "daily-reminders",
+                email_service,
+                [
+                    (
+                        player.email,
+                        partial(
+                            email_service.send_daily_signup_reminder,  # type: ignore[attr-defined]
                             to_email=player.email,
                             player_name=player.name,
                             available_dates=available_dates,
-                        )
-
-                        if success:
-                            sent_count += 1
-                            logger.info(f"Daily reminder sent to {player.name} ({player.email})")
-                        else:
-                            logger.error(f"Failed to send daily reminder to {player.name}")
-
-                except Exception as e:
-                    logger.error(f"Error sending daily reminder to {player.name}: {e!s}")
+                        ),
+                    )
+                    for player, _prefs in players_with_prefs
+                    if player.email
+                ],
+            )
 
-            logger.info(f"Daily reminders completed: {sent_count}/{len(players_with_prefs)} sent successfully")
+            logger.info(f"Daily reminders completed: {report.sent}/{len(players_with_prefs)} sent successfully")
+            return report.to_dict()
 
         except Exception as e:
             logger.error(f"Error in daily reminder job: {e!s}")
+            raise
         finally:
             db.close()
 
@@ -161,25 +172,28 @@ class EmailScheduler:
             # Get available signup dates (mock data for now)
             available_dates = self._get_available_signup_dates()
 
-            for player, prefs in players_with_prefs:
-                try:
-                    if player.email:
-                        success = get_email_service().send_daily_signup_reminder(  # type: ignore[attr-defined]
+            email_service = get_email_service()
+            fan_out(
+                f"daily-reminders-{time_slot}",
+                email_service,
+                [
+                    (
+                        player.email,
+                        partial(
+                            email_service.send_daily_signup_reminder,  # type: ignore[attr-defined]
                             to_email=player.email,
                             player_name=player.name,
                             available_dates=available_dates,
-                        )
-
-                        if success:
-                            logger.info(f"Daily reminder sent to {player.name} ({player.email})")
-                        else:
-                            logger.error(f"Failed to send daily reminder to {player.name}")
-
-                except Exception as e:
-                    logger.error(f"Error sending daily reminder to {player.name}: {e!s}")
+                        ),
+                    )
+                    for player, _prefs in players_with_prefs
+                    if player.email
+                ],
+            )
 
         except Exception as e:
             logger.error(f"Error in daily reminder job: {e!s}")
+            raise
         finally:
             db.close()
 
@@ -205,28 +219,30 @@ class EmailScheduler:
 
             logger.info(f"Found {len(players_with_prefs)} players for weekly summary")
 
-            for player, prefs in players_with_prefs:
-                try:
-                    if player.email:
-                        # Get player's weekly stats (mock data for now)
-                        summary_data = self._get_player_weekly_summary(player.id)
-
-                        success = get_email_service().send_weekly_summary(  # type: ignore[attr-defined]
+            email_service = get_email_service()
+            report = fan_out(
+                "weekly-summaries",
+                email_service,
+                [
+                    (
+                        player.email,
+                        partial(
+                            email_service.send_weekly_summary,  # type: ignore[attr-defined]
                             to_email=player.email,
                             player_name=player.name,
-                            summary_data=summary_data,
-                        )
-
-                        if success:
-                            logger.info(f"Weekly summary sent to {player.name} ({player.email})")
-                        else:
-                            logger.error(f"Failed to send weekly summary to {player.name}")
-
-                except Exception as e:
-                    logger.error(f"Error sending weekly summary to {player.name}: {e!s}")
+                            # Get player's weekly stats (mock data for now)
+                            summary_data=self._get_player_weekly_summary(player.id),
+                        ),
+                    )
+                    for player, _prefs in players_with_prefs
+                    if player.email
+                ],
+            )
+            return report.to_dict()
 
         except Exception as e:
             logger.error(f"Error in weekly summary job: {e!s}")
+            raise
         finally:
             db.close()
 
@@ -276,21 +292,33 @@ class EmailScheduler:
                 self.scheduler_thread.join(timeout=5)
             logger.info("Email scheduler stopped")
 
-    def run_job(self, job_name: str) -> dict:
+    def run_job(self, job_name: str, trigger: str = "internal") -> dict:
         """Run a single scheduled job once, by its registry key.
 
         Used by the /internal/jobs/* endpoints so Cloud Scheduler can drive the
         periodic work instead of the in-process thread. Raises KeyError for an
-        unknown job. The underlying method handles its own DB session and errors;
-        because Cloud Scheduler is at-least-once, each target must stay idempotent
-        (design doc §12).
+        unknown job. The underlying method handles its own DB session, logs its
+        errors and re-raises them, so the lease records the run as failed and
+        a retry is not blocked by the job's minimum interval. Because Cloud
+        Scheduler is at-least-once, each target must stay idempotent (design
+        doc §12).
+
+        The run is guarded by the job's row in ``job_leases``: if another
+        instance holds it, or ran the job within its minimum interval, this
+        returns ``{"status": "skipped"}`` without running anything.
         """
         method_name = self.JOB_METHODS.get(job_name)
         if method_name is None:
             raise KeyError(job_name)
-        logger.info("Running scheduled job '%s' one-shot via run_job()", job_name)
-        getattr(self, method_name)()
-        return {"job": job_name, "status": "completed"}
+        logger.info("Running scheduled job '%s' one-shot via run_job() (%s)", job_name, trigger)
+        return run_with_lease(job_name, getattr(self, method_name), self._get_db, trigger=trigger)
+
+    def _run_scheduled(self, job_name: str) -> None:
+        """``schedule`` callback: run a job under its lease, never raising into the loop."""
+        try:
+            self.run_job(job_name, trigger="schedule")
+        except Exception as e:
+            logger.error("Scheduled job '%s' failed: %s", job_name, e)
 
     def send_signup_confirmation_now(self, player_email: str, player_name: str, signup_date: str) -> bool:
         """Send an immediate signup confirmation email"""
@@ -339,6 +367,7 @@ class EmailScheduler:
 
         except Exception as e:
             logger.error(f"Error in Saturday pairing job: {e!s}")
+            raise
         finally:
             db.close()
 
@@ -395,6 +424,7 @@ class EmailScheduler:
         except Exception as exc:
             logger.error("Legacy rounds sync failed: %s", exc)
             db.rollback()
+            raise
         finally:
             db.close()
 
@@ -479,6 +509,7 @@ class EmailScheduler:
 
         except Exception as exc:
             logger.error("_process_pending_sheet_syncs failed: %s", exc)
+            raise
         finally:
             db.close()
 
@@ -530,12 +561,27 @@ class EmailScheduler:
                     return
                 results = loop.run_until_complete(ghin_service.sync_all_players_handicaps())
                 synced = results.get("synced", 0)
-                failed = results.get("failed", 0)
+                failed = results.get("errors", 0)
                 logger.info("GHIN handicap sync complete: %d synced, %d failed", synced, failed)
             finally:
                 loop.close()
         except Exception as exc:
             logger.error("GHIN handicap sync failed: %s", exc)
+            raise
+        finally:
+            db.close()
+
+    def _export_season_store(self):
+        """Export the scoring tables to the columnar season store (services/season_store.py)."""
+        from ..services.season_store import export_season_store
+
+        db = self._get_db()
+        try:
+            export_season_store(db)
+        except Exception as exc:
+            # Re-raised so the job lease records the run as failed.
+            logger.error("Season store export failed: %s", exc)
+            raise
         finally:
             db.close()
 
@@ -8,17 +8,36 @@ import logging
 import os
 import re
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import emails
-from jinja2 import Template
+from .email_fanout import OutgoingEmail, deliver
 
-# Import email providers
-from .providers.gmail_oauth2_provider import create_gmail_oauth2_provider
-from .providers.resend_provider import create_resend_provider
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Provider SDKs (googleapiclient/google-auth, resend, emails) and jinja2 are
+# imported on first use: together they cost ~0.5s of boot time and most
+# instances only ever load the one configured provider.
 
 logger = logging.getLogger(__name__)
 
+# Messages captured by EmailService.collect() instead of being sent.
+_outbox: ContextVar[list[OutgoingEmail] | None] = ContextVar("email_outbox", default=None)
+
+
+@lru_cache(maxsize=8)
+def _compile_template(source: str) -> "Template":
+    """Compile a Jinja template once per distinct source string."""
+    from jinja2 import Template
+
+    template: Template = Template(source)
+    return template
+
+
 # --- Provider Abstract Base Class ---
 
 
@@ -71,6 +90,8 @@ class SMTPEmailProvider(EmailProvider):
             logger.error("SMTP provider is not configured. Cannot send email.")
             return False
         try:
+            import emails
+
             message = emails.html(
                 html=html_body,
                 text=text_body or self._html_to_text(html_body),
@@ -119,11 +140,15 @@ class EmailService:
 
         if email_provider_type == "gmail_oauth2":
             logger.info("Using Gmail OAuth2 email provider.")
+            from .providers.gmail_oauth2_provider import create_gmail_oauth2_provider
+
             gmail_provider = create_gmail_oauth2_provider()
             return gmail_provider  # type: ignore
 
         if email_provider_type == "resend":
             logger.info("Using Resend email provider.")
+            from .providers.resend_provider import create_resend_provider
+
             resend_provider = create_resend_provider()
             return resend_provider  # type: ignore
 
@@ -143,10 +168,37 @@ class EmailService:
         if not self.is_configured():
             logger.error("Email service is not configured. Cannot send email.")
             return False
+        outbox = _outbox.get()
+        if outbox is not None:
+            outbox.append(OutgoingEmail(to_email, subject, html_body, text_body))
+            return True
         if self.provider is not None:
             return self.provider.send_email(to_email, subject, html_body, text_body)
         return False
 
+    @contextmanager
+    def collect(self) -> Iterator[list[OutgoingEmail]]:
+        """Capture rendered messages from ``send_*`` calls instead of sending them.
+
+        Pair with :meth:`send_many` (or use ``email_fanout.fan_out``) to deliver
+        a whole job's mail as one parallel/batched fan-out.
+        """
+        outbox: list[OutgoingEmail] = []
+        token = _outbox.set(outbox)
+        try:
+            yield outbox
+        finally:
+            _outbox.reset(token)
+
+    def send_many(self, messages: Sequence[OutgoingEmail], workers: int | None = None) -> list[bool]:
+        """Deliver pre-rendered messages; returns one success flag per message."""
+        if not messages:
+            return []
+        if not self.is_configured():
+            logger.error("Email service is not configured. Cannot send %d emails.", len(messages))
+            return [False] * len(messages)
+        return deliver(self.provider, messages, workers=workers)
+
     def send_test_email(self, to_email: str, admin_name: str = "Admin") -> bool:
         """Sends a test email to verify the current provider's configuration."""
         provider_name = self.provider.__class__.__name__ if self.provider else "None"
@@ -182,6 +234,9 @@ class EmailService:
         </html>
         """
 
+    def _render_base(self, subject: str, content: str) -> str:
+        return _compile_template(self._get_base_template()).render(subject=subject, content=content)
+
     def send_signup_confirmation(self, to_email: str, player_name: str, signup_date: str) -> bool:
         """Sends a signup confirmation email."""
         content = f"""
@@ -189,8 +244,7 @@ class EmailService:
         <p>Hi {player_name},</p>
         <p>You're all set for Wolf Goat Pig on <strong>{signup_date}</strong>.</p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Golf Signup Confirmed", content=content)
+        html_body = self._render_base(subject="Golf Signup Confirmed", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -227,8 +281,7 @@ class EmailService:
         the club roster is updated.</p>
         <p>Welcome aboard &mdash; see you on the first tee. &#9971;</p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Welcome to Wolf Goat Pig", content=content)
+        html_body = self._render_base(subject="Welcome to Wolf Goat Pig", content=content)
 
         text_body = (
             f"Welcome to Wolf Goat Pig!\n\n"
@@ -278,8 +331,7 @@ class EmailService:
         <p>Open the app to confirm it. The round won't count toward standings
         until a foursome member attests it.</p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Confirm a Wolf Goat Pig round", content=content)
+        html_body = self._render_base(subject="Confirm a Wolf Goat Pig round", content=content)
 
         text_body = (
             "Confirm a Wolf Goat Pig round\n\n"
@@ -323,8 +375,7 @@ class EmailService:
         </ol>
         <p>Until then they can play, but their date sign-ups won't reach the legacy board.</p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="New WGP player needs onboarding", content=content)
+        html_body = self._render_base(subject="New WGP player needs onboarding", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -398,8 +449,7 @@ class EmailService:
         </p>
         """
 
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Sunday Pairings", content=content)
+        html_body = self._render_base(subject="Sunday Pairings", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -458,8 +508,7 @@ class EmailService:
         </p>
         """
 
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="We're short for a game", content=content)
+        html_body = self._render_base(subject="We're short for a game", content=content)
 
         text_body = (
             f"We need {needed} more {player_word} for {formatted_date}!\n\n"
@@ -549,8 +598,7 @@ class EmailService:
         <p><em>- Wolf Goat Pig Automated System</em></p>
         """
 
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Tee Time Request", content=content)
+        html_body = self._render_base(subject="Tee Time Request", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -638,8 +686,7 @@ class EmailService:
             This match will expire in 7 days if not accepted.
         </p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Golf Match Found", content=content)
+        html_body = self._render_base(subject="Golf Match Found", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -692,8 +739,7 @@ class EmailService:
             {cta_html}
         </div>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Match Confirmed", content=content)
+        html_body = self._render_base(subject="Match Confirmed", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -730,8 +776,7 @@ class EmailService:
             New matches are automatically found when players update their availability.
         </p>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Match Update", content=content)
+        html_body = self._render_base(subject="Match Update", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -767,8 +812,7 @@ class EmailService:
             {cta_html}
         </div>
         """
-        template = Template(self._get_base_template())
-        html_body = template.render(subject="Match Waiting", content=content)
+        html_body = self._render_base(subject="Match Waiting", content=content)
 
         return self._send_email(
             to_email=to_email,
@@ -0,0 +1,100 @@
+"""
+Export Service — incremental NDJSON / CSV encoding for streaming exports.
+
+Exports never build the full result in memory: rows are read from the
+database in ``EXPORT_BATCH_SIZE`` partitions (``yield_per``, which uses a
+server-side cursor on Postgres) and encoded a batch at a time, so memory
+stays flat however large the season is. Routers wrap ``export_response``
+around any iterator of plain dicts.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Literal
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_BATCH_SIZE = 500
+
+MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+ROUND_COLUMNS = ("date", "date_sortable", "group", "member", "score", "location", "duration", "source")
+GAME_HISTORY_COLUMNS = (
+    "id",
+    "game_id",
+    "course_name",
+    "player_count",
+    "total_holes_played",
+    "game_duration_minutes",
+    "created_at",
+    "completed_at",
+    "final_scores",
+)
+HOLE_EVENT_COLUMNS = ("game_id", "hole_number", "player_id", "score", "quarters", "recorded_at")
+
+
+def stream_rows(db: Session, stmt: Select[Any], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Row[Any]]:
+    """Rows of a column ``select``, fetched ``batch_size`` at a time.
+
+    Select columns rather than entities so rows never enter the identity map.
+    """
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    try:
+        for partition in result.partitions():
+            yield from partition
+    finally:
+        result.close()
+
+
+def _csv_value(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, dict | list) else value
+
+
+def encode_ndjson(rows: Iterable[dict[str, Any]], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """One JSON object per line, yielded ``batch_size`` lines at a time."""
+    lines: list[str] = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str, separators=(",", ":")))
+        if len(lines) >= batch_size:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def encode_csv(
+    rows: Iterable[dict[str, Any]], columns: Sequence[str], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    """A header line, then ``columns`` of each row; nested values are JSON-encoded."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def export_response(
+    rows: Iterable[dict[str, Any]], fmt: ExportFormat, columns: Sequence[str], filename: str
+) -> StreamingResponse:
+    """Stream ``rows`` as an NDJSON or CSV attachment named ``filename``.<fmt>."""
+    body = encode_csv(rows, columns) if fmt == "csv" else encode_ndjson(rows)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
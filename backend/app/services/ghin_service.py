@@ -8,14 +8,18 @@ This service handles:
 - Joining GHIN data with existing player statistics
 """
 
+import asyncio
 import logging
 import os
+import random
+import weakref
 from typing import Any, cast
 
 import httpx  # Added httpx for API calls
 from sqlalchemy import and_, desc
 from sqlalchemy.orm import Session
 
+from ..database import run_db
 from ..models import GHINHandicapHistory, GHINScore, PlayerProfile, PlayerStatistics
 from ..observability.report import report_exception
 from ..utils.time import utc_now
@@ -26,6 +30,68 @@ from ..utils.time import utc_now
 
 logger = logging.getLogger(__name__)
 
+# Bulk-sync tuning. GHIN doesn't publish limits; these keep the 06:00 job
+# well under what the public site's own golfer lookups generate.
+GHIN_SYNC_CONCURRENCY = int(os.getenv("GHIN_SYNC_CONCURRENCY", "4"))
+GHIN_RATE_PER_SECOND = float(os.getenv("GHIN_RATE_PER_SECOND", "2"))
+GHIN_RATE_BURST = int(os.getenv("GHIN_RATE_BURST", "4"))
+GHIN_MAX_ATTEMPTS = int(os.getenv("GHIN_MAX_ATTEMPTS", "3"))
+GHIN_RETRY_BASE_SECONDS = float(os.getenv("GHIN_RETRY_BASE_SECONDS", "0.5"))
+GHIN_SYNC_CHUNK_SIZE = int(os.getenv("GHIN_SYNC_CHUNK_SIZE", "25"))
+
+# Responses worth retrying; anything else (bad id, auth) fails fast.
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# In-flight handicap lookups keyed by (event loop, GHIN id), so a bulk sync,
+# a lobby join and an on-demand sync for the same golfer share one request.
+_inflight_lookups: dict[tuple[int, str], asyncio.Task] = {}
+
+
+class _TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, bursting to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1 or self.rate <= 0:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# Process-wide GHIN request limits, one pair per event loop (asyncio locks and
+# semaphores are loop-bound). Every GHINService instance — lobby joins,
+# on-demand syncs and the scheduled sync — draws from the same token bucket
+# and concurrency cap.
+_request_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[_TokenBucket, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _request_limits_for_loop() -> tuple[_TokenBucket, asyncio.Semaphore]:
+    """The shared rate limiter and concurrency cap for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limits = _request_limits.get(loop)
+    if limits is None:
+        limits = (
+            _TokenBucket(GHIN_RATE_PER_SECOND, GHIN_RATE_BURST),
+            asyncio.Semaphore(max(GHIN_SYNC_CONCURRENCY, 1)),
+        )
+        _request_limits[loop] = limits
+    return limits
+
 
 class GHINService:
     """Service class for GHIN integration operations."""
@@ -37,6 +103,9 @@ class GHINService:
         self.ghin_password = os.getenv("GHIN_API_PASS")
         self.jwt_token: str | None = None  # Store JWT token
         self.GHIN_API_BASE_URL = "https://api2.ghin.com/api/v1"
+        # Bulk-sync plumbing: a shared client while a bulk sync is running.
+        # Rate limiting is process-wide (see _request_limits_for_loop).
+        self._client: httpx.AsyncClient | None = None
 
     async def initialize(self):
         """Initialize GHIN service with authentication."""
@@ -109,38 +178,17 @@ class GHINService:
             return None
 
         try:
-            player = self.db.query(PlayerProfile).filter(PlayerProfile.id == player_id).first()
+            player = await run_db(self._get_player, player_id)
             if not player or not player.ghin_id:
                 logger.warning(f"Player {player_id} has no GHIN ID configured")
                 return None
 
             # Use the actual GHIN API call - convert Column to str
             ghin_id_str = str(player.ghin_id)
-            handicap_data = await self._fetch_handicap_from_ghin(ghin_id_str)
+            handicap_data = await self._fetch_handicap_coalesced(ghin_id_str)
 
             if handicap_data:
-                # Only overwrite the stored handicap when GHIN actually returned
-                # a value; otherwise keep the last known good one (never clobber
-                # it with the 18.0 placeholder on a partial/failed lookup). #320
-                new_index = handicap_data.get("handicap_index")
-                if new_index is not None:
-                    player.handicap = new_index
-                    player.handicap_source = "ghin"  # authoritative, not the default placeholder
-                player.ghin_last_updated = utc_now().isoformat()
-
-                # Store handicap history
-                handicap_history = GHINHandicapHistory(
-                    player_profile_id=player_id,
-                    ghin_id=player.ghin_id,
-                    effective_date=handicap_data.get("effective_date", utc_now().date().isoformat()),
-                    handicap_index=handicap_data.get("handicap_index"),
-                    revision_reason=handicap_data.get("revision_reason"),
-                    scores_used_count=handicap_data.get("scores_used_count"),
-                    synced_at=utc_now().isoformat(),
-                )
-
-                self.db.add(handicap_history)
-                self.db.commit()
+                await run_db(self._store_handicap, player_id, player, handicap_data)
 
                 logger.info(f"Synced handicap for player {player.name}: {handicap_data.get('handicap_index')}")
                 return handicap_data
@@ -150,9 +198,40 @@ class GHINService:
 
         except Exception as e:
             logger.error(f"Failed to sync handicap for player {player_id}: {e}")
-            self.db.rollback()
+            await run_db(self.db.rollback)
             return None
 
+    def _get_player(self, player_id: int) -> PlayerProfile | None:
+        return self.db.query(PlayerProfile).filter(PlayerProfile.id == player_id).first()
+
+    def _store_handicap(self, player_id: int, player: PlayerProfile, handicap_data: dict[str, Any]) -> None:
+        self._apply_handicap(player_id, player, handicap_data)
+        self.db.commit()
+
+    def _apply_handicap(self, player_id: int, player: PlayerProfile, handicap_data: dict[str, Any]) -> None:
+        """Apply a GHIN handicap lookup to the profile and stage a history row."""
+        # Only overwrite the stored handicap when GHIN actually returned
+        # a value; otherwise keep the last known good one (never clobber
+        # it with the 18.0 placeholder on a partial/failed lookup). #320
+        new_index = handicap_data.get("handicap_index")
+        if new_index is not None:
+            player.handicap = new_index
+            player.handicap_source = "ghin"  # authoritative, not the default placeholder
+        player.ghin_last_updated = utc_now().isoformat()
+
+        # Store handicap history
+        handicap_history = GHINHandicapHistory(
+            player_profile_id=player_id,
+            ghin_id=player.ghin_id,
+            effective_date=handicap_data.get("effective_date", utc_now().date().isoformat()),
+            handicap_index=handicap_data.get("handicap_index"),
+            revision_reason=handicap_data.get("revision_reason"),
+            scores_used_count=handicap_data.get("scores_used_count"),
+            synced_at=utc_now().isoformat(),
+        )
+
+        self.db.add(handicap_history)
+
     async def sync_player_scores(self, player_id: int, days_back: int = 30) -> list[dict[str, Any]]:
         """
         Sync a player's recent scores from GHIN.
@@ -165,7 +244,7 @@ class GHINService:
             List of score records that were synced
         """
         try:
-            player = self.db.query(PlayerProfile).filter(PlayerProfile.id == player_id).first()
+            player = await run_db(self._get_player, player_id)
             if not player or not player.ghin_id:
                 logger.warning(f"Player {player_id} has no GHIN ID configured")
                 return []
@@ -178,67 +257,84 @@ class GHINService:
             ghin_id_str = str(player.ghin_id)
             scores_data = await self._fetch_scores_from_ghin(ghin_id_str, days_back)
 
-            synced_scores = []
-            for score_data in scores_data:
-                # Check if we already have this score
-                existing_score = (
-                    self.db.query(GHINScore)
-                    .filter(
-                        and_(
-                            GHINScore.player_profile_id == player_id,
-                            GHINScore.ghin_id == player.ghin_id,
-                            GHINScore.score_date == score_data.get("date"),
-                            GHINScore.course_name == score_data.get("course"),
-                        )
-                    )
-                    .first()
-                )
-
-                if not existing_score:
-                    # Create new score record
-                    ghin_score = GHINScore(
-                        player_profile_id=player_id,
-                        ghin_id=player.ghin_id,
-                        score_date=score_data.get("date"),
-                        course_name=score_data.get("course"),
-                        tees=score_data.get("tees"),
-                        score=score_data.get("score"),
-                        course_rating=score_data.get("course_rating"),
-                        slope_rating=score_data.get("slope_rating"),
-                        differential=score_data.get("differential"),
-                        posted=1 if score_data.get("posted", True) else 0,
-                        handicap_index_at_time=score_data.get("handicap_index_at_time"),
-                        synced_at=utc_now().isoformat(),
-                        created_at=utc_now().isoformat(),
-                        updated_at=utc_now().isoformat(),
-                    )
-
-                    self.db.add(ghin_score)
-                    synced_scores.append(score_data)
-
+            synced_scores = await run_db(self._store_new_scores, player_id, player, scores_data)
             if synced_scores:
-                self.db.commit()
                 logger.info(f"Synced {len(synced_scores)} new scores for player {player.name}")
 
             return synced_scores
 
         except Exception as e:
             logger.error(f"Failed to sync scores for player {player_id}: {e}")
-            self.db.rollback()
+            await run_db(self.db.rollback)
             return []
 
+    def _store_new_scores(
+        self, player_id: int, player: PlayerProfile, scores_data: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Insert the GHIN scores not already stored for ``player``; returns the new ones."""
+        synced_scores = []
+        for score_data in scores_data:
+            # Check if we already have this score
+            existing_score = (
+                self.db.query(GHINScore)
+                .filter(
+                    and_(
+                        GHINScore.player_profile_id == player_id,
+                        GHINScore.ghin_id == player.ghin_id,
+                        GHINScore.score_date == score_data.get("date"),
+                        GHINScore.course_name == score_data.get("course"),
+                    )
+                )
+                .first()
+            )
+
+            if not existing_score:
+                # Create new score record
+                ghin_score = GHINScore(
+                    player_profile_id=player_id,
+                    ghin_id=player.ghin_id,
+                    score_date=score_data.get("date"),
+                    course_name=score_data.get("course"),
+                    tees=score_data.get("tees"),
+                    score=score_data.get("score"),
+                    course_rating=score_data.get("course_rating"),
+                    slope_rating=score_data.get("slope_rating"),
+                    differential=score_data.get("differential"),
+                    posted=1 if score_data.get("posted", True) else 0,
+                    handicap_index_at_time=score_data.get("handicap_index_at_time"),
+                    synced_at=utc_now().isoformat(),
+                    created_at=utc_now().isoformat(),
+                    updated_at=utc_now().isoformat(),
+                )
+
+                self.db.add(ghin_score)
+                synced_scores.append(score_data)
+
+        if synced_scores:
+            self.db.commit()
+        return synced_scores
+
     async def sync_all_players_handicaps(self) -> dict[str, Any]:
         """
         Sync handicaps for all players who have GHIN IDs.
 
+        Lookups run concurrently (bounded by ``GHIN_SYNC_CONCURRENCY`` and the
+        ``GHIN_RATE_PER_SECOND`` token bucket) over one shared HTTP client.
+        Players sharing a GHIN id share one lookup, and each chunk of
+        ``GHIN_SYNC_CHUNK_SIZE`` players is written with a single commit.
+
         Returns:
             Summary of sync results
         """
         try:
-            players_with_ghin = (
-                self.db.query(PlayerProfile)
-                .filter(and_(PlayerProfile.ghin_id.isnot(None), PlayerProfile.is_active == 1))
-                .all()
+            # Plain (id, ghin_id, name) rows: each chunk commits, and touching an
+            # expired ORM instance here would refresh it on the event loop.
+            players_with_ghin = await run_db(
+                lambda: (
+                    self.db.query(PlayerProfile.id, PlayerProfile.ghin_id, PlayerProfile.name)
+                    .filter(and_(PlayerProfile.ghin_id.isnot(None), PlayerProfile.is_active == 1))
+                    .all()
+                )
             )
 
             if not players_with_ghin:
@@ -248,18 +344,34 @@ class GHINService:
             synced_count = 0
             error_count = 0
 
-            for player in players_with_ghin:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                self._client = client
                 try:
-                    # Convert Column to int
-                    player_id_int = int(player.id)
-                    result = await self.sync_player_handicap(player_id_int)
-                    if result:
-                        synced_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    logger.error(f"Error syncing player {player.name}: {e}")
-                    error_count += 1
+                    for start in range(0, len(players_with_ghin), max(GHIN_SYNC_CHUNK_SIZE, 1)):
+                        chunk = players_with_ghin[start : start + GHIN_SYNC_CHUNK_SIZE]
+                        results = await asyncio.gather(
+                            *(self._fetch_handicap_coalesced(str(ghin_id)) for _, ghin_id, _ in chunk),
+                            return_exceptions=True,
+                        )
+
+                        fetched = []
+                        for (player_id, _, name), result in zip(chunk, results, strict=True):
+                            if isinstance(result, BaseException) or not result:
+                                if isinstance(result, BaseException):
+                                    logger.error(f"Error syncing player {name}: {result}")
+                                error_count += 1
+                            else:
+                                fetched.append((player_id, result))
+
+                        try:
+                            await run_db(self._store_handicap_chunk, fetched)
+                            synced_count += len(fetched)
+                        except Exception as e:
+                            logger.error(f"Failed to store GHIN handicap chunk: {e}")
+                            await run_db(self.db.rollback)
+                            error_count += len(fetched)
+                finally:
+                    self._client = None
 
             summary = {
                 "total_players": len(players_with_ghin),
@@ -275,6 +387,15 @@ class GHINService:
             logger.error(f"Failed to sync all player handicaps: {e}")
             return {"total_players": 0, "synced": 0, "errors": 1, "error": str(e)}
 
+    def _store_handicap_chunk(self, fetched: list[tuple[int, dict[str, Any]]]) -> None:
+        ids = [player_id for player_id, _ in fetched]
+        players = {p.id: p for p in self.db.query(PlayerProfile).filter(PlayerProfile.id.in_(ids))}
+        for player_id, handicap_data in fetched:
+            player = players.get(player_id)
+            if player is not None:
+                self._apply_handicap(player_id, player, handicap_data)
+        self.db.commit()
+
     async def search_golfers(
         self,
         last_name: str,
@@ -552,6 +673,16 @@ class GHINService:
 
     # GHIN API Integration - Now supports real API calls
 
+    async def _fetch_handicap_coalesced(self, ghin_id: str) -> dict[str, Any] | None:
+        """Share one in-flight GHIN lookup between concurrent callers for ``ghin_id``."""
+        key = (id(asyncio.get_running_loop()), ghin_id)
+        task = _inflight_lookups.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_handicap_from_ghin(ghin_id))
+            _inflight_lookups[key] = task
+            task.add_done_callback(lambda _: _inflight_lookups.pop(key, None))
+        return await asyncio.shield(task)
+
     async def _fetch_handicap_from_ghin(self, ghin_id: str) -> dict[str, Any] | None:
         """Fetch handicap from GHIN API."""
         logger.info(f"Fetching handicap for GHIN ID {ghin_id}")
@@ -578,36 +709,73 @@ class GHINService:
                 "source": "GHINcom",
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
-
-                logger.info(f"Raw GHIN API response for {ghin_id}: {data}")
-
-                # Response is {"golfers": [...]} array format
-                golfers = data.get("golfers", [])
-                if not golfers:
-                    logger.warning(f"No golfer found in GHIN for ID {ghin_id}")
-                    return None
-
-                golfer = golfers[0]
-                handicap_index = golfer.get("handicap_index") or golfer.get("HiValue") or golfer.get("hi_value")
-                return {
-                    "ghin_id": ghin_id,
-                    "handicap_index": handicap_index,
-                    "name": golfer.get("display_name")
-                    or f"{golfer.get('first_name', '')} {golfer.get('last_name', '')}".strip()
-                    or "Unknown",
-                    "last_updated": golfer.get("rev_date") or golfer.get("last_revised_date"),
-                    "low_handicap_index": golfer.get("low_hi"),
-                    "status": "active",
-                }
+            data = await self._get_with_retry(url, headers=headers, params=params)
+
+            logger.info(f"Raw GHIN API response for {ghin_id}: {data}")
+
+            # Response is {"golfers": [...]} array format
+            golfers = data.get("golfers", [])
+            if not golfers:
+                logger.warning(f"No golfer found in GHIN for ID {ghin_id}")
+                return None
+
+            golfer = golfers[0]
+            handicap_index = golfer.get("handicap_index") or golfer.get("HiValue") or golfer.get("hi_value")
+            return {
+                "ghin_id": ghin_id,
+                "handicap_index": handicap_index,
+                "name": golfer.get("display_name")
+                or f"{golfer.get('first_name', '')} {golfer.get('last_name', '')}".strip()
+                or "Unknown",
+                "last_updated": golfer.get("rev_date") or golfer.get("last_revised_date"),
+                "low_handicap_index": golfer.get("low_hi"),
+                "status": "active",
+            }
 
         except Exception as e:
             logger.error(f"GHIN API call failed for {ghin_id}: {e}")
             return None
 
+    async def _get_with_retry(self, url: str, headers: dict[str, str], params: dict[str, str]) -> dict[str, Any]:
+        """GET ``url`` under the rate limiter and concurrency cap, retrying transient failures.
+
+        Backs off exponentially with full jitter (or the server's Retry-After)
+        on timeouts, connection errors, 429 and 5xx responses.
+        """
+        rate_limiter, semaphore = _request_limits_for_loop()
+        attempts = max(GHIN_MAX_ATTEMPTS, 1)
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after: float | None = None
+            try:
+                await rate_limiter.acquire()
+                async with semaphore:
+                    if self._client is not None:
+                        response = await self._client.get(url, headers=headers, params=params, timeout=10.0)
+                    else:
+                        async with httpx.AsyncClient() as client:
+                            response = await client.get(url, headers=headers, params=params, timeout=10.0)
+                response.raise_for_status()
+                return cast("dict[str, Any]", response.json())
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _RETRYABLE_STATUS or attempt >= attempts:
+                    raise
+                header = e.response.headers.get("Retry-After")
+                if header and header.isdigit():
+                    retry_after = min(float(header), 30.0)
+            except httpx.TransportError:
+                if attempt >= attempts:
+                    raise
+
+            delay = (
+                retry_after
+                if retry_after is not None
+                else random.uniform(0, GHIN_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+            )
+            logger.warning(f"GHIN request failed (attempt {attempt}/{attempts}); retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
     async def _get_mock_handicap_data(self, ghin_id: str) -> dict[str, Any]:
         """Return mock handicap data for development/fallback"""
         # Generate consistent mock data based on GHIN ID
@@ -621,8 +621,8 @@ def update_hole_history(
     game_state: dict[str, Any],
     hole_result: dict[str, Any],
     hole_number: int,
-) -> None:
-    """Add or update a hole in the history."""
+) -> int:
+    """Add or update a hole in the history; returns its index."""
     if "hole_history" not in game_state:
         game_state["hole_history"] = []
 
@@ -633,8 +633,9 @@ def update_hole_history(
 
     if existing_hole_index is not None:
         game_state["hole_history"][existing_hole_index] = hole_result
-    else:
-        game_state["hole_history"].append(hole_result)
+        return existing_hole_index
+    game_state["hole_history"].append(hole_result)
+    return len(game_state["hole_history"]) - 1
 
 
 def update_carry_over_state(
@@ -722,20 +723,53 @@ def sync_simulation(
             sim_player.points = db_player.get("points", 0)
 
 
+def refresh_running_totals(game_state: dict[str, Any], start: int = 0) -> None:
+    """Recompute each hole's ``running_totals`` (standings after it) from ``hole_history[start]`` on.
+
+    Holes before ``start`` keep their stored prefix, so editing hole k re-adds
+    only holes k onwards. Player ``points`` and ``standings`` are then read off
+    the last prefix.
+    """
+    history = game_state.get("hole_history", [])
+    players = game_state.get("players", [])
+    if start > 0 and "running_totals" not in history[start - 1]:
+        start = 0
+
+    running = dict(history[start - 1]["running_totals"]) if start > 0 else {p.get("id"): 0 for p in players}
+    for hole in history[start:]:
+        for player_id, quarters in (hole.get("points_delta") or {}).items():
+            running[player_id] = running.get(player_id, 0) + quarters
+        hole["running_totals"] = dict(running)
+
+    game_state["standings"] = running
+    for player in players:
+        player["points"] = running.get(player.get("id"), 0)
+
+
 def replay_player_totals(game_state: dict[str, Any]) -> None:
-    """Reset and replay all player totals from hole_history (used after update/delete)."""
-    for player in game_state.get("players", []):
-        player["points"] = 0
-        player["float_used"] = 0
+    """Reset and replay all player totals and float usage from hole_history."""
+    refresh_running_totals(game_state)
 
+    floats: dict[str, int] = {}
     for hole in game_state.get("hole_history", []):
-        hole_points_delta = hole.get("points_delta", {})
-        for player in game_state.get("players", []):
-            player_id = player.get("id")
-            if player_id in hole_points_delta:
-                player["points"] += hole_points_delta[player_id]
-            if hole.get("float_invoked_by") == player_id:
-                player["float_used"] += 1
+        if hole.get("float_invoked_by"):
+            floats[hole["float_invoked_by"]] = floats.get(hole["float_invoked_by"], 0) + 1
+    for player in game_state.get("players", []):
+        player["float_used"] = floats.get(player.get("id"), 0)
+
+
+def _move_float_usage(game_state: dict[str, Any], old_player_id: str | None, new_player_id: str | None) -> None:
+    """Move one float use from ``old_player_id`` to ``new_player_id`` after a hole edit."""
+    if old_player_id == new_player_id:
+        return
+    for player in game_state.get("players", []):
+        used = player.get("float_used", 0)
+        if isinstance(used, bool):
+            used = 0
+        if player.get("id") == old_player_id:
+            player["float_used"] = max(used - 1, 0)
+        elif player.get("id") == new_player_id:
+            player["float_used"] = used + 1
 
 
 # ---------------------------------------------------------------------------
@@ -766,9 +800,10 @@ def process_complete_hole(
     hole_result = build_hole_result(request, points_delta, quarters_breakdown, request.hole_number)
 
     # Update game state
-    update_hole_history(game_state, hole_result, request.hole_number)
+    hole_index = update_hole_history(game_state, hole_result, request.hole_number)
     update_carry_over_state(game_state, request)
     update_player_totals(game_state, points_delta, request)
+    refresh_running_totals(game_state, hole_index)
     game_state["current_hole"] = request.hole_number + 1
 
     return hole_result, game_state
@@ -799,10 +834,10 @@ def process_update_hole(
     quarters_breakdown = calculate_quarters_breakdown(points_delta, request)
     hole_result = build_hole_result(request, points_delta, quarters_breakdown, hole_number)
 
-    # Update hole in history
+    # Update hole in history; only this hole and the ones after it are re-added
+    previous = game_state["hole_history"][existing_hole_index]
     game_state["hole_history"][existing_hole_index] = hole_result
-
-    # Replay all totals from scratch
-    replay_player_totals(game_state)
+    refresh_running_totals(game_state, existing_hole_index)
+    _move_float_usage(game_state, previous.get("float_invoked_by"), request.float_invoked_by)
 
     return hole_result, game_state
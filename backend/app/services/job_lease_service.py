@@ -0,0 +1,202 @@
+"""
+Job Lease Service — run each periodic job once across autoscaled instances.
+
+Every Cloud Run instance with ``RUN_INPROCESS_SCHEDULERS=true`` has its own
+``schedule`` thread, and Cloud Scheduler's ``/internal/jobs/{job}`` calls are
+at-least-once. Before a job runs, its caller takes a row lock in
+``job_leases`` with a single conditional UPDATE. That UPDATE only succeeds
+when:
+
+- nobody holds the lease, or the holder's lease has expired (crashed
+  instance), and
+- the job hasn't succeeded within its ``min_interval`` (another instance
+  already handled this slot).
+
+Finished runs release the lease and record status/duration on the lease row
+and in ``job_runs``.
+"""
+
+import logging
+import os
+import socket
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models import JobLease, JobRun
+from ..utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process in job_leases.holder.
+LEASE_HOLDER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class LeasePolicy:
+    """How long a run may hold the lease, and how soon the job may run again."""
+
+    ttl_seconds: int
+    min_interval_seconds: int
+
+
+# Keyed by EmailScheduler.JOB_METHODS key. min_interval sits well under each
+# job's schedule period so a late trigger still runs, but well over the skew
+# between instances firing the same slot.
+JOB_LEASE_POLICIES: dict[str, LeasePolicy] = {
+    "daily-reminders": LeasePolicy(ttl_seconds=1800, min_interval_seconds=12 * 3600),
+    "weekly-summaries": LeasePolicy(ttl_seconds=1800, min_interval_seconds=12 * 3600),
+    "saturday-pairings": LeasePolicy(ttl_seconds=1800, min_interval_seconds=12 * 3600),
+    "legacy-rounds-sync": LeasePolicy(ttl_seconds=1800, min_interval_seconds=3600),
+    "pending-sheet-syncs": LeasePolicy(ttl_seconds=1800, min_interval_seconds=12 * 3600),
+    "ghin-sync": LeasePolicy(ttl_seconds=3600, min_interval_seconds=12 * 3600),
+    "season-store-export": LeasePolicy(ttl_seconds=1800, min_interval_seconds=12 * 3600),
+}
+DEFAULT_LEASE_POLICY = LeasePolicy(ttl_seconds=1800, min_interval_seconds=0)
+
+
+def _ts(moment: datetime) -> str:
+    # Fixed-width so lexicographic comparison in SQL matches time order.
+    return moment.isoformat(timespec="microseconds")
+
+
+def try_acquire_lease(db: Session, job_name: str, policy: LeasePolicy, holder: str = LEASE_HOLDER) -> bool:
+    """Atomically take the lease for ``job_name``; returns False if someone else should run it."""
+    now = utc_now()
+    if db.get(JobLease, job_name) is None:
+        try:
+            db.add(JobLease(job_name=job_name, run_count=0))
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # another instance created the row first
+
+    # Table columns rather than model attributes: the untyped declarative base
+    # gives mypy nothing to check the comparisons against.
+    lease = JobLease.__table__.c
+    conditions = [
+        lease.job_name == job_name,
+        or_(lease.holder.is_(None), lease.expires_at < _ts(now)),
+    ]
+    if policy.min_interval_seconds > 0:
+        recent = _ts(now - timedelta(seconds=policy.min_interval_seconds))
+        conditions.append(or_(lease.last_success_at.is_(None), lease.last_success_at < recent))
+
+    result = db.execute(
+        update(JobLease)
+        .where(*conditions)
+        .values(
+            holder=holder,
+            acquired_at=_ts(now),
+            expires_at=_ts(now + timedelta(seconds=policy.ttl_seconds)),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return bool(getattr(result, "rowcount", 0) == 1)
+
+
+def release_lease(
+    db: Session,
+    job_name: str,
+    started_at: str,
+    duration_seconds: float,
+    status: str,
+    trigger: str,
+    error: str | None = None,
+    holder: str = LEASE_HOLDER,
+) -> None:
+    """Release ``job_name`` and record how the run went."""
+    values: dict[str, Any] = {
+        "holder": None,
+        "expires_at": None,
+        "last_run_at": started_at,
+        "last_status": status,
+        "last_duration_seconds": duration_seconds,
+        "run_count": JobLease.run_count + 1,
+    }
+    if status == "success":
+        values["last_success_at"] = started_at
+    db.execute(
+        update(JobLease)
+        .where(JobLease.job_name == job_name, JobLease.holder == holder)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.add(
+        JobRun(
+            job_name=job_name,
+            holder=holder,
+            trigger=trigger,
+            started_at=started_at,
+            duration_seconds=duration_seconds,
+            status=status,
+            error=error[:500] if error else None,
+        )
+    )
+    db.commit()
+
+
+@contextmanager
+def _session(session_factory: Callable[[], Session]) -> Iterator[Session]:
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def run_with_lease(
+    job_name: str,
+    func: Callable[[], Any],
+    session_factory: Callable[[], Session],
+    trigger: str,
+    policy: LeasePolicy | None = None,
+) -> dict[str, Any]:
+    """Run ``func`` if this instance wins the lease for ``job_name``.
+
+    Returns ``{"job", "status", ...}`` where ``status`` is ``"completed"``, or
+    ``"skipped"`` when another instance holds the lease or ran the job
+    recently. Exceptions from ``func`` are recorded as a failed run and
+    re-raised. If the lease table can't be reached the job still runs: a
+    duplicate run (the old behaviour) beats silently skipping the job.
+    """
+    policy = policy or JOB_LEASE_POLICIES.get(job_name, DEFAULT_LEASE_POLICY)
+    leased = True
+    try:
+        with _session(session_factory) as db:
+            if not try_acquire_lease(db, job_name, policy):
+                logger.info("Job '%s' skipped: lease held or ran recently (%s)", job_name, trigger)
+                return {"job": job_name, "status": "skipped", "reason": "lease_unavailable"}
+    except Exception as e:
+        logger.warning("Job '%s': lease unavailable (%s); running without it", job_name, e)
+        leased = False
+
+    started_at = _ts(utc_now())
+    started = time.perf_counter()
+    status, error = "success", None
+    try:
+        result = func()
+    except Exception as e:
+        status, error = "failed", str(e)
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        logger.info("Job '%s' %s in %.2fs (%s)", job_name, status, duration, trigger)
+        if leased:
+            try:
+                with _session(session_factory) as db:
+                    release_lease(db, job_name, started_at, duration, status, trigger, error)
+            except Exception as e:
+                logger.error("Job '%s': failed to release lease: %s", job_name, e)
+
+    response: dict[str, Any] = {"job": job_name, "status": "completed", "duration_seconds": round(duration, 3)}
+    if isinstance(result, dict):
+        response["result"] = result
+    return response
@@ -6,12 +6,18 @@ through ``GET /players/{id}/avatar``, not public object URLs.
 
 ``avatar_url`` values of the form ``gcs:avatars/{id}.jpg`` mark a GCS-backed
 upload so ``has_avatar_image`` stays true without keeping the blob in Postgres.
+
+Downloads go through a small in-process LRU (``download_bytes_cached``) bounded
+by total bytes (``MEDIA_CACHE_MAX_BYTES``, default 16MB), so a hot avatar is
+fetched from GCS once per instance rather than once per request.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -19,6 +25,13 @@ logger = logging.getLogger(__name__)
 GCS_AVATAR_PREFIX = "gcs:"
 AVATAR_OBJECT_TEMPLATE = "avatars/{player_id}.jpg"
 
+MEDIA_CACHE_MAX_BYTES = int(os.getenv("MEDIA_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# (object_path, version) -> bytes, most recently used last
+_byte_cache: OrderedDict[tuple[str, str | None], bytes] = OrderedDict()
+_byte_cache_size = 0
+_byte_cache_lock = threading.Lock()
+
 
 def media_bucket() -> str:
     return (os.getenv("MEDIA_BUCKET") or "").strip()
@@ -57,6 +70,7 @@ def upload_bytes(object_path: str, data: bytes, content_type: str = "application
         raise RuntimeError("MEDIA_BUCKET is not configured")
     blob = _client().bucket(bucket_name).blob(object_path)
     blob.upload_from_string(data, content_type=content_type)
+    invalidate_cached(object_path)
     logger.info("Uploaded gs://%s/%s (%d bytes)", bucket_name, object_path, len(data))
 
 
@@ -75,6 +89,50 @@ def delete_object(object_path: str) -> None:
     if not bucket_name:
         return
     blob = _client().bucket(bucket_name).blob(object_path)
+    invalidate_cached(object_path)
     if blob.exists():
         blob.delete()
         logger.info("Deleted gs://%s/%s", bucket_name, object_path)
+
+
+def download_bytes_cached(object_path: str, version: str | None = None) -> bytes | None:
+    """download_bytes() behind the in-process LRU.
+
+    ``version`` (e.g. the owner's ``updated_at``) is part of the cache key, so
+    an upload handled by another instance is picked up without invalidation.
+    Misses (``None``) are not cached.
+    """
+    global _byte_cache_size
+    key = (object_path, version)
+    with _byte_cache_lock:
+        data = _byte_cache.get(key)
+        if data is not None:
+            _byte_cache.move_to_end(key)
+            return data
+
+    data = download_bytes(object_path)
+    if data is None or len(data) > MEDIA_CACHE_MAX_BYTES:
+        return data
+
+    with _byte_cache_lock:
+        previous = _byte_cache.pop(key, None)
+        if previous is not None:
+            _byte_cache_size -= len(previous)
+        _byte_cache[key] = data
+        _byte_cache_size += len(data)
+        while _byte_cache_size > MEDIA_CACHE_MAX_BYTES:
+            _, evicted = _byte_cache.popitem(last=False)
+            _byte_cache_size -= len(evicted)
+    return data
+
+
+def invalidate_cached(object_path: str | None = None) -> None:
+    """Drop cached bytes for one object (every version), or everything when None."""
+    global _byte_cache_size
+    with _byte_cache_lock:
+        if object_path is None:
+            _byte_cache.clear()
+            _byte_cache_size = 0
+            return
+        for key in [k for k in _byte_cache if k[0] == object_path]:
+            _byte_cache_size -= len(_byte_cache.pop(key))
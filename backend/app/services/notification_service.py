@@ -7,7 +7,7 @@ This service handles all notification operations for the Wolf Goat Pig applicati
 - Retrieving player notifications
 - Managing notification read/unread status
 - Deleting notifications
-- Tracking unread notification counts
+- Tracking unread notification counts (a maintained per-player counter)
 
 Notification types supported:
 - game_start: Game has started
@@ -20,18 +20,93 @@ Notification types supported:
 """
 
 import logging
+from collections import Counter
 from datetime import timedelta
 from typing import Any
 
 from fastapi import HTTPException
+from sqlalchemy import Connection, case, delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from ..models import Notification
+from ..models import Notification, NotificationUnreadCount
 from ..utils.time import utc_now
 
 logger = logging.getLogger(__name__)
 
 
+# ====================================================================================
+# UNREAD COUNTER
+# ====================================================================================
+#
+# notification_unread_counts holds one row per player. Every write path adjusts
+# it in the same transaction as the notifications it touches: the service's bulk
+# statements do so explicitly, and the mapper events below cover single-row ORM
+# writes (db.add / obj.is_read = True / db.delete). A player with no row yet is
+# seeded from COUNT(*) on first adjustment.
+
+
+def _count_unread(connection: Connection, player_id: int) -> int:
+    return connection.execute(
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.player_profile_id == player_id, Notification.is_read == False)
+    ).scalar_one()
+
+
+def _seed_unread(connection: Connection, player_id: int) -> None:
+    """Create the player's counter row from a COUNT(*), unless one already exists."""
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    connection.execute(
+        dialect.insert(NotificationUnreadCount)
+        .values(player_profile_id=player_id, unread=_count_unread(connection, player_id))
+        .on_conflict_do_nothing(index_elements=["player_profile_id"])
+    )
+
+
+def _adjust_unread(connection: Connection, player_id: int | None, delta: int) -> None:
+    if player_id is None or not delta:
+        return
+    result = connection.execute(
+        update(NotificationUnreadCount)
+        .where(NotificationUnreadCount.player_profile_id == player_id)
+        .values(
+            unread=case((NotificationUnreadCount.unread + delta < 0, 0), else_=NotificationUnreadCount.unread + delta)
+        )
+    )
+    if not result.rowcount:
+        # The COUNT already sees this transaction's rows, so seeding is exact.
+        _seed_unread(connection, player_id)
+
+
+def _reset_unread(connection: Connection, player_id: int) -> None:
+    connection.execute(
+        update(NotificationUnreadCount)
+        .where(NotificationUnreadCount.player_profile_id == player_id)
+        .values(unread=_count_unread(connection, player_id))
+    )
+
+
+@event.listens_for(Notification, "after_insert")
+def _count_inserted(mapper, connection: Connection, target: Notification) -> None:
+    if target.is_read is False:
+        _adjust_unread(connection, target.player_profile_id, 1)
+
+
+@event.listens_for(Notification, "after_update")
+def _count_read_change(mapper, connection: Connection, target: Notification) -> None:
+    history = inspect(target).attrs.is_read.history
+    if history.has_changes():
+        was_unread = history.deleted == [False]
+        _adjust_unread(connection, target.player_profile_id, int(target.is_read is False) - int(was_unread))
+
+
+@event.listens_for(Notification, "after_delete")
+def _count_deleted(mapper, connection: Connection, target: Notification) -> None:
+    if target.is_read is False:
+        _adjust_unread(connection, target.player_profile_id, -1)
+
+
 # ====================================================================================
 # NOTIFICATION SERVICE
 # ====================================================================================
@@ -284,22 +359,18 @@ class NotificationService:
             HTTPException: If update fails
         """
         try:
-            # Get all unread notifications for player
-            unread_notifications = (
-                db.query(Notification)
-                .filter(
-                    Notification.player_profile_id == player_id,
-                    Notification.is_read == False,
-                )
-                .all()
+            # One UPDATE for the rows, one for the counter, one commit
+            count = db.execute(
+                update(Notification)
+                .where(Notification.player_profile_id == player_id, Notification.is_read == False)
+                .values(is_read=True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.execute(
+                update(NotificationUnreadCount)
+                .where(NotificationUnreadCount.player_profile_id == player_id)
+                .values(unread=0)
             )
-
-            count = len(unread_notifications)
-
-            # Mark all as read
-            for notification in unread_notifications:
-                notification.is_read = True
-
             db.commit()
 
             logger.info(f"Marked {count} notifications as read for player {player_id}")
@@ -374,14 +445,12 @@ class NotificationService:
             HTTPException: If query fails
         """
         try:
-            count = (
-                db.query(Notification)
-                .filter(
-                    Notification.player_profile_id == player_id,
-                    Notification.is_read == False,
-                )
-                .count()
-            )
+            counter = db.get(NotificationUnreadCount, player_id)
+            if counter is not None:
+                count = counter.unread
+            else:
+                # Not seeded yet: the first notification write for this player will.
+                count = _count_unread(db.connection(), player_id)
 
             logger.debug(f"Player {player_id} has {count} unread notifications")
 
@@ -433,30 +502,38 @@ class NotificationService:
                 logger.warning(f"No players found for game {game_id}")
                 return 0
 
-            notification_count = 0
-
-            # Send notification to each player
-            for game_player in game_players:
-                if game_player.player_profile_id:
-                    try:
-                        self.send_notification(
-                            player_id=int(game_player.player_profile_id),
-                            notification_type=notification_type,
-                            message=message,
-                            db=db,
-                            data=data,
-                        )
-                        notification_count += 1
-                    except Exception as e:
-                        logger.error(f"Error sending notification to player {game_player.player_profile_id}: {e}")
-                        # Continue with other players even if one fails
-                        continue
+            recipients = Counter(int(gp.player_profile_id) for gp in game_players if gp.player_profile_id)
+            if not recipients:
+                return 0
+
+            # One multi-row INSERT plus one counter bump per player, one commit
+            created_at = utc_now().isoformat()
+            db.execute(
+                insert(Notification),
+                [
+                    {
+                        "player_profile_id": player_id,
+                        "notification_type": notification_type,
+                        "message": message,
+                        "data": data or {},
+                        "is_read": False,
+                        "created_at": created_at,
+                    }
+                    for player_id in recipients.elements()
+                ],
+            )
+            connection = db.connection()
+            for player_id, sent in recipients.items():
+                _adjust_unread(connection, player_id, sent)
+            db.commit()
+            notification_count = recipients.total()
 
             logger.info(f"Broadcast {notification_type} notification to {notification_count} players in game {game_id}")
 
             return notification_count
 
         except Exception as e:
+            db.rollback()
             logger.error(f"Error broadcasting to game {game_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to broadcast notification: {e!s}")
 
@@ -487,22 +564,13 @@ class NotificationService:
             # Calculate cutoff date
             cutoff_date = (utc_now() - timedelta(days=days_old)).isoformat()
 
-            # Get old notifications
-            old_notifications = (
-                db.query(Notification)
-                .filter(
-                    Notification.player_profile_id == player_id,
-                    Notification.created_at < cutoff_date,
-                )
-                .all()
-            )
-
-            count = len(old_notifications)
-
-            # Delete old notifications
-            for notification in old_notifications:
-                db.delete(notification)
-
+            # One DELETE, then re-count what is left unread for the counter
+            count = db.execute(
+                delete(Notification)
+                .where(Notification.player_profile_id == player_id, Notification.created_at < cutoff_date)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            _reset_unread(db.connection(), player_id)
             db.commit()
 
             logger.info(f"Deleted {count} notifications older than {days_old} days for player {player_id}")
@@ -7,11 +7,13 @@ Designed to run as a Saturday afternoon cron job.
 
 import logging
 from datetime import datetime, timedelta
+from functools import partial
 
 from sqlalchemy.orm import Session
 
 from ..models import DailySignup, GeneratedPairing, PlayerProfile
 from ..utils.time import utc_now
+from .email_fanout import fan_out
 from .email_service import get_email_service
 from .team_formation_service import TeamFormationService
 
@@ -188,35 +190,30 @@ class PairingSchedulerService:
         teams = pairing.pairings_data.get("teams", [])
         players = pairing.pairings_data.get("players", [])
 
-        emails_sent = 0
-        emails_failed = 0
-
-        # Send tee time request to the golf course
-        try:
-            tee_time_success = email_service.send_tee_time_request(
-                to_email=TEE_TIME_REQUEST_EMAIL,
-                game_date=pairing.game_date,
-                teams=teams,
-                player_count=pairing.player_count,
-                remaining_players=pairing.remaining_players,
+        # Tee time request to the golf course goes out with the player emails.
+        sends = [
+            (
+                TEE_TIME_REQUEST_EMAIL,
+                partial(
+                    email_service.send_tee_time_request,
+                    to_email=TEE_TIME_REQUEST_EMAIL,
+                    game_date=pairing.game_date,
+                    teams=teams,
+                    player_count=pairing.player_count,
+                    remaining_players=pairing.remaining_players,
+                ),
             )
-            if tee_time_success:
-                emails_sent += 1
-                logger.info("Tee time request sent to %s", TEE_TIME_REQUEST_EMAIL)
-            else:
-                emails_failed += 1
-                logger.error("Failed to send tee time request to %s", TEE_TIME_REQUEST_EMAIL)
-        except Exception as e:
-            logger.error("Failed to send tee time request: %s", e)
-            emails_failed += 1
-
-        # Get email addresses for all players
+        ]
+
+        # Get email addresses for all players in one query
+        profile_ids = [player.get("player_profile_id") for player in players if player.get("player_profile_id")]
+        profiles = (
+            {p.id: p for p in db.query(PlayerProfile).filter(PlayerProfile.id.in_(profile_ids)).all()}
+            if profile_ids
+            else {}
+        )
         for player in players:
-            profile_id = player.get("player_profile_id")
-            if not profile_id:
-                continue
-
-            profile = db.query(PlayerProfile).filter(PlayerProfile.id == profile_id).first()
+            profile = profiles.get(player.get("player_profile_id"))
 
             if not profile or not profile.email:
                 logger.debug("No email for player %s", player.get("player_name"))
@@ -224,22 +221,25 @@ class PairingSchedulerService:
 
             # Find which team they're on
             team_number = PairingSchedulerService.find_player_team(player.get("player_name", ""), teams)
-
-            try:
-                success = email_service.send_pairing_notification(
-                    to_email=profile.email,
-                    player_name=player.get("player_name", "Golfer"),
-                    game_date=pairing.game_date,
-                    teams=teams,
-                    player_team_number=team_number,
+            sends.append(
+                (
+                    profile.email,
+                    partial(
+                        email_service.send_pairing_notification,
+                        to_email=profile.email,
+                        player_name=player.get("player_name", "Golfer"),
+                        game_date=pairing.game_date,
+                        teams=teams,
+                        player_team_number=team_number,
+                    ),
                 )
-                if success:
-                    emails_sent += 1
-                else:
-                    emails_failed += 1
-            except Exception as e:
-                logger.error("Failed to send pairing email to %s: %s", profile.email, e)
-                emails_failed += 1
+            )
+
+        report = fan_out("pairing-notifications", email_service, sends)
+        if TEE_TIME_REQUEST_EMAIL in report.failures:
+            logger.error("Failed to send tee time request to %s", TEE_TIME_REQUEST_EMAIL)
+        emails_sent = report.sent
+        emails_failed = report.failed
 
         # Update pairing record
         if emails_sent > 0:
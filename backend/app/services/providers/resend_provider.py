@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 class ResendEmailProvider:
     """Provider for sending emails using the Resend API."""
 
+    # Resend's batch endpoint accepts at most 100 messages per call.
+    batch_size = 100
+
     def __init__(self, api_key: str, from_email: str, from_name: str):
         self.from_email = from_email
         self.from_name = from_name
@@ -62,6 +65,38 @@ class ResendEmailProvider:
             report_exception(e)
             return False
 
+    def send_batch(self, messages: list[Any]) -> list[bool]:
+        """Send up to ``batch_size`` rendered messages in one Resend batch call.
+
+        The batch endpoint is all-or-nothing: one bad address fails the whole
+        call. A failed batch is retried one message at a time so failures stay
+        per recipient.
+        """
+        if not self.is_configured():
+            logger.error("Resend provider is not configured. Cannot send email.")
+            return [False] * len(messages)
+
+        params: list[resend.Emails.SendParams] = [
+            {
+                "from": f"{self.from_name} <{self.from_email}>",
+                "to": [message.to_email],
+                "subject": message.subject,
+                "html": message.html_body,
+                "text": message.text_body or self._html_to_text(message.html_body),
+            }
+            for message in messages
+        ]
+        try:
+            resend.Batch.send(params)
+            logger.info(f"Batch of {len(messages)} emails sent via Resend.")
+            return [True] * len(messages)
+        except Exception as e:
+            logger.warning(f"Resend batch of {len(messages)} emails failed ({e}); retrying one at a time")
+            return [
+                self.send_email(message.to_email, message.subject, message.html_body, message.text_body)
+                for message in messages
+            ]
+
     def get_configuration_status(self) -> dict[str, Any]:
         return {
             "provider": "resend",
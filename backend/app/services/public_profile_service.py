@@ -0,0 +1,220 @@
+"""
+Public Profile Service — roster-wide availability and cached public profiles.
+
+Both reads are composed from the eager-loadable views on PlayerProfile
+(``availability``, ``statistics``) so they cost a fixed number of queries
+regardless of roster size:
+
+- ``all_players_availability``: one query — profiles (id, name, email only,
+  never the avatar blob) LEFT JOINed to their availability rows.
+- ``build_public_profile``: one query for the profile, its availability and
+  statistics plus the badge-catalog size, one for the showcased badges, and
+  the unified round history.
+
+Public profiles are cached per player in ``public_profile_cache``. Committed
+changes to a player's profile, availability, statistics, earned badges or
+game results evict that player's entry (see the session hooks below); a
+change to the badge catalog evicts every entry. Sheet-synced rounds carry no
+player id, so history from the sheets refreshes on the cache TTL.
+"""
+
+import logging
+from typing import Any
+
+from sqlalchemy import desc, event, func, nulls_last, select
+from sqlalchemy.orm import Session, UOWTransaction, joinedload, load_only
+
+from ..middleware.caching import public_profile_cache
+from ..models import (
+    Badge,
+    GamePlayerResult,
+    PlayerAvailability,
+    PlayerBadgeEarned,
+    PlayerProfile,
+    PlayerStatistics,
+)
+from .unified_data_service import get_unified_data_service
+
+logger = logging.getLogger(__name__)
+
+# Rows whose changes make a cached public profile stale, and the attribute
+# holding the PlayerProfile.id each one belongs to.
+_PROFILE_OWNER = {
+    PlayerProfile: "id",
+    PlayerAvailability: "player_profile_id",
+    PlayerStatistics: "player_id",
+    PlayerBadgeEarned: "player_profile_id",
+    GamePlayerResult: "player_profile_id",
+}
+# Sentinel in the pending set: the badge catalog changed, evict everyone.
+_ALL_PROFILES = "*"
+
+
+def _cache_key(player_id: int) -> str:
+    return f"public_profile:{player_id}"
+
+
+def invalidate_public_profile(player_id: int) -> None:
+    public_profile_cache.invalidate(_cache_key(player_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_profiles(session: Session, flush_context: UOWTransaction) -> None:
+    pending: set[Any] = session.info.setdefault("stale_public_profiles", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Badge):
+            pending.add(_ALL_PROFILES)
+            continue
+        attr = _PROFILE_OWNER.get(type(obj))
+        if attr is not None and getattr(obj, attr, None) is not None:
+            pending.add(getattr(obj, attr))
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_stale_profiles(session: Session) -> None:
+    pending = session.info.pop("stale_public_profiles", None)
+    if not pending:
+        return
+    if _ALL_PROFILES in pending:
+        public_profile_cache.clear()
+        return
+    for player_id in pending:
+        invalidate_public_profile(player_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_profiles(session: Session) -> None:
+    session.info.pop("stale_public_profiles", None)
+
+
+def all_players_availability(db: Session) -> list[dict[str, Any]]:
+    """Every player's weekly availability with their name, in one query."""
+    players = (
+        db.query(PlayerProfile)
+        .options(
+            load_only(PlayerProfile.id, PlayerProfile.name, PlayerProfile.email),
+            joinedload(PlayerProfile.availability),
+        )
+        .order_by(PlayerProfile.id)
+        .all()
+    )
+    return [
+        {
+            "player_id": player.id,
+            "player_name": player.name,
+            "email": player.email,
+            "availability": [
+                {
+                    "day_of_week": avail.day_of_week,
+                    "is_available": avail.is_available,
+                    "available_from_time": avail.available_from_time,
+                    "available_to_time": avail.available_to_time,
+                    "notes": avail.notes,
+                }
+                for avail in player.availability
+            ],
+        }
+        for player in players
+    ]
+
+
+def build_public_profile(db: Session, player_id: int) -> dict[str, Any] | None:
+    """Assemble the public profile for ``player_id`` (None if there is no such player).
+
+    Only non-sensitive fields: no email, venmo, or GHIN id.
+    """
+    total_badges = select(func.count(Badge.id)).scalar_subquery()
+    row = (
+        db.query(PlayerProfile, total_badges)
+        .options(joinedload(PlayerProfile.availability), joinedload(PlayerProfile.statistics))
+        .filter(PlayerProfile.id == player_id)
+        .first()
+    )
+    if row is None:
+        return None
+    player, total_badge_count = row
+    stats = player.statistics
+
+    # Badges — showcased (equipped) ones first, in their chosen order, then
+    # the rest by most-recently-earned.
+    badge_rows = (
+        db.query(PlayerBadgeEarned, Badge)
+        .join(Badge, PlayerBadgeEarned.badge_id == Badge.id)
+        .filter(PlayerBadgeEarned.player_profile_id == player_id)
+        .order_by(
+            nulls_last(PlayerBadgeEarned.showcase_position),
+            desc(PlayerBadgeEarned.earned_at),
+        )
+        .limit(12)
+        .all()
+    )
+    badges = [
+        {
+            "id": pbe.id,
+            "name": b.name,
+            "description": b.description,
+            "rarity": b.rarity,
+            "category": b.category,
+            "emoji": b.emoji,
+            "earned_at": pbe.earned_at,
+            "showcased": pbe.showcase_position is not None,
+        }
+        for pbe, b in badge_rows
+    ]
+
+    # Game history — actual played/scored rounds (sheet-synced + in-app).
+    game_history = []
+    if player.legacy_name or player.name:
+        rounds = get_unified_data_service(db=db).get_player_history(player.legacy_name or player.name)
+        game_history = [
+            {
+                "date": r.date_sortable,
+                "location": r.location,
+                "score": r.score,
+                "duration": r.duration,
+                "source": r.source,
+                # Only ever present for rounds scored live in the app or via
+                # scorecard scan — legacy sheet rounds are a total only.
+                "holes": (
+                    [
+                        {"hole": h.get("hole"), "quarters": h.get("quarters"), "gross_score": h.get("gross_score")}
+                        for h in sorted(r.hole_scores, key=lambda h: h.get("hole") or 0)
+                    ]
+                    if r.hole_scores
+                    else None
+                ),
+            }
+            for r in rounds[:20]
+        ]
+
+    return {
+        "id": player.id,
+        "name": player.name,
+        "handicap": player.handicap,
+        "description": player.description,
+        "avatar_url": player.avatar_url,
+        "has_avatar_image": bool(player.has_avatar_image),
+        "last_played": player.last_played,
+        "created_at": player.created_at,
+        "available_days": [a.day_of_week for a in player.availability if a.is_available],
+        "game_history": game_history,
+        "badges": badges,
+        "total_badges": total_badge_count,
+        "stats": {
+            "games_played": stats.games_played if stats else 0,
+            "games_won": stats.games_won if stats else 0,
+            "total_earnings": stats.total_earnings if stats else 0.0,
+            "solo_wins": stats.solo_wins if stats else 0,
+        },
+    }
+
+
+def get_public_profile(db: Session, player_id: int) -> dict[str, Any] | None:
+    """Cached ``build_public_profile``; missing players are not cached."""
+    key = _cache_key(player_id)
+    profile = public_profile_cache.get(key)
+    if profile is None:
+        profile = build_public_profile(db, player_id)
+        if profile is not None:
+            public_profile_cache.set(key, profile)
+    return profile
@@ -0,0 +1,491 @@
+"""
+Season Store — columnar snapshots of the scoring tables for season analytics.
+
+``export_season_store`` copies ``hole_events``, ``hole_logs``,
+``game_player_results`` and ``legacy_rounds`` out of the database into one
+``.npy`` file per column, streamed a batch at a time (``stream_rows``). Text
+columns are dictionary-encoded: an ``int32`` code array plus a sorted
+``<column>.dict.json`` of the distinct values, which keeps the repeated
+player names, game ids and courses to four bytes a row. Dates become
+``datetime64[D]`` and every table gets a ``season`` (the year the season
+starts in, see ``utils/season.py``; 0 when the row has no date).
+
+``SeasonStore`` reads the current snapshot with ``mmap_mode="r"``, so a
+season-wide aggregation is a handful of ``numpy`` passes over the mapped
+columns (``ColumnTable.group_by``) rather than a row-by-row walk through
+SQLAlchemy and the JSON columns. Snapshots are written to a fresh directory
+and published by swapping the ``CURRENT`` pointer, so readers never see a
+half-written export; the previous snapshot is kept for readers that still
+have it mapped.
+
+The narrative JSON of ``hole_logs`` and the ``hole_scores`` /
+``betting_history`` blobs stay in the database: ``hole_events`` already
+carries the per-hole numbers in columnar form.
+
+``SEASON_STORE_DIR`` must point at storage every instance shares (on Cloud
+Run, a Cloud Storage volume mount — see deploy/gcp/phase5-storage): the
+export refuses to run without it, and readers treat the store as unavailable
+and fall back to the database.
+
+Layout under ``SEASON_STORE_DIR``::
+
+    CURRENT                      -> name of the published snapshot
+    <snapshot>/manifest.json     -> row counts and column kinds per table
+    <snapshot>/<table>/<column>.npy
+    <snapshot>/<table>/<column>.dict.json
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models import GamePlayerResult, HoleEvent, HoleLog, LegacyRound
+from ..utils.season import SEASON_START_DAY, SEASON_START_MONTH
+from ..utils.time import utc_now
+from .export_service import EXPORT_BATCH_SIZE, stream_rows
+
+logger = logging.getLogger(__name__)
+
+# Published snapshots kept on disk; older ones are pruned after each export.
+KEEP_SNAPSHOTS = 2
+
+ColumnKind = Literal["int", "float", "str", "date"]
+Aggregate = Literal["count", "sum", "mean", "min", "max"]
+
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_DTYPES: dict[str, str] = {"int": "int64", "float": "float64", "date": "datetime64[D]"}
+
+
+@dataclass(frozen=True)
+class _Column:
+    name: str
+    kind: ColumnKind
+    expr: Any
+
+
+# Exported tables: (primary key for a stable row order, columns). Nullable
+# ints are stored as float so NULL survives as NaN; NOT NULL-with-default
+# counters fall back to 0.
+_TABLES: dict[str, tuple[Any, tuple[_Column, ...]]] = {
+    "hole_events": (
+        HoleEvent.id,
+        (
+            _Column("game_id", "str", HoleEvent.game_id),
+            _Column("hole_number", "int", HoleEvent.hole_number),
+            _Column("player_id", "str", HoleEvent.player_id),
+            _Column("score", "float", HoleEvent.score),
+            _Column("quarters", "float", HoleEvent.quarters),
+            _Column("date", "date", HoleEvent.recorded_at),
+        ),
+    ),
+    "hole_logs": (
+        HoleLog.id,
+        (
+            _Column("game_id", "str", HoleLog.game_id),
+            _Column("hole_number", "int", HoleLog.hole_number),
+            _Column("date", "date", HoleLog.recorded_at),
+        ),
+    ),
+    "game_player_results": (
+        GamePlayerResult.id,
+        (
+            _Column("game_record_id", "int", GamePlayerResult.game_record_id),
+            _Column("player_profile_id", "int", GamePlayerResult.player_profile_id),
+            _Column("player_name", "str", GamePlayerResult.player_name),
+            _Column("final_position", "float", GamePlayerResult.final_position),
+            _Column("total_earnings", "float", GamePlayerResult.total_earnings),
+            *(
+                _Column(name, "int", getattr(GamePlayerResult, name))
+                for name in (
+                    "holes_won",
+                    "successful_bets",
+                    "total_bets",
+                    "partnerships_formed",
+                    "partnerships_won",
+                    "solo_attempts",
+                    "solo_wins",
+                    "ping_pongs",
+                    "ping_pongs_won",
+                    "duncan_attempts",
+                    "duncan_wins",
+                )
+            ),
+            _Column("date", "date", GamePlayerResult.created_at),
+        ),
+    ),
+    "legacy_rounds": (
+        LegacyRound.id,
+        (
+            _Column("date", "date", LegacyRound.date),
+            _Column("group", "str", LegacyRound.group),
+            _Column("member", "str", LegacyRound.member),
+            _Column("score", "float", LegacyRound.score),
+            _Column("location", "str", LegacyRound.location),
+            _Column("source", "str", LegacyRound.source),
+            _Column("status", "str", LegacyRound.status),
+        ),
+    ),
+}
+
+TABLE_NAMES = tuple(_TABLES)
+
+
+class SeasonStoreUnavailableError(Exception):
+    """No store is configured, no snapshot has been exported yet, or the table is missing."""
+
+
+def season_store_dir() -> Path | None:
+    """Configured store root (``SEASON_STORE_DIR``), or None when unset."""
+    value = os.getenv("SEASON_STORE_DIR")
+    return Path(value) if value else None
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def _as_date(value: Any) -> str:
+    text = str(value) if value is not None else ""
+    return text[:10] if _ISO_DATE.match(text) else "NaT"
+
+
+def _convert(kind: ColumnKind, values: list[Any]) -> np.ndarray:
+    if kind == "date":
+        return np.array([_as_date(v) for v in values], dtype="datetime64[D]")
+    if kind == "float":
+        return np.array([np.nan if v is None else v for v in values], dtype="float64")
+    return np.array([0 if v is None else v for v in values], dtype="int64")
+
+
+class _StrColumnBuilder:
+    """Dictionary-encodes a text column as it streams in."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str | None, int] = {}
+        self._chunks: list[np.ndarray] = []
+
+    def add(self, values: list[Any]) -> None:
+        codes = self._codes
+        self._chunks.append(
+            np.fromiter(
+                (codes.setdefault(None if v is None else str(v), len(codes)) for v in values),
+                dtype="int32",
+                count=len(values),
+            )
+        )
+
+    def finish(self) -> tuple[np.ndarray, list[str | None]]:
+        """Codes re-numbered so the dictionary is sorted (None first)."""
+        values = sorted(self._codes, key=lambda v: (v is not None, v or ""))
+        remap = np.empty(len(values), dtype="int32")
+        for new_code, value in enumerate(values):
+            remap[self._codes[value]] = new_code
+        codes = np.concatenate(self._chunks) if self._chunks else np.empty(0, dtype="int32")
+        return remap[codes] if len(codes) else codes, values
+
+
+def _export_table(db: Session, name: str, target: Path, batch_size: int) -> dict[str, Any]:
+    pk, columns = _TABLES[name]
+    stmt = select(*(column.expr.label(column.name) for column in columns)).order_by(pk)
+    builders: dict[str, _StrColumnBuilder] = {c.name: _StrColumnBuilder() for c in columns if c.kind == "str"}
+    chunks: dict[str, list[np.ndarray]] = {c.name: [] for c in columns if c.kind != "str"}
+
+    batch: list[Any] = []
+
+    def flush() -> None:
+        for index, column in enumerate(columns):
+            values = [row[index] for row in batch]
+            if column.kind == "str":
+                builders[column.name].add(values)
+            else:
+                chunks[column.name].append(_convert(column.kind, values))
+        batch.clear()
+
+    for row in stream_rows(db, stmt, batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    target.mkdir(parents=True)
+    kinds: dict[str, str] = {}
+    rows = 0
+    for column in columns:
+        if column.kind == "str":
+            array, dictionary = builders[column.name].finish()
+            (target / f"{column.name}.dict.json").write_text(json.dumps(dictionary))
+        else:
+            parts = chunks[column.name]
+            array = np.concatenate(parts) if parts else np.empty(0, dtype=_DTYPES[column.kind])
+        np.save(target / f"{column.name}.npy", array)
+        kinds[column.name] = column.kind
+        rows = len(array)
+
+    dates = np.load(target / "date.npy")
+    years = dates.astype("datetime64[Y]")
+    starts = (years.astype("datetime64[M]") + (SEASON_START_MONTH - 1)).astype("datetime64[D]") + (SEASON_START_DAY - 1)
+    seasons = years.astype("int64") + 1970 - (dates < starts)
+    np.save(target / "season.npy", np.where(np.isnat(dates), 0, seasons).astype("int16"))
+    kinds["season"] = "int"
+    return {"rows": rows, "columns": kinds}
+
+
+def _prune_snapshots(root: Path, keep: Iterable[str]) -> None:
+    keep = set(keep)
+    for path in root.iterdir():
+        if path.is_dir() and path.name not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def export_season_store(db: Session, root: Path | None = None, batch_size: int = EXPORT_BATCH_SIZE) -> dict[str, Any]:
+    """Write a new columnar snapshot of the season tables and publish it."""
+    root = root or season_store_dir()
+    if root is None:
+        raise RuntimeError("SEASON_STORE_DIR is not configured")
+    root.mkdir(parents=True, exist_ok=True)
+    created_at = utc_now()
+    snapshot = created_at.strftime("%Y%m%dT%H%M%S%fZ")
+    target = root / snapshot
+
+    tables = {name: _export_table(db, name, target / name, batch_size) for name in _TABLES}
+    manifest = {"snapshot": snapshot, "created_at": created_at.isoformat(), "tables": tables}
+    (target / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    pointer = root / "CURRENT.tmp"
+    pointer.write_text(snapshot)
+    pointer.replace(root / "CURRENT")
+
+    # Snapshot names sort chronologically; the newest ones include this export.
+    published = sorted(p.name for p in root.iterdir() if p.is_dir())
+    _prune_snapshots(root, published[-KEEP_SNAPSHOTS:])
+    logger.info(
+        "Season store snapshot %s exported: %s",
+        snapshot,
+        ", ".join(f"{name}={meta['rows']}" for name, meta in tables.items()),
+    )
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# Query
+# ---------------------------------------------------------------------------
+
+
+def _current_snapshot(root: Path) -> str | None:
+    try:
+        return (root / "CURRENT").read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _python(value: Any) -> Any:
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+class ColumnTable:
+    """One exported table; columns are memory-mapped on first access."""
+
+    def __init__(self, path: Path, meta: Mapping[str, Any]):
+        self.path = path
+        self.rows: int = meta["rows"]
+        self.kinds: dict[str, str] = dict(meta["columns"])
+        self._arrays: dict[str, np.ndarray] = {}
+        self._dictionaries: dict[str, list[str | None]] = {}
+        self._codes: dict[str, dict[str | None, int]] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.kinds)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The stored array — dictionary codes for text columns."""
+        if name not in self.kinds:
+            raise KeyError(name)
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.path / f"{name}.npy", mmap_mode="r")
+        return self._arrays[name]
+
+    def dictionary(self, name: str) -> list[str | None]:
+        """Distinct values of a text column, indexed by code."""
+        if self.kinds.get(name) != "str":
+            raise KeyError(name)
+        if name not in self._dictionaries:
+            self._dictionaries[name] = json.loads((self.path / f"{name}.dict.json").read_text())
+        return self._dictionaries[name]
+
+    def code(self, name: str, value: str) -> int:
+        """Code of ``value`` in a text column, or -1 (matches no row) when absent."""
+        if name not in self._codes:
+            self._codes[name] = {v: i for i, v in enumerate(self.dictionary(name))}
+        return self._codes[name].get(value, -1)
+
+    def season_mask(self, season: int | None) -> np.ndarray | None:
+        return None if season is None else np.asarray(self["season"]) == season
+
+    def group_by(
+        self,
+        key: str,
+        aggregates: Mapping[str, tuple[str | np.ndarray, Aggregate]],
+        where: np.ndarray | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate ``aggregates`` per distinct ``key`` over the rows in ``where``.
+
+        Each aggregate is ``(column or precomputed array, function)``; NaN
+        values are skipped by sum/mean/min/max, and a group with no values
+        reports None. Text keys are decoded in the result.
+        """
+        keys = np.asarray(self[key])
+        if where is not None:
+            keys = keys[where]
+        groups, inverse = np.unique(keys, return_inverse=True)
+        size = len(groups)
+        counts = np.bincount(inverse, minlength=size)
+
+        results: dict[str, np.ndarray] = {}
+        for out_name, (source, fn) in aggregates.items():
+            if fn == "count":
+                results[out_name] = counts
+                continue
+            data = np.asarray(self[source] if isinstance(source, str) else source, dtype="float64")
+            if where is not None:
+                data = data[where]
+            valid = ~np.isnan(data)
+            slots, data = inverse[valid], data[valid]
+            filled = np.bincount(slots, minlength=size)
+            if fn in ("sum", "mean"):
+                total = np.bincount(slots, weights=data, minlength=size)
+                value = total if fn == "sum" else np.divide(total, filled, out=np.zeros(size), where=filled > 0)
+            else:
+                value = np.full(size, np.inf if fn == "min" else -np.inf)
+                (np.minimum if fn == "min" else np.maximum).at(value, slots, data)
+            results[out_name] = np.where(filled > 0, value, np.nan)
+
+        labels: Sequence[Any] = groups.tolist()
+        if self.kinds[key] == "str":
+            dictionary = self.dictionary(key)
+            labels = [dictionary[code] for code in groups]
+        return [
+            {key: _python(label), **{name: _python(values[i]) for name, values in results.items()}}
+            for i, label in enumerate(labels)
+        ]
+
+
+class SeasonStore:
+    """Read side of the store: the currently published snapshot's tables."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or season_store_dir()
+        self._snapshot: str | None = None
+        self._tables: dict[str, ColumnTable] = {}
+
+    @property
+    def snapshot(self) -> str | None:
+        return _current_snapshot(self.root) if self.root else None
+
+    def table(self, name: str) -> ColumnTable:
+        if self.root is None:
+            raise SeasonStoreUnavailableError("SEASON_STORE_DIR is not configured")
+        snapshot = self.snapshot
+        if snapshot is None:
+            raise SeasonStoreUnavailableError("no season store snapshot has been exported")
+        if snapshot != self._snapshot:
+            self._snapshot, self._tables = snapshot, {}
+        if name not in self._tables:
+            manifest = json.loads((self.root / snapshot / "manifest.json").read_text())
+            if name not in manifest["tables"]:
+                raise SeasonStoreUnavailableError(f"table '{name}' is not in snapshot {snapshot}")
+            self._tables[name] = ColumnTable(self.root / snapshot / name, manifest["tables"][name])
+        return self._tables[name]
+
+    def seasons(self) -> list[int]:
+        """Seasons with at least one dated legacy round or game result."""
+        found: set[int] = set()
+        for name in ("legacy_rounds", "game_player_results"):
+            found.update(int(s) for s in np.unique(self.table(name)["season"]) if s)
+        return sorted(found)
+
+    def member_season_totals(self, season: int | None = None) -> list[dict[str, Any]]:
+        """Per-member rounds and quarters from the sheet history, best total first.
+
+        Member-posted rounds still waiting for attestation are left out, as in
+        the database leaderboards; a NULL status counts as attested.
+        """
+        table = self.table("legacy_rounds")
+        where = np.asarray(table["status"]) != table.code("status", "pending")
+        season_mask = table.season_mask(season)
+        rows = table.group_by(
+            "member",
+            {
+                "rounds": ("score", "count"),
+                "total_quarters": ("score", "sum"),
+                "average_quarters": ("score", "mean"),
+                "best_round": ("score", "max"),
+                "worst_round": ("score", "min"),
+            },
+            where=where if season_mask is None else where & season_mask,
+        )
+        return sorted((r for r in rows if r["member"]), key=lambda r: (-(r["total_quarters"] or 0), r["member"]))
+
+    def player_season_results(self, season: int | None = None) -> list[dict[str, Any]]:
+        """Per-player completed-game totals, highest earnings first."""
+        table = self.table("game_player_results")
+        rows = table.group_by(
+            "player_name",
+            {
+                "games": ("total_earnings", "count"),
+                "wins": (np.asarray(table["final_position"]) == 1, "sum"),
+                "total_earnings": ("total_earnings", "sum"),
+                "average_earnings": ("total_earnings", "mean"),
+                "holes_won": ("holes_won", "sum"),
+                "solo_attempts": ("solo_attempts", "sum"),
+                "solo_wins": ("solo_wins", "sum"),
+                "partnerships_won": ("partnerships_won", "sum"),
+            },
+            where=table.season_mask(season),
+        )
+        return sorted(
+            (r for r in rows if r["player_name"]),
+            key=lambda r: (-(r["total_earnings"] or 0), r["player_name"]),
+        )
+
+    def hole_season_summary(self, season: int | None = None) -> list[dict[str, Any]]:
+        """Per-hole scoring and how many quarters change hands, by hole number."""
+        table = self.table("hole_events")
+        return table.group_by(
+            "hole_number",
+            {
+                "entries": ("quarters", "count"),
+                "average_score": ("score", "mean"),
+                "low_score": ("score", "min"),
+                "average_quarters_moved": (np.abs(np.asarray(table["quarters"])), "mean"),
+            },
+            where=table.season_mask(season),
+        )
+
+
+_season_store: SeasonStore | None = None
+
+
+def get_season_store() -> SeasonStore:
+    global _season_store
+    if _season_store is None:
+        _season_store = SeasonStore()
+    return _season_store
@@ -16,10 +16,11 @@ from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, case, desc, func, select
 from sqlalchemy.orm import Session
 
-from ..models import GamePlayerResult, GameRecord, PlayerProfile, PlayerStatistics
+from ..models import GamePlayerResult, GameRecord, LegacyRound, PlayerProfile, PlayerStatistics
+from ..utils.season import season_bounds
 from ..utils.time import utc_now
 
 logger = logging.getLogger(__name__)
@@ -59,6 +60,11 @@ class InsightRecommendation:
     suggested_actions: list[str]
 
 
+def _as_float(value: Any) -> float | None:
+    """SQL aggregate as the season store reports it: float, or None for no values."""
+    return None if value is None else float(value)
+
+
 class StatisticsService:
     """Advanced statistics and analytics service."""
 
@@ -140,8 +146,9 @@ class StatisticsService:
             )
 
             # Consistency Score (inverse of variance)
-            consistency_score = self._calculate_consistency_score(int(player_stats.player_id))
-            all_consistency = [self._calculate_consistency_score(int(s.player_id)) for s in all_stats]
+            recent = self._recent_positions([int(player_stats.player_id), *(int(s.player_id) for s in all_stats)])
+            consistency_score = self._consistency_score(recent.get(int(player_stats.player_id), []))
+            all_consistency = [self._consistency_score(recent.get(int(s.player_id), [])) for s in all_stats]
             consistency_percentile = self._calculate_percentile(consistency_score, all_consistency)
 
             metrics["consistency"] = PerformanceMetric(
@@ -464,7 +471,7 @@ class StatisticsService:
     def get_game_mode_analytics(self, player_id: int | None = None) -> dict[str, Any]:
         """Get analytics for different game modes and player counts."""
         try:
-            base_query = self.db.query(GamePlayerResult).join(
+            base_query = self.db.query(GamePlayerResult, GameRecord).join(
                 GameRecord, GamePlayerResult.game_record_id == GameRecord.id
             )
 
@@ -484,17 +491,15 @@ class StatisticsService:
                 }
             )
 
-            for result in results:
-                game_record = self.db.query(GameRecord).filter(GameRecord.id == result.game_record_id).first()
-                if game_record:
-                    mode_key = f"{game_record.game_mode}_{game_record.player_count}p"
+            for result, game_record in results:
+                mode_key = f"{game_record.game_mode}_{game_record.player_count}p"
 
-                    mode_analytics[mode_key]["games_played"] += 1
-                    mode_analytics[mode_key]["total_earnings"] += result.total_earnings
-                    if result.final_position == 1:
-                        mode_analytics[mode_key]["wins"] += 1
-                    mode_analytics[mode_key]["avg_position"] += result.final_position
-                    mode_analytics[mode_key]["player_count_breakdown"][game_record.player_count] += 1
+                mode_analytics[mode_key]["games_played"] += 1
+                mode_analytics[mode_key]["total_earnings"] += result.total_earnings
+                if result.final_position == 1:
+                    mode_analytics[mode_key]["wins"] += 1
+                mode_analytics[mode_key]["avg_position"] += result.final_position
+                mode_analytics[mode_key]["player_count_breakdown"][game_record.player_count] += 1
 
             # Calculate averages
             for mode_data in mode_analytics.values():
@@ -509,6 +514,105 @@ class StatisticsService:
             logger.error(f"Error getting game mode analytics: {e}")
             return {}
 
+    def get_season_standings(self, season: int | None = None) -> list[dict[str, Any]]:
+        """Per-member sheet totals for a season (all seasons when None), best total first.
+
+        Read from the columnar season store; aggregated in the database when no
+        snapshot is available.
+        """
+        from .season_store import SeasonStoreUnavailableError, get_season_store  # numpy stays off the boot path
+
+        try:
+            return get_season_store().member_season_totals(season)
+        except SeasonStoreUnavailableError as e:
+            logger.info(f"Season store unavailable ({e}); aggregating season standings in the database")
+
+        try:
+            query = self.db.query(
+                LegacyRound.member,
+                func.count(LegacyRound.id).label("rounds"),
+                func.sum(LegacyRound.score).label("total_quarters"),
+                func.avg(LegacyRound.score).label("average_quarters"),
+                func.max(LegacyRound.score).label("best_round"),
+                func.min(LegacyRound.score).label("worst_round"),
+            ).filter(
+                # NULL status counts as attested, as in the season store
+                func.coalesce(LegacyRound.status, "attested") != "pending",
+                func.coalesce(LegacyRound.member, "") != "",
+            )
+            if season is not None:
+                start, end = season_bounds(season)
+                query = query.filter(LegacyRound.date >= start, LegacyRound.date < end)
+            rows = query.group_by(LegacyRound.member).all()
+        except Exception as e:
+            logger.error(f"Error getting season standings: {e}")
+            return []
+
+        standings = [
+            {
+                "member": row.member,
+                "rounds": row.rounds,
+                "total_quarters": _as_float(row.total_quarters),
+                "average_quarters": _as_float(row.average_quarters),
+                "best_round": _as_float(row.best_round),
+                "worst_round": _as_float(row.worst_round),
+            }
+            for row in rows
+        ]
+        return sorted(standings, key=lambda r: (-(r["total_quarters"] or 0), r["member"]))
+
+    def get_season_player_results(self, season: int | None = None) -> list[dict[str, Any]]:
+        """Per-player completed-game totals for a season (all seasons when None), highest earnings first.
+
+        Read from the columnar season store; aggregated in the database when no
+        snapshot is available.
+        """
+        from .season_store import SeasonStoreUnavailableError, get_season_store
+
+        try:
+            return get_season_store().player_season_results(season)
+        except SeasonStoreUnavailableError as e:
+            logger.info(f"Season store unavailable ({e}); aggregating season results in the database")
+
+        try:
+            query = self.db.query(
+                GamePlayerResult.player_name,
+                func.count(GamePlayerResult.id).label("games"),
+                func.sum(case((GamePlayerResult.final_position == 1, 1), else_=0)).label("wins"),
+                func.sum(GamePlayerResult.total_earnings).label("total_earnings"),
+                func.avg(GamePlayerResult.total_earnings).label("average_earnings"),
+                func.sum(GamePlayerResult.holes_won).label("holes_won"),
+                func.sum(GamePlayerResult.solo_attempts).label("solo_attempts"),
+                func.sum(GamePlayerResult.solo_wins).label("solo_wins"),
+                func.sum(GamePlayerResult.partnerships_won).label("partnerships_won"),
+            ).filter(func.coalesce(GamePlayerResult.player_name, "") != "")
+            if season is not None:
+                start, end = season_bounds(season)
+                query = query.filter(GamePlayerResult.created_at >= start, GamePlayerResult.created_at < end)
+            rows = query.group_by(GamePlayerResult.player_name).all()
+        except Exception as e:
+            logger.error(f"Error getting season player results: {e}")
+            return []
+
+        totals = (
+            "wins",
+            "total_earnings",
+            "average_earnings",
+            "holes_won",
+            "solo_attempts",
+            "solo_wins",
+            "partnerships_won",
+        )
+        results = [
+            {
+                "player_name": row.player_name,
+                "games": row.games,
+                **{name: _as_float(getattr(row, name)) for name in totals},
+            }
+            for row in rows
+        ]
+        return sorted(results, key=lambda r: (-(r["total_earnings"] or 0), r["player_name"]))
+
     def calculate_skill_rating(self, player_id: int) -> dict[str, float]:
         """Calculate skill ratings similar to ELO or Glicko systems."""
         try:
@@ -622,21 +726,38 @@ class StatisticsService:
             return "declining"
         return "stable"
 
+    def _recent_positions(self, player_ids: list[int], limit: int = 20) -> dict[int, list[int]]:
+        """Each player's last ``limit`` finishing positions, newest first, in one query."""
+        results = GamePlayerResult.__table__.c
+        recency = (
+            func.row_number()
+            .over(partition_by=results.player_profile_id, order_by=results.created_at.desc())
+            .label("recency")
+        )
+        ranked = (
+            select(results.player_profile_id, results.final_position, recency)
+            .where(results.player_profile_id.in_(set(player_ids)))
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(ranked.c.player_profile_id, ranked.c.final_position)
+            .where(ranked.c.recency <= limit)
+            .order_by(ranked.c.player_profile_id, ranked.c.recency)
+        )
+        positions: dict[int, list[int]] = defaultdict(list)
+        for player_id, position in rows:
+            positions[player_id].append(position)
+        return positions
+
     def _calculate_consistency_score(self, player_id: int) -> float:
         """Calculate consistency score (0-100, higher is more consistent)."""
-        recent_results = (
-            self.db.query(GamePlayerResult.final_position)
-            .filter(GamePlayerResult.player_profile_id == player_id)
-            .order_by(desc(GamePlayerResult.created_at))
-            .limit(20)
-            .all()
-        )
+        return self._consistency_score(self._recent_positions([player_id]).get(player_id, []))
 
-        if len(recent_results) < 5:
+    @staticmethod
+    def _consistency_score(positions: list[int]) -> float:
+        if len(positions) < 5:
             return 50.0  # Default for insufficient data
 
-        positions = [result.final_position for result in recent_results]
-
         # Calculate variance (lower variance = higher consistency)
         mean_position = sum(positions) / len(positions)
         variance = sum((p - mean_position) ** 2 for p in positions) / len(positions)
@@ -10,20 +10,28 @@ season rounds and was polluting the 2026-27 leaderboard after the sheet cutover.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import GamePlayerResult, GameRecord, LegacyRound
 from ..utils.time import utc_now
+from .export_service import EXPORT_BATCH_SIZE, stream_rows
 from .spreadsheet_sync_service import PRIMARY_SHEET_ID, RoundResult, SpreadsheetSyncService
 
 logger = logging.getLogger(__name__)
 
+# Sort key for rounds whose date is missing or unparseable; sorts after every real date.
+UNKNOWN_DATE_SORTABLE = "1900-01-01"
+
 
 @dataclass
 class UnifiedRound:
@@ -122,14 +130,14 @@ class UnifiedDataService:
 
     def _legacy_round_to_unified(self, r: LegacyRound) -> UnifiedRound:
         """Convert a legacy_rounds DB row to unified format."""
+        date_sortable = r.date or UNKNOWN_DATE_SORTABLE
         try:
-            dt = datetime.strptime(r.date, "%Y-%m-%d")
-            date_display = dt.strftime("%-d-%b")
-        except ValueError:
-            date_display = r.date
+            date_display = datetime.strptime(r.date, "%Y-%m-%d").strftime("%-d-%b")
+        except (TypeError, ValueError):
+            date_display = r.date or "Unknown"
         return UnifiedRound(
             date=date_display,
-            date_sortable=r.date,
+            date_sortable=date_sortable,
             group=r.group,
             member=r.member,
             score=r.score,
@@ -151,7 +159,7 @@ class UnifiedDataService:
             date_sortable = dt.strftime("%Y-%m-%d")
         except (ValueError, AttributeError):
             date_display = "Unknown"
-            date_sortable = "1900-01-01"
+            date_sortable = UNKNOWN_DATE_SORTABLE
 
         return UnifiedRound(
             date=date_display,
@@ -218,19 +226,98 @@ class UnifiedDataService:
         if include_database:
             try:
                 db = self._get_db()
-                records = db.query(GameRecord).filter(GameRecord.completed_at.isnot(None)).all()
-                for record in records:
-                    results = db.query(GamePlayerResult).filter(GamePlayerResult.game_record_id == record.id).all()
-                    for result in results:
-                        unified = self._db_result_to_unified(result, record)
-                        key = (unified.date_sortable, unified.group, unified.member, unified.score)
-                        if key not in all_rounds:
-                            all_rounds[key] = unified
+                rows = (
+                    db.query(GamePlayerResult, GameRecord)
+                    .join(GameRecord, GamePlayerResult.game_record_id == GameRecord.id)
+                    .filter(GameRecord.completed_at.isnot(None))
+                    .order_by(GameRecord.id, GamePlayerResult.id)
+                    .all()
+                )
+                for result, record in rows:
+                    unified = self._db_result_to_unified(result, record)
+                    key = (unified.date_sortable, unified.group, unified.member, unified.score)
+                    if key not in all_rounds:
+                        all_rounds[key] = unified
             except Exception as e:
                 logger.warning(f"Failed to fetch database records: {e}")
 
         return sorted(all_rounds.values(), key=lambda r: r.date_sortable, reverse=True)
 
+    def iter_all_rounds(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[UnifiedRound]:
+        """Stream the same rounds, in the same order, as ``get_all_rounds()`` (sheet cache + database).
+
+        Both sources are read newest-first in ``batch_size`` partitions and
+        merged by date; because duplicates share a date, only the current
+        date's keys are remembered, so memory does not grow with the season.
+        Rounds without a usable date (``UNKNOWN_DATE_SORTABLE``) are out of
+        order in SQL, so they are held back and emitted last, sheet rows
+        first, as ``get_all_rounds()`` sorts them.
+        """
+        db = self._get_db()
+        legacy = stream_rows(
+            db,
+            select(
+                LegacyRound.date,
+                LegacyRound.group,
+                LegacyRound.member,
+                LegacyRound.score,
+                LegacyRound.location,
+                LegacyRound.duration,
+                LegacyRound.source,
+                LegacyRound.hole_scores,
+            )
+            .where(
+                LegacyRound.status != "pending",
+                LegacyRound.source != "writable_sheet",
+            )
+            .order_by(LegacyRound.date.desc(), LegacyRound.id),
+            batch_size,
+        )
+        results = stream_rows(
+            db,
+            select(
+                GameRecord.completed_at,
+                GameRecord.created_at,
+                GameRecord.course_name,
+                GameRecord.game_duration_minutes,
+                GamePlayerResult.player_name,
+                GamePlayerResult.total_earnings,
+                GamePlayerResult.hole_scores,
+            )
+            .join(GamePlayerResult, GamePlayerResult.game_record_id == GameRecord.id)
+            .where(GameRecord.completed_at.isnot(None))
+            .order_by(GameRecord.completed_at.desc(), GamePlayerResult.id),
+            batch_size,
+        )
+        undated_legacy: list[UnifiedRound] = []
+        undated_results: list[UnifiedRound] = []
+
+        def dated(rounds: Iterator[UnifiedRound], undated: list[UnifiedRound]) -> Iterator[UnifiedRound]:
+            for unified in rounds:
+                if unified.date_sortable == UNKNOWN_DATE_SORTABLE:
+                    undated.append(unified)
+                else:
+                    yield unified
+
+        merged = heapq.merge(
+            dated((self._legacy_round_to_unified(r) for r in legacy), undated_legacy),
+            dated((self._db_result_to_unified(r, r) for r in results), undated_results),
+            key=lambda r: r.date_sortable,
+            reverse=True,
+        )
+
+        current_date = None
+        seen: set[tuple] = set()
+        # The undated lists are complete once merged is exhausted.
+        for unified in itertools.chain(merged, undated_legacy, undated_results):
+            if unified.date_sortable != current_date:
+                current_date = unified.date_sortable
+                seen.clear()
+            key = (unified.date_sortable, unified.group, unified.member, unified.score)
+            if key not in seen:
+                seen.add(key)
+                yield unified
+
     def get_unified_leaderboard(self) -> list[UnifiedLeaderboardEntry]:
         """Get unified leaderboard aggregating all sources.
 
@@ -0,0 +1,232 @@
+"""Counterfactual ("what-if") replays of a recorded round.
+
+The round's ``hole_history`` is flattened once into arrays — one row of
+quarters per hole, one column per player, plus the running standings before
+each hole. A scenario re-scores the holes it changes, through the same
+``calculate_points_delta`` / ``apply_multipliers`` the scorekeeper uses, plus
+any later hole whose quarters Karl Marx split unevenly once the standings
+have moved (the goat is picked from them). The per-hole differences are added
+to the recorded totals, so evaluating dozens of alternatives costs a few dict
+builds each and never touches the engine or the database.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException
+
+from ..schemas import CompleteHoleRequest, HoleTeams, WhatIfChange, WhatIfScenario
+from .hole_completion_service import apply_multipliers, calculate_points_delta
+
+# Side that offered the declined double, keyed by the side that declined it.
+_OFFERING_SIDE = {"team1": "team2", "team2": "team1", "captain": "opponents", "opponents": "captain"}
+
+
+@dataclass(slots=True)
+class RoundArrays:
+    """A recorded round as per-hole rows of quarters (columns follow ``player_ids``)."""
+
+    player_ids: list[str]
+    entries: list[dict[str, Any]]
+    deltas: list[list[float]]
+    # Standings before each hole: before[row][col] = sum(deltas[:row])[col]
+    before: list[list[float]]
+    totals: list[float]
+    row_of: dict[int, int]
+
+
+def compact_history(game_state: dict[str, Any]) -> RoundArrays:
+    """Flatten ``hole_history`` (in hole order) into quarter rows and prefix standings."""
+    entries = sorted(game_state.get("hole_history", []), key=lambda e: e.get("hole") or e.get("hole_number") or 0)
+    player_ids = [p["id"] for p in game_state.get("players", []) if p.get("id")]
+    for entry in entries:
+        player_ids.extend(pid for pid in entry.get("points_delta") or {} if pid not in player_ids)
+    column = {pid: i for i, pid in enumerate(player_ids)}
+
+    deltas: list[list[float]] = []
+    before: list[list[float]] = []
+    running = [0.0] * len(player_ids)
+    for entry in entries:
+        row = [0.0] * len(player_ids)
+        for pid, quarters in (entry.get("points_delta") or {}).items():
+            row[column[pid]] = quarters
+        before.append(running)
+        running = [total + q for total, q in zip(running, row, strict=True)]
+        deltas.append(row)
+
+    return RoundArrays(
+        player_ids=player_ids,
+        entries=entries,
+        deltas=deltas,
+        before=before,
+        totals=running,
+        row_of={entry.get("hole") or entry.get("hole_number"): row for row, entry in enumerate(entries)},
+    )
+
+
+def recorded_request(entry: dict[str, Any]) -> CompleteHoleRequest:
+    """Rebuild the scorekeeper request a ``hole_history`` entry was scored from."""
+    hole_number = entry.get("hole") or entry.get("hole_number")
+    if hole_number is None:
+        raise HTTPException(status_code=400, detail="A hole_history entry has no hole number; it cannot be replayed")
+    teams = entry.get("teams")
+    wager = entry.get("final_wager") or entry.get("wager")
+    if not teams or not teams.get("type") or not wager or not entry.get("winner"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Hole {hole_number} was recorded without teams, wager and winner; it cannot be replayed",
+        )
+    team_players = (teams.get("team1") or []) + (teams.get("team2") or [])
+    if teams["type"] == "solo":
+        team_players = [teams.get("captain"), *(teams.get("opponents") or [])]
+    # model_validate, not the constructor: mypy (no pydantic plugin) requires every Field(None) argument
+    return CompleteHoleRequest.model_validate(
+        {
+            "hole_number": hole_number,
+            "rotation_order": entry.get("rotation_order") or team_players,
+            "captain_index": entry.get("captain_index") or 0,
+            "phase": entry.get("phase") or "normal",
+            "duncan_invoked": bool(entry.get("duncan_invoked")),
+            "tunkarri_invoked": bool(entry.get("tunkarri_invoked")),
+            "teams": HoleTeams(**teams),
+            "final_wager": wager,
+            "winner": entry["winner"],
+            "scores": entry.get("gross_scores") or {},
+            "hole_par": entry.get("hole_par") or 4,
+            "float_invoked_by": entry.get("float_invoked_by"),
+            "aardvark_requested_team": entry.get("aardvark_requested_team"),
+            "aardvark_tossed": bool(entry.get("aardvark_tossed")),
+            "aardvark_ping_ponged": bool(entry.get("aardvark_ping_ponged")),
+        }
+    )
+
+
+def _best_ball_winner(
+    request: CompleteHoleRequest, side_a: list[str], side_b: list[str], names: tuple[str, str]
+) -> str:
+    missing = [pid for pid in side_a + side_b if pid not in request.scores]
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Hole {request.hole_number} has no gross score for {missing}; it cannot be re-teamed",
+        )
+    best_a = min(request.scores[pid] for pid in side_a)
+    best_b = min(request.scores[pid] for pid in side_b)
+    if best_a == best_b:
+        return "push"
+    return names[0] if best_a < best_b else names[1]
+
+
+def apply_change(request: CompleteHoleRequest, change: WhatIfChange, floated: set[str]) -> CompleteHoleRequest:
+    """Return ``request`` with one alternative decision applied."""
+    hole = request.hole_number
+    captain = change.captain_id or request.teams.captain or request.rotation_order[request.captain_index]
+    if captain not in request.rotation_order:
+        raise HTTPException(status_code=400, detail=f"Hole {hole}: captain {captain} was not in the rotation")
+    others = [pid for pid in request.rotation_order if pid != captain]
+    solo_flags = {"duncan_invoked": False, "tunkarri_invoked": False, "aardvark_tossed": False}
+
+    if change.decision == "partner":
+        if change.partner_id not in others:
+            raise HTTPException(status_code=400, detail=f"Hole {hole}: partner must be another player in the rotation")
+        team1 = [captain, change.partner_id]
+        team2 = [pid for pid in others if pid != change.partner_id]
+        update = {"teams": HoleTeams(type="partners", team1=team1, team2=team2, captain=captain), **solo_flags}
+        request = request.model_copy(update=update)
+        winner = _best_ball_winner(request, team1, team2, ("team1", "team2"))
+        return request.model_copy(update={"winner": winner})
+
+    if change.decision == "solo":
+        update = {"teams": HoleTeams(type="solo", captain=captain, opponents=others), **solo_flags}
+        request = request.model_copy(update=update)
+        winner = _best_ball_winner(request, [captain], others, ("captain", "opponents"))
+        return request.model_copy(update={"winner": winner})
+
+    if change.decision == "float":
+        if request.float_invoked_by or captain in floated:
+            raise HTTPException(status_code=400, detail=f"Hole {hole}: {captain} has already used the float")
+        return request.model_copy(update={"float_invoked_by": captain, "final_wager": request.final_wager * 2})
+
+    # decline_double: the declining side concedes the hole at the pre-double wager.
+    sides = ("team1", "team2") if request.teams.type == "partners" else ("captain", "opponents")
+    if change.declined_by not in sides:
+        raise HTTPException(status_code=400, detail=f"Hole {hole}: declined_by must be one of {list(sides)}")
+    if request.final_wager < 2:
+        raise HTTPException(status_code=400, detail=f"Hole {hole} was never doubled")
+    return request.model_copy(
+        update={"winner": f"{_OFFERING_SIDE[change.declined_by]}_flush", "final_wager": request.final_wager / 2}
+    )
+
+
+def score_hole(request: CompleteHoleRequest, player_ids: list[str], standings: list[float]) -> dict[str, float]:
+    """Quarters for one hole; Karl Marx picks the goat from ``standings`` before the hole."""
+    game_state = {"players": [{"id": pid, "total_points": s} for pid, s in zip(player_ids, standings, strict=True)]}
+    return apply_multipliers(calculate_points_delta(request, game_state), request, request.hole_number)
+
+
+def splits_by_standings(request: CompleteHoleRequest) -> bool:
+    """Whether Karl Marx splits this hole unevenly, so its quarters follow the standings."""
+    if request.teams.type != "partners" or request.winner == "push":
+        return False
+    sizes = (len(request.teams.team1 or []), len(request.teams.team2 or []))
+    return any(own and request.final_wager * other % own for own, other in (sizes, sizes[::-1]))
+
+
+def replay_scenario(arrays: RoundArrays, scenario: WhatIfScenario) -> dict[str, Any]:
+    """Re-score the holes ``scenario`` changes (and the later ones that follow) and return the totals."""
+    by_row: dict[int, list[WhatIfChange]] = {}
+    for change in scenario.changes:
+        row = arrays.row_of.get(change.hole_number)
+        if row is None:
+            raise HTTPException(status_code=400, detail=f"Hole {change.hole_number} has not been played")
+        by_row.setdefault(row, []).append(change)
+
+    floated = {e["float_invoked_by"] for e in arrays.entries if e.get("float_invoked_by")}
+    shift = [0.0] * len(arrays.player_ids)
+    holes = []
+    for row in range(min(by_row, default=len(arrays.entries)), len(arrays.entries)):
+        if row in by_row:
+            request = recorded_request(arrays.entries[row])
+            for change in by_row[row]:
+                request = apply_change(request, change, floated)
+            if request.float_invoked_by:
+                floated.add(request.float_invoked_by)
+        elif not any(shift):
+            continue
+        else:
+            request = recorded_request(arrays.entries[row])
+            if not splits_by_standings(request):
+                continue
+        standings = [s + d for s, d in zip(arrays.before[row], shift, strict=True)]
+        points = score_hole(request, arrays.player_ids, standings)
+        new_row = [points.get(pid, 0.0) for pid in arrays.player_ids]
+        if row not in by_row and new_row == arrays.deltas[row]:
+            continue
+        shift = [d + new - old for d, new, old in zip(shift, new_row, arrays.deltas[row], strict=True)]
+        holes.append(
+            {
+                "hole_number": request.hole_number,
+                "teams": request.teams.model_dump(exclude_none=True),
+                "winner": request.winner,
+                "final_wager": request.final_wager,
+                "points_delta": points,
+                "recorded_points_delta": arrays.entries[row].get("points_delta") or {},
+            }
+        )
+
+    return {
+        "label": scenario.label,
+        "totals": {pid: t + d for pid, t, d in zip(arrays.player_ids, arrays.totals, shift, strict=True)},
+        "difference": dict(zip(arrays.player_ids, shift, strict=True)),
+        "holes": holes,
+    }
+
+
+def replay_what_if(game_state: dict[str, Any], scenarios: list[WhatIfScenario]) -> dict[str, Any]:
+    """Evaluate every scenario against the recorded round in ``game_state``."""
+    arrays = compact_history(game_state)
+    return {
+        "holes_played": len(arrays.entries),
+        "recorded_totals": dict(zip(arrays.player_ids, arrays.totals, strict=True)),
+        "scenarios": [replay_scenario(arrays, scenario) for scenario in scenarios],
+    }
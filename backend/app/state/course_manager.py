@@ -1,5 +1,8 @@
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any
 
 from sqlalchemy.orm import Session, joinedload
@@ -10,102 +13,321 @@ from ..models import Course, Hole
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class HoleSnapshot:
+    """Immutable copy of one hole's course data."""
+
+    hole_number: int
+    par: int
+    yards: int
+    handicap: int
+    description: str | None = None
+
+    def to_info(self) -> dict[str, Any]:
+        """Hole info in the shape returned by CourseManager.get_hole_info()."""
+        return {
+            "hole_number": self.hole_number,
+            "par": self.par,
+            "yards": self.yards,
+            # The Hole.handicap column is the stroke index (1 = hardest).
+            "stroke_index": self.handicap,
+            "handicap": self.handicap,
+            "description": self.description or "",
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CourseSnapshot:
+    """Immutable, detached view of a course and its holes.
+
+    Holes are stored in an array indexed by ``hole_number - 1`` so lookups are
+    O(1), and pars/handicaps are pre-sorted once at build time. ``version`` is
+    bumped every time the course is refreshed from the database; a game keeps
+    the snapshot it started with even after a newer version is cached.
+    """
+
+    id: int
+    name: str
+    version: int
+    holes: tuple[HoleSnapshot | None, ...]
+    pars: tuple[int, ...]
+    handicaps: tuple[int, ...]
+    description: str | None = None
+    total_par: int | None = None
+    total_yards: int | None = None
+    rating: float | None = None
+    slope: float | None = None
+
+    @classmethod
+    def from_course(cls, course: Any, version: int = 1) -> "CourseSnapshot":
+        """Build a snapshot from a Course row (holes must already be loaded)."""
+        ordered = sorted(course.holes, key=lambda h: h.hole_number)
+        size = max((h.hole_number for h in ordered), default=0)
+        holes: list[HoleSnapshot | None] = [None] * size
+        for h in ordered:
+            holes[h.hole_number - 1] = HoleSnapshot(
+                hole_number=h.hole_number,
+                par=h.par,
+                yards=h.yards,
+                handicap=h.handicap,
+                description=getattr(h, "description", None),
+            )
+        return cls(
+            id=int(course.id),
+            name=str(course.name),
+            version=version,
+            holes=tuple(holes),
+            pars=tuple(h.par for h in ordered),
+            handicaps=tuple(h.handicap for h in ordered),
+            description=getattr(course, "description", None),
+            total_par=getattr(course, "total_par", None),
+            total_yards=getattr(course, "total_yards", None),
+            rating=getattr(course, "course_rating", None),
+            slope=getattr(course, "slope_rating", None),
+        )
+
+    @classmethod
+    def from_details(cls, details: dict[str, Any], version: int = 1) -> "CourseSnapshot":
+        """Rebuild a snapshot from ``to_details()`` output, e.g. one saved with a game."""
+        return cls.from_course(
+            SimpleNamespace(
+                id=details["id"],
+                name=details["name"],
+                holes=[SimpleNamespace(**hole) for hole in details.get("holes", [])],
+                description=details.get("description"),
+                total_par=details.get("total_par"),
+                total_yards=details.get("total_yards"),
+                course_rating=details.get("rating"),
+                slope_rating=details.get("slope"),
+            ),
+            version=version,
+        )
+
+    def hole(self, hole_number: int) -> HoleSnapshot:
+        """Returns one hole by number. Raises KeyError when the course has no such hole."""
+        hole = self.holes[hole_number - 1] if 0 < hole_number <= len(self.holes) else None
+        if hole is None:
+            raise KeyError(f"Hole {hole_number} is not part of course '{self.name}'")
+        return hole
+
+    def hole_info(self, hole_number: int) -> dict[str, Any]:
+        """Returns par, yardage and stroke index for one hole."""
+        return self.hole(hole_number).to_info()
+
+    def to_summary(self) -> dict[str, Any]:
+        """Course summary in the shape returned by CourseManager.get_courses()."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "total_par": self.total_par,
+            "total_yards": self.total_yards,
+            "rating": self.rating,
+            "slope": self.slope,
+        }
+
+    def to_details(self) -> dict[str, Any]:
+        """Course details in the shape returned by CourseManager.get_course_details()."""
+        return {
+            **self.to_summary(),
+            "holes": [
+                {
+                    "hole_number": h.hole_number,
+                    "par": h.par,
+                    "yards": h.yards,
+                    "handicap": h.handicap,
+                    "description": h.description,
+                }
+                for h in self.holes
+                if h is not None
+            ],
+        }
+
+
+# Snapshot and get_courses() summary caches. Writes through CourseManager and
+# the courses router invalidate them; the TTL bounds staleness for writes that
+# go straight to the database (seeding, course import) or land on another
+# instance.
+_COURSES_SUMMARY_TTL = 60
+_SNAPSHOT_TTL = _COURSES_SUMMARY_TTL
+
+# Process-wide snapshot cache shared by every CourseManager instance, keyed by
+# course id. Snapshots are immutable, so handing the same object to many games
+# is safe; refresh_course() swaps in a new version instead of mutating it.
+_snapshots: dict[int, CourseSnapshot] = {}
+_snapshot_loaded_at: dict[int, float] = {}
+_snapshot_ids_by_name: dict[str, int] = {}
+_snapshot_lock = threading.Lock()
+
+_courses_summary: dict[str, dict[str, Any]] | None = None
+_courses_summary_ts = 0.0
+
+
+def _register_snapshot(course: Any) -> CourseSnapshot:
+    """Build and cache a snapshot for a loaded course, bumping its version."""
+    global _courses_summary
+    with _snapshot_lock:
+        previous = _snapshots.get(int(course.id))
+        snapshot = CourseSnapshot.from_course(course, version=previous.version + 1 if previous else 1)
+        if previous is not None and previous.name != snapshot.name:
+            _snapshot_ids_by_name.pop(previous.name, None)
+        _snapshots[snapshot.id] = snapshot
+        _snapshot_loaded_at[snapshot.id] = time.monotonic()
+        _snapshot_ids_by_name[snapshot.name] = snapshot.id
+        _courses_summary = None
+    return snapshot
+
+
+def _fresh_snapshot(course_id: int | None) -> CourseSnapshot | None:
+    """The cached snapshot for a course, or None when missing or older than the TTL."""
+    if course_id is None:
+        return None
+    snapshot = _snapshots.get(course_id)
+    if snapshot is None or time.monotonic() - _snapshot_loaded_at.get(course_id, 0.0) >= _SNAPSHOT_TTL:
+        return None
+    return snapshot
+
+
+def invalidate_course_cache(course_id: int | None = None) -> None:
+    """Drop cached snapshots (one course, or all when course_id is None)."""
+    global _courses_summary
+    with _snapshot_lock:
+        if course_id is None:
+            _snapshots.clear()
+            _snapshot_loaded_at.clear()
+            _snapshot_ids_by_name.clear()
+        else:
+            _snapshot_loaded_at.pop(course_id, None)
+            snapshot = _snapshots.pop(course_id, None)
+            if snapshot is not None:
+                _snapshot_ids_by_name.pop(snapshot.name, None)
+        _courses_summary = None
+
+
 @dataclass
 class CourseManager:
-    """Manages golf course data by interacting directly with the database."""
+    """Manages golf course data backed by the database and a shared snapshot cache."""
 
     selected_course_name: str | None = None
     selected_course_id: int | None = None
 
-    # In-memory cache for the currently selected course
-    _course_cache: dict[int, Course] = field(default_factory=dict)
+    # Snapshots this manager has selected, keyed by course id. Games keep their
+    # own snapshot (WolfGoatPigGame.course_snapshot), so the manager follows the
+    # shared cache and only falls back to these when it misses.
+    _course_cache: dict[int, CourseSnapshot] = field(default_factory=dict)
+    # Ids of the entries above that came from the database. Those are reloaded
+    # once the shared cache drops them; a snapshot placed in _course_cache by
+    # hand has nowhere to be reloaded from and is served as is.
+    _loaded_ids: set[int] = field(default_factory=set)
+
+    def _select(self, snapshot: CourseSnapshot) -> None:
+        self._course_cache[snapshot.id] = snapshot
+        self._loaded_ids.add(snapshot.id)
+        self.selected_course_name = snapshot.name
+        self.selected_course_id = snapshot.id
+
+    def get_snapshot(self, course_name: str) -> CourseSnapshot | None:
+        """Returns the cached snapshot for a course, loading it from the database on a miss or after the TTL."""
+        snapshot = _fresh_snapshot(_snapshot_ids_by_name.get(course_name))
+        if snapshot is not None:
+            return snapshot
 
-    def load_course(self, course_name: str) -> bool:
-        """Loads a course from the database and caches it."""
         db: Session = SessionLocal()
         try:
             course = db.query(Course).options(joinedload(Course.holes)).filter(Course.name == course_name).first()
-            if course:
-                course_id = int(course.id)
-                self._course_cache[course_id] = course
-                self.selected_course_name = str(course.name)
-                self.selected_course_id = int(course.id)
-                logger.info(f"Successfully loaded and cached course: {course_name}")
-                return True
-            logger.warning(f"Course '{course_name}' not found in the database.")
-            return False
+            if not course:
+                return None
+            return _register_snapshot(course)
         finally:
             db.close()
 
-    def get_selected_course(self) -> Course | None:
-        """Returns the currently selected course from the cache."""
-        if self.selected_course_id is None:
+    def load_course(self, course_name: str) -> bool:
+        """Selects a course, serving it from the snapshot cache when possible."""
+        snapshot = self.get_snapshot(course_name)
+        if snapshot is None:
+            logger.warning(f"Course '{course_name}' not found in the database.")
+            return False
+        self._select(snapshot)
+        logger.info(f"Successfully loaded course: {course_name} (v{snapshot.version})")
+        return True
+
+    def get_selected_snapshot(self) -> CourseSnapshot | None:
+        """Returns the immutable snapshot of the currently selected course.
+
+        The shared cache wins, so an update made through any CourseManager (or
+        an invalidation from the courses router) reaches long-lived managers
+        such as the app singleton within the TTL.
+        """
+        course_id = self.selected_course_id
+        if course_id is None:
             return None
-        return self._course_cache.get(self.selected_course_id)
+        shared = _fresh_snapshot(course_id)
+        if shared is not None:
+            self._course_cache[course_id] = shared
+            self._loaded_ids.add(course_id)
+            return shared
+        pinned = self._course_cache.get(course_id)
+        if pinned is not None and course_id not in self._loaded_ids:
+            return pinned
+        return self._course_cache.get(course_id) if self.refresh_course(course_id) else None
+
+    def get_selected_course(self) -> CourseSnapshot | None:
+        """Returns the currently selected course."""
+        return self.get_selected_snapshot()
 
     def refresh_course(self, course_id: int) -> bool:
-        """Reloads a course from the database to refresh the cache."""
+        """Reloads a course from the database, caching it as a new snapshot version."""
         db: Session = SessionLocal()
         try:
-            course = db.query(Course).options(joinedload(Course.holes)).get(course_id)
-            if course:
-                cached_course_id = int(course.id)
-                self._course_cache[cached_course_id] = course
-                logger.info(f"Refreshed course '{course.name}' from database.")
-                return True
-            return False
+            course = db.get(Course, course_id, options=[joinedload(Course.holes)])
+            if not course:
+                invalidate_course_cache(course_id)
+                self._course_cache.pop(course_id, None)
+                self._loaded_ids.discard(course_id)
+                return False
+            snapshot = _register_snapshot(course)
         finally:
             db.close()
 
+        self._course_cache[snapshot.id] = snapshot
+        self._loaded_ids.add(snapshot.id)
+        if self.selected_course_id == snapshot.id:
+            self.selected_course_name = snapshot.name
+        logger.info(f"Refreshed course '{snapshot.name}' from database (v{snapshot.version}).")
+        return True
+
     def get_courses(self) -> dict[str, dict[str, Any]]:
-        """Returns a dict of all courses from the database, keyed by course name."""
-        db: Session = SessionLocal()
-        try:
-            courses = db.query(Course).all()
-            return {
-                c.name: {
-                    "id": c.id,
-                    "name": c.name,
-                    "description": c.description,
-                    "total_par": c.total_par,
-                    "total_yards": c.total_yards,
-                    "rating": c.course_rating,
-                    "slope": c.slope_rating,
+        """Returns a dict of all courses, keyed by course name."""
+        global _courses_summary, _courses_summary_ts
+        summary = _courses_summary
+        if summary is None or (time.time() - _courses_summary_ts) >= _COURSES_SUMMARY_TTL:
+            db: Session = SessionLocal()
+            try:
+                courses = db.query(Course).all()
+                summary = {
+                    c.name: {
+                        "id": c.id,
+                        "name": c.name,
+                        "description": c.description,
+                        "total_par": c.total_par,
+                        "total_yards": c.total_yards,
+                        "rating": c.course_rating,
+                        "slope": c.slope_rating,
+                    }
+                    for c in courses
                 }
-                for c in courses
-            }
-        finally:
-            db.close()
+            finally:
+                db.close()
+            # An empty table is not cached, so a freshly seeded database shows up at once
+            if summary:
+                _courses_summary = summary
+                _courses_summary_ts = time.time()
+        return {name: dict(info) for name, info in summary.items()}
 
     def get_course_details(self, course_name: str) -> dict[str, Any] | None:
         """Returns detailed information for a specific course, including all holes."""
-        db: Session = SessionLocal()
-        try:
-            course = db.query(Course).options(joinedload(Course.holes)).filter(Course.name == course_name).first()
-            if not course:
-                return None
-
-            return {
-                "id": course.id,
-                "name": course.name,
-                "description": course.description,
-                "total_par": course.total_par,
-                "total_yards": course.total_yards,
-                "rating": course.course_rating,
-                "slope": course.slope_rating,
-                "holes": [
-                    {
-                        "hole_number": h.hole_number,
-                        "par": h.par,
-                        "yards": h.yards,
-                        "handicap": h.handicap,
-                        "description": h.description,
-                    }
-                    for h in sorted(course.holes, key=lambda x: x.hole_number)
-                ],
-            }
-        finally:
-            db.close()
+        snapshot = self.get_snapshot(course_name)
+        return snapshot.to_details() if snapshot else None
 
     def create_course(self, course_data: dict[str, Any]) -> Course:
         """Creates a new course and its holes in the database."""
@@ -133,6 +355,7 @@ class CourseManager:
 
             db.commit()
             db.refresh(new_course)
+            invalidate_course_cache(int(new_course.id))
             logger.info(f"Created new course: {new_course.name}")
             return new_course
         except Exception as e:
@@ -144,17 +367,13 @@ class CourseManager:
 
     def get_hole_pars(self) -> list[int]:
         """Gets the pars for the currently selected course."""
-        course = self.get_selected_course()
-        if not course:
-            return []
-        return [h.par for h in sorted(course.holes, key=lambda x: x.hole_number)]
+        snapshot = self.get_selected_snapshot()
+        return list(snapshot.pars) if snapshot else []
 
     def get_hole_handicaps(self) -> list[int]:
         """Gets the handicaps for the currently selected course."""
-        course = self.get_selected_course()
-        if not course:
-            return []
-        return [h.handicap for h in sorted(course.holes, key=lambda x: x.hole_number)]
+        snapshot = self.get_selected_snapshot()
+        return list(snapshot.handicaps) if snapshot else []
 
     def get_hole_info(self, hole_number: int) -> dict[str, Any]:
         """Gets par, yardage and stroke index for one hole of the selected course.
@@ -162,23 +381,10 @@ class CourseManager:
         Raises KeyError when the hole cannot be resolved, so callers fall back
         explicitly instead of scoring the hole against invented values.
         """
-        course = self.get_selected_course()
-        if not course:
+        snapshot = self.get_selected_snapshot()
+        if not snapshot:
             raise KeyError(f"No course is loaded; cannot resolve hole {hole_number}")
-
-        hole = next((h for h in course.holes if h.hole_number == hole_number), None)
-        if hole is None:
-            raise KeyError(f"Hole {hole_number} is not part of course '{self.selected_course_name}'")
-
-        return {
-            "hole_number": hole.hole_number,
-            "par": hole.par,
-            "yards": hole.yards,
-            # The Hole.handicap column is the stroke index (1 = hardest).
-            "stroke_index": hole.handicap,
-            "handicap": hole.handicap,
-            "description": hole.description or "",
-        }
+        return snapshot.hole_info(hole_number)
 
 
 # Singleton instance of the CourseManager
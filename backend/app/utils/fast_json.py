@@ -0,0 +1,74 @@
+"""orjson-backed JSON responses, with a stdlib fallback.
+
+Routes keep Starlette's ``JSONResponse`` by default. Hot endpoints (game
+state, the polled lobby) return ``FastJSONResponse(content)`` themselves,
+which skips FastAPI's ``jsonable_encoder`` walk as well as the stdlib
+encoder; keep ``response_model`` on their decorator so the OpenAPI schema is
+unchanged.
+
+Output matches Starlette's ``JSONResponse`` (compact separators, UTF-8,
+non-ASCII kept): datetimes and dates render as ``isoformat()``, Enums as
+their value, non-string dict keys as their JSON text. Anything orjson cannot
+encode natively (pydantic models, Decimal, sets, ints past 64 bits) goes
+through ``jsonable_encoder`` and the stdlib encoder, which is also the
+whole path when orjson is not installed. The one intended difference: NaN
+and infinity render as ``null`` instead of raising.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from types import ModuleType
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def _load_orjson() -> ModuleType | None:
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:  # pragma: no cover - orjson is in requirements.txt
+        return None
+
+
+orjson = _load_orjson()
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    encoded = jsonable_encoder(obj)
+    if encoded is obj:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return encoded
+
+
+def stdlib_dumps(content: Any) -> bytes:
+    """Starlette's ``JSONResponse.render`` after FastAPI's ``jsonable_encoder`` pass."""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is None:
+        return stdlib_dumps(content)
+    try:
+        rendered: bytes = orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # orjson.JSONEncodeError subclasses TypeError (unsupported type, int
+        # overflow, nesting too deep); the stdlib path handles or reports it.
+        return stdlib_dumps(content)
+    return rendered
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson (see module docstring)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
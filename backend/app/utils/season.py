@@ -0,0 +1,30 @@
+"""Season helpers.
+
+The spreadsheet season starts the day after the final round of the Open
+Championship and ends with the next one (docs/features/rules.txt). The Open
+finishes on a Sunday in mid-July, so the start is kept as a fixed month and
+day, ``SEASON_START`` (``MM-DD``, default the day after the 2026 final round).
+A season is numbered by the year it starts in: season 2026 is "2026-27".
+"""
+
+import os
+from datetime import date
+
+from .time import utc_now
+
+SEASON_START = os.environ.get("SEASON_START", "07-20")
+SEASON_START_MONTH, SEASON_START_DAY = (int(part) for part in SEASON_START.split("-"))
+
+
+def season_of(day: date) -> int:
+    """The season a date falls in."""
+    return day.year if (day.month, day.day) >= (SEASON_START_MONTH, SEASON_START_DAY) else day.year - 1
+
+
+def current_season() -> int:
+    return season_of(utc_now().date())
+
+
+def season_bounds(season: int) -> tuple[str, str]:
+    """ISO dates ``[start, end)`` of a season, for comparing against stored date strings."""
+    return f"{season}-{SEASON_START}", f"{season + 1}-{SEASON_START}"
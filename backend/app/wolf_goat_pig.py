@@ -19,7 +19,7 @@ from .engine import (
     SimulationMixin,
     StateViewsMixin,
 )
-from .mixins import PersistenceMixin
+from .mixins import PersistenceBackend, PersistenceMixin
 from .state.course_manager import get_course_manager
 from .validators import (
     HandicapValidationError,
@@ -56,9 +56,11 @@ class WolfGoatPigGame(
         player_count: int = 4,
         players: list[Player] | None = None,
         course_manager: Any = None,
+        persistence: PersistenceBackend | None = None,
     ) -> None:
-        # Initialize persistence FIRST (generates/loads game_id)
-        self.__init_persistence__(game_id)
+        # Initialize persistence FIRST (generates/loads game_id). The backend
+        # defaults to the database; pass NullPersistence() for throwaway engines.
+        self.__init_persistence__(game_id, persistence)
 
         # Check if we loaded from DB - if so, skip initialization
         if hasattr(self, "_loaded_from_db") and cast("bool", getattr(self, "_loaded_from_db", False)):
@@ -90,10 +92,12 @@ class WolfGoatPigGame(
                 first_course_name = next(iter(courses.keys()))
                 self.course_manager.load_course(first_course_name)
 
-        logger.info(f"Course manager type: {type(self.course_manager)}")
-        logger.info(f"Course manager attributes: {dir(self.course_manager)}")
-
-        self.course_name = self.course_manager.selected_course_name
+        # Pin this game's own immutable course snapshot so a later course
+        # selection or refresh on the shared manager never changes its holes.
+        self.course_snapshot = self.course_manager.get_selected_snapshot()
+        self.course_name = (
+            self.course_snapshot.name if self.course_snapshot else self.course_manager.selected_course_name
+        )
 
         # Computer players for AI decision making
         self.computer_players: dict[str, Any] = {}
@@ -6,6 +6,7 @@ Detects:
 1. Datetime objects assigned to String columns (type mismatches)
 2. Missing rollback in exception handlers within query loops
 3. Potential transaction abort cascades
+4. Blocking Session calls made directly inside ``async def`` bodies
 
 Usage:
     python lint_db_transactions.py [path]
@@ -13,6 +14,7 @@ Usage:
     python lint_db_transactions.py app/seed_data.py
 """
 
+import ast
 import re
 import sys
 import os
@@ -65,6 +67,9 @@ class DatabaseTransactionLinter:
             # Check for missing rollback in loops
             self._check_loop_rollbacks(file_path, content, lines)
 
+            # Check for sync DB calls blocking the event loop
+            self._check_async_db_calls(file_path, content, lines)
+
             return self.issues
 
         except Exception as e:
@@ -132,6 +137,109 @@ class DatabaseTransactionLinter:
                         code_snippet=lines[exc_line - 1].strip() if exc_line > 0 else ''
                     ))
 
+    # Session methods that hit the database (or the connection pool).
+    BLOCKING_SESSION_METHODS = frozenset({
+        'query', 'execute', 'scalar', 'scalars', 'get', 'commit', 'rollback',
+        'flush', 'refresh', 'close', 'add', 'add_all', 'delete', 'merge',
+    })
+
+    def _check_async_db_calls(self, file_path: str, content: str, lines: List[str]):
+        """Flag blocking Session work made directly in a coroutine body.
+
+        A receiver counts as a Session when it is named ``db`` / ``self.db``,
+        is a parameter or local annotated as a ``Session``, or was assigned
+        from ``SessionLocal()``. Calling ``SessionLocal()`` itself on the loop
+        is reported too - checking a connection out of the pool can block.
+
+        Passing the bound method (``await run_db(db.commit)``) or wrapping the
+        work in a nested sync ``def``/``lambda`` is fine - only calls that run
+        on the event loop itself are reported.
+        """
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return
+
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.AsyncFunctionDef):
+                continue
+            sessions = self._session_names(node)
+            for call in self._direct_calls(node.body):
+                func = call.func
+                if self._is_session_factory(func):
+                    message = (f"SessionLocal() inside 'async def {node.name}' runs on the event loop. "
+                               f"Open the session with 'await run_db(SessionLocal)'.")
+                elif isinstance(func, ast.Attribute) and func.attr in self.BLOCKING_SESSION_METHODS:
+                    target = func.value
+                    is_session = (isinstance(target, ast.Name) and target.id in sessions) or (
+                        isinstance(target, ast.Attribute) and target.attr == 'db'
+                    )
+                    if not is_session:
+                        continue
+                    message = (f"Blocking Session.{func.attr}() inside 'async def {node.name}' stalls the "
+                               f"event loop. Use a plain def route or 'await run_db(...)'.")
+                else:
+                    continue
+                self.issues.append(LintIssue(
+                    file_path=file_path,
+                    line_number=call.lineno,
+                    severity='error',
+                    rule_id='DB003',
+                    message=message,
+                    code_snippet=lines[call.lineno - 1].strip()
+                ))
+
+    @staticmethod
+    def _is_session_factory(func: ast.expr) -> bool:
+        return (isinstance(func, ast.Name) and func.id == 'SessionLocal') or (
+            isinstance(func, ast.Attribute) and func.attr == 'SessionLocal'
+        )
+
+    @staticmethod
+    def _is_session_annotation(annotation) -> bool:
+        return annotation is not None and re.search(r'\bSession\b', ast.unparse(annotation)) is not None
+
+    def _session_names(self, func: ast.AsyncFunctionDef) -> set:
+        """Names bound to a Session in ``func``: ``db``, Session-typed args, and SessionLocal() results."""
+        names = {'db'}
+        args = func.args
+        for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs):
+            if self._is_session_annotation(arg.annotation):
+                names.add(arg.arg)
+        for node in self._direct_nodes(func.body):
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                if self._is_session_annotation(node.annotation):
+                    names.add(node.target.id)
+            elif isinstance(node, ast.Assign) and self._opens_session(node.value):
+                names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        return names
+
+    def _opens_session(self, value: ast.expr) -> bool:
+        """``SessionLocal()`` or ``await run_db(SessionLocal)``."""
+        if isinstance(value, ast.Await):
+            value = value.value
+        if not isinstance(value, ast.Call):
+            return False
+        if self._is_session_factory(value.func):
+            return True
+        return any(isinstance(arg, (ast.Name, ast.Attribute)) and self._is_session_factory(arg) for arg in value.args)
+
+    def _direct_calls(self, body: List[ast.stmt]):
+        """Yield calls in ``body`` without descending into nested functions or lambdas."""
+        for node in self._direct_nodes(body):
+            if isinstance(node, ast.Call):
+                yield node
+
+    def _direct_nodes(self, body: List[ast.stmt]):
+        """Yield nodes in ``body`` without descending into nested functions or lambdas."""
+        stack: List[ast.AST] = list(body)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                continue
+            yield node
+            stack.extend(ast.iter_child_nodes(node))
+
     def _find_loop_blocks(self, content: str, lines: List[str]) -> List[Tuple[int, int]]:
         """Find all for-loop blocks in the code."""
         blocks = []
@@ -0,0 +1,3 @@
+-- Optimistic-concurrency version for game_state writes (GameStateModel.version).
+-- Existing rows start at 1; the ORM compares-and-swaps on it for every UPDATE.
+ALTER TABLE game_state ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
@@ -0,0 +1,25 @@
+-- Cross-instance leases for scheduled jobs, plus per-run history
+CREATE TABLE IF NOT EXISTS job_leases (
+    job_name VARCHAR PRIMARY KEY,
+    holder VARCHAR,
+    acquired_at VARCHAR,
+    expires_at VARCHAR,
+    last_run_at VARCHAR,
+    last_success_at VARCHAR,
+    last_status VARCHAR,
+    last_duration_seconds DOUBLE PRECISION,
+    run_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS job_runs (
+    id SERIAL PRIMARY KEY,
+    job_name VARCHAR NOT NULL,
+    holder VARCHAR,
+    trigger VARCHAR,
+    started_at VARCHAR NOT NULL,
+    duration_seconds DOUBLE PRECISION,
+    status VARCHAR,
+    error VARCHAR
+);
+
+CREATE INDEX IF NOT EXISTS ix_job_runs_job_started ON job_runs (job_name, started_at);
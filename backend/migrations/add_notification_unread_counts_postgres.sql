@@ -0,0 +1,14 @@
+-- Per-player unread notification counter (NotificationService keeps it in step)
+CREATE TABLE IF NOT EXISTS notification_unread_counts (
+    player_profile_id INTEGER PRIMARY KEY,
+    unread INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS ix_notifications_player_unread ON notifications (player_profile_id, is_read);
+
+INSERT INTO notification_unread_counts (player_profile_id, unread)
+SELECT player_profile_id, COUNT(*)
+FROM notifications
+WHERE is_read = false AND player_profile_id IS NOT NULL
+GROUP BY player_profile_id
+ON CONFLICT (player_profile_id) DO NOTHING;
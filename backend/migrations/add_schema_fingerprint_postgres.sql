@@ -0,0 +1,6 @@
+-- Boot fast path: hash of model metadata + migration files from the last full schema preparation
+CREATE TABLE IF NOT EXISTS schema_fingerprint (
+    id INTEGER PRIMARY KEY,
+    fingerprint VARCHAR NOT NULL,
+    recorded_at VARCHAR
+);
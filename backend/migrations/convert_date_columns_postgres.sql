@@ -0,0 +1,33 @@
+-- Migration: native DATE / TIMESTAMP for date columns stored as ISO strings
+-- (see app/db_types.py). Existing rows are backfilled in place by the USING
+-- casts; values that do not start with an ISO date become NULL instead of
+-- failing the conversion. Dependent indexes are rebuilt by ALTER ... TYPE.
+
+ALTER TABLE daily_signups
+    ALTER COLUMN date TYPE DATE
+    USING CASE WHEN date::text ~ '^\d{4}-\d{2}-\d{2}' THEN substring(date::text from 1 for 10)::date END;
+
+ALTER TABLE legacy_rounds
+    ALTER COLUMN date TYPE DATE
+    USING CASE WHEN date::text ~ '^\d{4}-\d{2}-\d{2}' THEN substring(date::text from 1 for 10)::date END;
+
+ALTER TABLE ghin_scores
+    ALTER COLUMN score_date TYPE DATE
+    USING CASE WHEN score_date::text ~ '^\d{4}-\d{2}-\d{2}' THEN substring(score_date::text from 1 for 10)::date END;
+
+ALTER TABLE callout_notifications
+    ALTER COLUMN game_date TYPE DATE
+    USING CASE WHEN game_date::text ~ '^\d{4}-\d{2}-\d{2}' THEN substring(game_date::text from 1 for 10)::date END;
+
+-- Offsets in legacy values are all +00:00/Z; the cast keeps the UTC wall time
+ALTER TABLE game_state
+    ALTER COLUMN created_at TYPE TIMESTAMP
+    USING CASE WHEN created_at::text ~ '^\d{4}-\d{2}-\d{2}' THEN created_at::text::timestamp END;
+
+-- GameStateModel: newest-first listing keyset on (created_at, id)
+CREATE INDEX IF NOT EXISTS ix_game_state_created_at_id
+    ON game_state (created_at, id);
+
+-- GamePlayerResult: time-filtered leaderboards range-scan created_at per player
+CREATE INDEX IF NOT EXISTS ix_game_player_results_created_player
+    ON game_player_results (created_at, player_profile_id);
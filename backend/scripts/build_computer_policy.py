@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Generate the computer-player decision table (app/data/computer_policy.bin).
+
+The table is built from the personality base rates in
+``app/domain/computer_policy.py``; edit those (or the situation adjustments in
+``_rate``) and rerun this script, then commit the regenerated file.
+
+Usage:
+    python scripts/build_computer_policy.py            # write the table
+    python scripts/build_computer_policy.py --check    # exit 1 if it is stale
+
+Run from the ``backend/`` directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def main() -> int:
+    from app.domain.computer_policy import POLICY_PATH, build_table, encode
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=POLICY_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit non-zero if the committed table is out of date.",
+    )
+    args = parser.parse_args()
+
+    axes, cells = build_table()
+    rendered = encode(axes, cells)
+
+    if args.check:
+        if not args.output.exists() or args.output.read_bytes() != rendered:
+            print(
+                f"❌ {args.output} is out of date with the personality rates.\n"
+                "   Regenerate it with: python scripts/build_computer_policy.py",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"✅ {args.output} is in sync.")
+        return 0
+
+    args.output.write_bytes(rendered)
+    print(f"✅ Wrote {args.output} ({len(cells)} cells, {len(axes.personalities)} personalities)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Play computer-only Wolf Goat Pig rounds in bulk (see app/self_play.py).
+
+Usage:
+    python scripts/self_play.py --rounds 10000 --out sims/run1
+    python scripts/self_play.py --rounds 2000 --players 4 --personalities aggressive conservative --seed 3
+
+Writes one gzipped CSV of per-hole rows per chunk to ``--out`` and prints a
+summary. No database is touched. Run from the ``backend/`` directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.self_play import PERSONALITIES, SelfPlayConfig, run_batch
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, required=True)
+    parser.add_argument("--out", type=Path, required=True, help="directory for holes-*.csv.gz chunk files")
+    parser.add_argument("--players", type=int, nargs="+", default=[4, 5, 6], choices=[4, 5, 6])
+    parser.add_argument("--personalities", nargs="+", default=list(PERSONALITIES), choices=list(PERSONALITIES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=250, help="rounds per worker task and output file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    config = SelfPlayConfig(
+        rounds=args.rounds,
+        player_counts=tuple(args.players),
+        personalities=tuple(args.personalities),
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+    started = time.perf_counter()
+    summary = run_batch(config, args.out, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{summary.rounds} rounds / {summary.holes} holes in {elapsed:.1f}s ({summary.rounds / elapsed:.0f} rounds/s)"
+    )
+    print(f"solo holes {summary.solo_holes}, doubles {summary.doubles} ({summary.declined_doubles} declined)")
+    for name, points in summary.points_per_round().items():
+        print(f"  {name:<13} {points:+.2f} quarters per round")
+    print(f"wrote {len(summary.files)} files to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""Performance benchmarks with JSON baselines.
+
+Run from ``backend/``::
+
+    python -m tests.benchmarks                  # run every case and print timings
+    python -m tests.benchmarks -k odds          # only cases whose name contains "odds"
+    python -m tests.benchmarks --save           # overwrite tests/benchmarks/baseline.json
+    python -m tests.benchmarks --compare        # exit 1 if a case got > 25% slower (or bigger)
+
+Cases register themselves with ``@benchmark`` in the modules listed in
+``CASE_MODULES``. Baselines are machine-specific: refresh ``baseline.json``
+with ``--save`` on the machine you compare on, and raise ``--threshold`` on
+shared or single-vCPU runners where run-to-run jitter alone can exceed 25%.
+"""
+
+CASE_MODULES = ("tests.benchmarks.engine", "tests.benchmarks.responses")
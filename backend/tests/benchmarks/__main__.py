@@ -0,0 +1,72 @@
+"""Command-line entry point: ``python -m tests.benchmarks --help``."""
+
+import argparse
+import importlib
+import logging
+import sys
+from pathlib import Path
+
+from . import CASE_MODULES
+from .harness import DEFAULT_THRESHOLD, compare, format_comparison, format_results, load, run, save, select
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this substring")
+    parser.add_argument("--samples", type=int, default=30, help="timed samples per case (default: 30)")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed warm-up calls per case (default: 3)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="write results to the baseline file")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"relative slowdown counted as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+
+    for module in CASE_MODULES:
+        importlib.import_module(module)
+
+    cases = select(args.pattern)
+    if not cases:
+        parser.error(f"no benchmark matches {args.pattern!r}")
+    payload = run(cases, samples=args.samples, warmup=args.warmup)
+    print(format_results(payload))
+
+    if args.save:
+        if args.pattern and args.baseline.exists():
+            # Partial run: refresh only the selected cases.
+            merged = load(args.baseline)
+            merged.update({k: v for k, v in payload.items() if k != "results"})
+            merged["results"].update(payload["results"])
+            payload = merged
+        save(payload, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"\nNo baseline at {args.baseline}; run with --save first", file=sys.stderr)
+            return 2
+        baseline = load(args.baseline)
+        if args.pattern:
+            baseline["results"] = {k: v for k, v in baseline["results"].items() if args.pattern in k}
+        comparisons = compare(payload, baseline, args.threshold)
+        print()
+        print(format_comparison(comparisons))
+        regressions = [c.name for c in comparisons if c.status == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Engine code logs at INFO on every hole; keep the output to the table.
+    # Only here: main() also runs in-process under pytest, where this would
+    # silence every later test's logging.
+    logging.disable(logging.WARNING)
+    sys.exit(main())
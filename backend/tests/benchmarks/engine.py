@@ -0,0 +1,247 @@
+"""Engine benchmarks driven by ``tests/fixtures/golden_round.json``.
+
+Everything runs in memory: games use ``NullPersistence`` (no DB session, no
+state serialization on save) on a course built from the golden round's pars, so timings
+measure engine work only.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from app.domain.game_types import Player
+from app.managers.rule_manager import RuleManager
+from app.mixins import NullPersistence
+from app.schemas.games import CompleteHoleRequest, HoleTeams
+from app.services.hole_completion_service import process_complete_hole, process_update_hole, replay_player_totals
+from app.services.odds_calculator import HoleState, OddsCalculator, PlayerState, TeamConfiguration
+from app.state.course_manager import CourseManager, CourseSnapshot
+from app.wolf_goat_pig import WolfGoatPigGame
+
+from .harness import benchmark, memory_benchmark
+
+GOLDEN_ROUND_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "golden_round.json"
+
+# Extra golfers for the 5- and 6-player odds cases.
+EXTRA_PLAYERS = [
+    {"id": "player_e", "name": "Eve", "handicap": 18},
+    {"id": "player_f", "name": "Frank", "handicap": 4},
+]
+
+
+@cache
+def golden_round() -> dict[str, Any]:
+    return json.loads(GOLDEN_ROUND_PATH.read_text())
+
+
+def golden_course_manager() -> CourseManager:
+    """A CourseManager holding the golden round's course in its cache (no DB)."""
+    holes = [
+        SimpleNamespace(
+            hole_number=h["hole_number"], par=h["par"], yards=380, handicap=h["hole_number"], description=""
+        )
+        for h in golden_round()["holes"]
+    ]
+    manager = CourseManager()
+    manager.selected_course_name = "Golden Round"
+    # An id no real course has, so the shared snapshot cache never replaces it
+    manager.selected_course_id = 9001
+    manager._course_cache[9001] = CourseSnapshot.from_course(SimpleNamespace(id=9001, name="Golden Round", holes=holes))
+    return manager
+
+
+def new_game(course_manager: CourseManager | None = None) -> WolfGoatPigGame:
+    players = [
+        Player(id=p["id"], name=p["name"], handicap=p["handicap"]) for p in golden_round()["game_metadata"]["players"]
+    ]
+    return WolfGoatPigGame(
+        player_count=4,
+        players=players,
+        course_manager=course_manager or golden_course_manager(),
+        persistence=NullPersistence(),
+    )
+
+
+def play_golden_round(game: WolfGoatPigGame, holes: int = 18) -> WolfGoatPigGame:
+    """Play the golden round's team shapes and scores through the engine.
+
+    The engine picks its own captains, so the captain takes the next player
+    in the hitting order as partner (the golden round's pattern) or goes
+    solo wherever the golden hole was solo.
+    """
+    for hole in golden_round()["holes"][:holes]:
+        hole_state = game.hole_states[game.current_hole]
+        captain = hole_state.teams.captain
+        if hole["teams"]["type"] == "solo":
+            game.captain_go_solo(captain)
+        else:
+            order = hole_state.hitting_order
+            partner = order[(order.index(captain) + 1) % len(order)]
+            game.request_partner(captain, partner)
+            game.respond_to_partnership(partner, accept=True)
+        game.enter_hole_scores(hole["scores"])
+        if game.current_hole < holes or holes == 18:
+            game.advance_to_next_hole()
+    return game
+
+
+def golden_requests() -> list[CompleteHoleRequest]:
+    return [
+        CompleteHoleRequest(
+            hole_number=hole["hole_number"],
+            rotation_order=hole["rotation_order"],
+            captain_index=0,
+            teams=HoleTeams(**hole["teams"]),
+            final_wager=hole["wager"],
+            winner=hole["winner"],
+            scores=hole["scores"],
+            hole_par=hole["par"],
+            duncan_invoked=hole.get("duncan_invoked", False),
+        )
+        for hole in golden_round()["holes"]
+    ]
+
+
+def scorekeeper_state() -> dict[str, Any]:
+    """A fresh scorekeeper-mode game_state dict for the golden round's players."""
+    return {
+        "players": [
+            {**p, "points": 0, "total_points": 0, "float_used": 0} for p in golden_round()["game_metadata"]["players"]
+        ],
+        "hole_history": [],
+        "current_hole": 1,
+    }
+
+
+def odds_inputs(player_count: int) -> tuple[list[PlayerState], HoleState]:
+    roster = golden_round()["game_metadata"]["players"] + EXTRA_PLAYERS
+    players = [
+        PlayerState(
+            id=p["id"],
+            name=p["name"],
+            handicap=float(p["handicap"]),
+            shots_taken=1,
+            distance_to_pin=120.0 + 15 * i,
+            lie_type="fairway" if i % 2 == 0 else "rough",
+            is_captain=i == 0,
+            team_id="team1" if i < 2 else "team2",
+        )
+        for i, p in enumerate(roster[:player_count])
+    ]
+    hole = HoleState(hole_number=7, par=4, difficulty_rating=3.5, teams=TeamConfiguration.PARTNERS, current_wager=2)
+    return players, hole
+
+
+def rules_state() -> dict[str, Any]:
+    """Golden round hole 1 in the dict shape RuleManager reads."""
+    hole = golden_round()["holes"][0]
+    return {
+        "game_id": "benchmark",
+        "players": [dict(p) for p in golden_round()["game_metadata"]["players"]],
+        "current_hole_number": 1,
+        "current_hole": {
+            "hole_number": 1,
+            "par": hole["par"],
+            "yards": 380,
+            "stroke_index": 1,
+            "hitting_order": list(hole["rotation_order"]),
+            "teams": {},
+            "betting": {"base_wager": 1, "current_wager": 1, "doubled": False, "redoubled": False},
+            "tee_shots_complete": 0,
+            "partnership_deadline_passed": False,
+            "wagering_closed": False,
+            "hole_complete": False,
+            "balls_in_hole": [],
+            "next_player_to_hit": hole["rotation_order"][0],
+        },
+    }
+
+
+@benchmark("engine.play_golden_round")
+def _play_golden_round():
+    course_manager = golden_course_manager()
+    return lambda: play_golden_round(new_game(course_manager))
+
+
+@memory_benchmark("memory.resident_game")
+def _resident_game():
+    # Course shared across games (as CourseManager's cache is); weigh the game itself.
+    course_manager = _shared_course_manager()
+    return play_golden_round(new_game(course_manager))
+
+
+@cache
+def _shared_course_manager() -> CourseManager:
+    return golden_course_manager()
+
+
+@benchmark("engine.get_game_state")
+def _get_game_state():
+    return play_golden_round(new_game(), holes=9).get_game_state
+
+
+@benchmark("engine.serialize")
+def _serialize():
+    return play_golden_round(new_game(), holes=9)._serialize
+
+
+@benchmark("engine.deserialize")
+def _deserialize():
+    # Round-trip through JSON so the input looks like a game_state row.
+    data = json.loads(json.dumps(play_golden_round(new_game(), holes=9)._serialize()))
+    target = new_game()
+    return lambda: target._deserialize(data)
+
+
+@benchmark("hole_completion.process_complete_hole_x18")
+def _process_complete_hole():
+    requests = golden_requests()
+
+    def complete_round() -> dict[str, Any]:
+        state = scorekeeper_state()
+        for request in requests:
+            process_complete_hole(request, state)
+        return state
+
+    return complete_round
+
+
+@benchmark("hole_completion.replay_player_totals", number=10)
+def _replay_player_totals():
+    state = scorekeeper_state()
+    for request in golden_requests():
+        process_complete_hole(request, state)
+    return lambda: replay_player_totals(state)
+
+
+@benchmark("hole_completion.process_update_hole_12", number=10)
+def _process_update_hole():
+    state = scorekeeper_state()
+    requests = golden_requests()
+    for request in requests:
+        process_complete_hole(request, state)
+    return lambda: process_update_hole(requests[11], state, 12, 11)
+
+
+def _register_odds(player_count: int) -> None:
+    @benchmark(f"odds.real_time_odds_{player_count}p")
+    def _odds():
+        players, hole = odds_inputs(player_count)
+        # A fresh calculator per call: measures the uncached computation.
+        return lambda: OddsCalculator().calculate_real_time_odds(players, hole)
+
+
+for _count in (4, 5, 6):
+    _register_odds(_count)
+
+
+@benchmark("rules.get_valid_actions", number=10)
+def _get_valid_actions():
+    manager = RuleManager.get_instance()
+    state = rules_state()
+    player_ids = [p["id"] for p in state["players"]]
+    return lambda: [manager.get_valid_actions(player_id, state) for player_id in player_ids]
@@ -0,0 +1,241 @@
+"""Minimal timing harness: case registry, runner, JSON baselines and comparison.
+
+A case is a setup function decorated with ``@benchmark``; it builds its
+fixtures and returns the zero-argument callable to time, so setup cost never
+lands in the measurement. Each sample times ``number`` back-to-back calls
+with the garbage collector paused (as ``timeit`` does). Comparisons use the
+fastest sample: noise from other processes only ever adds time, so the
+minimum is the most repeatable figure on a shared machine (the ``timeit``
+docs make the same argument).
+
+Memory cases (``@memory_benchmark``) return the object to measure instead;
+the result is the heap it keeps alive, traced with ``tracemalloc`` from
+before the build to after a collection, smallest of a few builds.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.utils.time import utc_now
+
+DEFAULT_THRESHOLD = 0.25  # flag cases more than 25% slower than baseline
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Any]
+    number: int = 1
+    kind: str = "time"  # "time" | "memory"
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    samples: int
+    number: int
+    min_us: float
+    median_us: float
+    mean_us: float
+    p95_us: float
+
+
+@dataclass(frozen=True)
+class MemoryResult:
+    name: str
+    samples: int
+    bytes: int
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float | None  # µs for timing cases, bytes for memory cases
+    current: float | None
+    status: str  # "ok" | "regression" | "improvement" | "new" | "missing"
+    unit: str = "us"
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+CASES: dict[str, Case] = {}
+
+
+def benchmark(name: str, *, number: int = 1) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Any]]:
+    """Register a case; ``number`` calls are timed together per sample for sub-µs work."""
+
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Any]:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark name: {name}")
+        CASES[name] = Case(name=name, setup=setup, number=number)
+        return setup
+
+    return register
+
+
+def memory_benchmark(name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """Register a memory case; the decorated function builds and returns the object to weigh."""
+
+    def register(build: Callable[[], Any]) -> Callable[[], Any]:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark name: {name}")
+        CASES[name] = Case(name=name, setup=build, kind="memory")
+        return build
+
+    return register
+
+
+def select(pattern: str | None = None) -> list[Case]:
+    """Registered cases whose name contains ``pattern`` (all when None)."""
+    return [case for name, case in sorted(CASES.items()) if not pattern or pattern in name]
+
+
+def run_case(case: Case, samples: int = 30, warmup: int = 3) -> Result | MemoryResult:
+    if case.kind == "memory":
+        return measure_memory(case, samples=min(samples, 5))
+    func = case.setup()
+    for _ in range(warmup):
+        func()
+
+    timings: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            started = time.perf_counter_ns()
+            for _ in range(case.number):
+                func()
+            timings.append((time.perf_counter_ns() - started) / case.number / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    timings.sort()
+    return Result(
+        name=case.name,
+        samples=samples,
+        number=case.number,
+        min_us=round(timings[0], 3),
+        median_us=round(statistics.median(timings), 3),
+        mean_us=round(statistics.fmean(timings), 3),
+        p95_us=round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    )
+
+
+def measure_memory(case: Case, samples: int = 5) -> MemoryResult:
+    """Bytes kept alive by the object ``case`` builds (after one untraced warm-up build)."""
+    case.setup()  # warm import-time and module-level caches outside the trace
+    sizes = []
+    for _ in range(max(samples, 1)):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            kept = case.setup()
+            gc.collect()
+            sizes.append(tracemalloc.get_traced_memory()[0] - before)
+        finally:
+            tracemalloc.stop()
+        del kept
+    return MemoryResult(name=case.name, samples=len(sizes), bytes=min(sizes))
+
+
+def run(cases: Iterable[Case], samples: int = 30, warmup: int = 3) -> dict[str, Any]:
+    """Run ``cases`` and return a baseline-shaped payload."""
+    return {
+        "created_at": utc_now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {case.name: asdict(run_case(case, samples, warmup)) for case in cases},
+    }
+
+
+def save(payload: dict[str, Any], path: Path) -> None:
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare the fastest sample (or retained bytes) per case; above ``1 + threshold`` x baseline regresses."""
+    now, before = current["results"], baseline["results"]
+    comparisons = []
+    for name in sorted(set(now) | set(before)):
+        unit = _unit(now.get(name) or before[name])
+        if name not in before:
+            comparisons.append(Comparison(name, None, _value(now[name]), "new", unit))
+            continue
+        if name not in now:
+            comparisons.append(Comparison(name, _value(before[name]), None, "missing", unit))
+            continue
+        baseline_value, current_value = _value(before[name]), _value(now[name])
+        ratio = current_value / baseline_value if baseline_value else 1.0
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, baseline_value, current_value, status, unit))
+    return comparisons
+
+
+def format_results(payload: dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<44} {'min':>12} {'median':>12} {'p95':>12}"]
+    for name, result in payload["results"].items():
+        if "bytes" in result:
+            lines.append(f"{name:<44} {_bytes(result['bytes']):>12} {'':>12} {'':>12}")
+            continue
+        lines.append(
+            f"{name:<44} {_us(result['min_us']):>12} {_us(result['median_us']):>12} {_us(result['p95_us']):>12}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(comparisons: list[Comparison]) -> str:
+    lines = [f"{'benchmark':<44} {'baseline':>12} {'current':>12} {'change':>8}  status"]
+    for c in comparisons:
+        change = f"{c.change:+.0%}" if c.change is not None else "-"
+        show = _bytes if c.unit == "bytes" else _us
+        baseline = show(c.baseline) if c.baseline is not None else "-"
+        current = show(c.current) if c.current is not None else "-"
+        lines.append(f"{c.name:<44} {baseline:>12} {current:>12} {change:>8}  {c.status}")
+    return "\n".join(lines)
+
+
+def _unit(result: dict[str, Any]) -> str:
+    return "bytes" if "bytes" in result else "us"
+
+
+def _value(result: dict[str, Any]) -> float:
+    return result["bytes"] if "bytes" in result else result["min_us"]
+
+
+def _bytes(value: float) -> str:
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.2f} MiB"
+    return f"{value / 1024:.1f} KiB"
+
+
+def _us(value: float) -> str:
+    if value >= 1000:
+        return f"{value / 1000:.2f} ms"
+    return f"{value:.1f} µs"
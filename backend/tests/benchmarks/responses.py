@@ -0,0 +1,169 @@
+"""JSON response encoding on the API's largest payloads.
+
+``json.game_state.*`` is a plain-dict payload rendered on its own: ``stdlib``
+is ``jsonable_encoder`` + ``JSONResponse``, ``fast`` is ``FastJSONResponse``
+on the raw dict. ``http.game_state.*`` serves the same payload through a full
+ASGI request (routing, threadpool, response) so the encoder's share of a real
+request shows: ``stdlib`` returning the dict from a plain route, ``direct``
+returning ``FastJSONResponse(state)`` (no ``jsonable_encoder`` walk), as the
+hot game endpoints do.
+
+``/data/rounds`` and ``/players/all`` have response models, which FastAPI
+encodes with pydantic's ``dump_json`` (``*.pydantic``, unchanged). The
+``orjson`` case is what they would cost if the app set an explicit
+``default_response_class`` (pydantic to dicts, then orjson), and ``stdlib``
+the same through ``json`` — the reason they stay on pydantic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import cache
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.routers.unified_data import UnifiedRoundResponse
+from app.schemas import PlayerProfileResponse
+from app.utils.fast_json import FastJSONResponse, dumps, orjson, stdlib_dumps
+
+from .engine import new_game, play_golden_round
+from .harness import benchmark
+
+ROUND_COUNT = 1000  # /data/rounds max page size
+PLAYER_COUNT = 250
+
+
+@cache
+def game_state() -> dict[str, Any]:
+    return play_golden_round(new_game()).get_game_state()
+
+
+def unified_rounds() -> list[UnifiedRoundResponse]:
+    return [
+        UnifiedRoundResponse(
+            date="27-Jan",
+            date_sortable=f"2025-01-{i % 28 + 1:02d}",
+            group=f"Group {i % 6}",
+            member=f"Member {i}",
+            score=72 + i % 20,
+            location="Wing Point",
+            duration="4:15" if i % 3 else None,
+            source="sheet" if i % 2 else "app",
+        )
+        for i in range(ROUND_COUNT)
+    ]
+
+
+def player_profiles() -> list[PlayerProfileResponse]:
+    return [
+        PlayerProfileResponse(
+            id=i,
+            name=f"Player {i}",
+            legacy_name=f"Legacy {i}",
+            handicap=4.0 + i % 30,
+            email=f"player{i}@example.com",
+            preferences={"tee": "white", "notifications": {"email": True, "sms": False}},
+            created_at="2025-01-01T08:00:00",
+            last_played="2025-06-01",
+            ghin_id=str(1000000 + i),
+            handicap_source="ghin",
+        )
+        for i in range(PLAYER_COUNT)
+    ]
+
+
+@benchmark("json.game_state.stdlib")
+def _game_state_stdlib():
+    state = game_state()
+    return lambda: stdlib_dumps(state)
+
+
+@benchmark("json.game_state.fast")
+def _game_state_fast():
+    state = game_state()
+    # What the hot game endpoints do: FastJSONResponse on the dict, no jsonable_encoder.
+    return lambda: dumps(state)
+
+
+@cache
+def game_state_app() -> FastAPI:
+    state = game_state()
+    app = FastAPI()
+
+    @app.get("/stdlib")
+    def stdlib_route() -> Any:
+        return state
+
+    @app.get("/direct", response_model=dict[str, Any])
+    def direct_route() -> FastJSONResponse:
+        return FastJSONResponse(state)
+
+    return app
+
+
+@cache
+def _loop() -> asyncio.AbstractEventLoop:
+    return asyncio.new_event_loop()
+
+
+def _get(app: FastAPI, path: str):
+    """One GET through the ASGI app, on a loop kept for the benchmark run."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} answered {message['status']}")
+
+    return lambda: _loop().run_until_complete(app(dict(scope), receive, send))
+
+
+@benchmark("http.game_state.stdlib")
+def _http_stdlib():
+    return _get(game_state_app(), "/stdlib")
+
+
+@benchmark("http.game_state.direct")
+def _http_direct():
+    return _get(game_state_app(), "/direct")
+
+
+def _register_model_payload(name: str, adapter: TypeAdapter, build) -> None:
+    @benchmark(f"json.{name}.stdlib")
+    def _stdlib():
+        value = build()
+        return lambda: stdlib_dumps(adapter.dump_python(value, mode="json"))
+
+    if orjson is not None:
+
+        @benchmark(f"json.{name}.orjson")
+        def _orjson():
+            value = build()
+            return lambda: dumps(adapter.dump_python(value, mode="json"))
+
+    @benchmark(f"json.{name}.pydantic")
+    def _pydantic():
+        value = build()
+        return lambda: adapter.dump_json(value)
+
+
+_register_model_payload("unified_rounds", TypeAdapter(list[UnifiedRoundResponse]), unified_rounds)
+_register_model_payload("players_all", TypeAdapter(list[PlayerProfileResponse]), player_profiles)
@@ -85,3 +85,20 @@ def mock_admin_identity():
     finally:
         app.dependency_overrides.pop(get_current_user, None)
         app.dependency_overrides.pop(get_current_auth0_user, None)
+
+
+@pytest.fixture
+def query_budget():
+    """Factory for ``QueryBudget`` blocks on the app engine (or a given one).
+
+    ``with query_budget(max_queries=10, max_repeats=2): client.get(...)``
+    fails the test when the block exceeds either limit and prints the
+    statement shapes it ran.
+    """
+    from app.database import engine as app_engine
+    from app.observability.queries import QueryBudget
+
+    def _budget(max_queries: int | None = None, max_repeats: int | None = None, engine=None) -> QueryBudget:
+        return QueryBudget(engine or app_engine, max_queries=max_queries, max_repeats=max_repeats)
+
+    return _budget
@@ -5,6 +5,7 @@ import json
 import httpx
 import pytest
 import respx
+from google import genai
 
 from app.services import commissioner_llm_service as llm
 
@@ -39,7 +40,7 @@ async def test_vertex_success(monkeypatch):
     class _Client:
         aio = _Aio()
 
-    monkeypatch.setattr(llm.genai, "Client", lambda **kwargs: _Client())
+    monkeypatch.setattr(genai, "Client", lambda **kwargs: _Client())
     result = await llm.llm_generate(PROMPT, SYSTEM)
     assert "pong" in result
 
@@ -1,20 +1,14 @@
 """Comprehensive tests for advanced Wolf Goat Pig rules."""
 
-from unittest.mock import patch
-
 import pytest
 
+from app.mixins import NullPersistence
 from app.wolf_goat_pig import WGPPlayer, WolfGoatPigGame
 
 
 def _make_game(player_count: int = 4) -> WolfGoatPigGame:
-    """Create a WolfGoatPigGame with DB persistence stubbed out."""
-    with (
-        patch.object(WolfGoatPigGame, "__init_persistence__", lambda self, gid: None),
-        patch.object(WolfGoatPigGame, "_save_to_db", lambda self: None),
-    ):
-        game = WolfGoatPigGame(player_count=player_count)
-    return game
+    """Create a WolfGoatPigGame that never touches the database."""
+    return WolfGoatPigGame(player_count=player_count, persistence=NullPersistence())
 
 
 class TestAdvancedWGPRules:
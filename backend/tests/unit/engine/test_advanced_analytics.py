@@ -0,0 +1,42 @@
+"""Season form in the advanced analytics dashboard (app/engine/analytics.py)."""
+
+import pytest
+
+from app.domain import wgp_handlers_core
+from app.services.statistics_service import StatisticsService
+from tests.benchmarks.engine import new_game
+
+
+def test_season_form_matches_players_by_name():
+    game = new_game()
+    first, second = game.players[:2]
+    results = [{"player_name": first.name, "games": 3, "total_earnings": 12.0}]
+    standings = [{"member": second.name, "rounds": 5, "total_quarters": -4.0}]
+
+    form = game.get_advanced_analytics(results, standings)["season_form"]
+
+    assert form[first.id] == {"name": first.name, "games": results[0], "sheet": None}
+    assert form[second.id] == {"name": second.name, "games": None, "sheet": standings[0]}
+    assert set(form) == {p.id for p in game.players}
+
+
+@pytest.mark.asyncio
+async def test_handler_loads_this_seasons_aggregations(monkeypatch):
+    game = new_game()
+    player = game.players[0]
+    seasons = []
+
+    def results(self, season):
+        seasons.append(season)
+        return [{"player_name": player.name, "games": 2}]
+
+    monkeypatch.setattr(StatisticsService, "get_season_player_results", results)
+    monkeypatch.setattr(StatisticsService, "get_season_standings", lambda self, season: [])
+
+    response = await wgp_handlers_core.handle_get_advanced_analytics(game, {})
+
+    assert response.game_state["analytics"]["season_form"][player.id]["games"] == {
+        "player_name": player.name,
+        "games": 2,
+    }
+    assert seasons == [wgp_handlers_core.current_season()]
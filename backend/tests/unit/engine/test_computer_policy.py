@@ -0,0 +1,107 @@
+"""Precomputed computer-player policy table (app/domain/computer_policy.py)."""
+
+import random
+from itertools import product
+
+import pytest
+
+from app.domain import computer_policy as cp
+from app.domain.computer_policy import PERSONALITIES, ComputerPolicy, Situation, build_table, encode
+from app.domain.game_types import GamePhase, TeamFormation
+from tests.benchmarks.engine import new_game
+
+
+def test_committed_table_matches_the_generator():
+    assert cp.POLICY_PATH.read_bytes() == encode(*build_table())
+
+
+def test_lookups_return_the_generated_rates():
+    policy = cp.computer_policy()
+    axes = policy.axes
+    shape = (axes.phases, axes.holes, axes.wagers, axes.standings, axes.spreads)
+    for name, decision in product(PERSONALITIES, cp.DECISIONS):
+        for index in product(*map(range, shape)):
+            situation = Situation(*index)
+            expected = round(cp._rate(PERSONALITIES[name], decision, situation) * 255) / 255
+            assert policy.probability(name, decision, situation) == expected
+
+
+def test_situation_quantization():
+    situation = Situation.of(GamePhase.HOEPFINGER, hole=17, wager=5, standing=-8, spread=0.5)
+
+    assert situation == Situation(phase=2, hole=16, wager=2, standing=0, spread=2)
+    assert Situation.of(GamePhase.REGULAR, hole=1, wager=64, standing=9, spread=-12) == Situation(0, 0, 3, 4, 0)
+
+
+def test_personalities_order_as_described():
+    policy = cp.computer_policy()
+    even = Situation.of(GamePhase.REGULAR, hole=5, wager=1, standing=0, spread=0)
+    behind = Situation.of(GamePhase.REGULAR, hole=5, wager=1, standing=-10, spread=0)
+
+    assert policy.probability("aggressive", "offer_double", even) > policy.probability(
+        "conservative", "offer_double", even
+    )
+    assert policy.probability("strategic", "go_solo", behind) > policy.probability("strategic", "go_solo", even)
+    assert policy.probability("reckless", "go_solo", even) == policy.probability("balanced", "go_solo", even)
+
+
+def test_decode_rejects_a_foreign_file():
+    with pytest.raises(ValueError, match="Not a computer policy table"):
+        ComputerPolicy.decode(b"not a table")
+
+
+@pytest.fixture
+def game():
+    game = new_game()
+    game.set_computer_players([p.id for p in game.players], ["aggressive", "conservative", "balanced", "strategic"])
+    return game
+
+
+@pytest.mark.parametrize("decision", ["go_solo", "use_float", "offer_double"])
+def test_engine_decisions_draw_against_the_table(game, decision, monkeypatch):
+    captain = game.hole_states[game.current_hole].teams.captain
+    probability = game.decision_probability(decision, captain)
+    should = getattr(game, f"should_{decision}")
+
+    monkeypatch.setattr(random, "random", lambda: probability - 0.001)
+    assert should() is True
+    monkeypatch.setattr(random, "random", lambda: probability + 0.001)
+    assert should({}, player_id=captain) is False
+
+
+def test_double_is_answered_by_the_doubled_side(game, monkeypatch):
+    hole_state = game.hole_states[game.current_hole]
+    captain, *others = hole_state.hitting_order
+    hole_state.teams = TeamFormation(type="partners", captain=captain, team1=[captain, others[0]], team2=others[1:])
+    hole_state.betting.doubles_history.append({"offering_player": captain, "target_team": None, "wager_before": 1})
+    responder = others[1]
+    probability = game.decision_probability("accept_double", responder)
+    assert probability != game.decision_probability("accept_double", captain)
+
+    monkeypatch.setattr(random, "random", lambda: probability - 0.001)
+    assert game.should_accept_double() is True
+    monkeypatch.setattr(random, "random", lambda: probability + 0.001)
+    assert game.should_accept_double() is False
+
+    hole_state.betting.doubles_history.append({"offering_player": responder, "target_team": None, "wager_before": 2})
+    assert game._double_responder() == captain
+
+
+def test_accepting_a_double_needs_teams_or_a_player(game):
+    with pytest.raises(ValueError, match="pass player_id"):
+        game.should_accept_double()
+
+
+def test_computer_partner_answers_from_the_table(game, monkeypatch):
+    captain = game.hole_states[game.current_hole].teams.captain
+    partner = next(
+        pid
+        for pid in game.hole_states[game.current_hole].hitting_order
+        if pid != captain and game._is_player_eligible_for_partnership(pid, game.hole_states[game.current_hole])
+    )
+    monkeypatch.setattr(random, "random", lambda: 0.0)
+
+    result = game.human_requests_partner(captain, partner)
+
+    assert result["computer_response"].endswith("accepts your partnership request!")
+    assert game.hole_states[game.current_hole].teams.type == "partners"
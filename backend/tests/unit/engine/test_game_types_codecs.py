@@ -0,0 +1,81 @@
+"""Hand-written to_dict/from_dict codecs on the slots-based domain types.
+
+The codecs replaced ``dataclasses.asdict`` in game serialization, so their
+output must keep asdict's shape and round-trip every field of a real game.
+"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from app.domain.game_types import BettingState, HoleState, Player, TeamFormation, TimelineEvent
+from app.utils.time import utc_now
+from tests.benchmarks.engine import new_game, play_golden_round
+
+
+@pytest.fixture(scope="module")
+def game():
+    return play_golden_round(new_game(), holes=9)
+
+
+def test_types_use_slots(game):
+    for obj in (game.players[0], game.hole_states[1], game.hole_states[1].teams, game.hole_states[1].betting):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_to_dict_matches_asdict_shape(game):
+    for player in game.players:
+        assert player.to_dict() == asdict(player)
+    for hole_state in game.hole_states.values():
+        assert hole_state.to_dict() == asdict(hole_state)
+
+
+def test_hole_state_round_trips_through_json(game):
+    for number, hole_state in game.hole_states.items():
+        data = json.loads(json.dumps(hole_state.to_dict()))
+        assert HoleState.from_dict(data, hole_number=number) == hole_state
+
+
+def test_to_dict_does_not_alias_state(game):
+    hole_state = game.hole_states[1]
+    data = hole_state.to_dict()
+
+    data["hitting_order"].append("intruder")
+    data["teams"]["team1"].append("intruder")
+    data["scores"]["intruder"] = 1
+
+    assert "intruder" not in hole_state.hitting_order
+    assert "intruder" not in hole_state.teams.team1
+    assert "intruder" not in hole_state.scores
+
+
+def test_from_dict_fills_defaults_for_older_states():
+    hole_state = HoleState.from_dict({"hitting_order": ["a", "b"], "teams": {}, "betting": {}}, hole_number=3)
+
+    assert hole_state.hole_number == 3
+    assert hole_state.teams == TeamFormation(type="pending")
+    assert hole_state.betting == BettingState()
+    assert hole_state.hole_par == 4
+    assert hole_state.conceded is False
+    assert Player.from_dict({"id": "p1", "name": "Pat", "handicap": 10}) == Player(id="p1", name="Pat", handicap=10)
+
+
+def test_flush_fields_survive_a_save(game):
+    hole_state = HoleState.from_dict(game.hole_states[1].to_dict())
+    hole_state.status = "completed"
+    hole_state.conceded = True
+    hole_state.conceding_player = "p2"
+
+    restored = HoleState.from_dict(json.loads(json.dumps(hole_state.to_dict())))
+
+    assert (restored.status, restored.conceded, restored.conceding_player) == ("completed", True, "p2")
+
+
+def test_timeline_event_round_trip():
+    event = TimelineEvent(id="event_1", timestamp=utc_now(), type="shot", description="Tee shot", player_id="p1")
+
+    data = event.to_dict()
+
+    assert data["timestamp"] == event.timestamp.isoformat()
+    assert TimelineEvent.from_dict(json.loads(json.dumps(data))) == event
@@ -6,13 +6,15 @@ random stroke index. Handicap strokes for the hole were therefore unrelated to
 the course being played, and disagreed with the scorecard's stroke allocation.
 """
 
+import json
 from types import SimpleNamespace
-from unittest.mock import patch
 
 import pytest
 
 from app.domain.game_types import Player
-from app.state.course_manager import CourseManager
+from app.mixins import NullPersistence
+from app.state import course_manager
+from app.state.course_manager import CourseManager, CourseSnapshot
 from app.wolf_goat_pig import WolfGoatPigGame
 
 # hole_number, par, yards, stroke index (Wing Point front nine)
@@ -22,6 +24,9 @@ COURSE_HOLES = [
     (3, 4, 310, 1),
 ]
 
+# Not a real course id, so the shared snapshot cache never holds it
+COURSE_ID = 9001
+
 PLAYERS = [
     Player(id="p1", name="Mark", handicap=11.0),
     Player(id="p2", name="Hart", handicap=9.0),
@@ -38,8 +43,10 @@ def make_course_manager() -> CourseManager:
     ]
     manager = CourseManager()
     manager.selected_course_name = "Test Course"
-    manager.selected_course_id = 1
-    manager._course_cache[1] = SimpleNamespace(id=1, name="Test Course", holes=holes)
+    manager.selected_course_id = COURSE_ID
+    manager._course_cache[COURSE_ID] = CourseSnapshot.from_course(
+        SimpleNamespace(id=COURSE_ID, name="Test Course", holes=holes)
+    )
     return manager
 
 
@@ -68,11 +75,9 @@ class TestGetHoleInfo:
 
 class TestHoleSetupUsesCourseData:
     def _make_game(self) -> WolfGoatPigGame:
-        with (
-            patch.object(WolfGoatPigGame, "__init_persistence__", lambda self, gid: None),
-            patch.object(WolfGoatPigGame, "_save_to_db", lambda self: None),
-        ):
-            return WolfGoatPigGame(player_count=4, players=list(PLAYERS), course_manager=make_course_manager())
+        return WolfGoatPigGame(
+            player_count=4, players=list(PLAYERS), course_manager=make_course_manager(), persistence=NullPersistence()
+        )
 
     def test_hole_state_matches_the_course(self):
         hole_state = self._make_game().hole_states[1]
@@ -95,3 +100,123 @@ class TestHoleSetupUsesCourseData:
         assert advantages["p2"].strokes_received == 0.0
         assert advantages["p3"].strokes_received == 0.5
         assert advantages["p4"].strokes_received == 0.5
+
+
+class TestCourseSnapshot:
+    def _snapshot(self) -> CourseSnapshot:
+        return make_course_manager().get_selected_snapshot()
+
+    def test_holes_are_indexed_by_hole_number(self):
+        snapshot = self._snapshot()
+
+        assert snapshot.hole(3).par == 4
+        assert snapshot.pars == (5, 3, 4)
+        assert snapshot.handicaps == (5, 15, 1)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self._snapshot()
+
+        with pytest.raises(AttributeError):
+            snapshot.name = "Other Course"
+        with pytest.raises(AttributeError):
+            snapshot.hole(1).par = 3
+
+    def test_game_keeps_its_snapshot_when_the_manager_changes(self):
+        manager = make_course_manager()
+        game = WolfGoatPigGame(
+            player_count=4, players=list(PLAYERS), course_manager=manager, persistence=NullPersistence()
+        )
+
+        refreshed = SimpleNamespace(
+            id=COURSE_ID,
+            name="Test Course",
+            holes=[SimpleNamespace(hole_number=1, par=4, yards=380, handicap=7, description="")],
+        )
+        manager._course_cache[COURSE_ID] = CourseSnapshot.from_course(refreshed, version=2)
+
+        assert game.course_snapshot.version == 1
+        assert game._get_course_hole_info(1)["par"] == 5
+        assert manager.get_hole_info(1)["par"] == 4
+
+
+class TestSharedSnapshotTTL:
+    def _course(self, par: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=991,
+            name="TTL Course",
+            holes=[SimpleNamespace(hole_number=1, par=par, yards=380, handicap=7, description="")],
+        )
+
+    def test_shared_snapshot_expires_after_the_ttl(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(course_manager.time, "monotonic", lambda: clock[0])
+        course_manager._register_snapshot(self._course(par=4))
+        try:
+            assert course_manager._fresh_snapshot(991).hole(1).par == 4
+
+            clock[0] += course_manager._SNAPSHOT_TTL
+            assert course_manager._fresh_snapshot(991) is None
+        finally:
+            course_manager.invalidate_course_cache(991)
+
+    def test_pinned_selection_outlives_the_shared_ttl(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(course_manager.time, "monotonic", lambda: clock[0])
+        manager = make_course_manager()
+        clock[0] += course_manager._SNAPSHOT_TTL * 10
+
+        assert manager.get_selected_snapshot().hole(1).par == 5
+
+    def test_loaded_selection_follows_updates_from_other_managers(self):
+        course_manager._register_snapshot(self._course(par=4))
+        try:
+            manager = CourseManager()
+            assert manager.load_course("TTL Course")
+
+            # An admin edit elsewhere refreshes the shared cache
+            course_manager._register_snapshot(self._course(par=5))
+
+            assert manager.get_selected_snapshot().hole(1).par == 5
+        finally:
+            course_manager.invalidate_course_cache(991)
+
+    def test_invalidated_selection_is_reloaded(self, monkeypatch):
+        course_manager._register_snapshot(self._course(par=4))
+        try:
+            manager = CourseManager()
+            assert manager.load_course("TTL Course")
+
+            reloaded = self._course(par=6)
+
+            def reload(manager, course_id):
+                manager._course_cache[course_id] = course_manager._register_snapshot(reloaded)
+                return True
+
+            monkeypatch.setattr(CourseManager, "refresh_course", reload)
+            course_manager.invalidate_course_cache(991)
+
+            assert manager.get_selected_snapshot().hole(1).par == 6
+        finally:
+            course_manager.invalidate_course_cache(991)
+
+
+class TestSnapshotPersistence:
+    def test_restored_game_keeps_its_saved_snapshot(self):
+        game = WolfGoatPigGame(
+            player_count=4, players=list(PLAYERS), course_manager=make_course_manager(), persistence=NullPersistence()
+        )
+        data = json.loads(json.dumps(game._serialize()))
+
+        # The course has since changed, and the restoring manager has the new version
+        manager = make_course_manager()
+        changed = SimpleNamespace(
+            id=COURSE_ID, name="Test Course", holes=[SimpleNamespace(hole_number=1, par=3, yards=150, handicap=9)]
+        )
+        manager._course_cache[COURSE_ID] = CourseSnapshot.from_course(changed, version=2)
+        restored = WolfGoatPigGame(
+            player_count=4, players=list(PLAYERS), course_manager=manager, persistence=NullPersistence()
+        )
+        restored._deserialize(data)
+
+        assert restored.course_snapshot == game.course_snapshot
+        assert restored._get_course_hole_info(1)["par"] == 5
@@ -0,0 +1,130 @@
+"""PersistenceMixin storage backends (app/mixins/persistence_backends.py).
+
+The engine picks its backend at construction: the database by default,
+a dict for tests and what-if tools, or nothing at all for batch simulation.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import database
+from app.database import Base
+from app.mixins import DatabasePersistence, InMemoryPersistence, PersistenceBackend
+from app.models import GamePlayerResult, GameRecord, GameStateModel
+from app.wolf_goat_pig import WolfGoatPigGame
+from tests.benchmarks.engine import golden_course_manager, new_game, play_golden_round
+
+
+def _game(persistence, game_id="game-1"):
+    return WolfGoatPigGame(
+        game_id=game_id, player_count=4, course_manager=golden_course_manager(), persistence=persistence
+    )
+
+
+@pytest.fixture
+def no_database(monkeypatch):
+    def _refuse():
+        raise AssertionError("engine opened a database session")
+
+    monkeypatch.setattr(database, "SessionLocal", _refuse)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def test_null_persistence_never_serializes_or_touches_the_database(no_database, monkeypatch):
+    monkeypatch.setattr(WolfGoatPigGame, "_serialize", lambda self: pytest.fail("state was serialized"))
+
+    game = play_golden_round(new_game(), holes=3)
+
+    assert game.complete_game() == f"Game {game.game_id} completed successfully"
+    assert game._game_completed is True
+    game.close_db_session()
+
+
+def test_in_memory_round_trip(no_database):
+    store = InMemoryPersistence()
+    game = play_golden_round(
+        WolfGoatPigGame(
+            game_id="game-1",
+            player_count=4,
+            players=new_game().players,
+            course_manager=golden_course_manager(),
+            persistence=store,
+        ),
+        holes=3,
+    )
+    game._save_to_db()
+
+    reloaded = _game(store)
+
+    assert reloaded._loaded_from_db is True
+    assert reloaded._game_start_time == game._game_start_time
+    assert {p.id: p.points for p in reloaded.players} == {p.id: p.points for p in game.players}
+    assert reloaded.current_hole == game.current_hole
+
+
+def test_in_memory_states_are_copies(no_database):
+    store = InMemoryPersistence()
+    game = _game(store)
+
+    store.load("game-1").state["players"].clear()
+
+    assert store.load("game-1").state["players"]
+    assert len(_game(store).players) == len(game.players)
+
+
+def test_in_memory_records_completion(no_database):
+    store = InMemoryPersistence()
+    game = _game(store)
+
+    assert game.complete_game() == "Game game-1 completed successfully"
+    assert game.complete_game() == "Game already completed"
+
+    record = store.completed["game-1"]
+    assert record["game_mode"] == "wolf_goat_pig"
+    assert len(record["player_results"]) == 4
+
+
+def test_backend_must_implement_every_operation():
+    class LoadOnly(PersistenceBackend):
+        def load(self, game_id):
+            return None
+
+    with pytest.raises(TypeError, match="record_completion"):
+        LoadOnly()
+
+
+def test_database_persistence_is_the_default(session_factory, monkeypatch):
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+
+    game = WolfGoatPigGame(game_id="db-game", player_count=4, course_manager=golden_course_manager())
+    game.complete_game()
+    game.close_db_session()
+
+    session = session_factory()
+    row = session.query(GameStateModel).filter_by(game_id="db-game").one()
+    assert row.created_at == game._game_start_time
+    assert row.state["current_hole"] == 1
+    assert session.query(GameRecord).filter_by(game_id="db-game").count() == 1
+    assert session.query(GamePlayerResult).count() == 4
+
+
+def test_database_save_failure_rolls_back_and_game_continues(session_factory, capsys):
+    backend = DatabasePersistence(session_factory)
+    game = _game(backend, game_id="db-game")
+    rollbacks = []
+    backend.session.rollback = lambda: rollbacks.append(True)
+    backend.session.commit = lambda: (_ for _ in ()).throw(RuntimeError("db down"))
+
+    game._save_to_db()
+
+    assert rollbacks == [True]
+    assert "Database save failed for game db-game: db down" in capsys.readouterr().out
+    assert game.current_hole == 1
@@ -0,0 +1,72 @@
+"""Headless self-play batches (app/self_play.py)."""
+
+import random
+
+import pytest
+
+from app import database
+from app.self_play import PERSONALITIES, SelfPlayConfig, read_holes, run_batch, simulate_round, simulate_score
+
+
+@pytest.fixture(autouse=True)
+def no_database(monkeypatch):
+    def _refuse():
+        raise AssertionError("self-play opened a database session")
+
+    monkeypatch.setattr(database, "SessionLocal", _refuse)
+
+
+@pytest.mark.parametrize("player_count", [4, 5, 6])
+def test_round_plays_eighteen_holes(player_count):
+    holes = simulate_round(random.Random(1), [PERSONALITIES["balanced"]] * player_count)
+
+    assert [h.hole for h in holes] == list(range(1, 19))
+    assert all(len(h.scores) == len(h.points) == player_count for h in holes)
+    assert all(h.team_type in ("partners", "solo") for h in holes)
+
+
+def test_batch_writes_every_hole_and_matches_summary(tmp_path):
+    summary = run_batch(SelfPlayConfig(rounds=7, chunk_size=3, seed=5), tmp_path, workers=1)
+    rows = list(read_holes(tmp_path))
+
+    assert (summary.rounds, summary.holes, len(summary.files)) == (7, 7 * 18, 3)
+    assert sorted({r["round"] for r in rows}) == list(range(7))
+    assert summary.solo_holes == sum(r["team_type"] == "solo" for r in rows)
+    by_personality: dict[str, int] = {}
+    for row in rows:
+        for name, points in zip(row["personalities"], row["points"], strict=True):
+            by_personality[name] = by_personality.get(name, 0) + points
+    assert by_personality == summary.points_by_personality
+
+
+def test_batch_is_reproducible_across_worker_counts(tmp_path):
+    config = SelfPlayConfig(rounds=4, chunk_size=2, seed=11, player_counts=(4, 6))
+
+    run_batch(config, tmp_path / "serial", workers=1)
+    run_batch(config, tmp_path / "pool", workers=2)
+
+    assert list(read_holes(tmp_path / "serial")) == list(read_holes(tmp_path / "pool"))
+
+
+def test_personalities_shape_decisions(tmp_path):
+    def doubles_per_hole(name):
+        run_batch(SelfPlayConfig(rounds=20, personalities=(name,), player_counts=(4,)), tmp_path / name, workers=1)
+        rows = list(read_holes(tmp_path / name))
+        return sum(r["doubles"] for r in rows) / len(rows)
+
+    assert doubles_per_hole("aggressive") > doubles_per_hole("conservative")
+
+
+def test_score_model_gives_strokes_on_hard_holes():
+    rng = random.Random(0)
+    hardest = sum(simulate_score(rng, 18, 4, 1) for _ in range(2000)) / 2000
+    scratch = sum(simulate_score(rng, 0, 4, 1) for _ in range(2000)) / 2000
+
+    assert hardest == pytest.approx(scratch + 1, abs=0.15)
+
+
+def test_config_rejects_unknown_settings():
+    with pytest.raises(ValueError, match="Unknown personalities"):
+        SelfPlayConfig(rounds=1, personalities=("reckless",))
+    with pytest.raises(ValueError, match="4, 5, or 6"):
+        SelfPlayConfig(rounds=1, player_counts=(3,))
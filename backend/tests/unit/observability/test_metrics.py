@@ -0,0 +1,171 @@
+"""Unit tests for the request/DB metrics middleware and Prometheus rendering."""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.database import run_db
+from app.main import app as main_app
+from app.observability.metrics import MetricsMiddleware, MetricsRegistry, instrument_engine
+from app.utils.admin_auth import require_admin
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(metrics, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    instrument_engine(engine, metrics)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id, "padding": "x" * 100}
+
+    @app.get("/async-items")
+    async def read_async():
+        def query() -> int:
+            with engine.connect() as conn:
+                return conn.execute(text("SELECT 2")).scalar_one()
+
+        return {"value": await run_db(query)}
+
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    yield TestClient(app)
+    engine.dispose()
+
+
+def _sample(rendered: str, prefix: str) -> str:
+    return next(line.rsplit(" ", 1)[1] for line in rendered.splitlines() if line.startswith(prefix))
+
+
+def test_requests_are_labelled_by_route_template(client, metrics):
+    client.get("/items/1")
+    client.get("/items/2")
+
+    rendered = metrics.render()
+
+    assert 'wgp_http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2' in rendered
+    assert _sample(rendered, 'wgp_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"}') == "2"
+
+
+def test_sync_route_queries_are_charged_to_the_request(client, metrics):
+    client.get("/items/1")
+
+    rendered = metrics.render()
+
+    assert 'wgp_http_request_db_queries_bucket{method="GET",route="/items/{item_id}",le="2"} 0' in rendered
+    assert 'wgp_http_request_db_queries_bucket{method="GET",route="/items/{item_id}",le="5"} 1' in rendered
+    assert _sample(rendered, 'wgp_http_request_db_queries_sum{method="GET",route="/items/{item_id}"}') == "3"
+
+
+def test_run_db_queries_are_charged_to_the_request(client, metrics):
+    client.get("/async-items")
+
+    assert _sample(metrics.render(), 'wgp_http_request_db_queries_sum{method="GET",route="/async-items"}') == "1"
+
+
+def test_response_size_and_unmatched_routes(client, metrics):
+    response = client.get("/items/7")
+    client.get("/nope/123")
+
+    rendered = metrics.render()
+
+    size = _sample(rendered, 'wgp_http_response_size_bytes_sum{method="GET",route="/items/{item_id}"}')
+    assert int(size) == len(response.content)
+    assert 'wgp_http_requests_total{method="GET",route="(unmatched)",status="404"} 1' in rendered
+    assert "wgp_http_requests_in_flight 0" in rendered
+
+
+def test_queries_outside_requests_only_count_towards_totals(metrics, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'background.db'}")
+    instrument_engine(engine, metrics)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine.dispose()
+
+    rendered = metrics.render()
+
+    assert "wgp_db_queries_total 1" in rendered
+    assert not any(line.startswith("wgp_http_request_db_queries_") for line in rendered.splitlines())
+
+
+def test_metrics_endpoint_requires_admin():
+    client = TestClient(main_app)
+
+    assert client.get("/metrics").status_code in (401, 403)
+
+    main_app.dependency_overrides[require_admin] = lambda: {"email": "admin@example.com"}
+    try:
+        response = client.get("/metrics")
+    finally:
+        main_app.dependency_overrides.pop(require_admin, None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE wgp_http_request_duration_seconds histogram" in response.text
+
+
+def test_slow_queries_are_logged_by_fingerprint_per_route(metrics, tmp_path, caplog):
+    engine = create_engine(f"sqlite:///{tmp_path / 'slow.db'}")
+    instrument_engine(engine, metrics, slow_query_ms=0)
+    app = FastAPI()
+
+    @app.get("/games/{game_id}")
+    def read_game(game_id: str):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :id"), {"id": game_id})
+        return {}
+
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    client = TestClient(app)
+
+    with caplog.at_level("WARNING", logger="app.observability.metrics"):
+        client.get("/games/a")
+        client.get("/games/b")
+    engine.dispose()
+
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Slow query")]
+    assert len(slow) == 2
+    assert slow[-1].endswith("on GET /games/{game_id} (2 slow on this route): SELECT ?")
+    assert 'wgp_db_slow_queries_total{method="GET",route="/games/{game_id}"} 2' in metrics.render()
+
+
+def test_fast_queries_are_not_sampled(metrics, tmp_path, caplog):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fast.db'}")
+    instrument_engine(engine, metrics, slow_query_ms=60_000)
+
+    with caplog.at_level("WARNING", logger="app.observability.metrics"), engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert metrics.slow_queries == {}
+    assert not caplog.records
+
+
+def test_failed_statement_does_not_skew_later_timings(metrics, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'failing.db'}")
+    instrument_engine(engine, metrics)
+    with engine.connect() as conn:
+        with pytest.raises(Exception, match="no such table"):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.rollback()
+        time.sleep(0.2)
+        conn.execute(text("SELECT 1"))
+        assert "query_started" not in conn.info
+    engine.dispose()
+
+    rendered = metrics.render()
+
+    assert "wgp_db_queries_total 1" in rendered
+    # Only the successful statement is timed, not the gap since the failure.
+    assert float(_sample(rendered, "wgp_db_query_seconds_total")) < 0.2
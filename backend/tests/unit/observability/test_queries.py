@@ -0,0 +1,76 @@
+"""Unit tests for statement fingerprints and the query budget."""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.observability.queries import QueryBudgetExceededError, fingerprint
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'budget.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE game_players (id INTEGER PRIMARY KEY, game_id TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "SELECT count(*) FROM game_players WHERE game_players.game_id = ?",
+            "SELECT count(*) FROM game_players WHERE game_players.game_id = ?",
+        ),
+        ("SELECT * FROM t1 WHERE name = 'O''Brien' AND id = 42", "SELECT * FROM t1 WHERE name = ? AND id = ?"),
+        ("SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s, %(id_3)s)", "SELECT * FROM t WHERE id IN (?)"),
+        ("INSERT INTO t (a, b) VALUES (:a, :b)", "INSERT INTO t (a, b) VALUES (?)"),
+        ("SELECT x::text\n   FROM t LIMIT 10 OFFSET $1", "SELECT x::text FROM t LIMIT ? OFFSET ?"),
+    ],
+)
+def test_fingerprint_collapses_values(statement, expected):
+    assert fingerprint(statement) == expected
+
+
+def test_fingerprint_matches_across_ids():
+    assert fingerprint("SELECT * FROM t WHERE id IN (1, 2)") == fingerprint("SELECT * FROM t WHERE id IN (3, 4, 5)")
+
+
+def test_budget_passes_within_limits(query_budget, engine):
+    with query_budget(max_queries=3, max_repeats=2, engine=engine) as budget, engine.connect() as conn:
+        conn.execute(text("SELECT count(*) FROM game_players WHERE game_id = 'a'"))
+        conn.execute(text("SELECT count(*) FROM game_players WHERE game_id = 'b'"))
+
+    assert budget.count == 2
+    assert len(budget.shapes) == 1
+
+
+def test_budget_fails_on_total(query_budget, engine):
+    with (
+        pytest.raises(QueryBudgetExceededError, match="3 queries \\(budget 2\\)"),
+        query_budget(max_queries=2, engine=engine),
+        engine.connect() as conn,
+    ):
+        for statement in ("SELECT 1", "SELECT 2", "SELECT count(*) FROM game_players"):
+            conn.execute(text(statement))
+
+
+def test_budget_fails_on_repeated_shape(query_budget, engine):
+    with (
+        pytest.raises(QueryBudgetExceededError) as excinfo,
+        query_budget(max_repeats=3, engine=engine),
+        engine.connect() as conn,
+    ):
+        for game_id in range(5):
+            conn.execute(text("SELECT count(*) FROM game_players WHERE game_id = :id"), {"id": str(game_id)})
+
+    assert "5x (limit 3): SELECT count(*) FROM game_players WHERE game_id = ?" in str(excinfo.value)
+
+
+def test_budget_stops_listening_after_block(query_budget, engine):
+    with query_budget(engine=engine) as budget, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert budget.count == 1
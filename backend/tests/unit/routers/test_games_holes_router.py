@@ -367,3 +367,137 @@ class TestDeleteHole:
         # Hole 2 is gone — deleting again returns 404; hole 1 still deletable
         assert client.delete(f"/games/{game_id}/holes/2").status_code == 404
         assert client.delete(f"/games/{game_id}/holes/1").status_code == 200
+
+    def test_delete_and_upsert_refresh_running_totals(self):
+        game_id, slots = _setup_started_game()
+        _post_scores(
+            game_id,
+            {
+                "hole_quarters": {
+                    "1": {slots[0]: 2, slots[1]: -2, slots[2]: 0, slots[3]: 0},
+                    "2": {slots[0]: 1, slots[1]: 0, slots[2]: -1, slots[3]: 0},
+                    "3": {slots[0]: 0, slots[1]: 3, slots[2]: -3, slots[3]: 0},
+                },
+                "current_hole": 3,
+            },
+        )
+
+        assert client.delete(f"/games/{game_id}/holes/1").status_code == 200
+        history = client.get(f"/games/{game_id}/state").json()["hole_history"]
+        assert history[0]["running_totals"] == {slots[0]: 1, slots[1]: 0, slots[2]: -1, slots[3]: 0}
+        assert history[1]["running_totals"] == {slots[0]: 1, slots[1]: 3, slots[2]: -4, slots[3]: 0}
+
+        # Re-scoring hole 2 must carry through to hole 3's prefix
+        _post_scores(game_id, {"hole_quarters": {"2": {slots[0]: -2, slots[1]: 2, slots[2]: 0, slots[3]: 0}}})
+        state = client.get(f"/games/{game_id}/state").json()
+        assert state["hole_history"][1]["running_totals"] == {slots[0]: -2, slots[1]: 5, slots[2]: -3, slots[3]: 0}
+        assert {p["id"]: p["total_points"] for p in state["players"]} == state["hole_history"][1]["running_totals"]
+
+
+# ── Optimistic concurrency on game_state ─────────────────────────────────────
+
+
+class TestGameStateConcurrency:
+    def test_scores_merge_with_holes_saved_by_another_scorekeeper(self):
+        game_id, slots = _setup_started_game()
+        _post_scores(game_id, {"hole_quarters": {"1": {slots[0]: 2, slots[1]: -2, slots[2]: 0, slots[3]: 0}}})
+
+        resp = _post_scores(game_id, {"hole_quarters": {"2": {slots[0]: 1, slots[1]: 0, slots[2]: -1, slots[3]: 0}}})
+
+        assert resp.json()["standings"][slots[0]] == 3
+        state = client.get(f"/games/{game_id}/state").json()
+        assert [h["hole"] for h in state["hole_history"]] == [1, 2]
+
+    def test_conflicting_write_is_retried_not_lost(self):
+        from app.database import SessionLocal
+        from app.db_helpers import commit_with_optimistic_retry
+        from app.models import GameStateModel
+
+        game_id, _slots = _setup_started_game()
+        ours, theirs = SessionLocal(), SessionLocal()
+        try:
+            attempts = []
+
+            def apply():
+                game = ours.query(GameStateModel).filter_by(game_id=game_id).one()
+                game.state = {**game.state, "ours": True}
+                if not attempts:
+                    # Another writer commits between our read and our write.
+                    other = theirs.query(GameStateModel).filter_by(game_id=game_id).one()
+                    other.state = {**other.state, "theirs": True}
+                    theirs.commit()
+                attempts.append(game.version)
+                return game
+
+            game = commit_with_optimistic_retry(ours, apply)
+
+            assert len(attempts) == 2
+            assert game.state["ours"] is True
+            assert game.state["theirs"] is True
+        finally:
+            ours.close()
+            theirs.close()
+
+    def test_conflict_surfaces_after_max_attempts(self):
+        from sqlalchemy.orm.exc import StaleDataError
+
+        from app.database import SessionLocal
+        from app.db_helpers import commit_with_optimistic_retry
+        from app.models import GameStateModel
+
+        game_id, _slots = _setup_started_game()
+        ours, theirs = SessionLocal(), SessionLocal()
+        try:
+
+            def apply():
+                game = ours.query(GameStateModel).filter_by(game_id=game_id).one()
+                game.state = {**game.state, "ours": True}
+                other = theirs.query(GameStateModel).filter_by(game_id=game_id).one()
+                other.state = {**other.state, "bump": (other.state.get("bump") or 0) + 1}
+                theirs.commit()
+
+            with pytest.raises(StaleDataError):
+                commit_with_optimistic_retry(ours, apply, max_attempts=2)
+        finally:
+            ours.close()
+            theirs.close()
+
+
+# ── POST /games/{game_id}/what-if ────────────────────────────────────────────
+
+
+class TestWhatIf:
+    def test_replays_recorded_holes_without_saving(self):
+        game_id, slots = _setup_started_game()
+        a, b, c, d = slots
+        _post_scores(
+            game_id,
+            {
+                "hole_quarters": {"1": {a: 1, b: 1, c: -1, d: -1}},
+                "optional_details": {
+                    "1": {
+                        "teams": {"type": "partners", "team1": [a, b], "team2": [c, d]},
+                        "winner": "team1",
+                        "wager": 1,
+                        "gross_scores": {a: 4, b: 5, c: 5, d: 6},
+                    }
+                },
+            },
+        )
+
+        resp = client.post(
+            f"/games/{game_id}/what-if",
+            json={"scenarios": [{"label": "solo", "changes": [{"hole_number": 1, "decision": "solo"}]}]},
+        )
+
+        assert resp.status_code == 200
+        (scenario,) = resp.json()["scenarios"]
+        assert scenario["totals"] == {a: 3, b: -1, c: -1, d: -1}
+        state = client.get(f"/games/{game_id}/state").json()
+        assert state["hole_history"][0]["points_delta"] == {a: 1, b: 1, c: -1, d: -1}
+
+    def test_unknown_game_returns_404(self):
+        resp = client.post(
+            "/games/nope/what-if", json={"scenarios": [{"changes": [{"hole_number": 1, "decision": "solo"}]}]}
+        )
+        assert resp.status_code == 404
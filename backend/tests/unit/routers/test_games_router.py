@@ -1,5 +1,6 @@
 """Unit tests for games router — create, join, lobby, list, delete, complete."""
 
+import json
 import uuid
 
 import pytest
@@ -274,6 +275,79 @@ class TestListGames:
         data = resp.json()
         assert "has_more" in data
 
+    def test_cursor_walks_every_game_once(self):
+        creator = f"lister-{_unique_id()}"
+        created = [_create_game(user_id=creator).json()["game_id"] for _ in range(5)]
+        _join_game(_create_game(user_id=creator).json()["join_code"])
+        created.append(
+            client.get("/games", params={"creator_user_id": creator, "limit": 1}).json()["games"][0]["game_id"]
+        )
+
+        seen, cursor = [], None
+        while True:
+            params = {"creator_user_id": creator, "limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = client.get("/games", params=params).json()
+            seen.extend(data["games"])
+            cursor = data["next_cursor"]
+            assert data["has_more"] is (cursor is not None)
+            if not cursor:
+                break
+
+        assert sorted(g["game_id"] for g in seen) == sorted(created)
+        assert seen[0]["player_count"] == 1
+        assert all(g["player_count"] == 0 for g in seen[1:])
+        assert data["total_count"] == 6
+
+    def test_listing_is_one_query_without_state(self, query_budget):
+        creator = f"lister-{_unique_id()}"
+        _join_game(_create_game(user_id=creator).json()["join_code"])
+        client.get("/games", params={"creator_user_id": creator})  # warm the cached total
+
+        with query_budget(max_queries=1) as budget:
+            resp = client.get("/games", params={"creator_user_id": creator})
+
+        assert resp.json()["games"][0]["player_count"] == 1
+        assert not any("game_state.state " in shape for shape in budget.shapes)
+
+    def test_invalid_cursor_returns_400(self):
+        resp = client.get("/games", params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+
+
+# ── GET /games/history/export ────────────────────────────────────────────────
+
+
+class TestGameHistoryExport:
+    def test_export_streams_completed_games_as_ndjson(self):
+        from app.database import SessionLocal
+        from app.models import GameRecord
+
+        game_id = f"history-{_unique_id()}"
+        db = SessionLocal()
+        try:
+            db.add(
+                GameRecord(
+                    game_id=game_id,
+                    course_name="Wing Point",
+                    player_count=4,
+                    completed_at="2999-01-01T00:00:00",
+                    final_scores={"p1": 3, "p2": -3},
+                )
+            )
+            db.commit()
+
+            resp = client.get("/games/history/export")
+        finally:
+            db.query(GameRecord).filter(GameRecord.game_id == game_id).delete()
+            db.commit()
+            db.close()
+
+        assert resp.status_code == 200
+        assert resp.headers["content-disposition"] == 'attachment; filename="game-history.ndjson"'
+        first = json.loads(resp.text.splitlines()[0])
+        assert first["game_id"] == game_id
+        assert first["final_scores"] == {"p1": 3, "p2": -3}
+
 
 # ── DELETE /games/{game_id} ──────────────────────────────────────────────────
 
@@ -52,7 +52,9 @@ def _seed_notification(is_read=False):
 def _cleanup():
     db = database.SessionLocal()
     try:
-        db.query(models.Notification).filter(models.Notification.player_profile_id == _PLAYER_ID).delete()
+        # Row-by-row so the unread counter follows (a bulk Query.delete bypasses it).
+        for n in db.query(models.Notification).filter(models.Notification.player_profile_id == _PLAYER_ID):
+            db.delete(n)
         db.commit()
     finally:
         db.close()
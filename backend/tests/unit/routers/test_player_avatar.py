@@ -135,3 +135,68 @@ class TestAvatarUpload:
         body = resp.json()
         assert body["has_avatar_image"] is True
         assert "game_history" in body
+
+
+class TestAvatarHttpCaching:
+    def _upload(self, client):
+        resp = client.post(
+            "/players/me/avatar",
+            files={"file": ("photo.jpg", _make_jpeg_bytes(), "image/jpeg")},
+        )
+        assert resp.status_code == 200
+
+    def test_avatar_has_content_hash_etag(self, client):
+        self._upload(client)
+
+        first = client.get("/players/1/avatar")
+        second = client.get("/players/1/avatar")
+
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "public, no-cache"
+
+    def test_matching_if_none_match_returns_304(self, client):
+        self._upload(client)
+        etag = client.get("/players/1/avatar").headers["etag"]
+
+        resp = client.get("/players/1/avatar", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_versioned_url_is_immutable(self, client):
+        self._upload(client)
+
+        resp = client.get("/players/1/avatar?v=2")
+
+        assert "immutable" in resp.headers["cache-control"]
+
+    def test_gcs_avatar_is_downloaded_once(self, client, monkeypatch):
+        from app.services import media_storage_service as mss
+
+        downloads: list[str] = []
+        monkeypatch.setenv("MEDIA_BUCKET", "wgp-media-test")
+        monkeypatch.setattr(mss, "upload_bytes", lambda *args, **kwargs: None)
+        monkeypatch.setattr(mss, "download_bytes", lambda path: downloads.append(path) or _make_jpeg_bytes())
+        mss.invalidate_cached()
+        self._upload(client)
+
+        client.get("/players/1/avatar")
+        client.get("/players/1/avatar")
+
+        assert downloads == ["avatars/1.jpg"]
+        mss.invalidate_cached()
+
+
+class TestAvatarBlobIsDeferred:
+    def test_listing_does_not_load_the_blob(self, db_session):
+        db = db_session()
+        db.query(PlayerProfile).filter_by(id=1).update({"avatar_image": "abc"})
+        db.commit()
+        db.close()
+
+        db = db_session()
+        player = db.query(PlayerProfile).filter_by(id=1).first()
+
+        assert "avatar_image" not in player.__dict__
+        assert player.has_avatar_image is True
+        db.close()
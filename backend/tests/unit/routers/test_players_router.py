@@ -332,7 +332,7 @@ class TestPublicProfile:
         fake_service = MagicMock()
         fake_service.get_player_history.return_value = rounds
 
-        with patch("app.routers.players.get_unified_data_service", return_value=fake_service):
+        with patch("app.services.public_profile_service.get_unified_data_service", return_value=fake_service):
             resp = client.get(f"/players/{player_id}/public-profile")
 
         assert resp.status_code == 200
@@ -1,6 +1,7 @@
 """Unit tests for signups router — legacy players, daily signup CRUD."""
 
 import uuid
+from datetime import date, timedelta
 from types import SimpleNamespace
 
 import pytest
@@ -253,3 +254,17 @@ class TestWeeklySignups:
     def test_weekly_signups_missing_param_returns_422(self):
         resp = client.get("/signups/weekly")
         assert resp.status_code == 422
+
+    def test_weekly_signups_bucket_one_range_query(self, query_budget):
+        week_start = date.fromisoformat(_unique_signup_date())
+        for offset in (0, 3, 7):
+            day = (week_start + timedelta(days=offset)).isoformat()
+            assert client.post("/signups", json={"date": day}).status_code == 200
+
+        with query_budget(max_queries=1):
+            resp = client.get("/signups/weekly", params={"week_start": week_start.isoformat()})
+
+        counts = {day["date"]: day["total_count"] for day in resp.json()["daily_summaries"]}
+        assert counts[week_start.isoformat()] == 1
+        assert counts[(week_start + timedelta(days=3)).isoformat()] == 1
+        assert sum(counts.values()) == 2
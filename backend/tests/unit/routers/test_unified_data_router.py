@@ -1,5 +1,9 @@
 """Unit tests for unified_data router — leaderboard, rounds, player history, stats, status, sync."""
 
+import csv
+import io
+import json
+import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -181,6 +185,58 @@ class TestGetUnifiedRounds:
         assert resp.status_code == 422
 
 
+# ── GET /data/rounds/export, /data/hole-events/export ──────────────────────
+
+
+class TestExports:
+    @patch("app.routers.unified_data.get_unified_data_service")
+    def test_rounds_export_streams_ndjson(self, mock_get_service):
+        mock_service = MagicMock()
+        mock_service.iter_all_rounds.return_value = iter(
+            [_make_mock_round(member="Alice"), _make_mock_round(member="Bob")]
+        )
+        mock_get_service.return_value = mock_service
+
+        resp = client.get("/data/rounds/export")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["member"] for line in lines] == ["Alice", "Bob"]
+        assert set(lines[0]) == {"date", "date_sortable", "group", "member", "score", "location", "duration", "source"}
+
+    def test_hole_events_export_filters_by_game_as_csv(self):
+        from app.database import SessionLocal
+        from app.models import HoleEvent
+
+        game_id = f"export-{uuid.uuid4().hex[:8]}"
+        db = SessionLocal()
+        try:
+            for hole, player, quarters in [(2, "p1", -1.0), (1, "p2", 1.0), (1, "p1", -1.0)]:
+                db.add(
+                    HoleEvent(game_id=game_id, hole_number=hole, player_id=player, quarters=quarters, recorded_at="x")
+                )
+            db.commit()
+
+            resp = client.get("/data/hole-events/export", params={"format": "csv", "game_id": game_id})
+        finally:
+            db.query(HoleEvent).filter(HoleEvent.game_id == game_id).delete()
+            db.commit()
+            db.close()
+
+        assert resp.status_code == 200
+        assert f'filename="hole-events-{game_id}.csv"' in resp.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert [(r["hole_number"], r["player_id"], r["quarters"]) for r in rows] == [
+            ("1", "p1", "-1.0"),
+            ("1", "p2", "1.0"),
+            ("2", "p1", "-1.0"),
+        ]
+
+    def test_export_rejects_unknown_format(self):
+        assert client.get("/data/hole-events/export", params={"format": "xlsx"}).status_code == 422
+
+
 # ── GET /data/rounds/by-date/{date} ────────────────────────────────────────
 
 
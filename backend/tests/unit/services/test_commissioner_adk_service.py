@@ -1,5 +1,6 @@
 """Unit tests for Commissioner ADK data-chat service."""
 
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,6 +8,7 @@ import pytest
 from app.services.commissioner_adk_service import (
     _build_instruction,
     _extract_text,
+    _make_tools,
     run_data_chat_adk,
 )
 
@@ -33,6 +35,41 @@ class TestExtractText:
         assert _extract_text(event) == "Hello world"
 
 
+class TestTools:
+    @pytest.mark.asyncio
+    async def test_sql_runs_off_the_event_loop(self):
+        loop_thread = threading.current_thread().name
+        seen: dict[str, str] = {}
+
+        def fake_execute(_db, sql):
+            seen["thread"] = threading.current_thread().name
+            return {"columns": ["n"], "rows": [[1]], "row_count": 1}
+
+        trace: dict = {}
+        with (
+            patch("app.routers.commissioner._validate_sql", return_value=True),
+            patch("app.routers.commissioner._execute_readonly_sql", side_effect=fake_execute),
+        ):
+            _, run_readonly_sql = _make_tools(MagicMock(), trace)
+            result = await run_readonly_sql("SELECT 1")
+
+        assert result["status"] == "success"
+        assert seen["thread"] != loop_thread
+        assert trace["sql_used"] == "SELECT 1"
+
+    @pytest.mark.asyncio
+    async def test_season_context_runs_off_the_event_loop(self):
+        loop_thread = threading.current_thread().name
+        with patch(
+            "app.routers.commissioner._build_data_context",
+            side_effect=lambda _db: threading.current_thread().name,
+        ):
+            get_season_context, _ = _make_tools(MagicMock(), {})
+            result = await get_season_context()
+
+        assert result["context"] != loop_thread
+
+
 class TestRunDataChatAdk:
     @pytest.mark.asyncio
     async def test_returns_agent_response_and_sql_trace(self, monkeypatch):
@@ -0,0 +1,161 @@
+"""
+Unit tests for the email fan-out pipeline
+
+Covers template caching, collect/send_many on EmailService, batch delivery
+through providers with ``send_batch``, and per-job reporting.
+"""
+
+from functools import partial
+from unittest.mock import Mock, patch
+
+import jinja2
+
+from app.services import email_service as email_service_module
+from app.services.email_fanout import OutgoingEmail, deliver, fan_out
+from app.services.email_service import EmailService
+from app.services.providers.resend_provider import ResendEmailProvider
+
+
+def _service_with(provider) -> EmailService:
+    with patch.object(EmailService, "_get_configured_provider", return_value=provider):
+        return EmailService()
+
+
+def _provider(fail_for: tuple[str, ...] = ()) -> Mock:
+    provider = Mock(spec=["is_configured", "send_email"])
+    provider.is_configured.return_value = True
+    provider.send_email.side_effect = lambda to, *args: to not in fail_for
+    return provider
+
+
+def _messages(count: int) -> list[OutgoingEmail]:
+    return [OutgoingEmail(f"p{i}@example.com", "Subject", "<p>Hi</p>") for i in range(count)]
+
+
+class TestTemplateCaching:
+    def test_base_template_compiled_once(self):
+        service = _service_with(_provider())
+        email_service_module._compile_template.cache_clear()
+
+        with patch.object(jinja2, "Template", wraps=jinja2.Template) as template_cls:
+            for i in range(5):
+                service.send_signup_confirmation(f"p{i}@example.com", "Player", "2026-05-03")
+
+        assert template_cls.call_count == 1
+
+
+class TestCollect:
+    def test_collect_captures_rendered_messages_without_sending(self):
+        provider = _provider()
+        service = _service_with(provider)
+
+        with service.collect() as outbox:
+            assert service.send_signup_confirmation("a@example.com", "Ann", "2026-05-03") is True
+
+        provider.send_email.assert_not_called()
+        assert [m.to_email for m in outbox] == ["a@example.com"]
+        assert "Ann" in outbox[0].html_body
+
+        # Outside the context sends go straight to the provider again.
+        service.send_signup_confirmation("b@example.com", "Bo", "2026-05-03")
+        provider.send_email.assert_called_once()
+
+    def test_send_many_when_unconfigured_fails_every_message(self):
+        service = _service_with(None)
+
+        assert service.send_many(_messages(3)) == [False, False, False]
+
+
+class TestDeliver:
+    def test_per_message_provider_runs_each_send(self):
+        provider = _provider(fail_for=("p1@example.com",))
+
+        results = deliver(provider, _messages(3), workers=2)
+
+        assert results == [True, False, True]
+        assert provider.send_email.call_count == 3
+
+    def test_batch_provider_receives_chunks(self):
+        provider = Mock(spec=["send_batch", "batch_size"])
+        provider.batch_size = 2
+        provider.send_batch.side_effect = lambda chunk: [True] * len(chunk)
+
+        results = deliver(provider, _messages(5), workers=4)
+
+        assert results == [True] * 5
+        assert sorted(len(call.args[0]) for call in provider.send_batch.call_args_list) == [1, 2, 2]
+
+    def test_resend_batch_failure_falls_back_to_single_sends(self):
+        provider = ResendEmailProvider(api_key="key", from_email="club@example.com", from_name="Club")
+
+        with patch("app.services.providers.resend_provider.resend.Batch.send") as batch_send:
+            assert provider.send_batch(_messages(3)) == [True, True, True]
+            params = batch_send.call_args.args[0]
+            assert [p["to"] for p in params] == [["p0@example.com"], ["p1@example.com"], ["p2@example.com"]]
+            assert all(p["text"] == "Hi" for p in params)
+
+            def send_one(params):
+                if params["to"] == ["p1@example.com"]:
+                    raise ValueError("bad address")
+
+            batch_send.side_effect = RuntimeError("invalid `to` field")
+            with patch(
+                "app.services.providers.resend_provider.resend.Emails.send", side_effect=send_one
+            ) as single_send:
+                assert provider.send_batch(_messages(3)) == [True, False, True]
+            assert [call.args[0]["to"] for call in single_send.call_args_list] == [
+                ["p0@example.com"],
+                ["p1@example.com"],
+                ["p2@example.com"],
+            ]
+
+
+class TestFanOut:
+    def test_reports_sent_failures_and_throughput(self):
+        service = _service_with(_provider(fail_for=("p2@example.com",)))
+        recipients = [f"p{i}@example.com" for i in range(4)]
+
+        report = fan_out(
+            "test-job",
+            service,
+            [(to, partial(service.send_signup_confirmation, to, "Player", "2026-05-03")) for to in recipients],
+        )
+
+        assert report.attempted == 4
+        assert report.sent == 3
+        assert report.failures == ["p2@example.com"]
+        assert report.throughput > 0
+        assert report.to_dict()["failed"] == 1
+
+    def test_render_errors_are_isolated(self):
+        service = _service_with(_provider())
+
+        def broken():
+            raise ValueError("bad template data")
+
+        report = fan_out(
+            "test-job",
+            service,
+            [
+                ("bad@example.com", broken),
+                ("ok@example.com", partial(service.send_signup_confirmation, "ok@example.com", "Ok", "2026-05-03")),
+            ],
+        )
+
+        assert report.sent == 1
+        assert report.failures == ["bad@example.com"]
+
+    def test_services_without_collect_run_sends_directly(self):
+        sent = []
+
+        class StubService:
+            def send(self, to):
+                sent.append(to)
+                return to != "x@example.com"
+
+        stub = StubService()
+        report = fan_out("stub-job", stub, [(to, partial(stub.send, to)) for to in ("a@example.com", "x@example.com")])
+
+        assert sorted(sent) == ["a@example.com", "x@example.com"]
+        assert report.sent == 1
+        assert report.failures == ["x@example.com"]
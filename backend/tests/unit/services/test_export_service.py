@@ -0,0 +1,56 @@
+"""Incremental NDJSON / CSV export encoding (app/services/export_service.py)."""
+
+import csv
+import io
+import json
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import HoleEvent
+from app.services.export_service import encode_csv, encode_ndjson, export_response, stream_rows
+
+
+def test_ndjson_yields_one_chunk_per_batch():
+    rows = [{"n": i, "scores": {"a": i}} for i in range(5)]
+
+    chunks = list(encode_ndjson(iter(rows), batch_size=2))
+
+    assert len(chunks) == 3
+    assert [json.loads(line) for line in "".join(chunks).splitlines()] == rows
+
+
+def test_csv_writes_header_and_json_encodes_nested_values():
+    rows = [{"id": 1, "final_scores": {"p1": 3}, "extra": "dropped"}, {"id": 2, "final_scores": None}]
+
+    text = "".join(encode_csv(rows, ("id", "final_scores"), batch_size=1))
+
+    assert list(csv.reader(io.StringIO(text))) == [["id", "final_scores"], ["1", '{"p1": 3}'], ["2", ""]]
+
+
+def test_csv_of_no_rows_is_just_the_header():
+    assert "".join(encode_csv([], ("a", "b"))) == "a,b\r\n"
+
+
+def test_stream_rows_reads_in_partitions():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        HoleEvent(game_id="g", hole_number=h, player_id="p", quarters=h, recorded_at="2026-04-06") for h in range(7)
+    )
+    db.commit()
+
+    rows = stream_rows(db, select(HoleEvent.hole_number).order_by(HoleEvent.hole_number), batch_size=3)
+
+    assert [row.hole_number for row in rows] == list(range(7))
+    assert not db.identity_map
+
+
+def test_export_response_sets_media_type_and_filename():
+    response = export_response(iter([]), "csv", ("a",), "rounds")
+
+    assert response.media_type == "text/csv"
+    assert response.headers["content-disposition"] == 'attachment; filename="rounds.csv"'
@@ -4,15 +4,18 @@ Unit tests for GHINService
 Tests GHIN (Golf Handicap Information Network) integration.
 """
 
+import asyncio
+import threading
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Base, PlayerProfile
-from app.services.ghin_service import GHINService
+from app.services.ghin_service import GHINService, _request_limits, _TokenBucket
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite:///./test_ghin.db"
@@ -236,3 +239,244 @@ class TestGHINConfiguration:
         service = GHINService(db)
 
         assert service.GHIN_API_BASE_URL == "https://api2.ghin.com/api/v1"
+
+
+def _add_ghin_players(db, ghin_ids):
+    players = []
+    for i, ghin_id in enumerate(ghin_ids):
+        player = PlayerProfile(
+            name=f"Bulk Player {i}",
+            email=f"bulk{i}@example.com",
+            handicap=15.0,
+            ghin_id=ghin_id,
+            created_at=datetime.now().isoformat(),
+        )
+        db.add(player)
+        players.append(player)
+    db.commit()
+    return players
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+        self.request = httpx.Request("GET", "https://example.test")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError("error", request=self.request, response=self)
+
+    def json(self):
+        return self._payload
+
+
+class TestBulkHandicapSync:
+    """Concurrent bulk sync: coalescing, chunked commits, rate limiting and retry."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_for_same_ghin_id_are_coalesced(self, db):
+        first, second = GHINService(db), GHINService(db)
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch(ghin_id):
+            calls.append(ghin_id)
+            await release.wait()
+            return {"handicap_index": 7.1}
+
+        with (
+            patch.object(first, "_fetch_handicap_from_ghin", side_effect=fetch),
+            patch.object(second, "_fetch_handicap_from_ghin", side_effect=fetch),
+        ):
+            pending = asyncio.gather(
+                first._fetch_handicap_coalesced("111"),
+                second._fetch_handicap_coalesced("111"),
+                first._fetch_handicap_coalesced("222"),
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await pending
+
+        assert sorted(calls) == ["111", "222"]
+        assert results == [{"handicap_index": 7.1}] * 3
+
+    @pytest.mark.asyncio
+    async def test_one_commit_per_chunk(self, db):
+        players = _add_ghin_players(db, ["1", "2", "3", "4", "5"])
+        service = GHINService(db)
+        service.initialized = True
+
+        with (
+            patch("app.services.ghin_service.GHIN_SYNC_CHUNK_SIZE", 2),
+            patch.object(service, "_fetch_handicap_from_ghin", new_callable=AsyncMock) as mock_fetch,
+            patch.object(db, "commit", wraps=db.commit) as commit_spy,
+        ):
+            mock_fetch.return_value = {"handicap_index": 4.4}
+            summary = await service.sync_all_players_handicaps()
+
+        assert summary["synced"] == 5
+        assert commit_spy.call_count == 3
+        for player in players:
+            db.refresh(player)
+            assert player.handicap == 4.4
+            assert player.handicap_source == "ghin"
+
+    @pytest.mark.asyncio
+    async def test_later_chunks_do_not_query_on_the_event_loop(self, db):
+        _add_ghin_players(db, ["1", "2", "3", "4", "5"])
+        service = GHINService(db)
+        service.initialized = True
+        loop_thread = threading.get_ident()
+        loop_queries = []
+
+        def record(conn, cursor, statement, *args):
+            if threading.get_ident() == loop_thread:
+                loop_queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with (
+                patch("app.services.ghin_service.GHIN_SYNC_CHUNK_SIZE", 2),
+                patch.object(service, "_fetch_handicap_from_ghin", new_callable=AsyncMock) as mock_fetch,
+            ):
+                mock_fetch.return_value = {"handicap_index": 4.4}
+                summary = await service.sync_all_players_handicaps()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert summary["synced"] == 5
+        assert loop_queries == []
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_counts_as_error_without_blocking_others(self, db):
+        _add_ghin_players(db, ["ok", "missing"])
+        service = GHINService(db)
+        service.initialized = True
+
+        async def fetch(ghin_id):
+            return {"handicap_index": 9.0} if ghin_id == "ok" else None
+
+        with patch.object(service, "_fetch_handicap_from_ghin", side_effect=fetch):
+            summary = await service.sync_all_players_handicaps()
+
+        assert summary["synced"] == 1
+        assert summary["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, db):
+        service = GHINService(db)
+        in_flight = 0
+        peak = 0
+
+        class Client:
+            async def get(self, *args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return _FakeResponse(200, {"golfers": []})
+
+        service._client = Client()
+        _request_limits.clear()
+        with (
+            patch("app.services.ghin_service.GHIN_SYNC_CONCURRENCY", 2),
+            patch("app.services.ghin_service.GHIN_RATE_PER_SECOND", 1000.0),
+            patch("app.services.ghin_service.GHIN_RATE_BURST", 100),
+        ):
+            await asyncio.gather(*(service._get_with_retry("u", headers={}, params={}) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_is_shared_between_instances(self, db):
+        in_flight = 0
+        peak = 0
+
+        class Client:
+            async def get(self, *args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return _FakeResponse(200, {"golfers": []})
+
+        services = [GHINService(db) for _ in range(3)]
+        for service in services:
+            service._client = Client()
+        _request_limits.clear()
+        with (
+            patch("app.services.ghin_service.GHIN_SYNC_CONCURRENCY", 2),
+            patch("app.services.ghin_service.GHIN_RATE_PER_SECOND", 1000.0),
+            patch("app.services.ghin_service.GHIN_RATE_BURST", 100),
+        ):
+            await asyncio.gather(
+                *(service._get_with_retry("u", headers={}, params={}) for service in services for _ in range(2))
+            )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_exhaust_attempts_then_raise(self, db):
+        service = GHINService(db)
+        client = Mock()
+        client.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+        service._client = client
+
+        with (
+            patch("app.services.ghin_service.GHIN_MAX_ATTEMPTS", 3),
+            patch("app.services.ghin_service.asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(httpx.ConnectError),
+        ):
+            await service._get_with_retry("u", headers={}, params={})
+
+        assert client.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status_then_succeeds(self, db):
+        service = GHINService(db)
+        responses = [
+            _FakeResponse(503),
+            _FakeResponse(429, headers={"Retry-After": "1"}),
+            _FakeResponse(200, {"ok": 1}),
+        ]
+
+        class Client:
+            async def get(self, *args, **kwargs):
+                return responses.pop(0)
+
+        service._client = Client()
+        with patch("app.services.ghin_service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            data = await service._get_with_retry("u", headers={}, params={})
+
+        assert data == {"ok": 1}
+        assert mock_sleep.await_count == 2
+        assert mock_sleep.await_args_list[1].args[0] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_fails_fast(self, db):
+        service = GHINService(db)
+        client = Mock()
+        client.get = AsyncMock(return_value=_FakeResponse(404))
+        service._client = client
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await service._get_with_retry("u", headers={}, params={})
+
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_spaces_requests_after_burst(self):
+        bucket = _TokenBucket(rate=50.0, capacity=2)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = loop.time() - start
+
+        # Two tokens are free; the next two wait ~1/50s each.
+        assert elapsed >= 0.035
@@ -8,6 +8,8 @@ from app.services.hole_completion_service import (
     apply_multipliers,
     calculate_points_delta,
     process_complete_hole,
+    process_update_hole,
+    replay_player_totals,
     update_carry_over_state,
     validate_aardvark,
     validate_big_dick,
@@ -15,6 +17,7 @@ from app.services.hole_completion_service import (
     validate_float,
     validate_joes_special,
 )
+from tests.benchmarks.engine import golden_requests, golden_round, scorekeeper_state
 
 
 def _partners_request(*, hole_number=3, winner="team1", wager=2.0, big_dick=None, float_by=None):
@@ -312,3 +315,50 @@ def test_hole_18_cannot_push_under_carry_over():
         validate_carry_over_hole_18(request, game_state)
     assert exc.value.status_code == 400
     assert "hole 18" in str(exc.value.detail).lower()
+
+
+# ---------------------------------------------------------------------------
+# Running totals — per-hole prefix standings maintained alongside hole_history
+# ---------------------------------------------------------------------------
+
+
+def _golden_state():
+    state = scorekeeper_state()
+    for request in golden_requests():
+        process_complete_hole(request, state)
+    return state
+
+
+def test_running_totals_match_the_golden_round():
+    state = _golden_state()
+
+    assert [h["running_totals"] for h in state["hole_history"]] == [
+        h["running_totals"] for h in golden_round()["holes"]
+    ]
+    assert {p["id"]: p["points"] for p in state["players"]} == golden_round()["expected_final_totals"]
+    assert state["standings"] == golden_round()["expected_final_totals"]
+
+
+def test_hole_edit_re_adds_only_later_holes_and_matches_a_full_replay():
+    state = _golden_state()
+    untouched = [h["running_totals"] for h in state["hole_history"][:11]]
+    request = golden_requests()[11].model_copy(update={"winner": "captain", "float_invoked_by": "player_d"})
+
+    process_update_hole(request, state, 12, 11)
+
+    assert all(h["running_totals"] is prefix for h, prefix in zip(state["hole_history"], untouched, strict=False))
+    incremental = [{k: p[k] for k in ("id", "points", "float_used")} for p in state["players"]]
+    replay_player_totals(state)
+    assert incremental == [{k: p[k] for k in ("id", "points", "float_used")} for p in state["players"]]
+    assert state["standings"]["player_d"] == golden_round()["expected_final_totals"]["player_d"] + 6
+
+
+def test_running_totals_rebuild_when_history_has_no_prefix():
+    state = _golden_state()
+    for hole in state["hole_history"]:
+        del hole["running_totals"]
+
+    process_update_hole(golden_requests()[17], state, 18, 17)
+
+    assert state["hole_history"][0]["running_totals"] == golden_round()["holes"][0]["running_totals"]
+    assert state["standings"] == golden_round()["expected_final_totals"]
@@ -0,0 +1,147 @@
+"""Contracts for the job_leases table that keeps periodic jobs single-instance."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, JobLease, JobRun
+from app.services.email_scheduler import EmailScheduler
+from app.services.job_lease_service import LeasePolicy, run_with_lease, try_acquire_lease
+from app.utils.time import utc_now
+
+POLICY = LeasePolicy(ttl_seconds=600, min_interval_seconds=3600)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _lease(session_factory, job_name="ghin-sync") -> JobLease:
+    db = session_factory()
+    try:
+        return db.get(JobLease, job_name)
+    finally:
+        db.close()
+
+
+def test_second_holder_cannot_take_a_held_lease(session_factory):
+    db = session_factory()
+
+    assert try_acquire_lease(db, "ghin-sync", POLICY, holder="instance-a") is True
+    assert try_acquire_lease(db, "ghin-sync", POLICY, holder="instance-b") is False
+    assert _lease(session_factory).holder == "instance-a"
+
+
+def test_expired_lease_is_taken_over(session_factory):
+    db = session_factory()
+    try_acquire_lease(db, "ghin-sync", POLICY, holder="crashed")
+    lease = db.get(JobLease, "ghin-sync")
+    lease.expires_at = (utc_now() - timedelta(seconds=1)).isoformat(timespec="microseconds")
+    db.commit()
+
+    assert try_acquire_lease(db, "ghin-sync", POLICY, holder="instance-b") is True
+
+
+def test_successful_run_releases_and_blocks_repeat_within_interval(session_factory):
+    calls = []
+
+    first = run_with_lease("ghin-sync", lambda: calls.append(1) or {"synced": 3}, session_factory, "schedule", POLICY)
+    second = run_with_lease("ghin-sync", lambda: calls.append(2), session_factory, "internal", POLICY)
+
+    assert first["status"] == "completed"
+    assert first["result"] == {"synced": 3}
+    assert second == {"job": "ghin-sync", "status": "skipped", "reason": "lease_unavailable"}
+    assert calls == [1]
+
+    lease = _lease(session_factory)
+    assert lease.holder is None
+    assert lease.last_status == "success"
+    assert lease.last_success_at == lease.last_run_at
+    assert lease.run_count == 1
+    assert lease.last_duration_seconds is not None
+
+
+def test_no_min_interval_allows_back_to_back_runs(session_factory):
+    policy = LeasePolicy(ttl_seconds=600, min_interval_seconds=0)
+    calls = []
+
+    for _ in range(2):
+        run_with_lease("legacy-rounds-sync", lambda: calls.append(1), session_factory, "internal", policy)
+
+    assert calls == [1, 1]
+    assert _lease(session_factory, "legacy-rounds-sync").run_count == 2
+
+
+def test_failed_run_is_recorded_and_can_retry(session_factory):
+    def boom():
+        raise RuntimeError("sheet unavailable")
+
+    with pytest.raises(RuntimeError):
+        run_with_lease("ghin-sync", boom, session_factory, "schedule", POLICY)
+
+    lease = _lease(session_factory)
+    assert lease.holder is None
+    assert lease.last_status == "failed"
+    assert lease.last_success_at is None
+
+    db = session_factory()
+    runs = db.query(JobRun).all()
+    assert [(r.job_name, r.status, r.trigger, r.error) for r in runs] == [
+        ("ghin-sync", "failed", "schedule", "sheet unavailable")
+    ]
+
+    # A failure doesn't count toward min_interval, so a retry goes through.
+    assert run_with_lease("ghin-sync", lambda: None, session_factory, "internal", POLICY)["status"] == "completed"
+
+
+def test_job_still_runs_when_lease_table_is_unreachable():
+    def broken_factory():
+        raise RuntimeError("db down")
+
+    calls = []
+    result = run_with_lease("ghin-sync", lambda: calls.append(1), broken_factory, "schedule", POLICY)
+
+    assert calls == [1]
+    assert result["status"] == "completed"
+
+
+def test_email_scheduler_run_job_uses_the_lease(session_factory):
+    scheduler = EmailScheduler()
+    calls = []
+
+    with (
+        patch.object(scheduler, "_get_db", side_effect=session_factory),
+        patch.object(scheduler, "_sync_ghin_handicaps", side_effect=lambda: calls.append("ghin")),
+    ):
+        first = scheduler.run_job("ghin-sync")
+        scheduler._run_scheduled("ghin-sync")
+
+    assert first["status"] == "completed"
+    assert calls == ["ghin"]
+    assert _lease(session_factory).run_count == 1
+
+
+def test_email_scheduler_job_failure_is_recorded_and_retryable(session_factory):
+    scheduler = EmailScheduler()
+
+    with (
+        patch.object(scheduler, "_get_db", side_effect=session_factory),
+        patch("app.services.ghin_service.GHINService", side_effect=RuntimeError("GHIN down")),
+    ):
+        with pytest.raises(RuntimeError, match="GHIN down"):
+            scheduler.run_job("ghin-sync")
+        assert _lease(session_factory).last_status == "failed"
+
+        # The failed run doesn't count toward min_interval, so the retry runs too.
+        with pytest.raises(RuntimeError, match="GHIN down"):
+            scheduler.run_job("ghin-sync")
+
+    assert _lease(session_factory).run_count == 2
@@ -17,7 +17,8 @@ from fastapi import HTTPException
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.models import Base, GamePlayer, PlayerProfile
+from app.models import Base, GamePlayer, NotificationUnreadCount, PlayerProfile
+from app.observability.queries import QueryBudget
 from app.services.notification_service import Notification, get_notification_service
 
 # Test database setup
@@ -415,5 +416,74 @@ class TestNotificationService:
         assert retrieved is None
 
 
+class TestUnreadCounter:
+    """The per-player unread counter stays equal to COUNT(*) across every write path."""
+
+    @staticmethod
+    def _counter(db, player_id):
+        db.expire_all()
+        row = db.get(NotificationUnreadCount, player_id)
+        actual = db.query(Notification).filter_by(player_profile_id=player_id, is_read=False).count()
+        assert row is not None and row.unread == actual
+        return row.unread
+
+    def test_counter_follows_every_write(self, db, test_game_players):
+        service = get_notification_service()
+        game_id, players = test_game_players
+        me = players[0].id
+        sent = [service.send_notification(me, "game_start", f"n{i}", db)["id"] for i in range(3)]
+        assert self._counter(db, me) == 3
+
+        service.mark_as_read(sent[0], db)
+        service.mark_as_read(sent[0], db)
+        service.delete_notification(sent[1], db)
+        service.delete_notification(sent[0], db)
+        assert self._counter(db, me) == 1
+
+        service.broadcast_to_game(game_id, "hole_complete", "Hole 1", db)
+        assert self._counter(db, me) == 2
+        assert self._counter(db, players[3].id) == 1
+
+        old = db.get(Notification, sent[2])
+        old.created_at = "2000-01-01T00:00:00"
+        db.commit()
+        assert service.delete_old_notifications(me, db) == 1
+        assert self._counter(db, me) == 1
+
+        assert service.mark_all_as_read(me, db) == 1
+        assert self._counter(db, me) == 0
+
+    def test_counter_is_seeded_from_existing_rows(self, db, test_player):
+        service = get_notification_service()
+        for i in range(2):
+            db.add(Notification(player_profile_id=test_player.id, message=f"old {i}", is_read=False, created_at="x"))
+        db.flush()
+        db.query(NotificationUnreadCount).delete()
+        db.commit()
+
+        assert service.get_unread_count(test_player.id, db) == 2
+        service.send_notification(test_player.id, "game_start", "new", db)
+        assert self._counter(db, test_player.id) == 3
+
+    def test_unread_count_is_one_point_read(self, db, test_player):
+        service = get_notification_service()
+        player_id = test_player.id
+        service.send_notification(player_id, "game_start", "hi", db)
+        db.expire_all()
+
+        with QueryBudget(engine, max_queries=1) as budget:
+            assert service.get_unread_count(player_id, db) == 1
+        assert "notification_unread_counts" in next(iter(budget.shapes))
+
+    def test_broadcast_inserts_in_one_statement(self, db, test_game_players):
+        game_id, players = test_game_players
+
+        with QueryBudget(engine) as budget:
+            get_notification_service().broadcast_to_game(game_id, "game_start", "Tee off", db)
+
+        inserts = [shape for shape in budget.shapes if shape.startswith("INSERT INTO notifications ")]
+        assert len(inserts) == 1 and budget.shapes[inserts[0]] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""Roster availability and cached public profiles (app/services/public_profile_service.py)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.middleware.caching import public_profile_cache
+from app.models import Badge, PlayerAvailability, PlayerProfile, PlayerStatistics
+from app.observability.queries import QueryBudget
+from app.services.public_profile_service import all_players_availability, get_public_profile
+from app.utils.time import utc_now
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    now = utc_now().isoformat()
+    session.add_all(
+        [
+            PlayerProfile(id=1, name="Avail One", avatar_image="blob", created_at=now),
+            PlayerProfile(id=2, name="Avail Two", created_at=now),
+            PlayerProfile(id=3, name="Avail Three", created_at=now),
+            PlayerAvailability(player_profile_id=1, day_of_week=0, is_available=True),
+            PlayerAvailability(player_profile_id=1, day_of_week=2, is_available=False),
+            PlayerAvailability(player_profile_id=3, day_of_week=5, is_available=True),
+            PlayerStatistics(player_id=1, games_played=4, games_won=1, total_earnings=2.5),
+        ]
+    )
+    session.commit()
+    public_profile_cache.clear()
+    try:
+        yield session
+    finally:
+        session.close()
+        public_profile_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_round_history():
+    service = MagicMock()
+    service.get_player_history.return_value = []
+    with patch("app.services.public_profile_service.get_unified_data_service", return_value=service):
+        yield
+
+
+def test_all_players_availability_is_one_query_without_blobs(engine, db):
+    with QueryBudget(engine, max_queries=1) as budget:
+        players = all_players_availability(db)
+
+    assert [(p["player_id"], [a["day_of_week"] for a in p["availability"]]) for p in players] == [
+        (1, [0, 2]),
+        (2, []),
+        (3, [5]),
+    ]
+    assert not any("avatar_image" in shape for shape in budget.shapes)
+
+
+def test_public_profile_is_served_from_cache(engine, db):
+    first = get_public_profile(db, 1)
+
+    with QueryBudget(engine, max_queries=0):
+        again = get_public_profile(db, 1)
+
+    assert again == first
+    assert first["available_days"] == [0]
+    assert first["stats"]["games_played"] == 4
+    assert first["has_avatar_image"] is True
+
+
+def test_committed_stats_change_evicts_only_that_player(engine, db):
+    get_public_profile(db, 1)
+    get_public_profile(db, 3)
+
+    db.query(PlayerStatistics).filter_by(player_id=1).one().games_played = 5
+    db.commit()
+
+    assert get_public_profile(db, 1)["stats"]["games_played"] == 5
+    with QueryBudget(engine, max_queries=0):
+        get_public_profile(db, 3)
+
+
+def test_rolled_back_change_keeps_cached_profile(engine, db):
+    get_public_profile(db, 2)
+
+    db.add(PlayerAvailability(player_profile_id=2, day_of_week=1, is_available=True))
+    db.flush()
+    db.rollback()
+
+    with QueryBudget(engine, max_queries=0):
+        assert get_public_profile(db, 2)["available_days"] == []
+
+
+def test_badge_catalog_change_evicts_every_profile(db):
+    assert get_public_profile(db, 2)["total_badges"] == 0
+
+    db.add(Badge(badge_id=1, name="New Badge", category="progression", rarity="common", created_at="x"))
+    db.commit()
+
+    assert get_public_profile(db, 2)["total_badges"] == 1
+
+
+def test_missing_player_is_not_cached(db):
+    assert get_public_profile(db, 99) is None
+    assert public_profile_cache.get("public_profile:99") is None
@@ -0,0 +1,225 @@
+"""Columnar season analytics store (app/services/season_store.py)."""
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import GamePlayerResult, HoleEvent, HoleLog, LegacyRound
+from app.services.email_scheduler import EmailScheduler
+from app.services.season_store import (
+    TABLE_NAMES,
+    SeasonStore,
+    SeasonStoreUnavailableError,
+    export_season_store,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def seeded(db):
+    db.add_all(
+        [
+            LegacyRound(date="2025-06-29", group="A", member="Alice", score=12, location="Wing Point"),
+            LegacyRound(date="2026-04-05", group="A", member="Alice", score=-4, location="Wing Point"),
+            LegacyRound(date="2026-04-12", group="B", member="Alice", score=10, location="Meadowmeer"),
+            LegacyRound(date="2026-04-05", group="A", member="Bob", score=-6, location="Wing Point"),
+            LegacyRound(date="2026-04-12", group="B", member="Bob", score=None, location="Meadowmeer"),
+            LegacyRound(date=None, group="B", member="Carol", score=3, location=None),
+        ]
+    )
+    db.add_all(
+        HoleEvent(
+            game_id="g1",
+            hole_number=hole,
+            player_id=player,
+            score=score,
+            quarters=quarters,
+            recorded_at=f"2026-04-12T15:0{hole}:00",
+        )
+        for hole, player, score, quarters in (
+            (1, "p1", 4, 2.0),
+            (1, "p2", 5, -2.0),
+            (2, "p1", 3, -1.0),
+            (2, "p2", None, 1.0),
+        )
+    )
+    db.add(HoleLog(game_id="g1", hole_number=1, log_data={"story": "halved"}, recorded_at="2026-04-12T15:01:00"))
+    db.add_all(
+        [
+            GamePlayerResult(
+                game_record_id=1,
+                player_profile_id=1,
+                player_name="Alice",
+                final_position=1,
+                total_earnings=8.0,
+                solo_attempts=2,
+                solo_wins=1,
+                created_at="2026-04-12T18:00:00",
+            ),
+            GamePlayerResult(
+                game_record_id=1,
+                player_profile_id=2,
+                player_name="Bob",
+                final_position=2,
+                total_earnings=-8.0,
+                created_at="2026-04-12T18:00:00",
+            ),
+            GamePlayerResult(
+                game_record_id=2,
+                player_profile_id=1,
+                player_name="Alice",
+                final_position=2,
+                total_earnings=-3.0,
+                created_at="2025-07-01T18:00:00",
+            ),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def test_export_writes_every_table_and_publishes_it(seeded, tmp_path):
+    manifest = export_season_store(seeded, root=tmp_path, batch_size=2)
+
+    assert set(manifest["tables"]) == set(TABLE_NAMES)
+    assert manifest["tables"]["legacy_rounds"]["rows"] == 6
+    assert (tmp_path / "CURRENT").read_text() == manifest["snapshot"]
+    assert SeasonStore(tmp_path).snapshot == manifest["snapshot"]
+
+
+def test_columns_are_memory_mapped_and_text_is_dictionary_encoded(seeded, tmp_path):
+    export_season_store(seeded, root=tmp_path, batch_size=4)
+    rounds = SeasonStore(tmp_path).table("legacy_rounds")
+
+    assert isinstance(rounds["score"], np.memmap)
+    assert rounds["member"].dtype == np.int32
+    assert rounds.dictionary("member") == ["Alice", "Bob", "Carol"]
+    assert rounds.dictionary("location") == [None, "Meadowmeer", "Wing Point"]
+    assert int((rounds["member"] == rounds.code("member", "Bob")).sum()) == 2
+    assert rounds.code("member", "Nobody") == -1
+    assert rounds["season"].tolist() == [2024, 2025, 2025, 2025, 2025, 0]
+    assert np.isnan(rounds["score"][4])
+
+
+def test_member_season_totals_filters_by_season(seeded, tmp_path):
+    export_season_store(seeded, root=tmp_path)
+    store = SeasonStore(tmp_path)
+
+    totals = store.member_season_totals(2025)
+
+    assert totals == [
+        {
+            "member": "Alice",
+            "rounds": 2,
+            "total_quarters": 6.0,
+            "average_quarters": 3.0,
+            "best_round": 10.0,
+            "worst_round": -4.0,
+        },
+        {
+            "member": "Bob",
+            "rounds": 2,
+            "total_quarters": -6.0,
+            "average_quarters": -6.0,
+            "best_round": -6.0,
+            "worst_round": -6.0,
+        },
+    ]
+    assert {r["member"] for r in store.member_season_totals()} == {"Alice", "Bob", "Carol"}
+    assert store.seasons() == [2024, 2025]
+
+
+def test_player_season_results_counts_wins(seeded, tmp_path):
+    export_season_store(seeded, root=tmp_path)
+
+    results = SeasonStore(tmp_path).player_season_results(2025)
+
+    assert [(r["player_name"], r["games"], r["wins"], r["total_earnings"]) for r in results] == [
+        ("Alice", 1, 1.0, 8.0),
+        ("Bob", 1, 0.0, -8.0),
+    ]
+    assert results[0]["solo_wins"] == 1.0
+
+
+def test_hole_season_summary_skips_missing_scores(seeded, tmp_path):
+    export_season_store(seeded, root=tmp_path)
+
+    summary = SeasonStore(tmp_path).hole_season_summary(2025)
+
+    assert summary == [
+        {"hole_number": 1, "entries": 2, "average_score": 4.5, "low_score": 4.0, "average_quarters_moved": 2.0},
+        {"hole_number": 2, "entries": 2, "average_score": 3.0, "low_score": 3.0, "average_quarters_moved": 1.0},
+    ]
+
+
+def test_empty_tables_export_cleanly(db, tmp_path):
+    export_season_store(db, root=tmp_path)
+    store = SeasonStore(tmp_path)
+
+    assert len(store.table("hole_logs")) == 0
+    assert store.member_season_totals() == []
+
+
+def test_new_export_is_picked_up_and_old_snapshots_pruned(seeded, tmp_path):
+    store = SeasonStore(tmp_path)
+    snapshots = [export_season_store(seeded, root=tmp_path)["snapshot"] for _ in range(3)]
+    assert len(store.table("legacy_rounds")) == 6
+
+    seeded.add(LegacyRound(date="2026-04-19", group="A", member="Dan", score=1, location="Wing Point"))
+    seeded.commit()
+    latest = export_season_store(seeded, root=tmp_path)["snapshot"]
+
+    assert len(store.table("legacy_rounds")) == 7
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == [snapshots[-1], latest]
+
+
+def test_reading_before_any_export_raises(tmp_path):
+    with pytest.raises(SeasonStoreUnavailableError):
+        SeasonStore(tmp_path).table("legacy_rounds")
+
+
+def test_pending_member_rounds_are_left_out_of_standings(seeded, tmp_path):
+    seeded.add(LegacyRound(date="2026-04-19", group="A", member="Dan", score=9, status="pending"))
+    seeded.commit()
+    export_season_store(seeded, root=tmp_path)
+
+    assert "Dan" not in {r["member"] for r in SeasonStore(tmp_path).member_season_totals(2025)}
+
+
+def test_seasons_start_after_the_open_championship(db, tmp_path):
+    db.add_all(
+        LegacyRound(date=day, group="A", member="Alice", score=1) for day in ("2026-07-19", "2026-07-20", "2027-01-03")
+    )
+    db.commit()
+    export_season_store(db, root=tmp_path)
+
+    assert SeasonStore(tmp_path).table("legacy_rounds")["season"].tolist() == [2025, 2026, 2026]
+
+
+def test_store_is_unavailable_without_a_configured_directory(seeded, monkeypatch):
+    monkeypatch.delenv("SEASON_STORE_DIR", raising=False)
+
+    with pytest.raises(SeasonStoreUnavailableError, match="not configured"):
+        SeasonStore().table("legacy_rounds")
+    with pytest.raises(RuntimeError, match="SEASON_STORE_DIR is not configured"):
+        export_season_store(seeded)
+
+
+def test_scheduled_export_failure_reaches_the_job_lease(seeded, monkeypatch):
+    monkeypatch.delenv("SEASON_STORE_DIR", raising=False)
+    scheduler = EmailScheduler()
+    monkeypatch.setattr(scheduler, "_get_db", lambda: seeded)
+
+    with pytest.raises(RuntimeError, match="not configured"):
+        scheduler._export_season_store()
@@ -15,8 +15,11 @@ from datetime import datetime, timedelta
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.models import Base, GamePlayerResult, GameRecord, PlayerProfile, PlayerStatistics
+from app.models import Base, GamePlayerResult, GameRecord, LegacyRound, PlayerProfile, PlayerStatistics
+from app.services import season_store
+from app.services.season_store import SeasonStore, export_season_store
 from app.services.statistics_service import StatisticsService
 
 # Test database setup
@@ -656,5 +659,134 @@ class TestHelperMethods:
         assert score == 50.0  # Default for insufficient data
 
 
+class TestQueryBudgets:
+    """Per-player lookups are batched, so query counts don't grow with the roster."""
+
+    def test_advanced_metrics_batches_consistency_scores(
+        self, db, test_player_with_stats, test_game_results, multiple_players, query_budget
+    ):
+        player_id = test_player_with_stats[0].id
+        service = StatisticsService(db)
+        expected = service._calculate_consistency_score(player_id)
+
+        with query_budget(max_queries=5, max_repeats=1, engine=engine):
+            metrics = service.get_advanced_player_metrics(player_id)
+
+        assert metrics["consistency"].value == expected
+
+    def test_game_mode_analytics_is_one_query(self, db, test_game_results, query_budget):
+        service = StatisticsService(db)
+
+        with query_budget(max_queries=1, engine=engine):
+            analytics = service.get_game_mode_analytics()
+
+        assert analytics["wolf_goat_pig_4p"]["games_played"] == 10
+        assert analytics["wolf_goat_pig_4p"]["player_count_breakdown"] == {4: 10}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestSeasonAggregations:
+    """Season aggregations read the season store and fall back to the database."""
+
+    @pytest.fixture
+    def season_rows(self, db):
+        db.add_all(
+            [
+                LegacyRound(date="2026-04-05", group="A", member="Alice", score=-4),
+                LegacyRound(date="2026-04-12", group="B", member="Alice", score=10),
+                LegacyRound(date="2026-04-05", group="A", member="Bob", score=-6),
+                LegacyRound(date="2026-04-12", group="B", member="Bob", score=None),
+                LegacyRound(date="2026-04-19", group="A", member="Carol", score=7, status="pending"),
+                LegacyRound(date="2025-06-29", group="A", member="Alice", score=12),
+                LegacyRound(date="2026-07-20", group="A", member="Carol", score=2),
+            ]
+        )
+        db.add_all(
+            GamePlayerResult(
+                game_record_id=game,
+                player_profile_id=profile,
+                player_name=name,
+                final_position=position,
+                total_earnings=earnings,
+                holes_won=holes_won,
+                solo_attempts=1,
+                created_at=created_at,
+            )
+            for game, profile, name, position, earnings, holes_won, created_at in (
+                (1, 1, "Alice", 1, 8.0, 6, "2026-04-12T18:00:00"),
+                (1, 2, "Bob", 2, -8.0, 3, "2026-04-12T18:00:00"),
+                (2, 1, "Alice", 2, -3.0, 2, "2026-05-03T18:00:00"),
+                (3, 2, "Bob", 1, 5.0, 5, "2025-07-01T18:00:00"),
+            )
+        )
+        db.commit()
+        return db
+
+    def test_database_fallback_matches_the_store(self, season_rows, tmp_path, monkeypatch):
+        store = SeasonStore(tmp_path)
+        monkeypatch.setattr(season_store, "get_season_store", lambda: store)
+        service = StatisticsService(season_rows)
+
+        from_db = [
+            service.get_season_standings(2025),
+            service.get_season_standings(),
+            service.get_season_player_results(2025),
+            service.get_season_player_results(),
+        ]
+        export_season_store(season_rows, root=tmp_path)
+        from_store = [
+            service.get_season_standings(2025),
+            service.get_season_standings(),
+            service.get_season_player_results(2025),
+            service.get_season_player_results(),
+        ]
+
+        assert from_store == from_db
+        standings, _, results, _ = from_db
+        assert [(r["member"], r["rounds"], r["total_quarters"]) for r in standings] == [
+            ("Alice", 2, 6.0),
+            ("Bob", 2, -6.0),
+        ]
+        assert [(r["player_name"], r["games"], r["wins"], r["total_earnings"]) for r in results] == [
+            ("Alice", 2, 1.0, 5.0),
+            ("Bob", 1, 0.0, -8.0),
+        ]
+
+    def test_store_is_read_once_a_snapshot_exists(self, season_rows, tmp_path, monkeypatch):
+        export_season_store(season_rows, root=tmp_path)
+        monkeypatch.setattr(season_store, "get_season_store", lambda: SeasonStore(tmp_path))
+        season_rows.query(LegacyRound).delete()
+        season_rows.commit()
+
+        assert [r["member"] for r in StatisticsService(season_rows).get_season_standings(2025)] == ["Alice", "Bob"]
+
+    def test_null_status_counts_as_attested_in_both_paths(self, tmp_path, monkeypatch):
+        # status is NOT NULL now, but rows from before the attestation
+        # migration can still hold NULL in an older database.
+        monkeypatch.setattr(LegacyRound.__table__.c.status, "nullable", True)
+        legacy_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=legacy_engine)
+        db = sessionmaker(bind=legacy_engine)()
+        try:
+            db.add_all(
+                [
+                    LegacyRound(date="2026-04-05", group="A", member="Alice", score=4, status=None),
+                    LegacyRound(date="2026-04-05", group="A", member="Bob", score=-4, status="pending"),
+                ]
+            )
+            db.commit()
+            store = SeasonStore(tmp_path)
+            monkeypatch.setattr(season_store, "get_season_store", lambda: store)
+            service = StatisticsService(db)
+
+            from_db = service.get_season_standings(2025)
+            export_season_store(db, root=tmp_path)
+
+            assert service.get_season_standings(2025) == from_db
+            assert [r["member"] for r in from_db] == ["Alice"]
+        finally:
+            db.close()
+            legacy_engine.dispose()
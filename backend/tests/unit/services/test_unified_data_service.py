@@ -6,7 +6,12 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.database import Base
+from app.models import GamePlayerResult, GameRecord, LegacyRound
 from app.services.unified_data_service import (
     UnifiedDataService,
     UnifiedLeaderboardEntry,
@@ -230,6 +235,72 @@ class TestGetUnifiedLeaderboard:
         svc.primary_sheet.get_all_rounds.assert_called_once()
 
 
+class TestIterAllRounds:
+    def test_streams_the_same_rounds_as_get_all_rounds(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        for day, member, score, source, status in [
+            ("2026-04-06", "Alice", 4, "primary_sheet", "attested"),
+            ("2026-04-06", "Bob", -4, "primary_sheet", "attested"),
+            ("2026-04-08", "Cara", 2, "member", "attested"),
+            ("2026-04-08", "Dan", 9, "member", "pending"),
+            ("2026-04-01", "Eve", 1, "writable_sheet", "attested"),
+            ("2026-03-30", "Alice", -1, "primary_sheet", "attested"),
+            (None, "Gus", 3, "primary_sheet", "attested"),
+        ]:
+            db.add(
+                LegacyRound(
+                    date=day, group="A", member=member, score=score, location="WP", source=source, status=status
+                )
+            )
+        record = GameRecord(game_id="g1", course_name="WP", completed_at="2026-04-06T20:00:00")
+        db.add(record)
+        db.flush()
+        # Alice's app-recorded round duplicates her sheet row; Fay's is new
+        db.add(GamePlayerResult(game_record_id=record.id, player_name="Alice", total_earnings=4))
+        db.add(GamePlayerResult(game_record_id=record.id, player_name="Fay", total_earnings=0))
+        # An unparseable completed_at sorts first in SQL but falls back to the
+        # unknown date, so it must still come out last
+        garbled = GameRecord(game_id="g2", course_name="WP", completed_at="not recorded")
+        db.add(garbled)
+        db.flush()
+        db.add(GamePlayerResult(game_record_id=garbled.id, player_name="Hal", total_earnings=2))
+        db.commit()
+        with patch("app.services.unified_data_service.SpreadsheetSyncService"):
+            svc = UnifiedDataService(db=db)
+
+        def fields(rounds):
+            return [(r.date_sortable, r.member, r.score, r.source) for r in rounds]
+
+        streamed = fields(svc.iter_all_rounds(batch_size=2))
+
+        assert streamed == fields(svc.get_all_rounds())
+        assert [m for _, m, _, _ in streamed] == ["Cara", "Alice", "Bob", "Fay", "Alice", "Gus", "Hal"]
+
+
+class TestGetAllRoundsQueries:
+    def test_reads_each_source_in_one_query(self, query_budget):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        db.add(LegacyRound(date="2026-04-06", group="A", member="Alice", score=4, source="primary_sheet"))
+        for day in range(1, 6):
+            record = GameRecord(game_id=f"g{day}", course_name="WP", completed_at=f"2026-04-0{day}T20:00:00")
+            db.add(record)
+            db.flush()
+            db.add(GamePlayerResult(game_record_id=record.id, player_name="Bob", total_earnings=day))
+            db.add(GamePlayerResult(game_record_id=record.id, player_name="Cara", total_earnings=-day))
+        db.commit()
+        with patch("app.services.unified_data_service.SpreadsheetSyncService"):
+            svc = UnifiedDataService(db=db)
+
+        with query_budget(max_queries=2, max_repeats=1, engine=engine):
+            rounds = svc.get_all_rounds()
+
+        assert len(rounds) == 11
+
+
 def test_writable_sheet_is_season_primary():
     """App→sheet writes must target the same 2026-27 workbook as reads."""
     from app.services.spreadsheet_sync_service import PRIMARY_SHEET_ID, WRITABLE_SHEET_ID
@@ -0,0 +1,143 @@
+"""Counterfactual replays of a recorded round (app/services/what_if_service.py)."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas import CompleteHoleRequest, HoleTeams, WhatIfScenario
+from app.services.hole_completion_service import process_complete_hole
+from app.services.what_if_service import compact_history, replay_what_if
+from tests.benchmarks.engine import golden_requests, golden_round, scorekeeper_state
+
+
+@pytest.fixture
+def state():
+    state = scorekeeper_state()
+    for request in golden_requests():
+        process_complete_hole(request, state)
+    return state
+
+
+def _replay(state, *changes):
+    (scenario,) = replay_what_if(state, [WhatIfScenario(changes=list(changes))])["scenarios"]
+    return scenario
+
+
+def test_compact_history_matches_the_golden_totals(state):
+    arrays = compact_history(state)
+    expected = golden_round()["expected_final_totals"]
+
+    assert dict(zip(arrays.player_ids, arrays.totals, strict=True)) == expected
+    hole_9 = arrays.row_of[9]
+    running = golden_round()["holes"][hole_9 - 1]["running_totals"]
+    assert dict(zip(arrays.player_ids, arrays.before[hole_9], strict=True)) == running
+
+
+def test_going_solo_rescores_from_gross_scores(state):
+    # Hole 1: A and D both made 4, so A alone halves the hole A/B won.
+    scenario = _replay(state, {"hole_number": 1, "decision": "solo"})
+
+    assert scenario["holes"][0]["winner"] == "push"
+    assert scenario["difference"] == {"player_a": -1, "player_b": -1, "player_c": 1, "player_d": 1}
+
+
+def test_different_partner(state):
+    scenario = _replay(state, {"hole_number": 1, "decision": "partner", "partner_id": "player_d"})
+
+    assert scenario["holes"][0]["teams"]["team1"] == ["player_a", "player_d"]
+    assert scenario["holes"][0]["points_delta"] == {"player_a": 1, "player_d": 1, "player_b": -1, "player_c": -1}
+    assert scenario["totals"]["player_d"] == golden_round()["expected_final_totals"]["player_d"] + 2
+
+
+def test_declined_double_concedes_at_the_pre_double_wager(state):
+    # Hole 5 was played for 2 and won by C/D.
+    scenario = _replay(state, {"hole_number": 5, "decision": "decline_double", "declined_by": "team1"})
+
+    assert scenario["holes"][0]["winner"] == "team2_flush"
+    assert scenario["difference"] == {"player_a": 1, "player_b": 1, "player_c": -1, "player_d": -1}
+
+
+def test_float_doubles_the_wager_once(state):
+    scenario = _replay(state, {"hole_number": 9, "decision": "float"})
+    assert scenario["difference"]["player_a"] == 6
+
+    with pytest.raises(HTTPException, match="already used the float"):
+        _replay(state, {"hole_number": 9, "decision": "float"}, {"hole_number": 13, "decision": "float"})
+
+
+def test_changes_compose_and_scenarios_are_independent(state):
+    result = replay_what_if(
+        state,
+        [
+            WhatIfScenario(
+                label="both", changes=[{"hole_number": 1, "decision": "solo"}, {"hole_number": 9, "decision": "float"}]
+            ),
+            WhatIfScenario(label="float", changes=[{"hole_number": 9, "decision": "float"}]),
+        ],
+    )
+
+    both, float_only = result["scenarios"]
+    assert [h["hole_number"] for h in both["holes"]] == [1, 9]
+    assert both["difference"]["player_a"] == -1 + 6
+    assert float_only["difference"]["player_a"] == 6
+    assert result["recorded_totals"] == golden_round()["expected_final_totals"]
+
+
+def _five_player_state(hole_1_team1):
+    state = {
+        "players": [{"id": pid, "points": 0, "total_points": 0, "float_used": 0} for pid in "abcde"],
+        "hole_history": [],
+        "current_hole": 1,
+    }
+    holes = (
+        (1, hole_1_team1, {"a": 5, "b": 5, "c": 5, "d": 3, "e": 5}),
+        (2, ["a", "b"], {"a": 5, "b": 5, "c": 3, "d": 5, "e": 5}),
+    )
+    for hole, team1, scores in holes:
+        team2 = [pid for pid in "abcde" if pid not in team1]
+        winner = "team1" if min(scores[p] for p in team1) < min(scores[p] for p in team2) else "team2"
+        request = CompleteHoleRequest(
+            hole_number=hole,
+            rotation_order=list("abcde"),
+            captain_index=0,
+            teams=HoleTeams(type="partners", captain="a", team1=team1, team2=team2),
+            final_wager=1,
+            winner=winner,
+            scores=scores,
+            hole_par=4,
+        )
+        process_complete_hole(request, state)
+        for player in state["players"]:
+            player["total_points"] = player["points"]
+    return state
+
+
+def test_later_uneven_splits_follow_the_shifted_standings():
+    # Hole 2 splits 2 quarters three ways; the goat who gets the odd one
+    # depends on the standings hole 1 leaves behind.
+    scenario = _replay(_five_player_state(["a", "c"]), {"hole_number": 1, "decision": "partner", "partner_id": "d"})
+    replayed = {p["id"]: p["total_points"] for p in _five_player_state(["a", "d"])["players"]}
+
+    assert scenario["totals"] == replayed
+    assert [h["hole_number"] for h in scenario["holes"]] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        ({"hole_number": 1, "decision": "partner", "partner_id": "nobody"}, "partner must be another player"),
+        ({"hole_number": 1, "decision": "decline_double", "declined_by": "team1"}, "never doubled"),
+        ({"hole_number": 3, "decision": "decline_double", "declined_by": "team1"}, "declined_by must be one of"),
+    ],
+)
+def test_invalid_changes_are_rejected(state, change, message):
+    with pytest.raises(HTTPException, match=message):
+        _replay(state, change)
+
+
+def test_holes_without_decisions_cannot_be_replayed():
+    state = {"players": [{"id": "a"}, {"id": "b"}], "hole_history": [{"hole": 1, "points_delta": {"a": 1, "b": -1}}]}
+
+    with pytest.raises(HTTPException, match="cannot be replayed"):
+        _replay(state, {"hole_number": 1, "decision": "solo", "captain_id": "a"})
+    with pytest.raises(HTTPException, match="has not been played"):
+        _replay(state, {"hole_number": 2, "decision": "solo"})
@@ -0,0 +1,116 @@
+"""Tests for keeping blocking SQLAlchemy work off the event loop.
+
+Covers the ``run_db`` offload helper and the DB003 lint rule that keeps
+coroutine bodies in ``app/`` free of direct Session calls.
+"""
+
+import contextvars
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.database import run_db
+from lint_db_transactions import DatabaseTransactionLinter
+
+APP_DIR = Path(__file__).resolve().parents[2] / "app"
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class TestRunDb:
+    @pytest.mark.asyncio
+    async def test_runs_in_db_thread_not_event_loop(self):
+        loop_thread = threading.current_thread().name
+
+        thread_name = await run_db(lambda: threading.current_thread().name)
+
+        assert thread_name != loop_thread
+        assert thread_name.startswith("db")
+
+    @pytest.mark.asyncio
+    async def test_passes_args_and_context(self):
+        request_id.set("req-42")
+
+        result = await run_db(lambda a, b=0: (a + b, request_id.get()), 1, b=2)
+
+        assert result == (3, "req-42")
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        def boom():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError, match="nope"):
+            await run_db(boom)
+
+
+class TestAsyncDbLint:
+    def _lint(self, tmp_path, source: str) -> list:
+        path = tmp_path / "mod.py"
+        path.write_text(source)
+        issues = DatabaseTransactionLinter().lint_file(str(path))
+        return [issue for issue in issues if issue.rule_id == "DB003"]
+
+    def test_flags_session_calls_in_coroutine(self, tmp_path):
+        issues = self._lint(
+            tmp_path,
+            "async def route(db):\n    db.query(1).all()\n    self.db.commit()\n",
+        )
+
+        assert sorted(issue.line_number for issue in issues) == [2, 3]
+
+    def test_allows_offloaded_and_sync_work(self, tmp_path):
+        issues = self._lint(
+            tmp_path,
+            "async def route(db):\n"
+            "    await run_db(db.commit)\n"
+            "    await run_db(lambda: db.query(1).all())\n"
+            "    def save():\n"
+            "        db.commit()\n"
+            "    await run_db(save)\n"
+            "\n"
+            "def sync_route(db):\n"
+            "    db.commit()\n",
+        )
+
+        assert issues == []
+
+    def test_flags_session_typed_params_and_opened_sessions(self, tmp_path):
+        issues = self._lint(
+            tmp_path,
+            "async def route(session: Session, other: 'Session | None'):\n"
+            "    session.execute(1)\n"
+            "    other.commit()\n"
+            "    conn = database.SessionLocal()\n"
+            "    conn.query(1).all()\n"
+            "    offloaded = await run_db(SessionLocal)\n"
+            "    offloaded.close()\n"
+            "    typed: Session = make()\n"
+            "    typed.flush()\n",
+        )
+
+        assert sorted(issue.line_number for issue in issues) == [2, 3, 4, 5, 7, 9]
+
+    def test_allows_offloaded_session_open(self, tmp_path):
+        issues = self._lint(
+            tmp_path,
+            "async def route(client: Client):\n"
+            "    db = await run_db(SessionLocal)\n"
+            "    await run_db(db.close)\n"
+            "    client.get('/x')\n",
+        )
+
+        assert issues == []
+
+    def test_app_coroutines_do_not_block_on_the_session(self):
+        offenders = []
+        for path in sorted(APP_DIR.rglob("*.py")):
+            issues = DatabaseTransactionLinter().lint_file(str(path))
+            offenders.extend(
+                f"{issue.file_path}:{issue.line_number} {issue.code_snippet}"
+                for issue in issues
+                if issue.rule_id == "DB003"
+            )
+
+        assert offenders == []
@@ -16,6 +16,7 @@ from app.badge_engine import BadgeEngine
 from app.database import Base
 from app.models import (
     Badge,
+    BadgeProgress,
     GamePlayerResult,
     GameRecord,
     PlayerBadgeEarned,
@@ -186,3 +187,39 @@ class TestPostGameDedup:
             engine.check_post_game_achievements(record.id, 1)
 
         assert db.query(PlayerBadgeEarned).filter_by(player_profile_id=1, badge_id=1).count() == 1
+
+
+class TestQueryBudget:
+    def test_post_game_check_does_not_query_per_badge(self, db, query_budget):
+        """Once a player's progress rows exist, a post-game check costs the same
+        handful of statements however many badges are active."""
+        _make_player(db)
+        db.add(PlayerStatistics(player_id=1, games_played=5, total_earnings=0.0))
+        for threshold in range(1, 9):
+            _make_badge(
+                db,
+                badge_id=threshold,
+                name=f"{threshold * 10} Games",
+                trigger_type="career_milestone",
+                trigger_condition={"type": "games_played_milestone", "games_threshold": threshold * 10},
+            )
+        record_ids = []
+        for game_num in range(2):
+            record = GameRecord(
+                game_id=f"game-{game_num}", course_name="Test Course", completed_at=utc_now().isoformat()
+            )
+            db.add(record)
+            db.commit()
+            db.add(GamePlayerResult(game_record_id=record.id, player_profile_id=1, player_name="Player 1"))
+            db.commit()
+            record_ids.append(record.id)
+        engine = BadgeEngine(db)
+        engine.check_post_game_achievements(record_ids[0], 1)
+
+        with query_budget(max_queries=9, max_repeats=2, engine=db.get_bind()):
+            earned = engine.check_post_game_achievements(record_ids[1], 1)
+
+        assert earned == []
+        progress = db.query(BadgeProgress).filter_by(player_profile_id=1).all()
+        assert len(progress) == 8
+        assert {p.current_progress for p in progress} == {5}
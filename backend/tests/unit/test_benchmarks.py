@@ -0,0 +1,78 @@
+"""Keeps the benchmark suite (tests/benchmarks) runnable and its comparison honest.
+
+Each case runs once so a broken engine API fails here rather than in the
+next manual benchmark run; timings themselves are never asserted.
+"""
+
+import json
+
+import pytest
+
+from tests.benchmarks import __main__ as cli
+from tests.benchmarks import engine, responses
+from tests.benchmarks.harness import CASES, MemoryResult, compare, run_case, select
+
+
+def _payload(**timings: float) -> dict:
+    return {"results": {name: {"min_us": us} for name, us in timings.items()}}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_every_case_runs(name):
+    result = run_case(CASES[name], samples=1, warmup=0)
+
+    assert (result.bytes if isinstance(result, MemoryResult) else result.median_us) > 0
+
+
+def test_scorekeeper_inputs_reproduce_golden_totals():
+    state = engine.scorekeeper_state()
+    for request in engine.golden_requests():
+        engine.process_complete_hole(request, state)
+
+    assert {p["id"]: p["points"] for p in state["players"]} == engine.golden_round()["expected_final_totals"]
+
+
+def test_engine_play_through_finishes_the_round():
+    game = engine.play_golden_round(engine.new_game())
+
+    assert game._game_completed is True
+    assert sum(p.points for p in game.players) == 0
+
+
+def test_compare_classifies_each_case():
+    baseline = _payload(steady=100.0, slower=100.0, faster=100.0, dropped=100.0)
+    current = _payload(steady=110.0, slower=140.0, faster=50.0, added=5.0)
+
+    statuses = {c.name: c.status for c in compare(current, baseline, threshold=0.25)}
+
+    assert statuses == {
+        "added": "new",
+        "dropped": "missing",
+        "faster": "improvement",
+        "slower": "regression",
+        "steady": "ok",
+    }
+
+
+def test_cli_compare_exits_nonzero_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    name = select("replay_player_totals")[0].name
+    baseline.write_text(json.dumps(_payload(**{name: 0.0001})))
+
+    assert cli.main(["-k", name, "--samples", "2", "--baseline", str(baseline), "--compare"]) == 1
+
+
+def test_cli_save_merges_partial_runs(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_payload(other_case=1.0)))
+
+    assert cli.main(["-k", "replay_player_totals", "--samples", "2", "--baseline", str(baseline), "--save"]) == 0
+
+    saved = json.loads(baseline.read_text())
+    assert set(saved["results"]) == {"other_case", "hole_completion.replay_player_totals"}
+
+
+def test_json_cases_encode_the_same_document():
+    state = responses.game_state()
+
+    assert json.loads(responses.dumps(state)) == json.loads(responses.stdlib_dumps(state))
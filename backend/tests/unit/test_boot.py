@@ -0,0 +1,103 @@
+"""Tests for the boot fast path (app/boot.py).
+
+A full schema preparation records a fingerprint of the model metadata and
+migration file set; a boot that finds the same fingerprint must skip
+init_db, migrations and seeding, and a boot whose preparation partly failed
+must not record one.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.boot as boot
+from app.models import Badge, LegacyRosterPlayer, SchemaFingerprint
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'boot.db'}", connect_args={"check_same_thread": False})
+    yield engine, sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _count(session_factory, model) -> int:
+    session = session_factory()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+class TestSchemaFingerprint:
+    def test_stable_for_same_inputs(self, tmp_path):
+        (tmp_path / "a_postgres.sql").write_text("SELECT 1;")
+
+        assert boot.schema_fingerprint(migrations_dir=tmp_path) == boot.schema_fingerprint(migrations_dir=tmp_path)
+
+    def test_changes_when_migration_set_changes(self, tmp_path):
+        (tmp_path / "a_postgres.sql").write_text("SELECT 1;")
+        before = boot.schema_fingerprint(migrations_dir=tmp_path)
+
+        (tmp_path / "b_postgres.sql").write_text("SELECT 2;")
+        added = boot.schema_fingerprint(migrations_dir=tmp_path)
+        (tmp_path / "b_postgres.sql").write_text("SELECT 3;")
+        edited = boot.schema_fingerprint(migrations_dir=tmp_path)
+
+        assert len({before, added, edited}) == 3
+
+
+class TestPrepareDatabase:
+    @pytest.mark.asyncio
+    async def test_first_boot_prepares_and_second_boot_takes_fast_path(self, db):
+        engine, session_factory = db
+
+        first = await boot.prepare_database(engine, session_factory, force=False)
+
+        assert first["fast_path"] is False
+        assert first["recorded"] is True
+        assert _count(session_factory, Badge) > 0
+        assert _count(session_factory, LegacyRosterPlayer) > 0
+
+        timer = boot.BootTimer()
+        with (
+            patch.object(boot.database, "init_db") as init_db,
+            patch.object(boot, "run_sql_migrations") as migrations,
+            patch.object(boot, "seed_badges_if_empty") as seed_badges,
+        ):
+            second = await boot.prepare_database(engine, session_factory, timer=timer, force=False)
+
+        assert second == {"fast_path": True, "fingerprint": first["fingerprint"]}
+        init_db.assert_not_called()
+        migrations.assert_not_called()
+        seed_badges.assert_not_called()
+        assert list(timer.phases) == ["schema_check"]
+
+    @pytest.mark.asyncio
+    async def test_changed_schema_runs_full_preparation(self, db):
+        engine, session_factory = db
+        await boot.prepare_database(engine, session_factory, force=False)
+
+        with patch.object(boot, "schema_fingerprint", return_value="new-deploy"):
+            result = await boot.prepare_database(engine, session_factory, force=False)
+
+        assert result["fast_path"] is False
+        assert boot.stored_fingerprint(session_factory) == "new-deploy"
+
+    @pytest.mark.asyncio
+    async def test_failed_seed_leaves_fingerprint_unrecorded(self, db):
+        engine, session_factory = db
+
+        with patch.object(boot, "seed_legacy_roster", side_effect=RuntimeError("seed file missing")):
+            result = await boot.prepare_database(engine, session_factory, force=False)
+
+        assert result["recorded"] is False
+        assert _count(session_factory, SchemaFingerprint) == 0
+        assert _count(session_factory, Badge) > 0  # the independent seed still ran
+
+    def test_fresh_database_has_no_stored_fingerprint(self, db):
+        _, session_factory = db
+
+        assert boot.stored_fingerprint(session_factory) is None
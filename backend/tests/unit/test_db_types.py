@@ -0,0 +1,58 @@
+"""ISO-string date/timestamp column types (app/db_types.py)."""
+
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.db_types import ISODate, ISOTimestamp
+from app.models import LegacyRound
+
+PG = postgresql.dialect()
+SQLITE = sqlite.dialect()
+
+
+def test_date_binds_native_on_postgres_and_text_on_sqlite():
+    assert ISODate().process_bind_param("2026-04-06", PG) == date(2026, 4, 6)
+    assert ISODate().process_bind_param("2026-04-06T00:00:00Z", SQLITE) == "2026-04-06"
+    assert ISODate().process_result_value(date(2026, 4, 6), PG) == "2026-04-06"
+    assert ISODate().process_result_value("2026-04-06", SQLITE) == "2026-04-06"
+
+
+def test_timestamp_round_trips_isoformat():
+    stamp = "2026-04-06T13:45:10.123456"
+
+    bound = ISOTimestamp().process_bind_param(stamp, PG)
+
+    assert bound == datetime(2026, 4, 6, 13, 45, 10, 123456)
+    assert ISOTimestamp().process_result_value(bound, PG) == stamp
+    assert ISOTimestamp().process_bind_param(stamp, SQLITE) == stamp
+
+
+def test_aware_timestamps_are_stored_as_naive_utc():
+    assert ISOTimestamp().process_bind_param("2026-04-06T08:00:00-05:00", SQLITE) == "2026-04-06T13:00:00"
+
+
+def test_malformed_values_bind_as_null(caplog):
+    assert ISODate().process_bind_param("6-Apr", PG) is None
+    assert ISODate().process_bind_param("", SQLITE) is None
+    assert ISOTimestamp().process_bind_param("yesterday", SQLITE) is None
+    assert "Unparseable date '6-Apr'" in caplog.text
+
+
+def test_malformed_sheet_date_commits_as_null():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[LegacyRound.__table__])
+    with Session(engine) as db:
+        db.add_all([LegacyRound(date="TBD", member="Alice", score=3), LegacyRound(date="2026-04-06", member="Bob")])
+        db.commit()
+
+        assert [r.date for r in db.query(LegacyRound).order_by(LegacyRound.member)] == [None, "2026-04-06"]
+
+
+def test_dialect_storage_types():
+    assert ISODate().load_dialect_impl(PG).__visit_name__ == "date"
+    assert ISOTimestamp().load_dialect_impl(PG).__visit_name__ == "datetime"
+    assert ISODate().load_dialect_impl(SQLITE).__visit_name__ == "string"
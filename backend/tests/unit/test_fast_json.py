@@ -0,0 +1,101 @@
+"""orjson-backed response rendering (app/utils/fast_json.py).
+
+``dumps`` must produce the same document Starlette's ``JSONResponse`` would
+after FastAPI's ``jsonable_encoder`` pass, and a returned ``FastJSONResponse``
+must skip that pass without changing the route's OpenAPI schema.
+"""
+
+import json
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.utils import fast_json
+from app.utils.fast_json import FastJSONResponse, dumps, stdlib_dumps
+
+
+class Colour(Enum):
+    RED = "red"
+
+
+class Side(str, Enum):
+    LEFT = "left"
+
+
+class Item(BaseModel):
+    name: str
+    when: datetime
+
+
+PAYLOADS = {
+    "naive_datetime": {"at": datetime(2025, 6, 1, 8, 30, 15, 120)},
+    "aware_datetime": {"at": datetime(2025, 6, 1, 8, 30, tzinfo=UTC)},
+    "date": [date(2025, 1, 27)],
+    "enums": {"colour": Colour.RED, "side": Side.LEFT},
+    "int_keys": {1: "a", 2: {3: "b"}},
+    "unicode": {"name": "Zoë — 🏌️"},
+    "model": {"item": Item(name="tee", when=datetime(2025, 1, 1))},
+    "decimal_uuid": {"amount": Decimal("1.50"), "id": uuid.UUID(int=7)},
+    "big_int": {"n": 2**70},
+    "nested": {"players": [{"id": "p1", "points": -3, "handicap": 10.5, "tags": None}]},
+}
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_dumps_matches_stdlib_rendering(name):
+    payload = PAYLOADS[name]
+
+    assert json.loads(dumps(payload)) == json.loads(stdlib_dumps(payload))
+
+
+def test_dumps_is_compact_utf8():
+    assert dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode()
+
+
+def test_nan_renders_as_null():
+    assert dumps({"x": float("nan")}) == b'{"x":null}'
+
+
+def test_falls_back_to_stdlib_without_orjson(monkeypatch):
+    monkeypatch.setattr(fast_json, "orjson", None)
+
+    assert dumps({"at": date(2025, 1, 27), 1: Colour.RED}) == b'{"at":"2025-01-27","1":"red"}'
+    with pytest.raises(ValueError, match="Out of range float"):
+        dumps({"x": float("nan")})
+
+
+def test_unencodable_values_still_raise():
+    with pytest.raises((TypeError, ValueError)):
+        dumps({"x": object()})
+
+
+def _small_app() -> FastAPI:
+    small = FastAPI()
+
+    @small.get("/direct", response_model=dict[str, datetime])
+    def direct():
+        return FastJSONResponse({"at": datetime(2025, 1, 1)})
+
+    return small
+
+
+def test_returned_fast_json_response_skips_jsonable_encoder(monkeypatch):
+    rendered = []
+    original = FastJSONResponse.render
+    monkeypatch.setattr(
+        FastJSONResponse, "render", lambda self, content: rendered.append(content) or original(self, content)
+    )
+    small = _small_app()
+    client = TestClient(small)
+
+    assert client.get("/direct").json() == {"at": "2025-01-01T00:00:00"}
+    # orjson saw the datetime itself: no jsonable_encoder pass ran first.
+    assert rendered == [{"at": datetime(2025, 1, 1)}]
+    schema = small.openapi()["paths"]["/direct"]["get"]["responses"]["200"]["content"]["application/json"]
+    assert schema["schema"]["additionalProperties"]["format"] == "date-time"
@@ -0,0 +1,77 @@
+"""Import-time budget for ``app.main``.
+
+Cold-start readiness on Cloud Run is dominated by importing the app. Heavy
+optional subsystems (OpenCV/NumPy scorecard scanning, google-genai/ADK for
+the Commissioner, provider SDKs for email, Pillow for avatars, sqlglot) are
+imported on first use; these tests run ``python -X importtime`` in a fresh
+interpreter and fail if one of them creeps back into the boot path or the
+total import cost regresses past ``IMPORT_TIME_BUDGET_MS``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Default leaves ~1.5x headroom over a cold import on a slow CI runner.
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+
+LAZY_MODULES = (
+    "cv2",
+    "numpy",
+    "google.genai",
+    "google.adk",
+    "googleapiclient.discovery",
+    "google_auth_oauthlib",
+    "resend",
+    "emails",
+    "jinja2",
+    "PIL.Image",
+    "sqlglot",
+)
+
+
+def _import_profile() -> dict[str, int]:
+    """Cumulative import time (µs) per module for ``import app.main`` in a fresh interpreter."""
+    proc = subprocess.run(  # noqa: S603 - fixed argv, our own interpreter
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            profile[module.strip()] = int(cumulative)
+    return profile
+
+
+def _heaviest(profile: dict[str, int], count: int = 10) -> str:
+    ranked = sorted(((us, name) for name, us in profile.items() if name.startswith("app.")), reverse=True)
+    return ", ".join(f"{name}={us // 1000}ms" for us, name in ranked[:count])
+
+
+def test_heavy_subsystems_are_not_imported_at_boot():
+    profile = _import_profile()
+
+    eager = [module for module in LAZY_MODULES if module in profile]
+
+    assert eager == [], f"imported by app.main: {eager}"
+
+
+def test_app_main_import_within_budget():
+    # Best of three: the budget guards against regressions, not scheduler noise.
+    profiles = [_import_profile() for _ in range(3)]
+    best = min(profiles, key=lambda profile: profile["app.main"])
+    elapsed_ms = best["app.main"] / 1000
+
+    assert elapsed_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"import app.main took {elapsed_ms:.0f} ms (budget {IMPORT_TIME_BUDGET_MS} ms); heaviest: {_heaviest(best)}"
+    )
@@ -48,6 +48,7 @@ JOBS=(
   "wgp-legacy-rounds-sync|0 */2 * * *|legacy-rounds-sync"
   "wgp-pending-sheet-syncs|0 0 * * *|pending-sheet-syncs"
   "wgp-ghin-sync|0 6 * * *|ghin-sync"
+  "wgp-season-store-export|0 3 * * *|season-store-export"
 )
 
 for entry in "${JOBS[@]}"; do
@@ -1395,6 +1395,28 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/data/hole-events/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Hole Events
+         * @description Stream per-player hole events (gross score and quarters) as NDJSON or CSV.
+         *
+         *     Ordered by game, hole and player; all games unless ``game_id`` is given.
+         */
+        get: operations["export_hole_events_data_hole_events_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/data/leaderboard": {
         parameters: {
             query?: never;
@@ -1747,6 +1769,29 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/data/rounds/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Unified Rounds
+         * @description Stream every round from all data sources as NDJSON or CSV.
+         *
+         *     Same rounds and order as /data/rounds, but read from the database in
+         *     batches and written incrementally, so memory stays flat for a full season.
+         */
+        get: operations["export_unified_rounds_data_rounds_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/data/status": {
         parameters: {
             query?: never;
@@ -2086,6 +2131,29 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/games/history/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Game History
+         * @description Stream every completed game, newest first, as NDJSON or CSV.
+         *
+         *     Same fields as /games/history; rows are read in batches and written
+         *     incrementally instead of being paged by the client.
+         */
+        get: operations["export_game_history_games_history_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/games/join/{join_code}": {
         parameters: {
             query?: never;
@@ -2598,6 +2666,30 @@ export interface paths {
         patch: operations["update_game_course_data_games__game_id__update_course_data_patch"];
         trace?: never;
     };
+    "/games/{game_id}/what-if": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Replay Game What If
+         * @description Re-score the recorded round under alternative decisions.
+         *
+         *     Each scenario swaps decisions on recorded holes (a different partner, going
+         *     solo, declining the last double, floating) and gets back the resulting
+         *     totals and per-player difference from the recorded totals. Nothing is saved.
+         */
+        post: operations["replay_game_what_if_games__game_id__what_if_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/ghin/courses": {
         parameters: {
             query?: never;
@@ -3453,9 +3545,7 @@ export interface paths {
         };
         /**
          * Get All Players Availability
-         * @description Get all players' weekly availability with their names.
-         *
-         *     Uses two queries instead of N+1: one for all players, one for all availability records.
+         * @description Get all players' weekly availability with their names, in one query.
          */
         get: operations["get_all_players_availability_players_availability_all_get"];
         put?: never;
@@ -3935,7 +4025,7 @@ export interface paths {
         /**
          * Get Public Player Profile
          * @description Public profile — no auth required. Returns only non-sensitive fields
-         *     (no email, venmo, or GHIN id).
+         *     (no email, venmo, or GHIN id). Cached per player; see public_profile_service.
          */
         get: operations["get_public_player_profile_players__player_id__public_profile_get"];
         put?: never;
@@ -6405,6 +6495,52 @@ export interface components {
             /** Week Start */
             week_start: string;
         };
+        /**
+         * WhatIfChange
+         * @description One alternative decision on one recorded hole
+         */
+        WhatIfChange: {
+            /**
+             * Captain Id
+             * @description Captain for 'partner'/'solo' when the hole did not record one (defaults to team1's first player)
+             */
+            captain_id?: string | null;
+            /**
+             * Decision
+             * @enum {string}
+             */
+            decision: "partner" | "solo" | "decline_double" | "float";
+            /**
+             * Declined By
+             * @description Side that declines the last double: 'team1'/'team2' or 'captain'/'opponents' (decision='decline_double')
+             */
+            declined_by?: string | null;
+            /** Hole Number */
+            hole_number: number;
+            /**
+             * Partner Id
+             * @description Partner the captain picks instead (decision='partner')
+             */
+            partner_id?: string | null;
+        };
+        /**
+         * WhatIfRequest
+         * @description Counterfactual replay of a recorded round - nothing is saved
+         */
+        WhatIfRequest: {
+            /** Scenarios */
+            scenarios: components["schemas"]["WhatIfScenario"][];
+        };
+        /**
+         * WhatIfScenario
+         * @description A set of alternative decisions re-scored together
+         */
+        WhatIfScenario: {
+            /** Changes */
+            changes: components["schemas"]["WhatIfChange"][];
+            /** Label */
+            label?: string | null;
+        };
     };
     responses: never;
     parameters: never;
@@ -8546,6 +8682,38 @@ export interface operations {
             };
         };
     };
+    export_hole_events_data_hole_events_export_get: {
+        parameters: {
+            query?: {
+                /** @description ndjson or csv */
+                format?: "ndjson" | "csv";
+                /** @description Only this game's hole events */
+                game_id?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_unified_leaderboard_data_leaderboard_get: {
         parameters: {
             query?: {
@@ -9012,6 +9180,36 @@ export interface operations {
             };
         };
     };
+    export_unified_rounds_data_rounds_export_get: {
+        parameters: {
+            query?: {
+                /** @description ndjson or csv */
+                format?: "ndjson" | "csv";
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_data_status_data_status_get: {
         parameters: {
             query?: never;
@@ -9294,8 +9492,10 @@ export interface operations {
                 creator_user_id?: string | null;
                 /** @description Maximum number of games to return */
                 limit?: number;
-                /** @description Number of games to skip */
+                /** @description Number of games to skip (ignored when cursor is given) */
                 offset?: number;
+                /** @description next_cursor from the previous page */
+                cursor?: string | null;
             };
             header?: never;
             path?: never;
@@ -9494,6 +9694,36 @@ export interface operations {
             };
         };
     };
+    export_game_history_games_history_export_get: {
+        parameters: {
+            query?: {
+                /** @description ndjson or csv */
+                format?: "ndjson" | "csv";
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     join_game_with_code_games_join__join_code__post: {
         parameters: {
             query?: never;
@@ -10290,6 +10520,43 @@ export interface operations {
             };
         };
     };
+    replay_game_what_if_games__game_id__what_if_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                game_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["WhatIfRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     search_courses_ghin_courses_get: {
         parameters: {
             query: {